@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# ruff: noqa: E402, T201
+from warp_launcher.aio import AsyncLauncher
+from warp_launcher.config import Config
+from warp_launcher.constants import DEFAULT_LAUNCH_MODE
+from warp_launcher.dispatcher import UriDispatcher
+from warp_launcher.launcher import Launcher
+
+
+class _LatencyDispatcher(UriDispatcher):
+    """Stand-in for a real dispatcher that blocks for the hand-off latency of a helper process."""
+
+    name = "latency"
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def _hand_off(self, uri: str) -> None:
+        time.sleep(self.latency)
+
+
+def _measure(function: Callable[[], object], launches: int) -> float:
+    """
+    Run the function once and return the launches per second.
+    """
+    start = time.perf_counter()
+    function()
+    return launches / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the launch throughput of the asyncio API")
+    parser.add_argument("-n", "--paths", type=int, default=64, help="directories launched by each run")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="maximum simultaneous path checks")
+    parser.add_argument("-l", "--latency", type=float, default=5.0, help="simulated hand-off latency in ms")
+    parser.add_argument("--callers", type=int, default=16, help="concurrent single-path callers of the event loop")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = [Path(temp_dir) / f"project{index}" for index in range(args.paths)]
+        for path in paths:
+            path.mkdir()
+
+        config = Config("warp", DEFAULT_LAUNCH_MODE, Path("."))
+        dispatcher = _LatencyDispatcher(args.latency / 1000)
+        launcher = Launcher(Path(temp_dir), config=config, dispatcher=dispatcher, coalesce_window=0)
+        # The default executor of the loop has too few threads on small machines to reach the concurrency
+        executor = ThreadPoolExecutor(max_workers=max(args.concurrency, args.callers))
+        async_launcher = AsyncLauncher(launcher, executor)
+
+        async def launch_callers() -> None:
+            # Independent callers, such as editor commands, each launching one directory
+            semaphore = asyncio.Semaphore(args.callers)
+
+            async def launch_one(path: Path) -> None:
+                async with semaphore:
+                    await async_launcher.launch(path)
+
+            await asyncio.gather(*(launch_one(path) for path in paths))
+
+        # A single event loop, warmed up so its default executor threads already exist
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(async_launcher.launch(*paths, max_concurrency=args.concurrency))
+
+        results = {
+            "sequential launch_warp": _measure(lambda: [launcher.launch_warp(path) for path in paths], args.paths),
+            "Launcher.launch_many": _measure(
+                lambda: launcher.launch_many(paths, max_workers=args.concurrency), args.paths
+            ),
+            "AsyncLauncher.launch": _measure(
+                lambda: loop.run_until_complete(async_launcher.launch(*paths, max_concurrency=args.concurrency)),
+                args.paths,
+            ),
+            f"AsyncLauncher, {args.callers} callers": _measure(
+                lambda: loop.run_until_complete(launch_callers()), args.paths
+            ),
+        }
+        loop.close()
+        executor.shutdown()
+
+    print(f"{args.paths} paths, {args.latency:.1f} ms hand-off latency, concurrency {args.concurrency}")
+    for name, throughput in results.items():
+        print(f"{name}: {throughput:.0f} launches/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# ruff: noqa: E402, T201
+from warp_launcher.config import Config, ConfigHandler, clear_config_cache
+from warp_launcher.enums import LaunchMode
+
+
+def _time(function: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cached and uncached configuration loads")
+    parser.add_argument("-n", "--iterations", type=int, default=5_000, help="loads per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        handler = ConfigHandler(Path(temp_dir) / "config.json")
+        handler.save_config(Config("warp", LaunchMode.TAB, Path(temp_dir)))
+
+        uncached_handler = ConfigHandler(handler.config_file_path)
+        uncached_handler._load_snapshot = lambda stat_key: None  # type: ignore[method-assign]
+        uncached_handler._save_snapshot = lambda stat_key, config: None  # type: ignore[method-assign]
+
+        def uncached_load() -> None:
+            # Parse and validate the file every time, as before the cache existed
+            clear_config_cache()
+            uncached_handler.load_config()
+
+        def snapshot_load() -> None:
+            # A new process with the snapshot written by a previous one
+            clear_config_cache()
+            handler.load_config()
+
+        scenarios = {
+            "uncached": uncached_load,
+            "snapshot (cold process)": snapshot_load,
+            "cached (warm process)": handler.load_config,
+        }
+        for name, function in scenarios.items():
+            handler.load_config()
+            print(f"{name}: {_time(function, args.iterations) * 1_000_000:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# ruff: noqa: E402, T201
+from warp_launcher.config import Config
+from warp_launcher.constants import DEFAULT_LAUNCH_MODE
+from warp_launcher.dispatcher import DISPATCHERS, RecordingDispatcher, measure_dispatchers
+from warp_launcher.launcher import Launcher
+
+
+def bench_launch_path(iterations: int) -> float:
+    """
+    Time the in-process launch path with the recording dispatcher, return the mean in seconds.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config("warp", DEFAULT_LAUNCH_MODE, Path(temp_dir))
+        launcher = Launcher(Path(temp_dir), config=config, dispatcher=RecordingDispatcher())
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            launcher.launch_warp()
+        return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Warp URI hand-off")
+    parser.add_argument("-n", "--iterations", type=int, default=10_000, help="launch path iterations")
+    parser.add_argument(
+        "-d",
+        "--dispatcher",
+        action="append",
+        choices=list(DISPATCHERS),
+        default=[],
+        help="also measure a real dispatcher, each measurement opens the URI",
+    )
+    parser.add_argument("--uri", default="warp://action/new_tab", help="URI dispatched by the real dispatchers")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="hand-offs per real dispatcher")
+    args = parser.parse_args()
+
+    print(f"launch path (recording): {bench_launch_path(args.iterations) * 1_000_000:.2f} us")
+
+    if args.dispatcher:
+        for name, latency in measure_dispatchers(args.uri, args.dispatcher, args.repeat).items():
+            print(f"{name}: {latency * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# ruff: noqa: E402, T201
+from warp_launcher.history import HistoryEntry, HistoryHandler
+
+_WORDS = ("src", "tests", "docs", "api", "web", "client", "server", "tools", "build", "scripts", "infra", "data")
+
+
+def _median(function: Callable[[], object], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark history recording and frecency lookups")
+    parser.add_argument("-e", "--entries", type=int, default=100_000, help="directories in the history")
+    parser.add_argument("-n", "--iterations", type=int, default=1_000, help="operations per scenario")
+    args = parser.parse_args()
+
+    random.seed(0)
+    now = int(time.time())
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        handler = HistoryHandler(root)
+
+        # Existing directories near the top of the ranking, generated ones below
+        (root / "projects" / "warp-launcher").mkdir(parents=True)
+        entries = [HistoryEntry(str(root / "projects" / "warp-launcher"), 50.0, now)]
+        for index in range(args.entries - 1):
+            parts = random.choices(_WORDS, k=random.randint(2, 5))
+            entries.append(HistoryEntry(str(root / "repos" / f"project{index}" / "/".join(parts)), 1.0, now - index))
+
+        start = time.perf_counter()
+        handler._write_index(handler._age(entries, now))
+        print(f"compact {args.entries} entries: {(time.perf_counter() - start) * 1_000:.2f} ms")
+
+        scenarios = {
+            "lookup hit": lambda: handler.lookup("warp launcher", now),
+            "lookup miss": lambda: handler.lookup("does-not-exist", now),
+            "record": lambda: handler.record(root / "projects" / "warp-launcher", now),
+        }
+        for name, function in scenarios.items():
+            print(f"{name}: {_median(function, args.iterations) * 1_000_000:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TextIO
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# ruff: noqa: E402, T201
+from warp_launcher.config import Config
+from warp_launcher.constants import LOG_FORMAT
+from warp_launcher.dispatcher import RecordingDispatcher
+from warp_launcher.enums import LaunchMode
+from warp_launcher.launcher import Launcher
+from warp_launcher.logger import ColorFormatter, configure_logging, shutdown_logging
+
+_TERMINAL_WRITE_LATENCY = 0.0002
+
+
+class _TerminalStream(io.StringIO):
+    """Stream that blocks on every write like a console does, releasing the GIL meanwhile."""
+
+    def write(self, text: str) -> int:
+        time.sleep(_TERMINAL_WRITE_LATENCY)
+        return len(text)
+
+
+def _time(function: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+def _reset_root_logger() -> None:
+    shutdown_logging()
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    logging.disable(logging.NOTSET)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the logging overhead of the launch path with DEBUG off")
+    parser.add_argument("-n", "--iterations", type=int, default=2_000, help="launches per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir, open(os.devnull, "w", encoding="utf-8") as devnull:
+        launch_directory = Path(temp_dir)
+        config = Config("warp", LaunchMode.TAB, launch_directory)
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(launch_directory, config=config, dispatcher=dispatcher)
+
+        def launch() -> None:
+            # The setter and the hand-off log the same messages as a launch, without the history
+            launcher.launch_path = str(launch_directory)
+            launcher._dispatch(launch_directory)
+            dispatcher.uris.clear()
+
+        def disabled() -> None:
+            logging.disable(logging.CRITICAL)
+
+        def synchronous(stream: TextIO) -> Callable[[], None]:
+            def setup() -> None:
+                handler = logging.StreamHandler(stream)
+                handler.setFormatter(ColorFormatter(LOG_FORMAT))
+                logging.getLogger().addHandler(handler)
+                logging.getLogger().setLevel(logging.INFO)
+
+            return setup
+
+        def queued(stream: TextIO) -> Callable[[], None]:
+            return lambda: configure_logging(logging.INFO, stream=stream)
+
+        terminal = _TerminalStream()
+        setups = {
+            "logging disabled": disabled,
+            "synchronous handler, null device": synchronous(devnull),
+            "queue pipeline, null device": queued(devnull),
+            "synchronous handler, terminal": synchronous(terminal),
+            "queue pipeline, terminal": queued(terminal),
+        }
+        baseline = 0.0
+        for name, setup in setups.items():
+            _reset_root_logger()
+            setup()
+            elapsed = _time(launch, args.iterations)
+            baseline = baseline or elapsed
+            print(f"launch, {name}: {elapsed * 1_000_000:.2f} us (+{(elapsed - baseline) * 1_000_000:.2f} us)")
+        _reset_root_logger()
+
+        logger = logging.getLogger("warp_launcher.bench")
+        logger.setLevel(logging.INFO)
+        calls = {
+            "debug call, f-string": lambda: logger.debug(f"Loaded configuration '{config.to_dict()}'"),
+            "debug call, lazy": lambda: logger.debug("Loaded configuration '%s'", config),
+        }
+        for name, function in calls.items():
+            print(f"{name}: {_time(function, args.iterations) * 1_000_000:.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# Keep the install directory, the launch history and the daemon lookups of the CLI away from the real installation
+_INSTALL_ROOT = tempfile.TemporaryDirectory()
+os.environ["LOCALAPPDATA"] = _INSTALL_ROOT.name
+
+# ruff: noqa: E402, T201
+from warp_launcher.cli import main as cli_main
+from warp_launcher.coalesce import LaunchCoalescer
+from warp_launcher.config import Config, ConfigHandler, clear_config_cache
+from warp_launcher.dispatcher import DISPATCHERS, RecordingDispatcher
+from warp_launcher.enums import LaunchMode
+from warp_launcher.launcher import Launcher
+from warp_launcher.metrics import MetricsHandler
+from warp_launcher.registry import MemoryRegistryBackend
+from warp_launcher.script import ScriptHandler
+from warp_launcher.utils import (
+    merge_dicts,
+    validate_command_name,
+    validate_command_names,
+    validate_path,
+    validate_paths,
+)
+
+_DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+_IMPORTED_MODULES = {
+    "cli": ("warp_launcher", "warp_launcher.cli"),
+    "fastlaunch": ("warp_launcher", "warp_launcher.fastlaunch", "warp_launcher.daemon", "warp_launcher.launcher"),
+}
+
+
+class _Scenario:
+    def __init__(
+        self, function: Callable[[], object], setup: Callable[[], object] | None = None, in_process: bool = True
+    ) -> None:
+        self.function = function
+        self.setup = setup
+        self.in_process = in_process
+
+
+def _median(scenario: _Scenario, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        if scenario.setup:
+            scenario.setup()
+        start = time.perf_counter()
+        scenario.function()
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+def _peak_memory(scenario: _Scenario) -> int:
+    if scenario.setup:
+        scenario.setup()
+    tracemalloc.start()
+    try:
+        scenario.function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(src_path)}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _measure_import_time(modules: tuple[str, ...]) -> float:
+    """
+    Sum the cumulative import time in seconds of the modules reported by '-X importtime' in a new interpreter.
+    """
+    result = _run_python("-X", "importtime", "-c", f"import {', '.join(modules)}")
+
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() in modules:
+            total += int(cumulative)
+    return total / 1_000_000
+
+
+def _build_scenarios(root: Path) -> dict[str, _Scenario]:
+    install_directory = root / "install"
+    launch_directory = root / "projects" / "warp-launcher"
+    launch_directory.mkdir(parents=True)
+    config = Config("warp", LaunchMode.TAB, launch_directory)
+
+    config_handler = ConfigHandler(root / "config.json")
+    config_handler.save_config(config)
+    script_handler = ScriptHandler(root / "launcher.vbs")
+
+    registry_backend = MemoryRegistryBackend()
+
+    # Each claim is a second after the previous one, past the window, so every launch is recorded and none is dropped
+    coalescer = LaunchCoalescer(root, window=0.5)
+    claim_times = itertools.count(step=1_000_000_000)
+
+    def create_launcher() -> Launcher:
+        return Launcher(
+            install_directory,
+            config=Config("warp", LaunchMode.TAB, launch_directory),
+            dispatcher=RecordingDispatcher(),
+            registry_backend=registry_backend,
+        )
+
+    def install_setup() -> None:
+        create_launcher().install()
+
+    def uninstall_setup() -> None:
+        if install_directory.exists():
+            create_launcher().uninstall()
+
+    paths = [str(launch_directory), str(root / "missing"), "C:\\invalid|path"] * 100
+    names = ["warp", "warp-tab", "-invalid", "invalid name"] * 100
+    dict_a = {f"key{index}": index if index % 2 else None for index in range(100)}
+    dict_b = {f"key{index}": index for index in range(50, 150)}
+
+    # The recording dispatcher is not selectable by users, the benchmark registers it to time the CLI without launching
+    DISPATCHERS[RecordingDispatcher.name] = RecordingDispatcher
+    # The durations of a launch, the log is compacted every few hundred records as it is for real runs
+    metrics_handler = MetricsHandler(root)
+    launch_durations = {"total": 60_000, "imports": 40_000, "parse_arguments": 900, "run": 15_000, "dispatch": 9_000}
+
+    cli_arguments = ["-l", "-p", str(launch_directory), "--dispatcher", RecordingDispatcher.name]
+    cold_cli_code = (
+        "from warp_launcher.dispatcher import DISPATCHERS, RecordingDispatcher; "
+        "DISPATCHERS[RecordingDispatcher.name] = RecordingDispatcher; "
+        f"from warp_launcher.cli import main; main({cli_arguments!r})"
+    )
+
+    return {
+        "cli.main launch": _Scenario(lambda: cli_main(cli_arguments)),
+        "cli.main launch, cold process": _Scenario(
+            lambda: _run_python("-c", cold_cli_code),
+            in_process=False,
+        ),
+        "config load, cold": _Scenario(config_handler.load_config, clear_config_cache),
+        "config load, warm": _Scenario(config_handler.load_config, config_handler.load_config),
+        "script save": _Scenario(lambda: script_handler.save_script(config)),
+        "install, fresh": _Scenario(lambda: create_launcher().install(), uninstall_setup),
+        "install, up to date": _Scenario(lambda: create_launcher().install(), install_setup),
+        "uninstall": _Scenario(lambda: create_launcher().uninstall(), install_setup),
+        "coalesce claim": _Scenario(lambda: coalescer.claim("new_tab", launch_directory, now=next(claim_times))),
+        "metrics record": _Scenario(lambda: metrics_handler.record("launch", launch_durations)),
+        "merge_dicts": _Scenario(lambda: merge_dicts(dict_a, dict_b)),
+        "validate_path x300": _Scenario(lambda: [validate_path(path) for path in paths]),
+        "validate_paths x300": _Scenario(lambda: validate_paths(paths)),
+        "validate_command_name x400": _Scenario(lambda: [validate_command_name(name) for name in names]),
+        "validate_command_names x400": _Scenario(lambda: validate_command_names(names)),
+    }
+
+
+def run_suite(iterations: int) -> dict[str, dict[str, float]]:
+    """
+    Time every scenario, measure its peak traced memory, and the import time of the entry points.
+    """
+    results: dict[str, dict[str, float]] = {}
+
+    for name, modules in _IMPORTED_MODULES.items():
+        import_time = sorted(_measure_import_time(modules) for _ in range(5))[2]
+        results[f"import {name}"] = {"seconds": import_time}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, scenario in _build_scenarios(Path(temp_dir)).items():
+            if scenario.in_process:
+                results[name] = {"seconds": _median(scenario, iterations), "peak_bytes": _peak_memory(scenario)}
+            else:
+                # Dominated by the interpreter start up and invisible to tracemalloc, a few runs are enough
+                results[name] = {"seconds": _median(scenario, max(1, iterations // 20))}
+
+    return results
+
+
+def compare(baseline: dict[str, Any], results: dict[str, dict[str, float]], threshold: float) -> list[str]:
+    """
+    Return the metrics that regressed by more than the threshold, a fraction of the baseline value.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            baseline_value = baseline.get("results", {}).get(name, {}).get(metric)
+            if not baseline_value:
+                continue
+            change = value / baseline_value - 1
+            if change > threshold:
+                regressions.append(f"{name} {metric}: {baseline_value:.6g} -> {value:.6g} (+{change:.0%})")
+    return regressions
+
+
+def _format_result(name: str, metrics: dict[str, float]) -> str:
+    line = f"{name}: {metrics['seconds'] * 1_000_000:.2f} us"
+    if "peak_bytes" in metrics:
+        line += f", peak {metrics['peak_bytes'] / 1024:.1f} KiB"
+    return line
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the launch, install and configuration hot paths")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="runs per scenario, the median is kept")
+    parser.add_argument("--save", type=Path, nargs="?", const=_DEFAULT_BASELINE, help="save the results as a baseline")
+    parser.add_argument(
+        "--compare", type=Path, nargs="?", const=_DEFAULT_BASELINE, help="compare the results with a baseline"
+    )
+    parser.add_argument("--threshold", type=float, default=0.25, help="regression threshold (default: 0.25)")
+    args = parser.parse_args()
+
+    # Silence the CLI logs while keeping the console handler from being installed
+    logging.getLogger().addHandler(logging.NullHandler())
+
+    results = run_suite(args.iterations)
+    for name, metrics in results.items():
+        print(_format_result(name, metrics))
+
+    if args.save:
+        report = {"python": platform.python_version(), "platform": sys.platform, "results": results}
+        args.save.write_text(json.dumps(report, indent=4), encoding="utf-8")
+        print(f"Baseline saved to '{args.save}'")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+        print(f"No regression past {args.threshold:.0%} of '{args.compare}'")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add src to path so we can import our modules
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# ruff: noqa: E402, T201
+from warp_launcher.utils import validate_command_name, validate_command_names, validate_path, validate_paths
+
+
+def _time(function: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-item and bulk path and command name validation")
+    parser.add_argument("-c", "--candidates", type=int, default=5_000, help="candidates per validation")
+    parser.add_argument("-d", "--distinct", type=int, default=500, help="distinct paths among the candidates")
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="validations per scenario")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directories = []
+        for index in range(args.distinct):
+            directory = Path(temp_dir) / f"project{index}"
+            directory.mkdir()
+            directories.append(str(directory))
+
+        paths = [directories[index % args.distinct] for index in range(args.candidates)]
+        names = [f"warp-{index % args.distinct}" for index in range(args.candidates)]
+
+        scenarios = {
+            "paths, per item": lambda: [validate_path(path) for path in paths],
+            "paths, bulk": lambda: validate_paths(paths),
+            "command names, per item": lambda: [validate_command_name(name) for name in names],
+            "command names, bulk": lambda: validate_command_names(names),
+        }
+        for name, function in scenarios.items():
+            elapsed = _time(function, args.iterations)
+            print(f"{name}: {elapsed * 1_000:.2f} ms ({elapsed / args.candidates * 1_000_000:.2f} us per candidate)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import sys
+import time
 
-if sys.platform != "win32":
-    raise RuntimeError("Warp Launcher is only compatible with Windows")
+# Reference point of the timing report, the package is the first module imported by every entry point
+IMPORT_START_NS: int = time.perf_counter_ns()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from warp_launcher.config import Config
+from warp_launcher.constants import (
+    CONFIG_FILE_NAME,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_LAUNCH_CONCURRENCY,
+    INSTALL_DIRECTORY,
+    LAUNCHER_SCRIPT_NAME,
+)
+from warp_launcher.dispatcher import UriDispatcher
+from warp_launcher.launcher import Launcher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+    from warp_launcher.registry import RegistryBackend
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLauncher:
+    """
+    Asyncio interface of a Launcher for editors and tools that embed it in an event loop. Every blocking call, such
+    as the file and registry access or the URI hand-off, runs in the executor, the default one of the loop if none is
+    given, and goes through the same Launcher methods, so the launches behave exactly as the ones of the Launcher.
+    """
+
+    def __init__(self, launcher: Launcher, executor: Executor | None = None) -> None:
+        self.launcher = launcher
+        self._executor = executor
+
+    @classmethod
+    async def create(
+        cls,
+        install_directory: Path = INSTALL_DIRECTORY,
+        config_filename: str = CONFIG_FILE_NAME,
+        script_filename: str = LAUNCHER_SCRIPT_NAME,
+        config: Config | None = None,
+        dispatcher: UriDispatcher | None = None,
+        registry_backend: RegistryBackend | None = None,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        executor: Executor | None = None,
+    ) -> AsyncLauncher:
+        """
+        Create the launcher in the executor, loading the configuration file without blocking the event loop.
+        """
+        create_launcher = functools.partial(
+            Launcher,
+            install_directory,
+            config_filename,
+            script_filename,
+            config=config,
+            dispatcher=dispatcher,
+            registry_backend=registry_backend,
+            coalesce_window=coalesce_window,
+        )
+        launcher = await asyncio.get_running_loop().run_in_executor(executor, create_launcher)
+        return cls(launcher, executor)
+
+    @property
+    def config(self) -> Config:
+        return self.launcher.config
+
+    async def _run[T](self, function: Callable[..., T], *args: object) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(function, *args))
+
+    async def launch(
+        self,
+        *paths: str | Path,
+        max_concurrency: int = DEFAULT_LAUNCH_CONCURRENCY,
+        interval: float = 0.0,
+    ) -> list[Path]:
+        """
+        Launch warp at each path, or in the current working directory if no path is given. As with
+        Launcher.launch_many, the paths are validated before the first launch and duplicates are launched once.
+        max_concurrency bounds the validations that run at the same time, the slow part of a launch on network
+        shares. The hand-offs are made one at a time in the order of the paths, so the tabs and windows open in that
+        order, consecutive ones started at least interval seconds apart without holding an executor thread. Each path
+        is recorded in the history right after its hand-off.
+        """
+        if not paths:
+            return [await self.launch_warp()]
+
+        if interval < 0:
+            raise ValueError("Interval must not be negative")
+
+        launches = await self._run(self.launcher.resolve_launches, paths, max_concurrency)
+
+        logger.debug(
+            "Launching %d paths with concurrency %d and interval %ss", len(launches), max_concurrency, interval
+        )
+
+        failures = []
+        for index, (launch_path, launch_mode) in enumerate(launches):
+            if index and interval:
+                await asyncio.sleep(interval)
+            try:
+                await self._run(self.launcher.launch_at, launch_path, launch_mode)
+            except Exception as e:
+                failures.append(f"'{launch_path}': {e}")
+
+        if failures:
+            raise RuntimeError(f"Failed to launch {len(failures)} of {len(launches)} paths. {'; '.join(failures)}")
+
+        return [launch_path for launch_path, _ in launches]
+
+    async def launch_warp(self, working_directory: Path | None = None) -> Path:
+        """
+        Launch warp as Launcher.launch_warp does, the working directory is the current one of the caller by default.
+        """
+        working_directory = working_directory if working_directory else Path(os.getcwd())
+        return await self._run(self.launcher.launch_warp, working_directory)
+
+    async def load_config(self) -> Config:
+        """
+        Replace the configuration with the one of the configuration file.
+        """
+        return await self._run(self.launcher.reload_config)
+
+    async def save_config(self) -> None:
+        """
+        Save the configuration to the configuration file, without installing it.
+        """
+        await self._run(self.launcher.save_config)
+
+    async def set_launch_path(self, launch_path: str) -> None:
+        """
+        Validate and set the launch path, raise ValueError if it is invalid.
+        """
+        await self._run(setattr, self.launcher, "launch_path", launch_path)
+
+    async def check_install(self) -> list[str]:
+        return await self._run(self.launcher.check_install)
+
+    async def install(self) -> None:
+        await self._run(self.launcher.install)
+
+    async def uninstall(self) -> None:
+        await self._run(self.launcher.uninstall)
@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import IO, Any, Final
+
+from warp_launcher.constants import WRITE_LOCK_FILE_NAME
+
+# Attempts to replace a file held open by a reader on Windows, where the open files cannot be replaced
+_REPLACE_ATTEMPTS: Final[int] = 20
+_REPLACE_RETRY_DELAY: Final[float] = 0.005
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def lock_file(file_descriptor: int) -> None:
+        # The first byte stands for the whole file, the lock is retried for a few seconds before failing
+        os.lseek(file_descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(file_descriptor, msvcrt.LK_LOCK, 1)
+
+    def unlock_file(file_descriptor: int) -> None:
+        os.lseek(file_descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def lock_file(file_descriptor: int) -> None:
+        fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+
+    def unlock_file(file_descriptor: int) -> None:
+        fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+
+
+@contextmanager
+def locked(lock_file_path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on the lock file, shared by the processes and the threads that write next to it.
+    """
+    file_descriptor = os.open(lock_file_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        lock_file(file_descriptor)
+        try:
+            yield
+        finally:
+            unlock_file(file_descriptor)
+    finally:
+        os.close(file_descriptor)
+
+
+def replace_file(source_file_path: Path, target_file_path: Path) -> None:
+    """
+    Atomically replace the target with the source, retrying while a reader holds the target open on Windows.
+    """
+    for attempt in range(_REPLACE_ATTEMPTS):
+        try:
+            os.replace(source_file_path, target_file_path)
+            return
+        except PermissionError:
+            if sys.platform != "win32" or attempt == _REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(_REPLACE_RETRY_DELAY)
+
+
+@contextmanager
+def atomic_open(file_path: Path, lock: bool = True, mode: str = "w", **open_options: Any) -> Iterator[IO[Any]]:
+    """
+    Open a temporary file next to the target for writing, in text mode unless another mode is given, which replaces
+    the target at once when the block exits without error. Readers take no lock, they see either the previous content
+    or the new one, never a partial write. Writers hold the write lock of the directory, unless lock is False, so
+    concurrent writes are applied one by one.
+    """
+    temporary_file_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    with locked(file_path.with_name(WRITE_LOCK_FILE_NAME)) if lock else nullcontext():
+        try:
+            with temporary_file_path.open(mode, **open_options) as temporary_file:
+                yield temporary_file
+            replace_file(temporary_file_path, file_path)
+        except BaseException:
+            temporary_file_path.unlink(missing_ok=True)
+            raise
@@ -1,12 +1,61 @@
 import argparse
+import json
 import logging
+import os
 import sys
+import time
 from pathlib import Path
+from typing import Final
 
-from warp_launcher.constants import DEFAULT_COMMAND_NAME, DEFAULT_LAUNCH_MODE, DEFAULT_LAUNCH_PATH, LOG_LEVEL
-from warp_launcher.enums import LaunchMode
+from warp_launcher import IMPORT_START_NS
+from warp_launcher.constants import (
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_COMMAND_NAME,
+    DEFAULT_DISPATCHER,
+    DEFAULT_LAUNCH_CONCURRENCY,
+    DEFAULT_LAUNCH_MODE,
+    DEFAULT_LAUNCH_PATH,
+    DEFAULT_TIMEOUT_POLICY,
+    INSTALL_DIRECTORY,
+    LAUNCHER_SCRIPT_NAME,
+    LOG_FILE_NAME,
+    LOG_JSONL_FILE_NAME,
+    LOG_LEVEL,
+    MANIFEST_FILE_NAME,
+    PATH_PROBE_TIMEOUT,
+    PROFILE_FILE_NAME,
+)
+from warp_launcher.dispatcher import DISPATCHERS, get_dispatcher
+from warp_launcher.enums import FleetStatus, LaunchMode, LogFileFormat, ProbeStatus, TimeoutPolicy
 from warp_launcher.launcher import Launcher
-from warp_launcher.logger import configure_logging
+from warp_launcher.logger import configure_logging, shutdown_logging
+from warp_launcher.tracing import (
+    Tracer,
+    disable_phase_recording,
+    disable_tracing,
+    enable_phase_recording,
+    enable_tracing,
+    run_profiled,
+    span,
+)
+
+# Names of the script targets, listed without importing the script module
+_SCRIPT_TARGET_NAMES: Final[tuple[str, ...]] = ("vbs", "cmd", "sh")
+_FASTEST_SCRIPT_TARGET: Final[str] = "fastest"
+
+# Actions whose durations are recorded, besides the install and its check
+_RECORDED_ACTIONS: Final[tuple[str, ...]] = ("launch", "uninstall", "install_manifest", "doctor", "stop_daemon")
+
+# Spans summed into the phases recorded for every run, by phase, the other spans are only timed while tracing
+_RECORDED_PHASES: Final[dict[str, str]] = {
+    "config.load": "config",
+    "reachability.check_launch_path": "validate",
+    "reachability.validate_paths": "validate",
+    "launcher.dispatch": "dispatch",
+}
+
+# Failed and timed out health checks are logged as errors
+_PROBE_LOG_LEVELS: Final[dict[ProbeStatus, int]] = {ProbeStatus.OK: logging.INFO, ProbeStatus.WARNING: logging.WARNING}
 
 
 class _SingleLineFormatter(argparse.HelpFormatter):
@@ -39,20 +88,157 @@ def parse_cli_arguments(args: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument(
         "-p",
         "--path",
+        type=str,
+        action="append",
+        help=f"initial path, repeat it to launch several (default: '{DEFAULT_LAUNCH_PATH}' for current directory)",
+    )
+
+    parser.add_argument(
+        "--paths-file",
+        type=str,
+        metavar="FILE",
+        help="launch the paths listed in a file, one per line ('-' to read them from stdin)",
+    )
+
+    parser.add_argument(
+        "--jump",
+        type=str,
+        metavar="QUERY",
+        help="launch the most frecent directory of the launch history that matches the query",
+    )
+
+    parser.add_argument(
+        "--layout",
         type=Path,
-        help=f"initial path (default: '{DEFAULT_LAUNCH_PATH}' for current directory)",
+        metavar="FILE",
+        help="launch the windows, tabs and panes described in a JSON layout file",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=f"maximum simultaneous path checks or fleet installations (default: {DEFAULT_LAUNCH_CONCURRENCY})",
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        metavar="SECONDS",
+        help="minimum delay between launches when launching several paths (default: 0)",
+    )
+
+    parser.add_argument(
+        "--coalesce-window",
+        type=float,
+        metavar="SECONDS",
+        help=f"drop a launch repeated within this delay, 0 disables it (default: {DEFAULT_COALESCE_WINDOW})",
+    )
+
+    parser.add_argument(
+        "--path-timeout",
+        type=float,
+        metavar="SECONDS",
+        help=f"maximum wait for a launch path to answer, such as a network drive (default: {PATH_PROBE_TIMEOUT:g})",
+    )
+
+    parser.add_argument(
+        "--on-timeout",
+        choices=[str(timeout_policy) for timeout_policy in TimeoutPolicy],
+        help=f"launch an unanswering path anyway, in the home directory, or fail (default: {DEFAULT_TIMEOUT_POLICY})",
+    )
+
+    parser.add_argument(
+        "--dispatcher",
+        choices=list(DISPATCHERS),
+        help=f"select how the Warp URI is handed off (default: {DEFAULT_DISPATCHER})",
+    )
+
+    parser.add_argument(
+        "--script-target",
+        choices=[*_SCRIPT_TARGET_NAMES, _FASTEST_SCRIPT_TARGET],
+        help=f"with install, select the launcher script host, '{_FASTEST_SCRIPT_TARGET}' measures them (default: vbs)",
+    )
+
+    parser.add_argument(
+        "--alias",
+        type=str,
+        action="append",
+        metavar="NAME=MODE[:PATH]",
+        help="with install, add a command with its own mode and path, repeat it to add several",
+    )
+
+    parser.add_argument(
+        "--remove-alias",
+        type=str,
+        action="append",
+        metavar="NAME",
+        help="with install, remove a command added as an alias",
+    )
+
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="with install, report the differences with the current installation without writing anything",
+    )
+
+    parser.add_argument(
+        "--context-menu",
+        action="store_true",
+        help="with install, also add an 'Open in Warp' verb to the Explorer menu of folders, for one or several",
     )
 
     parser.add_argument("-v", "--verbose", action="store_true", help="enable detailed logging")
 
+    parser.add_argument(
+        "--log-file",
+        choices=[str(log_file_format) for log_file_format in LogFileFormat],
+        help="also write the logs to a rotating text or JSON lines file in the installation directory",
+    )
+
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="print a JSON report with the duration of each phase to stderr",
+    )
+
+    parser.add_argument(
+        "--export-metrics",
+        type=Path,
+        metavar="FILE",
+        help="with stats, also write the latency histograms to an OpenMetrics text file",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"save a cProfile and peak memory report to '{PROFILE_FILE_NAME}' in the installation directory",
+    )
+
     action_group = parser.add_mutually_exclusive_group()
     action_group.add_argument("-l", "--launch", action="store_true", help="launch Warp with the current configuration")
     action_group.add_argument(
         "-i", "--install", action="store_true", help="install the launcher and configuration files"
     )
+    action_group.add_argument(
+        "--install-manifest",
+        type=Path,
+        metavar="FILE",
+        help="install every entry of a JSON fleet manifest in parallel, rolling back the ones that fail",
+    )
     action_group.add_argument(
         "-u", "--uninstall", action="store_true", help="remove the launcher and configuration files"
     )
+    action_group.add_argument(
+        "-d", "--daemon", action="store_true", help="run a launch daemon that keeps the configuration loaded"
+    )
+    action_group.add_argument("--stop-daemon", action="store_true", help="stop the running launch daemon")
+    action_group.add_argument(
+        "--watch", action="store_true", help="apply the changes of the configuration file as soon as it is saved"
+    )
+    action_group.add_argument("--doctor", action="store_true", help="check the health of the installation")
+    action_group.add_argument(
+        "--stats", action="store_true", help="print the latency percentiles of the recorded actions and phases"
+    )
 
     # Use command-line args if not provided
     if args is None:
@@ -68,17 +254,185 @@ def parse_cli_arguments(args: list[str] | None = None) -> argparse.Namespace:
 
 def main(args: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
+    parse_start = time.perf_counter_ns()
     parsed_args = parse_cli_arguments(args)
+    parse_end = time.perf_counter_ns()
+
+    try:
+        if getattr(parsed_args, "profile", False):
+            return run_profiled(
+                lambda: _run_traced(parsed_args, parse_start, parse_end), INSTALL_DIRECTORY / PROFILE_FILE_NAME
+            )
+
+        return _run_traced(parsed_args, parse_start, parse_end)
+    finally:
+        # Write the logs still queued before returning
+        shutdown_logging()
+
 
+def _run_traced(parsed_args: argparse.Namespace, parse_start: int, parse_end: int) -> int:
+    """
+    Run the action, recording its duration and the one of its main phases in the latency histograms of the action.
+    The main phases are timed on every run, the other spans are only traced, and reported with the trace option,
+    while tracing or profiling.
+    """
+    is_traced = getattr(parsed_args, "trace", False)
+    action_name = _get_action_name(parsed_args)
+    recorder = enable_phase_recording(_RECORDED_PHASES) if action_name else None
+    tracer = None
+    if is_traced or getattr(parsed_args, "profile", False):
+        # The imports and the argument parsing happen before the arguments tell whether to trace
+        tracer = enable_tracing()
+        tracer.add_span("imports", IMPORT_START_NS, parse_start)
+        tracer.add_span("parse_arguments", parse_start, parse_end)
+
+    run_start = time.perf_counter_ns()
+    try:
+        return _run(parsed_args)
+    finally:
+        run_end = time.perf_counter_ns()
+        if tracer:
+            disable_tracing()
+            if is_traced:
+                _write_trace_report(tracer)
+        if action_name and recorder:
+            disable_phase_recording()
+            if tracer:
+                recorder.add_spans(tracer.spans)
+            _record_metrics(
+                action_name,
+                {
+                    "imports": parse_start - IMPORT_START_NS,
+                    "parse_arguments": parse_end - parse_start,
+                    "run": run_end - run_start,
+                    **recorder.durations,
+                },
+            )
+
+
+def _run(parsed_args: argparse.Namespace) -> int:
+    """
+    Run the action selected by the parsed arguments.
+    """
     # Set the log level based on verbosity
     log_level = logging.DEBUG if getattr(parsed_args, "verbose", False) else LOG_LEVEL
-    configure_logging(level=log_level)
+    log_file_format = LogFileFormat.from_value(getattr(parsed_args, "log_file", None))
+    with span("configure_logging"):
+        if log_file_format:
+            configure_logging(log_level, _get_log_file_path(log_file_format), log_file_format)
+        else:
+            configure_logging(level=log_level)
 
     logger = logging.getLogger(__name__)
     logger.debug("Executing main function with args: %s", parsed_args)
 
     try:
-        launcher = Launcher()
+        if log_file_format and getattr(parsed_args, "uninstall", False):
+            raise ValueError("A log file cannot be used with the uninstall action")
+
+        if getattr(parsed_args, "check", False) and not getattr(parsed_args, "install", False):
+            raise ValueError("The check option can only be used with the install action")
+
+        if getattr(parsed_args, "context_menu", False) and not getattr(parsed_args, "install", False):
+            raise ValueError("The context menu option can only be used with the install action")
+
+        if (hasattr(parsed_args, "alias") or hasattr(parsed_args, "remove_alias")) and not getattr(
+            parsed_args, "install", False
+        ):
+            raise ValueError("Aliases can only be changed with the install action")
+
+        with span("read_launch_paths"):
+            launch_paths = _read_launch_paths(parsed_args)
+        is_batch_launch = len(launch_paths) > 1 or hasattr(parsed_args, "paths_file")
+
+        jump_query = getattr(parsed_args, "jump", None)
+        if jump_query is not None:
+            if not getattr(parsed_args, "launch", False):
+                raise ValueError("A jump can only be used with the launch action")
+            if launch_paths:
+                raise ValueError("A jump cannot be combined with launch paths")
+
+            with span("jump"):
+                from warp_launcher.history import HistoryHandler
+
+                jump_path = HistoryHandler(INSTALL_DIRECTORY).lookup(jump_query)
+            if not jump_path:
+                raise ValueError(f"No directory in the launch history matches '{jump_query}'")
+            launch_paths = [str(jump_path)]
+
+        layout_file_path = getattr(parsed_args, "layout", None)
+
+        if (
+            getattr(parsed_args, "launch", False)
+            and not is_batch_launch
+            and not layout_file_path
+            and not hasattr(parsed_args, "coalesce_window")
+            and not hasattr(parsed_args, "path_timeout")
+            and not hasattr(parsed_args, "on_timeout")
+            and _forward_to_daemon(parsed_args, launch_paths[0] if launch_paths else None)
+        ):
+            return 0
+
+        if getattr(parsed_args, "daemon", False):
+            from warp_launcher.daemon import LaunchDaemon
+
+            LaunchDaemon(dispatcher=get_dispatcher(getattr(parsed_args, "dispatcher", None))).serve_forever()
+            return 0
+
+        if getattr(parsed_args, "stop_daemon", False):
+            from warp_launcher.daemon import stop_daemon
+
+            if not stop_daemon():
+                logger.info("Launch daemon is not running")
+            return 0
+
+        if getattr(parsed_args, "watch", False):
+            from warp_launcher.watch import ConfigWatcher
+
+            ConfigWatcher().watch_forever()
+            return 0
+
+        if getattr(parsed_args, "doctor", False):
+            return _run_doctor()
+
+        export_file_path = getattr(parsed_args, "export_metrics", None)
+        if export_file_path and not getattr(parsed_args, "stats", False):
+            raise ValueError("The metrics can only be exported with the stats action")
+
+        if getattr(parsed_args, "stats", False):
+            return _print_stats(export_file_path)
+
+        fleet_file_path = getattr(parsed_args, "install_manifest", None)
+        script_target = getattr(parsed_args, "script_target", None)
+        if script_target and not (getattr(parsed_args, "install", False) or fleet_file_path):
+            raise ValueError("A script target can only be used with the install action")
+
+        if fleet_file_path:
+            if launch_paths or hasattr(parsed_args, "command") or hasattr(parsed_args, "mode"):
+                raise ValueError("The install manifest defines the command, mode and path of each installation")
+            return _install_fleet(
+                fleet_file_path,
+                getattr(parsed_args, "concurrency", DEFAULT_LAUNCH_CONCURRENCY),
+                _get_script_filename(script_target),
+            )
+
+        if script_target:
+            script_filename = _get_script_filename(script_target)
+        elif getattr(parsed_args, "install", False) or getattr(parsed_args, "uninstall", False):
+            # Keep the script target of the installation, another script would replace the installed one
+            script_filename = _get_installed_script_filename()
+        else:
+            script_filename = LAUNCHER_SCRIPT_NAME
+
+        timeout_policy = TimeoutPolicy.from_value(getattr(parsed_args, "on_timeout", None)) or DEFAULT_TIMEOUT_POLICY
+        with span("create_launcher"):
+            launcher = Launcher(
+                script_filename=script_filename,
+                dispatcher=get_dispatcher(getattr(parsed_args, "dispatcher", None)),
+                coalesce_window=getattr(parsed_args, "coalesce_window", DEFAULT_COALESCE_WINDOW),
+                path_timeout=getattr(parsed_args, "path_timeout", PATH_PROBE_TIMEOUT),
+                timeout_policy=timeout_policy,
+            )
 
         if getattr(parsed_args, "command", None):
             launcher.command_name = parsed_args.command
@@ -86,13 +440,39 @@ def main(args: list[str] | None = None) -> int:
         if getattr(parsed_args, "mode", None):
             launcher.launch_mode = parsed_args.mode
 
-        if getattr(parsed_args, "path", None):
-            launcher.launch_path = parsed_args.path
+        if len(launch_paths) == 1 and not is_batch_launch:
+            launcher.launch_path = launch_paths[0]
+
+        # Applied after the main command settings, which the aliases inherit
+        for command_name in getattr(parsed_args, "remove_alias", []):
+            launcher.remove_alias(command_name)
+
+        for alias in getattr(parsed_args, "alias", []):
+            launcher.add_alias(*_parse_alias(alias))
 
-        if getattr(parsed_args, "launch", False):
+        if layout_file_path and not getattr(parsed_args, "launch", False):
+            raise ValueError("A layout can only be used with the launch action")
+
+        if layout_file_path:
+            from warp_launcher.layout import LayoutHandler
+
+            launcher.launch_layout(LayoutHandler.load_layout(layout_file_path))
+        elif getattr(parsed_args, "launch", False) and is_batch_launch:
+            launcher.launch_many(
+                launch_paths,
+                getattr(parsed_args, "concurrency", DEFAULT_LAUNCH_CONCURRENCY),
+                getattr(parsed_args, "interval", 0.0),
+            )
+        elif getattr(parsed_args, "launch", False):
             launcher.launch_warp()
+        elif is_batch_launch:
+            raise ValueError("Several paths can only be used with the launch action")
+        elif getattr(parsed_args, "install", False) and getattr(parsed_args, "check", False):
+            return _check_install(launcher)
         elif getattr(parsed_args, "install", False):
             launcher.install()
+            if getattr(parsed_args, "context_menu", False):
+                launcher.install_context_menu()
         elif getattr(parsed_args, "uninstall", False):
             launcher.uninstall()
     except Exception as e:
@@ -100,3 +480,234 @@ def main(args: list[str] | None = None) -> int:
         return 1
 
     return 0
+
+
+def _get_script_filename(script_target: str | None) -> str:
+    """
+    Build the launcher script filename of the script target, measuring the available targets to pick the fastest.
+    """
+    if not script_target:
+        return LAUNCHER_SCRIPT_NAME
+
+    from warp_launcher.config import Config
+    from warp_launcher.script import get_available_script_targets, get_script_target, measure_script_targets
+
+    if script_target == _FASTEST_SCRIPT_TARGET:
+        logger = logging.getLogger(__name__)
+
+        config = Config(DEFAULT_COMMAND_NAME, DEFAULT_LAUNCH_MODE, DEFAULT_LAUNCH_PATH)
+        latencies = measure_script_targets(config, get_available_script_targets())
+        if not latencies:
+            raise RuntimeError("No script target is available on this system")
+
+        for name, latency in latencies.items():
+            logger.info("Script target '%s': %.2f ms", name, latency * 1000)
+        script_target = next(iter(latencies))
+        logger.info("Using the fastest script target '%s'", script_target)
+
+    return Path(LAUNCHER_SCRIPT_NAME).with_suffix(get_script_target(script_target).extension).name
+
+
+def _get_installed_script_filename() -> str:
+    """
+    Return the launcher script filename of the installation, recorded in its install manifest.
+    """
+    from warp_launcher.manifest import ManifestHandler
+
+    return ManifestHandler(INSTALL_DIRECTORY / MANIFEST_FILE_NAME).load_script_filename() or LAUNCHER_SCRIPT_NAME
+
+
+def _parse_alias(alias: str) -> tuple[str, str | None, str | None]:
+    """
+    Split an alias option into its command name, launch mode and launch path, the ones left empty are inherited.
+    The path is everything after the mode, so it can contain a drive colon.
+    """
+    command_name, _, settings = alias.partition("=")
+    launch_mode, _, launch_path = settings.partition(":")
+    return command_name, launch_mode or None, launch_path or None
+
+
+def _get_log_file_path(log_file_format: LogFileFormat) -> Path:
+    log_file_name = LOG_JSONL_FILE_NAME if log_file_format == LogFileFormat.JSONL else LOG_FILE_NAME
+    return INSTALL_DIRECTORY / log_file_name
+
+
+def _get_action_name(parsed_args: argparse.Namespace) -> str | None:
+    """
+    Name the action whose durations are recorded, None for the long-running and the reporting ones.
+    """
+    if getattr(parsed_args, "install", False):
+        return "check" if getattr(parsed_args, "check", False) else "install"
+
+    for action_name in _RECORDED_ACTIONS:
+        if getattr(parsed_args, action_name, None):
+            return action_name
+    return None
+
+
+def _record_metrics(action_name: str, phase_durations: dict[str, int]) -> None:
+    """
+    Record the end-to-end duration of the action and the duration of its phases, given in nanoseconds, in
+    microseconds.
+    """
+    from warp_launcher.metrics import TOTAL_PHASE, MetricsHandler
+
+    durations = {TOTAL_PHASE: (time.perf_counter_ns() - IMPORT_START_NS) // 1000}
+    for phase, duration in phase_durations.items():
+        durations[phase] = duration // 1000
+
+    MetricsHandler(INSTALL_DIRECTORY).record(action_name, durations)
+
+
+def _print_stats(export_file_path: Path | None) -> int:
+    """
+    Report the latency percentiles of each recorded action and phase, and export them if requested.
+    """
+    from warp_launcher.metrics import MetricsHandler
+
+    logger = logging.getLogger(__name__)
+
+    metrics_handler = MetricsHandler(INSTALL_DIRECTORY)
+    histograms = metrics_handler.load_histograms()
+    if not histograms:
+        logger.info("No durations recorded yet")
+
+    for (action_name, phase), histogram in histograms.items():
+        logger.info(
+            "%-16s %-32s %6d runs  p50 %9.2f ms  p95 %9.2f ms  p99 %9.2f ms",
+            action_name,
+            phase,
+            histogram.count,
+            histogram.get_quantile(0.5) / 1000,
+            histogram.get_quantile(0.95) / 1000,
+            histogram.get_quantile(0.99) / 1000,
+        )
+
+    if export_file_path:
+        metrics_handler.export_openmetrics(export_file_path)
+        logger.info("Metrics exported to '%s'", export_file_path)
+    return 0
+
+
+def _write_trace_report(tracer: Tracer) -> None:
+    """
+    Print the timing report to stderr, keeping stdout for the logs.
+    """
+    sys.stderr.write(json.dumps(tracer.to_dict(), indent=2) + "\n")
+
+
+def _forward_to_daemon(parsed_args: argparse.Namespace, launch_path: str | None) -> bool:
+    """
+    Forward the launch to the running daemon, return False if it should be handled in-process.
+    """
+    logger = logging.getLogger(__name__)
+
+    with span("forward_to_daemon"):
+        from warp_launcher.daemon import forward_launch
+
+        forwarded_path = forward_launch(
+            INSTALL_DIRECTORY,
+            Path(os.getcwd()),
+            getattr(parsed_args, "mode", None),
+            launch_path,
+            getattr(parsed_args, "dispatcher", None),
+        )
+    if forwarded_path is None:
+        logger.debug("Launch daemon is not available, launching in-process")
+        return False
+
+    logger.info("Warp launched by the daemon at '%s'", forwarded_path)
+    return True
+
+
+def _check_install(launcher: Launcher) -> int:
+    """
+    Report the differences with the current installation, return 1 if the installation is not up to date.
+    """
+    logger = logging.getLogger(__name__)
+
+    changes = launcher.check_install()
+    for change in changes:
+        logger.info(change)
+
+    if changes:
+        logger.info("Installation is not up to date, %d change(s) would be applied", len(changes))
+        return 1
+
+    logger.info("Installation is up to date")
+    return 0
+
+
+def _install_fleet(fleet_file_path: Path, max_workers: int, script_filename: str) -> int:
+    """
+    Install the entries of the fleet manifest and report the result of each one, return 1 if any of them failed.
+    """
+    from warp_launcher.fleet import FleetHandler
+
+    logger = logging.getLogger(__name__)
+
+    results = FleetHandler(script_filename=script_filename).provision_fleet(fleet_file_path, max_workers)
+    for result in results:
+        if result.status == FleetStatus.INSTALLED:
+            logger.info("Entry %d '%s': %s", result.index, result.install_directory, result.status)
+        else:
+            logger.error("Entry %d '%s': %s. %s", result.index, result.install_directory, result.status, result.error)
+
+    installed = sum(result.status == FleetStatus.INSTALLED for result in results)
+    logger.info("%d of %d installations completed successfully", installed, len(results))
+    return 0 if installed == len(results) else 1
+
+
+def _run_doctor() -> int:
+    """
+    Report the result and the duration of each health check, return 1 if any of them failed.
+    """
+    from warp_launcher.doctor import Doctor
+
+    logger = logging.getLogger(__name__)
+
+    report = Doctor().run()
+    if report.cached:
+        logger.info("Results of the checks made %.1f s ago", (time.time_ns() - report.checked) / 1_000_000_000)
+
+    for result in report.results:
+        logger.log(
+            _PROBE_LOG_LEVELS.get(result.status, logging.ERROR),
+            "%-12s %-8s %8.1f ms  %s",
+            result.name,
+            result.status,
+            result.duration * 1000,
+            result.detail,
+        )
+
+    if not report.is_healthy():
+        logger.error("The installation has problems")
+        return 1
+
+    logger.info("The installation is healthy")
+    return 0
+
+
+def _read_launch_paths(parsed_args: argparse.Namespace) -> list[str]:
+    """
+    Collect the paths given with the path option followed by the ones listed in the paths file.
+    """
+    launch_paths: list[str] = list(getattr(parsed_args, "path", []))
+
+    paths_file = getattr(parsed_args, "paths_file", None)
+    if not paths_file:
+        return launch_paths
+
+    try:
+        if paths_file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(paths_file).read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise RuntimeError(f"Error reading paths file '{paths_file}': {e}") from e
+
+    launch_paths.extend(line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#"))
+    if not launch_paths:
+        raise ValueError(f"No paths found in '{paths_file}'")
+
+    return launch_paths
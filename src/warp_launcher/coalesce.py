@@ -0,0 +1,205 @@
+import logging
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from warp_launcher.atomic import lock_file, unlock_file
+from warp_launcher.constants import (
+    COALESCE_FILE_NAME,
+    DEFAULT_COALESCE_WINDOW,
+    INSTALL_DIRECTORY,
+    SELECTION_BATCH_MAX_WAIT,
+    SELECTION_BATCH_WINDOW,
+    SELECTION_FILE_NAME,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _read_lines(file_descriptor: int) -> list[str]:
+    chunks = []
+    os.lseek(file_descriptor, 0, os.SEEK_SET)
+    while chunk := os.read(file_descriptor, 4096):
+        chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8", errors="replace").splitlines()
+
+
+def _write_lines(file_descriptor: int, lines: list[str]) -> None:
+    content = "".join(f"{line}\n" for line in lines).encode("utf-8")
+    os.lseek(file_descriptor, 0, os.SEEK_SET)
+    os.write(file_descriptor, content)
+    os.ftruncate(file_descriptor, len(content))
+
+
+class LaunchCoalescer:
+    """
+    Drops the launches identical to one dispatched moments before, by this or another process. The recent launches
+    are kept in a small file, read and rewritten under an exclusive lock on the same file.
+    """
+
+    def __init__(self, install_directory: Path = INSTALL_DIRECTORY, window: float = DEFAULT_COALESCE_WINDOW) -> None:
+        self.record_file_path: Path = install_directory / COALESCE_FILE_NAME
+        self.window = window
+
+    def claim(self, launch_mode: str, launch_path: Path | str, now: int | None = None) -> bool:
+        """
+        Record the launch and return True, or return False if the same launch was recorded within the window.
+        Errors are logged and the launch is allowed, coalescing never fails a launch.
+        """
+        if self.window <= 0:
+            return True
+
+        key = self._get_key(launch_mode, launch_path)
+        if not key:
+            return True
+
+        current_time = now if now is not None else time.time_ns()
+        return self._update(lambda file_descriptor: self._claim(file_descriptor, key, current_time), True)
+
+    def release(self, launch_mode: str, launch_path: Path | str) -> None:
+        """
+        Forget a claimed launch that could not be dispatched, so the next identical launch is not dropped.
+        """
+        key = self._get_key(launch_mode, launch_path)
+        if self.window > 0 and key:
+            self._update(lambda file_descriptor: self._release(file_descriptor, key), None)
+
+    @staticmethod
+    def _get_key(launch_mode: str, launch_path: Path | str) -> str | None:
+        key = f"{launch_mode}\t{os.path.abspath(launch_path)}"
+        return key if "\n" not in key else None
+
+    def _update[T](self, update: Callable[[int], T], default: T) -> T:
+        """
+        Apply the update to the record file under its lock, errors are logged and the default is returned.
+        """
+        try:
+            file_descriptor = os.open(self.record_file_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+        except OSError as e:
+            logger.debug("Launch not coalesced: %s", e)
+            return default
+
+        try:
+            lock_file(file_descriptor)
+            try:
+                return update(file_descriptor)
+            finally:
+                unlock_file(file_descriptor)
+        except (OSError, ValueError) as e:
+            logger.debug("Launch not coalesced: %s", e)
+            return default
+        finally:
+            os.close(file_descriptor)
+
+    def _claim(self, file_descriptor: int, key: str, now: int) -> bool:
+        window = int(self.window * 1_000_000_000)
+
+        # Each line holds the dispatch time in nanoseconds and the key, the expired ones are dropped
+        recent_lines = []
+        for line in _read_lines(file_descriptor):
+            timestamp, _, recorded_key = line.partition(" ")
+            if not timestamp.isdigit() or abs(now - int(timestamp)) >= window:
+                continue
+            if recorded_key == key:
+                return False
+            recent_lines.append(line)
+
+        recent_lines.append(f"{now} {key}")
+        _write_lines(file_descriptor, recent_lines)
+        return True
+
+    @staticmethod
+    def _release(file_descriptor: int, key: str) -> None:
+        lines = _read_lines(file_descriptor)
+        recent_lines = [line for line in lines if line.partition(" ")[2] != key]
+        if len(recent_lines) != len(lines):
+            _write_lines(file_descriptor, recent_lines)
+
+
+class LaunchBatcher:
+    """
+    Gathers the directories of a multiple selection, which Explorer hands to one process per directory, so a single
+    process launches all of them. The first process of a selection becomes the leader: it waits until no directory
+    has been added for the batch window, then takes the batch. The other processes add their directory and exit.
+    """
+
+    def __init__(
+        self,
+        install_directory: Path = INSTALL_DIRECTORY,
+        window: float = SELECTION_BATCH_WINDOW,
+        max_wait: float = SELECTION_BATCH_MAX_WAIT,
+    ) -> None:
+        self.batch_file_path: Path = install_directory / SELECTION_FILE_NAME
+        self.window = window
+        self.max_wait = max_wait
+
+    def submit(self, launch_path: Path | str) -> list[Path]:
+        """
+        Add the path to the current batch. Return the paths of the whole batch when this process leads it, or an
+        empty list when another process launches them. Errors are logged and the path is launched alone.
+        """
+        path = os.path.abspath(launch_path)
+        if "\n" in path:
+            return [Path(path)]
+
+        try:
+            file_descriptor = os.open(self.batch_file_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+        except OSError as e:
+            logger.debug("Selection not batched: %s", e)
+            return [Path(path)]
+
+        try:
+            if not self._join(file_descriptor, path, time.time_ns()):
+                return []
+            return self._gather(file_descriptor)
+        except (OSError, ValueError) as e:
+            logger.debug("Selection not batched: %s", e)
+            return [Path(path)]
+        finally:
+            os.close(file_descriptor)
+
+    def _join(self, file_descriptor: int, path: str, now: int) -> bool:
+        """
+        Add the path to the batch, return True if this process leads it.
+        """
+        lock_file(file_descriptor)
+        try:
+            lines = _read_lines(file_descriptor)
+
+            # Each line holds the time the path was added in nanoseconds, the first line is the one of the leader
+            timestamp = lines[0].partition(" ")[0] if lines else ""
+            leader_timeout = int((self.max_wait + self.window) * 2 * 1_000_000_000)
+            is_leader_alive = timestamp.isdigit() and now - int(timestamp) < leader_timeout
+            if is_leader_alive:
+                lines.append(f"{now} {path}")
+            else:
+                # A leader that died before taking its batch leaves it to the next process
+                lines = [f"{now} {path}", *lines]
+
+            _write_lines(file_descriptor, lines)
+            return not is_leader_alive
+        finally:
+            unlock_file(file_descriptor)
+
+    def _gather(self, file_descriptor: int) -> list[Path]:
+        deadline = time.monotonic() + self.max_wait
+        count = 1
+        while True:
+            time.sleep(self.window)
+
+            lock_file(file_descriptor)
+            try:
+                lines = _read_lines(file_descriptor)
+                if len(lines) > count and time.monotonic() < deadline:
+                    count = len(lines)
+                    continue
+
+                # The batch is taken, the next selection starts a new one
+                _write_lines(file_descriptor, [])
+            finally:
+                unlock_file(file_descriptor)
+
+            paths = [Path(line.partition(" ")[2]) for line in lines if line.partition(" ")[2]]
+            logger.debug("Launching a selection of %d paths", len(paths))
+            return list(dict.fromkeys(paths))
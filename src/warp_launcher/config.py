@@ -1,45 +1,80 @@
 import json
 import logging
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Final
 
+from warp_launcher.atomic import atomic_open, locked
 from warp_launcher.constants import (
+    CONFIG_SNAPSHOT_SUFFIX,
     DEFAULT_COMMAND_NAME,
     DEFAULT_LAUNCH_MODE,
     DEFAULT_LAUNCH_PATH,
     PARENT_PROCESS_IDENTIFIER,
+    PATH_PROBE_TIMEOUT,
+    WRITE_LOCK_FILE_NAME,
 )
 from warp_launcher.enums import LaunchMode
-from warp_launcher.utils import merge_dicts, validate_command_name, validate_path
+from warp_launcher.tracing import traced
+from warp_launcher.utils import StatKey, get_stat_key, merge_dicts, string_to_path, validate_command_name, validate_path
 
 _COMMAND_NAME_KEY: Final[str] = "commandName"
 _LAUNCH_MODE_KEY: Final[str] = "launchMode"
 _LAUNCH_PATH_KEY: Final[str] = "launchPath"
+_ALIASES_KEY: Final[str] = "aliases"
+
+# Settings a directory can override, the command name is registered once for all the directories
+_OVERRIDABLE_KEYS: Final[tuple[str, ...]] = (_LAUNCH_MODE_KEY, _LAUNCH_PATH_KEY)
+
+_SNAPSHOT_HEADER: Final[str] = "warp-launcher-config-snapshot 2"
+# Lines of the snapshot before the aliases, each alias then takes a line for its name, its mode and its path
+_SNAPSHOT_MAIN_LINES: Final[int] = 5
+_SNAPSHOT_ALIAS_LINES: Final[int] = 3
+
+# Validated configurations of this process by configuration file path
+_config_cache: dict[Path, tuple[StatKey, "Config"]] = {}
 
 logger = logging.getLogger(__name__)
 
 
+def clear_config_cache() -> None:
+    """
+    Forget the configurations validated by this process.
+    """
+    _config_cache.clear()
+
+
 @dataclass
 class Config:
     command_name: str
     launch_mode: LaunchMode
     launch_path: Path
+    # Other commands of the same installation, each one with its own launch mode and path
+    aliases: list["Config"] = field(default_factory=list)
 
-    def to_dict(self) -> dict[str, str]:
+    def to_dict(self) -> dict[str, Any]:
         """
         Convert the Config instance to a dictionary for JSON serialization.
         """
-        return {
+        config_dict: dict[str, Any] = {
             _COMMAND_NAME_KEY: self.command_name,
             _LAUNCH_MODE_KEY: str(self.launch_mode),
             _LAUNCH_PATH_KEY: str(self.launch_path),
         }
+        if self.aliases:
+            config_dict[_ALIASES_KEY] = {
+                alias.command_name: {_LAUNCH_MODE_KEY: str(alias.launch_mode), _LAUNCH_PATH_KEY: str(alias.launch_path)}
+                for alias in self.aliases
+            }
+        return config_dict
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Config":
+    def from_dict(cls, data: dict[str, Any], validate_launch_path: bool = True) -> "Config":
         """
         Create a Config instance from a dictionary, raise ValueError if a value is invalid.
+        Without validate_launch_path the launch path is only parsed, without checking that it exists, otherwise it must
+        answer within the path probe timeout, so an unreachable network drive cannot freeze the loading.
         """
         command_name, command_name_error = validate_command_name(data.get(_COMMAND_NAME_KEY))
         if not command_name:
@@ -49,11 +84,76 @@ class Config:
         if not launch_mode:
             raise ValueError(f"Invalid launch mode: '{data.get(_LAUNCH_MODE_KEY)}'")
 
-        launch_path, launch_path_error = validate_path(data.get(_LAUNCH_PATH_KEY))
+        if not validate_launch_path:
+            launch_path: Path | None = string_to_path(data.get(_LAUNCH_PATH_KEY))
+            launch_path_error: str | None = f"Invalid launch path: '{data.get(_LAUNCH_PATH_KEY)}'"
+        else:
+            launch_path, launch_path_error = validate_path(data.get(_LAUNCH_PATH_KEY), PATH_PROBE_TIMEOUT)
         if not launch_path:
             raise ValueError(launch_path_error)
 
-        return cls(command_name, launch_mode, launch_path)
+        return cls(command_name, launch_mode, launch_path, cls._aliases_from_dict(data, validate_launch_path))
+
+    @classmethod
+    def _aliases_from_dict(cls, data: dict[str, Any], validate_launch_path: bool) -> list["Config"]:
+        """
+        Create the aliases of the dictionary, the launch mode and path they do not define are the ones of the main
+        command. Raise ValueError if an alias is invalid or repeats a command name.
+        """
+        aliases_data = data.get(_ALIASES_KEY) or {}
+        if not isinstance(aliases_data, dict):
+            raise ValueError(f"Invalid aliases: '{aliases_data}'")
+
+        aliases: list[Config] = []
+        # Registry keys are case-insensitive, so are the command names
+        command_name_keys = {str(data.get(_COMMAND_NAME_KEY)).lower()}
+        for alias_name, alias_data in aliases_data.items():
+            if not isinstance(alias_data, dict):
+                raise ValueError(f"Invalid alias '{alias_name}': it must be an object")
+            if str(alias_name).lower() in command_name_keys:
+                raise ValueError(f"Command '{alias_name}' is defined more than once")
+            command_name_keys.add(str(alias_name).lower())
+
+            alias_dict = {
+                _COMMAND_NAME_KEY: alias_name,
+                _LAUNCH_MODE_KEY: alias_data.get(_LAUNCH_MODE_KEY) or data.get(_LAUNCH_MODE_KEY),
+                _LAUNCH_PATH_KEY: alias_data.get(_LAUNCH_PATH_KEY) or data.get(_LAUNCH_PATH_KEY),
+            }
+            aliases.append(cls.from_dict(alias_dict, validate_launch_path))
+        return aliases
+
+    def with_overrides(self, overrides: dict[str, Any]) -> "Config":
+        """
+        Create a Config with the overridable values of the dictionary in place of its own, raise ValueError if a value
+        is invalid.
+        """
+        overridden = {key: overrides.get(key) for key in _OVERRIDABLE_KEYS}
+        # The aliases are launched through their own scripts, the directory overrides apply to the main command. The
+        # launch path is checked by the launch, under the path timeout and its policy
+        config = Config.from_dict(merge_dicts(overridden, replace(self, aliases=[]).to_dict()), False)
+        config.aliases = self.aliases
+        return config
+
+    def copy(self) -> "Config":
+        """
+        Copy the configuration and its aliases, so changing the copy leaves the original unchanged.
+        """
+        return replace(self, aliases=[replace(alias) for alias in self.aliases])
+
+    def get_commands(self) -> list["Config"]:
+        """
+        Return the configuration of each command of the installation, the main command first and then its aliases.
+        """
+        return [replace(self, aliases=[]), *self.aliases]
+
+    def get_alias(self, command_name: str) -> "Config | None":
+        """
+        Return the alias with the command name, compared without case like the registry does, or None.
+        """
+        for alias in self.aliases:
+            if alias.command_name.lower() == command_name.lower():
+                return alias
+        return None
 
     def is_launch_path_parent_process(self) -> bool:
         return str(self.launch_path) == PARENT_PROCESS_IDENTIFIER
@@ -62,37 +162,169 @@ class Config:
 class ConfigHandler:
     def __init__(self, config_file_path: Path) -> None:
         self.config_file_path: Path = config_file_path
+        self.snapshot_file_path: Path = config_file_path.with_suffix(CONFIG_SNAPSHOT_SUFFIX)
 
+    @traced("config.load")
     def load_config(self) -> Config:
         """
         Load configuration from file, or return default config if not exist or an error occurs.
+
+        Validated configurations are cached by the file modification time, size and inode: in memory for this process,
+        and in a snapshot next to the file so other processes skip parsing and validation while the file is unchanged.
+        The launch path is not probed, so an unreachable share cannot replace the whole configuration with the
+        defaults, the launch checks it under the path timeout and its policy.
         """
-        logger.debug(f"Loading configuration from '{self.config_file_path}'")
+        logger.debug("Loading configuration from '%s'", self.config_file_path)
 
         default_config = Config(DEFAULT_COMMAND_NAME, DEFAULT_LAUNCH_MODE, DEFAULT_LAUNCH_PATH)
         try:
             if not self.config_file_path.exists():
-                logger.debug(f"Configuration file not found, using default configuration '{default_config.to_dict()}'")
+                # Only build the dictionary when the message is going to be logged
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Configuration file not found, using default configuration '%s'", default_config.to_dict()
+                    )
                 return default_config
 
-            with self.config_file_path.open("r", encoding="utf-8") as config_file:
-                config_dict = merge_dicts(json.load(config_file), default_config.to_dict())
-                logger.debug(f"Loaded configuration '{config_dict}'")
-                return Config.from_dict(config_dict)
+            stat_key = get_stat_key(self.config_file_path)
+            if stat_key is None:
+                raise RuntimeError(f"Error reading configuration '{self.config_file_path}'")
+
+            cached_entry = _config_cache.get(self.config_file_path)
+            if cached_entry and cached_entry[0] == stat_key:
+                logger.debug("Configuration file unchanged, using cached configuration")
+                return cached_entry[1].copy()
+
+            config = self._load_snapshot(stat_key)
+            if not config:
+                config = self.read_config(validate_launch_path=False)
+                if get_stat_key(self.config_file_path) != stat_key:
+                    # Replaced while it was read, the configuration may not be the one of the identity
+                    return config
+                self._save_snapshot(stat_key, config)
+
+            _config_cache[self.config_file_path] = (stat_key, config)
+            return config.copy()
         except Exception as e:
-            logger.error(f"Error loading configuration from '{self.config_file_path}': {e}")
+            logger.error("Error loading configuration from '%s': %s", self.config_file_path, e)
             return default_config
 
+    def read_config(self, validate_launch_path: bool = True) -> Config:
+        """
+        Read and validate the configuration file, without the caches, missing values take the defaults.
+        Raise ValueError if the configuration is invalid, and RuntimeError if the file cannot be read.
+        """
+        default_config = Config(DEFAULT_COMMAND_NAME, DEFAULT_LAUNCH_MODE, DEFAULT_LAUNCH_PATH)
+        try:
+            with self.config_file_path.open("r", encoding="utf-8") as config_file:
+                config_data = json.load(config_file)
+        except OSError as e:
+            raise RuntimeError(f"Error reading configuration '{self.config_file_path}': {e}") from e
+        except ValueError as e:
+            raise ValueError(f"Invalid configuration '{self.config_file_path}': {e}") from e
+
+        if not isinstance(config_data, dict):
+            raise ValueError(f"Invalid configuration '{self.config_file_path}': it must be an object")
+
+        config_dict = merge_dicts(config_data, default_config.to_dict())
+        logger.debug("Loaded configuration '%s'", config_dict)
+        return Config.from_dict(config_dict, validate_launch_path)
+
+    @staticmethod
+    def read_overrides(overrides_file_path: Path) -> dict[str, Any]:
+        """
+        Read the overridable settings of a directory configuration file, a relative launch path is resolved from its
+        directory. Raise ValueError if the file is invalid, and RuntimeError if it cannot be read.
+        """
+        try:
+            with overrides_file_path.open("r", encoding="utf-8") as overrides_file:
+                overrides_data = json.load(overrides_file)
+        except OSError as e:
+            raise RuntimeError(f"Error reading configuration '{overrides_file_path}': {e}") from e
+        except ValueError as e:
+            raise ValueError(f"Invalid configuration '{overrides_file_path}': {e}") from e
+
+        if not isinstance(overrides_data, dict):
+            raise ValueError(f"Invalid configuration '{overrides_file_path}': it must be an object")
+
+        overrides = {key: overrides_data[key] for key in _OVERRIDABLE_KEYS if overrides_data.get(key)}
+        launch_path = overrides.get(_LAUNCH_PATH_KEY)
+        if isinstance(launch_path, str) and launch_path != PARENT_PROCESS_IDENTIFIER:
+            overrides[_LAUNCH_PATH_KEY] = os.path.join(overrides_file_path.parent, os.path.expanduser(launch_path))
+        return overrides
+
+    @staticmethod
+    def render_config(config: Config) -> str:
+        """
+        Build the content written to the configuration file for the provided configuration.
+        """
+        return json.dumps(config.to_dict(), indent=4)
+
+    @traced("config.save")
     def save_config(self, config: Config) -> None:
         """
         Save the provided configuration to file.
         """
-        logger.debug(f"Saving configuration to '{self.config_file_path}'")
+        logger.debug("Saving configuration to '%s'", self.config_file_path)
         config_dict = config.to_dict()
         try:
-            with self.config_file_path.open("w", encoding="utf-8") as config_file:
-                json.dump(config_dict, config_file, indent=4)
-                logger.debug(f"Saved configuration '{config_dict}'")
+            with locked(self.config_file_path.with_name(WRITE_LOCK_FILE_NAME)):
+                with atomic_open(self.config_file_path, lock=False, encoding="utf-8") as config_file:
+                    json.dump(config_dict, config_file, indent=4)
+                # The identity is taken before another writer can replace the file
+                stat_key = get_stat_key(self.config_file_path)
+            logger.debug("Saved configuration '%s'", config_dict)
         except OSError as e:
-            logger.error(f"Error saving configuration '{self.config_file_path}' with content '{config_dict}': {e}")
+            _config_cache.pop(self.config_file_path, None)
+            logger.error("Error saving configuration '%s' with content '%s': %s", self.config_file_path, config_dict, e)
             raise RuntimeError(f"Error saving configuration: {e}") from e
+
+        if stat_key is None:
+            # Removed right after it was written, the next load reads the file again
+            _config_cache.pop(self.config_file_path, None)
+            return
+
+        # The saved configuration is already validated, cache it under the new file identity
+        _config_cache[self.config_file_path] = (stat_key, config.copy())
+        self._save_snapshot(stat_key, config)
+
+    def _load_snapshot(self, stat_key: StatKey) -> Config | None:
+        """
+        Load the validated configuration snapshot, return None if it is missing, invalid or outdated.
+        """
+        try:
+            lines = self.snapshot_file_path.read_text(encoding="utf-8").split("\n")
+        except OSError:
+            return None
+
+        if (
+            len(lines) < _SNAPSHOT_MAIN_LINES
+            or (len(lines) - _SNAPSHOT_MAIN_LINES) % _SNAPSHOT_ALIAS_LINES
+            or lines[0] != _SNAPSHOT_HEADER
+            or lines[1] != " ".join(map(str, stat_key))
+        ):
+            logger.debug("Ignoring outdated configuration snapshot '%s'", self.snapshot_file_path)
+            return None
+
+        commands = []
+        for index in range(_SNAPSHOT_MAIN_LINES - _SNAPSHOT_ALIAS_LINES, len(lines), _SNAPSHOT_ALIAS_LINES):
+            command_name, launch_mode_value, launch_path = lines[index : index + _SNAPSHOT_ALIAS_LINES]
+            launch_mode = LaunchMode.from_value(launch_mode_value)
+            if not launch_mode:
+                return None
+            commands.append(Config(command_name, launch_mode, Path(launch_path)))
+
+        logger.debug("Loaded configuration snapshot '%s'", self.snapshot_file_path)
+        return replace(commands[0], aliases=commands[1:])
+
+    def _save_snapshot(self, stat_key: StatKey, config: Config) -> None:
+        snapshot_lines = [_SNAPSHOT_HEADER, " ".join(map(str, stat_key))]
+        for command in config.get_commands():
+            snapshot_lines.extend([command.command_name, command.launch_mode.value, str(command.launch_path)])
+        try:
+            # Written by readers of the configuration too, so without the write lock
+            with atomic_open(self.snapshot_file_path, lock=False, encoding="utf-8") as snapshot_file:
+                snapshot_file.write("\n".join(snapshot_lines))
+        except OSError as e:
+            # The snapshot is only an optimization, the configuration file stays the source of truth
+            logger.debug("Error saving configuration snapshot '%s': %s", self.snapshot_file_path, e)
@@ -1,19 +1,82 @@
 import logging
 import os
+import sys
 from pathlib import Path
 from typing import Final
 
-from warp_launcher.enums import LaunchMode
+from warp_launcher.enums import LaunchMode, TimeoutPolicy
 
 CONFIG_FILE_NAME: Final[str] = "config.json"
+CONFIG_SNAPSHOT_SUFFIX: Final[str] = ".snapshot"
 LAUNCHER_SCRIPT_NAME: Final[str] = "launcher.vbs"
+MANIFEST_FILE_NAME: Final[str] = "manifest.json"
+REGISTRY_FILE_NAME: Final[str] = "registry.json"
+HISTORY_LOG_FILE_NAME: Final[str] = "history.log"
+HISTORY_INDEX_FILE_NAME: Final[str] = "history.idx"
+PROFILE_FILE_NAME: Final[str] = "profile.txt"
+COALESCE_FILE_NAME: Final[str] = "launches.lock"
+SELECTION_FILE_NAME: Final[str] = "selection.lock"
+WRITE_LOCK_FILE_NAME: Final[str] = "write.lock"
+OVERRIDES_FILE_NAME: Final[str] = ".warp-launcher.json"
+OVERRIDES_INDEX_FILE_NAME: Final[str] = "overrides.json"
+METRICS_LOG_FILE_NAME: Final[str] = "metrics.log"
+METRICS_FILE_NAME: Final[str] = "metrics.json"
+DOCTOR_FILE_NAME: Final[str] = "doctor.json"
+PATH_CACHE_FILE_NAME: Final[str] = "paths.json"
+DAEMON_FILE_NAME: Final[str] = "daemon.json"
+DAEMON_SOCKET_NAME: Final[str] = "daemon.sock"
+DAEMON_PIPE_NAME: Final[str] = "WarpLauncher"
+DAEMON_RESPONSE_TIMEOUT: Final[float] = 5.0
+DAEMON_REQUEST_TIMEOUT: Final[float] = 1.0
 INSTALL_DIRECTORY: Final[Path] = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "Programs" / "WarpLauncher"
 
+if sys.platform == "win32":
+    _WARP_DATA_DIRECTORY = Path(os.environ.get("APPDATA", Path.home())) / "warp" / "Warp" / "data"
+elif sys.platform == "darwin":
+    _WARP_DATA_DIRECTORY = Path.home() / ".warp"
+else:
+    _WARP_DATA_DIRECTORY = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")) / "warp-terminal"
+WARP_LAUNCH_CONFIGURATIONS_DIRECTORY: Final[Path] = _WARP_DATA_DIRECTORY / "launch_configurations"
+
 LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(message)" if LOG_LEVEL == logging.DEBUG else "%(message)s"
+LOG_FILE_NAME: Final[str] = "launcher.log"
+LOG_JSONL_FILE_NAME: Final[str] = "launcher.jsonl"
+LOG_FILE_MAX_SIZE: Final[int] = 1024 * 1024
+LOG_FILE_BACKUP_COUNT: Final[int] = 3
 
 PARENT_PROCESS_IDENTIFIER: Final[str] = "."
 
 DEFAULT_COMMAND_NAME: Final[str] = "warp"
 DEFAULT_LAUNCH_MODE: Final[LaunchMode] = LaunchMode.WINDOW
 DEFAULT_LAUNCH_PATH: Final[Path] = Path(PARENT_PROCESS_IDENTIFIER)
+DEFAULT_LAUNCH_CONCURRENCY: Final[int] = 4
+DEFAULT_COALESCE_WINDOW: Final[float] = 0.5
+SELECTION_BATCH_WINDOW: Final[float] = 0.3
+SELECTION_BATCH_MAX_WAIT: Final[float] = 2.0
+CONTEXT_MENU_VERB: Final[str] = "WarpLauncher"
+CONTEXT_MENU_LABEL: Final[str] = "Open in Warp"
+# Option of the fast launch entry point run by the context-menu verb with a folder of the selection
+SELECT_OPTION: Final[str] = "--select"
+WATCH_DEBOUNCE: Final[float] = 0.5
+WATCH_POLL_INTERVAL: Final[float] = 1.0
+
+PATH_PROBE_TIMEOUT: Final[float] = 2.0
+DEFAULT_TIMEOUT_POLICY: Final[TimeoutPolicy] = TimeoutPolicy.LAUNCH
+PATH_CACHE_TTL: Final[float] = 10.0
+PATH_NEGATIVE_CACHE_TTL: Final[float] = 30.0
+PATH_CACHE_MAX_ENTRIES: Final[int] = 256
+
+DOCTOR_PROBE_TIMEOUT: Final[float] = 2.0
+DOCTOR_CACHE_TTL: Final[float] = 10.0
+
+OVERRIDES_INDEX_TTL: Final[float] = 60.0
+OVERRIDES_INDEX_MAX_ENTRIES: Final[int] = 256
+
+METRICS_LOG_MAX_SIZE: Final[int] = 16 * 1024
+METRICS_MAX_SERIES: Final[int] = 256
+
+HISTORY_LOG_MAX_SIZE: Final[int] = 16 * 1024
+HISTORY_MAX_ENTRIES: Final[int] = 100_000
+HISTORY_MAX_RANK: Final[float] = 1_000_000.0
+DEFAULT_DISPATCHER: Final[str] = "cmd" if sys.platform == "win32" else "xdg-open"
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from warp_launcher.config import ConfigHandler
+from warp_launcher.constants import (
+    CONFIG_FILE_NAME,
+    DAEMON_FILE_NAME,
+    DAEMON_PIPE_NAME,
+    DAEMON_REQUEST_TIMEOUT,
+    DAEMON_RESPONSE_TIMEOUT,
+    DAEMON_SOCKET_NAME,
+    INSTALL_DIRECTORY,
+    LAUNCHER_SCRIPT_NAME,
+    PARENT_PROCESS_IDENTIFIER,
+)
+from warp_launcher.dispatcher import UriDispatcher, get_dispatcher
+from warp_launcher.launcher import Launcher
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection, Listener
+
+_MAX_MESSAGE_SIZE: Final[int] = 64 * 1024
+
+_ACTION_KEY: Final[str] = "action"
+_LAUNCH_ACTION: Final[str] = "launch"
+_PING_ACTION: Final[str] = "ping"
+_STOP_ACTION: Final[str] = "stop"
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_client_path(launch_path: str, working_directory: str | None) -> str:
+    """
+    Resolve a relative launch path of a request against the working directory of the client, as the daemon runs in
+    its own. The parent process identifier is kept, it already stands for the working directory of the client.
+    """
+    if not working_directory or launch_path == PARENT_PROCESS_IDENTIFIER:
+        return launch_path
+    return os.path.join(working_directory, os.path.expanduser(launch_path))
+
+
+@dataclass(frozen=True)
+class DaemonEndpoint:
+    address: str
+    authkey: bytes
+
+    def to_dict(self) -> dict[str, str]:
+        return {"address": self.address, "authkey": self.authkey.hex()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DaemonEndpoint:
+        """
+        Create a DaemonEndpoint instance from a dictionary, raise ValueError if a value is invalid.
+        """
+        address = data.get("address")
+        authkey = data.get("authkey")
+        if not isinstance(address, str) or not isinstance(authkey, str):
+            raise ValueError("Invalid daemon endpoint")
+
+        return cls(address, bytes.fromhex(authkey))
+
+
+def _build_endpoint(install_directory: Path) -> DaemonEndpoint:
+    import secrets
+
+    authkey = secrets.token_bytes(32)
+    if sys.platform == "win32":
+        return DaemonEndpoint(rf"\\.\pipe\{DAEMON_PIPE_NAME}-{secrets.token_hex(8)}", authkey)
+
+    return DaemonEndpoint(str(install_directory / DAEMON_SOCKET_NAME), authkey)
+
+
+def _read_endpoint(install_directory: Path) -> DaemonEndpoint | None:
+    endpoint_file_path = install_directory / DAEMON_FILE_NAME
+    try:
+        with endpoint_file_path.open("r", encoding="utf-8") as endpoint_file:
+            return DaemonEndpoint.from_dict(json.load(endpoint_file))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable daemon endpoint file '%s': %s", endpoint_file_path, e)
+        return None
+
+
+def _send_request(endpoint: DaemonEndpoint, request: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Send a request to the daemon and return its response, or None if the daemon is not reachable.
+    """
+    # Imported here so a missing daemon costs a single stat instead of the connection machinery
+    from multiprocessing import AuthenticationError
+    from multiprocessing.connection import Client
+
+    try:
+        connection = Client(endpoint.address, authkey=endpoint.authkey)
+    except (OSError, EOFError, AuthenticationError) as e:
+        logger.debug("Launch daemon is not reachable at '%s': %s", endpoint.address, e)
+        return None
+
+    try:
+        with connection:
+            connection.send_bytes(json.dumps(request).encode("utf-8"))
+            if not connection.poll(DAEMON_RESPONSE_TIMEOUT):
+                raise RuntimeError("Launch daemon did not respond in time")
+            response: dict[str, Any] = json.loads(connection.recv_bytes(_MAX_MESSAGE_SIZE))
+            return response
+    except (OSError, EOFError, ValueError) as e:
+        raise RuntimeError(f"Error communicating with launch daemon: {e}") from e
+
+
+def forward_launch(
+    install_directory: Path,
+    working_directory: Path,
+    launch_mode: str | None = None,
+    launch_path: str | None = None,
+    dispatcher: str | None = None,
+) -> Path | None:
+    """
+    Forward a launch request to the running daemon, return None if no daemon is available.
+    """
+    endpoint = _read_endpoint(install_directory)
+    if not endpoint:
+        return None
+
+    request = {
+        _ACTION_KEY: _LAUNCH_ACTION,
+        "cwd": str(working_directory),
+        "mode": launch_mode,
+        "path": launch_path,
+        "dispatcher": dispatcher,
+    }
+
+    response = _send_request(endpoint, request)
+    if response is None:
+        return None
+
+    if not response.get("ok"):
+        raise RuntimeError(f"Launch daemon failed to launch Warp: {response.get('error')}")
+
+    return Path(response["path"])
+
+
+def stop_daemon(install_directory: Path = INSTALL_DIRECTORY) -> bool:
+    """
+    Ask the running daemon to stop, return False if no daemon is available.
+    """
+    endpoint = _read_endpoint(install_directory)
+    if not endpoint:
+        return False
+
+    return _send_request(endpoint, {_ACTION_KEY: _STOP_ACTION}) is not None
+
+
+class LaunchDaemon:
+    def __init__(
+        self,
+        install_directory: Path = INSTALL_DIRECTORY,
+        config_filename: str = CONFIG_FILE_NAME,
+        script_filename: str = LAUNCHER_SCRIPT_NAME,
+        dispatcher: UriDispatcher | None = None,
+        request_timeout: float = DAEMON_REQUEST_TIMEOUT,
+    ) -> None:
+        self.install_directory = install_directory
+        self._dispatcher: UriDispatcher = dispatcher if dispatcher else get_dispatcher()
+        # Connections are served one at a time, a client that sends nothing is dropped after this many seconds
+        self._request_timeout = request_timeout
+        self._config_filename = config_filename
+        self._script_filename = script_filename
+        self._endpoint_file_path: Path = install_directory / DAEMON_FILE_NAME
+
+        # Keep the validated configuration warm, it is only parsed again when the file changes
+        self._config_handler: ConfigHandler = ConfigHandler(install_directory / config_filename)
+        self._config_handler.load_config()
+
+        self._endpoint: DaemonEndpoint | None = None
+        self._listener: Listener | None = None
+
+    def start(self) -> None:
+        """
+        Start listening for launch requests and publish the endpoint in the installation directory.
+        """
+        from multiprocessing.connection import Listener
+
+        if self._listener:
+            return
+
+        existing_endpoint = _read_endpoint(self.install_directory)
+        if existing_endpoint and _send_request(existing_endpoint, {_ACTION_KEY: _PING_ACTION}):
+            raise RuntimeError(f"Launch daemon is already running at '{existing_endpoint.address}'")
+
+        self.install_directory.mkdir(parents=True, exist_ok=True)
+
+        endpoint = _build_endpoint(self.install_directory)
+        if sys.platform != "win32":
+            # Remove the socket left behind by a daemon that did not shut down cleanly
+            Path(endpoint.address).unlink(missing_ok=True)
+
+        self._listener = Listener(endpoint.address, authkey=endpoint.authkey)
+        self._endpoint = endpoint
+
+        # The endpoint file holds the authentication key, so it is only readable by the current user
+        descriptor = os.open(self._endpoint_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as endpoint_file:
+            json.dump(endpoint.to_dict(), endpoint_file)
+
+        logger.info("Launch daemon listening on '%s'", endpoint.address)
+
+    def serve_forever(self) -> None:
+        """
+        Serve launch requests until a stop request is received or the process is interrupted.
+        """
+        from multiprocessing import AuthenticationError
+
+        self.start()
+        assert self._listener is not None
+
+        try:
+            while True:
+                try:
+                    connection = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError) as e:
+                    logger.warning("Rejected daemon connection: %s", e)
+                    continue
+
+                with connection:
+                    if not self._serve_connection(connection):
+                        break
+        except KeyboardInterrupt:
+            logger.info("Launch daemon interrupted")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Stop listening and remove the published endpoint.
+        """
+        if self._listener:
+            self._listener.close()
+            self._listener = None
+
+        if self._endpoint and _read_endpoint(self.install_directory) == self._endpoint:
+            self._endpoint_file_path.unlink(missing_ok=True)
+        self._endpoint = None
+
+        logger.info("Launch daemon stopped")
+
+    def _serve_connection(self, connection: Connection) -> bool:
+        """
+        Handle a single request, return False when the daemon should stop.
+        """
+        try:
+            if not connection.poll(self._request_timeout):
+                logger.warning("Dropping daemon connection without request after %s s", self._request_timeout)
+                return True
+            request = json.loads(connection.recv_bytes(_MAX_MESSAGE_SIZE))
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning("Ignoring malformed daemon request: %s", e)
+            return True
+
+        action = request.get(_ACTION_KEY)
+        if action == _STOP_ACTION:
+            connection.send_bytes(json.dumps({"ok": True}).encode("utf-8"))
+            return False
+
+        if action == _PING_ACTION:
+            response: dict[str, Any] = {"ok": True}
+        elif action == _LAUNCH_ACTION:
+            response = self._launch(request)
+        else:
+            response = {"ok": False, "error": f"Unknown action '{action}'"}
+
+        try:
+            connection.send_bytes(json.dumps(response).encode("utf-8"))
+        except OSError as e:
+            logger.debug("Client disconnected before receiving the response: %s", e)
+
+        return True
+
+    def _launch(self, request: dict[str, Any]) -> dict[str, Any]:
+        try:
+            launcher = Launcher(
+                self.install_directory,
+                self._config_filename,
+                self._script_filename,
+                config=self._config_handler.load_config(),
+                dispatcher=get_dispatcher(request["dispatcher"]) if request.get("dispatcher") else self._dispatcher,
+            )
+
+            if request.get("mode"):
+                launcher.launch_mode = request["mode"]
+
+            if request.get("path"):
+                launcher.launch_path = _resolve_client_path(request["path"], request.get("cwd"))
+
+            working_directory = Path(request["cwd"]) if request.get("cwd") else None
+            launch_path = launcher.launch_warp(working_directory)
+        except Exception as e:
+            logger.error("Error handling launch request '%s': %s", request, e)
+            return {"ok": False, "error": str(e)}
+
+        return {"ok": True, "path": str(launch_path)}
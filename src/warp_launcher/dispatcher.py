@@ -0,0 +1,157 @@
+import logging
+import os
+import subprocess
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from warp_launcher.constants import DEFAULT_DISPATCHER
+from warp_launcher.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DispatchResult:
+    uri: str
+    dispatcher: str
+    latency: float
+
+
+class UriDispatcher(ABC):
+    """Hands a URI off to the operating system so the registered application opens it."""
+
+    name: ClassVar[str]
+
+    @traced("dispatcher.dispatch")
+    def dispatch(self, uri: str) -> DispatchResult:
+        """
+        Hand off the URI and measure how long the hand-off took.
+        """
+        start = time.perf_counter()
+        self._hand_off(uri)
+        latency = time.perf_counter() - start
+
+        logger.debug("Dispatched '%s' with '%s' in %.2f ms", uri, self.name, latency * 1000)
+        return DispatchResult(uri, self.name, latency)
+
+    @abstractmethod
+    def _hand_off(self, uri: str) -> None: ...
+
+
+class ProcessDispatcher(UriDispatcher, ABC):
+    """Hands the URI off through a helper process, optionally waiting for it to finish the hand-off."""
+
+    def __init__(self, wait: bool = False) -> None:
+        self.wait = wait
+
+    def _hand_off(self, uri: str) -> None:
+        try:
+            process = subprocess.Popen(
+                self._build_command(uri),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **self._popen_options(),
+            )
+        except OSError as e:
+            raise RuntimeError(f"Error dispatching URI with '{self.name}': {e}") from e
+
+        if self.wait:
+            process.wait()
+
+    @abstractmethod
+    def _build_command(self, uri: str) -> list[str]: ...
+
+    def _popen_options(self) -> dict[str, Any]:
+        return {}
+
+
+class CmdStartDispatcher(ProcessDispatcher):
+    name = "cmd"
+
+    def _build_command(self, uri: str) -> list[str]:
+        return ["cmd", "/c", "start", "", uri]
+
+    def _popen_options(self) -> dict[str, Any]:
+        return {"creationflags": subprocess.DETACHED_PROCESS}
+
+
+class XdgOpenDispatcher(ProcessDispatcher):
+    name = "xdg-open"
+
+    def _build_command(self, uri: str) -> list[str]:
+        return ["xdg-open", uri]
+
+    def _popen_options(self) -> dict[str, Any]:
+        return {"start_new_session": True}
+
+
+class StartfileDispatcher(UriDispatcher):
+    """Calls ShellExecute directly through os.startfile, without starting a helper process."""
+
+    name = "startfile"
+
+    def _hand_off(self, uri: str) -> None:
+        if sys.platform != "win32":
+            raise RuntimeError(f"The '{self.name}' dispatcher is only available on Windows")
+
+        try:
+            os.startfile(uri)
+        except OSError as e:
+            raise RuntimeError(f"Error dispatching URI with '{self.name}': {e}") from e
+
+
+class RecordingDispatcher(UriDispatcher):
+    """
+    Records the URIs in memory instead of dispatching them, used by tests and benchmarks. It is not registered in
+    DISPATCHERS, so it cannot be selected from the command line or the configuration.
+    """
+
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.uris: list[str] = []
+
+    def _hand_off(self, uri: str) -> None:
+        self.uris.append(uri)
+
+
+DISPATCHERS: dict[str, type[UriDispatcher]] = {
+    dispatcher.name: dispatcher for dispatcher in (CmdStartDispatcher, StartfileDispatcher, XdgOpenDispatcher)
+}
+
+
+def get_dispatcher(name: str | None = None) -> UriDispatcher:
+    """
+    Create the dispatcher registered with the given name, or the platform default, raise ValueError if it is unknown.
+    """
+    dispatcher_name = name or DEFAULT_DISPATCHER
+    dispatcher_class = DISPATCHERS.get(dispatcher_name)
+    if not dispatcher_class:
+        raise ValueError(f"Invalid dispatcher: '{dispatcher_name}'")
+
+    return dispatcher_class()
+
+
+def measure_dispatchers(uri: str, names: list[str], repeat: int = 5) -> dict[str, float]:
+    """
+    Dispatch the URI with each dispatcher, waiting for the hand-off to complete, and return the median latencies
+    sorted from the cheapest. Dispatchers that are not available on this machine are skipped.
+    """
+    latencies: dict[str, float] = {}
+    for name in names:
+        dispatcher = get_dispatcher(name)
+        if isinstance(dispatcher, ProcessDispatcher):
+            dispatcher.wait = True
+
+        try:
+            samples = sorted(dispatcher.dispatch(uri).latency for _ in range(repeat))
+        except RuntimeError as e:
+            logger.warning("Skipping dispatcher '%s': %s", name, e)
+            continue
+
+        latencies[name] = samples[len(samples) // 2]
+
+    return dict(sorted(latencies.items(), key=lambda item: item[1]))
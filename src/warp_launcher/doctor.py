@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.config import Config, ConfigHandler
+from warp_launcher.constants import (
+    CONFIG_FILE_NAME,
+    DOCTOR_CACHE_TTL,
+    DOCTOR_FILE_NAME,
+    DOCTOR_PROBE_TIMEOUT,
+    INSTALL_DIRECTORY,
+    LAUNCHER_SCRIPT_NAME,
+    MANIFEST_FILE_NAME,
+)
+from warp_launcher.enums import ProbeStatus
+from warp_launcher.manifest import ManifestHandler
+from warp_launcher.registry import AppPathsRegister, RegistryBackend, UriSchemeRegister
+from warp_launcher.script import ScriptHandler
+from warp_launcher.utils import get_stat_key, validate_path
+
+_WARP_URI_SCHEME: Final[str] = "warp"
+
+# Outcome of a probe: its status and a description of what it found
+_ProbeOutcome = tuple[ProbeStatus, str]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProbeResult:
+    name: str
+    status: ProbeStatus
+    detail: str
+    duration: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "status": self.status.value, "detail": self.detail, "duration": self.duration}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ProbeResult:
+        try:
+            return cls(str(data["name"]), ProbeStatus(data["status"]), str(data["detail"]), float(data["duration"]))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid probe result: {e}") from e
+
+
+@dataclass
+class DoctorReport:
+    results: list[ProbeResult] = field(default_factory=list)
+    # Time of the checks in nanoseconds since the epoch, older than the run when the results come from the cache
+    checked: int = 0
+    cached: bool = False
+
+    def is_healthy(self) -> bool:
+        return all(result.status in (ProbeStatus.OK, ProbeStatus.WARNING) for result in self.results)
+
+
+class Doctor:
+    """
+    Checks the health of an installation: the configuration, the launcher script, the App Paths registration, the Warp
+    URI handler and the launch path. The probes run at the same time, each one in a daemon thread so a probe stuck on
+    a slow drive or registry is reported as timed out without delaying the others or the exit of the process.
+    """
+
+    def __init__(
+        self,
+        install_directory: Path = INSTALL_DIRECTORY,
+        config_filename: str = CONFIG_FILE_NAME,
+        registry_backend: RegistryBackend | None = None,
+        scheme_backend: RegistryBackend | None = None,
+        timeout: float = DOCTOR_PROBE_TIMEOUT,
+        cache_ttl: float = DOCTOR_CACHE_TTL,
+    ) -> None:
+        self.install_directory = install_directory
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_file_path: Path = install_directory / DOCTOR_FILE_NAME
+        self._config_handler: ConfigHandler = ConfigHandler(install_directory / config_filename)
+        self._manifest_handler: ManifestHandler = ManifestHandler(install_directory / MANIFEST_FILE_NAME)
+        self._registry_backend = registry_backend
+        self._scheme_backend = scheme_backend
+
+        self._probes: dict[str, Callable[[], _ProbeOutcome]] = {
+            "config": self._probe_config,
+            "script": self._probe_script,
+            "app_paths": self._probe_app_paths,
+            "uri_handler": self._probe_uri_handler,
+            "launch_path": self._probe_launch_path,
+        }
+
+    def run(self, use_cache: bool = True) -> DoctorReport:
+        """
+        Run the probes, or return the results of a previous run younger than the cache TTL while the configuration
+        file and the install manifest are unchanged.
+        """
+        now = time.time_ns()
+        cache_key = self._get_cache_key()
+
+        if use_cache:
+            report = self._load_cached_report(cache_key, now)
+            if report:
+                logger.debug("Using the doctor results of %d ns ago", now - report.checked)
+                return report
+
+        report = DoctorReport(self._run_probes(), now)
+        self._save_report(report, cache_key)
+        return report
+
+    def _run_probes(self) -> list[ProbeResult]:
+        results: dict[str, ProbeResult] = {}
+
+        def run_probe(name: str, probe: Callable[[], _ProbeOutcome]) -> None:
+            start = time.perf_counter()
+            try:
+                status, detail = probe()
+            except Exception as e:
+                status, detail = ProbeStatus.FAILED, str(e)
+            results[name] = ProbeResult(name, status, detail, time.perf_counter() - start)
+
+        threads = [
+            threading.Thread(target=run_probe, args=(name, probe), name=f"doctor-{name}", daemon=True)
+            for name, probe in self._probes.items()
+        ]
+        for thread in threads:
+            thread.start()
+
+        # All the probes start together, so they share the deadline
+        deadline = time.perf_counter() + self.timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.perf_counter()))
+
+        return [
+            results.get(name)
+            or ProbeResult(name, ProbeStatus.TIMEOUT, f"No answer within {self.timeout:g} s", self.timeout)
+            for name in self._probes
+        ]
+
+    def _load_config(self) -> Config:
+        # The launch path is left to its own probe, so an unreachable path neither fails nor delays the others
+        return self._config_handler.read_config(validate_launch_path=False)
+
+    def _get_script_file_path(self) -> Path:
+        for registered_path in self._manifest_handler.load_manifest().registrations.values():
+            return Path(registered_path)
+        return self.install_directory / LAUNCHER_SCRIPT_NAME
+
+    def _probe_config(self) -> _ProbeOutcome:
+        if not self._config_handler.config_file_path.exists():
+            return ProbeStatus.FAILED, f"Configuration '{self._config_handler.config_file_path}' does not exist"
+
+        config = self._load_config()
+        return ProbeStatus.OK, f"Command '{config.command_name}' launching in '{config.launch_mode}' mode"
+
+    def _probe_script(self) -> _ProbeOutcome:
+        script_file_path = self._get_script_file_path()
+        try:
+            content = script_file_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return ProbeStatus.FAILED, f"Launcher script '{script_file_path}' does not exist"
+
+        if content != ScriptHandler(script_file_path).render_script(self._load_config()):
+            return ProbeStatus.WARNING, f"Launcher script '{script_file_path.name}' does not match the configuration"
+        return ProbeStatus.OK, f"Launcher script '{script_file_path.name}' matches the configuration"
+
+    def _probe_app_paths(self) -> _ProbeOutcome:
+        command_names = [command.command_name for command in self._load_config().get_commands()]
+        script_file_path = self._get_script_file_path()
+        # The aliases are registered to their own scripts, recorded in the install manifest
+        registrations = self._manifest_handler.load_manifest().registrations
+        register = AppPathsRegister(script_file_path, self._registry_backend)
+
+        for command_name in command_names:
+            if not register.is_registered(command_name):
+                return ProbeStatus.FAILED, f"Command '{command_name}' is not registered"
+
+            registered_path = register.get_registered_path(command_name)
+            if registered_path != registrations.get(command_name, str(script_file_path)):
+                return ProbeStatus.FAILED, f"Command '{command_name}' is registered to '{registered_path}'"
+
+        if len(command_names) > 1:
+            quoted_names = ", ".join(f"'{command_name}'" for command_name in command_names)
+            return ProbeStatus.OK, f"Commands {quoted_names} are registered to their launcher scripts"
+        return ProbeStatus.OK, f"Command '{command_names[0]}' is registered to the launcher script"
+
+    def _probe_uri_handler(self) -> _ProbeOutcome:
+        open_command = UriSchemeRegister(self._scheme_backend).get_open_command(_WARP_URI_SCHEME)
+        if not open_command:
+            return ProbeStatus.FAILED, f"No handler is registered for '{_WARP_URI_SCHEME}://' URIs, is Warp installed?"
+        return ProbeStatus.OK, f"'{_WARP_URI_SCHEME}://' URIs open with {open_command}"
+
+    def _probe_launch_path(self) -> _ProbeOutcome:
+        config = self._load_config()
+        if config.is_launch_path_parent_process():
+            return ProbeStatus.OK, "Launches in the working directory"
+
+        launch_path, error = validate_path(str(config.launch_path))
+        if not launch_path:
+            return ProbeStatus.FAILED, str(error)
+        return ProbeStatus.OK, f"Launch path '{launch_path}' is reachable"
+
+    def _get_cache_key(self) -> list[list[int] | None]:
+        stat_keys = (
+            get_stat_key(self._config_handler.config_file_path),
+            get_stat_key(self._manifest_handler.manifest_file_path),
+        )
+        # Compared with the key saved as JSON, which has no tuples
+        return [list(stat_key) if stat_key else None for stat_key in stat_keys]
+
+    def _load_cached_report(self, cache_key: list[list[int] | None], now: int) -> DoctorReport | None:
+        try:
+            with self.cache_file_path.open("r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            checked = data["checked"]
+            if data["key"] != cache_key or not 0 <= now - checked < self.cache_ttl * 1_000_000_000:
+                return None
+            return DoctorReport([ProbeResult.from_dict(result) for result in data["results"]], checked, cached=True)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Doctor results not loaded: %s", e)
+            return None
+
+    def _save_report(self, report: DoctorReport, cache_key: list[list[int] | None]) -> None:
+        if not self.install_directory.is_dir():
+            return
+
+        data = {"checked": report.checked, "key": cache_key, "results": [result.to_dict() for result in report.results]}
+        try:
+            with atomic_open(self.cache_file_path, lock=False, encoding="utf-8") as cache_file:
+                json.dump(data, cache_file, indent=4)
+        except OSError as e:
+            logger.debug("Doctor results not saved: %s", e)
@@ -26,3 +26,69 @@ class LaunchMode(Enum):
 
     def __str__(self) -> str:
         return self.name.lower()
+
+
+class SplitDirection(Enum):
+    VERTICAL = "vertical"
+    HORIZONTAL = "horizontal"
+
+    @classmethod
+    def from_value(cls, value: str | None) -> SplitDirection | None:
+        try:
+            return cls(value)
+        except ValueError:
+            return None
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class LogFileFormat(Enum):
+    TEXT = "text"
+    JSONL = "jsonl"
+
+    @classmethod
+    def from_value(cls, value: str | None) -> LogFileFormat | None:
+        try:
+            return cls(value)
+        except ValueError:
+            return None
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class FleetStatus(Enum):
+    INSTALLED = "installed"
+    INVALID = "invalid"
+    ROLLED_BACK = "rolled_back"
+    FAILED = "failed"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class ProbeStatus(Enum):
+    OK = "ok"
+    WARNING = "warning"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class TimeoutPolicy(Enum):
+    LAUNCH = "launch"
+    HOME = "home"
+    FAIL = "fail"
+
+    @classmethod
+    def from_value(cls, value: str | None) -> TimeoutPolicy | None:
+        try:
+            return cls(value)
+        except ValueError:
+            return None
+
+    def __str__(self) -> str:
+        return self.value
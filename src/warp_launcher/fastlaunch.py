@@ -0,0 +1,106 @@
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Final
+
+from warp_launcher.constants import INSTALL_DIRECTORY, SELECT_OPTION
+
+_MODE_OPTIONS: Final[tuple[str, ...]] = ("-m", "--mode")
+_PATH_OPTIONS: Final[tuple[str, ...]] = ("-p", "--path")
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_fast_arguments(args: list[str]) -> tuple[str | None, str | None] | None:
+    """
+    Parse the launch mode and path options, return None if any other argument is present.
+    """
+    options: dict[str, str | None] = {"mode": None, "path": None}
+
+    remaining = iter(args)
+    for arg in remaining:
+        name, separator, value = arg.partition("=")
+        if name in _MODE_OPTIONS:
+            key = "mode"
+        elif name in _PATH_OPTIONS:
+            key = "path"
+        else:
+            return None
+
+        if not separator:
+            value = next(remaining, "")
+        if not value or options[key]:
+            return None
+
+        options[key] = value
+
+    return options["mode"], options["path"]
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Fast entry point that launches Warp loading only the modules needed to dispatch the URI.
+    Any argument other than the launch mode and path is handled by the full CLI.
+    """
+    if args is None:
+        args = sys.argv[1:]
+
+    if len(args) == 2 and args[0] == SELECT_OPTION:
+        return _launch_selection(args[1])
+
+    fast_arguments = _parse_fast_arguments(args)
+    if fast_arguments is None:
+        from warp_launcher.cli import main as cli_main
+
+        return cli_main(["--launch", *args])
+
+    launch_mode, launch_path = fast_arguments
+    try:
+        from warp_launcher.daemon import forward_launch
+
+        if forward_launch(INSTALL_DIRECTORY, Path(os.getcwd()), launch_mode, launch_path) is not None:
+            return 0
+
+        from warp_launcher.launcher import Launcher
+
+        launcher = Launcher()
+
+        if launch_mode:
+            launcher.launch_mode = launch_mode
+
+        if launch_path:
+            launcher.launch_path = launch_path
+
+        launcher.launch_warp()
+    except Exception as e:
+        logger.error("Failed to launch Warp: %s", e)
+        return 1
+
+    return 0
+
+
+def _launch_selection(launch_path: str) -> int:
+    """
+    Launch a folder of an Explorer selection, Explorer starts one process per folder. The folders are batched so the
+    first process launches the whole selection and the others exit at once.
+    """
+    try:
+        from warp_launcher.coalesce import LaunchBatcher
+
+        launch_paths = LaunchBatcher(INSTALL_DIRECTORY).submit(launch_path)
+        if not launch_paths:
+            return 0
+
+        from warp_launcher.launcher import Launcher
+
+        Launcher().launch_many(launch_paths)
+    except Exception as e:
+        logger.error("Failed to launch Warp: %s", e)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
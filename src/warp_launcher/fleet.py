@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.config import Config, ConfigHandler, clear_config_cache
+from warp_launcher.constants import (
+    CONFIG_FILE_NAME,
+    CONFIG_SNAPSHOT_SUFFIX,
+    DEFAULT_COMMAND_NAME,
+    DEFAULT_LAUNCH_CONCURRENCY,
+    DEFAULT_LAUNCH_MODE,
+    DEFAULT_LAUNCH_PATH,
+    LAUNCHER_SCRIPT_NAME,
+    MANIFEST_FILE_NAME,
+    PARENT_PROCESS_IDENTIFIER,
+)
+from warp_launcher.enums import FleetStatus, LaunchMode
+from warp_launcher.launcher import Launcher
+from warp_launcher.manifest import ManifestHandler
+from warp_launcher.registry import AppPathsRegister, RegistryBackend, get_registry_backend
+from warp_launcher.tracing import traced
+from warp_launcher.utils import string_to_path, validate_command_names, validate_paths
+
+_INSTALLS_KEY: Final[str] = "installs"
+_INSTALL_DIRECTORY_KEY: Final[str] = "installDirectory"
+_COMMAND_NAME_KEY: Final[str] = "commandName"
+_LAUNCH_MODE_KEY: Final[str] = "launchMode"
+_LAUNCH_PATH_KEY: Final[str] = "launchPath"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FleetEntry:
+    # Position of the entry in the fleet manifest
+    index: int
+    install_directory: Path
+    config: Config
+
+
+@dataclass
+class FleetResult:
+    index: int
+    install_directory: Path | None
+    command_name: str | None
+    status: FleetStatus
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "installDirectory": str(self.install_directory) if self.install_directory else None,
+            "commandName": self.command_name,
+            "status": str(self.status),
+            "error": self.error,
+        }
+
+
+@dataclass
+class _InstallSnapshot:
+    """State of an installation before it is provisioned, restored if the provisioning fails."""
+
+    install_directory: Path
+    directory_existed: bool
+    # Outermost directory the installation creates, removed with its content if the provisioning fails
+    created_directory: Path | None = None
+    # Content of each file the installation can write or remove, None if it did not exist
+    files: dict[Path, bytes | None] = field(default_factory=dict)
+    # Registered App Paths value of each command the installation can change, None if it was not registered
+    registrations: dict[str, str | None] = field(default_factory=dict)
+
+
+def _get_string(data: dict[str, Any], key: str, default: str) -> str | None:
+    # Missing and empty values take the default, like in the configuration file
+    value = data.get(key) or default
+    return value if isinstance(value, str) else None
+
+
+def parse_fleet(data: Any, base_directory: Path) -> tuple[list[FleetEntry], list[FleetResult]]:
+    """
+    Validate all the entries of a fleet manifest in one pass, relative paths are resolved from the base directory.
+    Returns the valid entries and a result for each invalid one, raise ValueError if the manifest is malformed.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get(_INSTALLS_KEY), list):
+        raise ValueError(f"A fleet manifest must be an object with an '{_INSTALLS_KEY}' list")
+
+    items: list[dict[str, Any]] = [item if isinstance(item, dict) else {} for item in data[_INSTALLS_KEY]]
+
+    launch_path_candidates = []
+    for item in items:
+        candidate = _get_string(item, _LAUNCH_PATH_KEY, str(DEFAULT_LAUNCH_PATH))
+        if candidate and candidate != PARENT_PROCESS_IDENTIFIER:
+            candidate = str(base_directory / Path(candidate).expanduser())
+        launch_path_candidates.append(candidate)
+
+    command_names = validate_command_names(_get_string(item, _COMMAND_NAME_KEY, DEFAULT_COMMAND_NAME) for item in items)
+    launch_paths = validate_paths(launch_path_candidates)
+
+    entries: list[FleetEntry] = []
+    invalid_results: list[FleetResult] = []
+    install_directory_keys: set[str] = set()
+    command_name_keys: set[str] = set()
+    for index, item in enumerate(items):
+        install_directory = string_to_path(_get_string(item, _INSTALL_DIRECTORY_KEY, ""))
+        if install_directory:
+            install_directory = (base_directory / install_directory).absolute()
+        command_name = command_names[index].value
+        launch_mode = LaunchMode.from_name(_get_string(item, _LAUNCH_MODE_KEY, str(DEFAULT_LAUNCH_MODE)))
+        launch_path = launch_paths[index].value
+
+        error = None
+        if not isinstance(data[_INSTALLS_KEY][index], dict):
+            error = "Entry must be an object"
+        elif not install_directory:
+            error = f"Install directory '{item.get(_INSTALL_DIRECTORY_KEY)}' is not valid"
+        elif not command_name:
+            error = command_names[index].error
+        elif not launch_mode:
+            error = f"Invalid launch mode: '{item.get(_LAUNCH_MODE_KEY)}'"
+        elif not launch_path:
+            error = launch_paths[index].error
+        elif os.path.normcase(install_directory) in install_directory_keys:
+            error = f"Install directory '{install_directory}' is used by a previous entry"
+        elif command_name.lower() in command_name_keys:
+            # The App Paths registry is shared, two entries would register the same command to different scripts
+            error = f"Command '{command_name}' is used by a previous entry"
+
+        if error or not install_directory or not command_name or not launch_mode or not launch_path:
+            invalid_results.append(FleetResult(index, install_directory, command_name, FleetStatus.INVALID, error))
+            continue
+
+        install_directory_keys.add(os.path.normcase(install_directory))
+        command_name_keys.add(command_name.lower())
+        entries.append(FleetEntry(index, install_directory, Config(command_name, launch_mode, launch_path)))
+
+    return entries, invalid_results
+
+
+class FleetHandler:
+    def __init__(
+        self,
+        config_filename: str = CONFIG_FILE_NAME,
+        script_filename: str = LAUNCHER_SCRIPT_NAME,
+        registry_backend: RegistryBackend | None = None,
+    ) -> None:
+        self.config_filename = config_filename
+        self.script_filename = script_filename
+        # A single backend is shared by all the installations, so their registry changes are serialized
+        self._registry_backend: RegistryBackend = registry_backend if registry_backend else get_registry_backend()
+
+    @staticmethod
+    def load_fleet(fleet_file_path: Path) -> tuple[list[FleetEntry], list[FleetResult]]:
+        """
+        Load and validate a fleet manifest from a JSON file, raise ValueError if the manifest is malformed.
+        """
+        logger.debug("Loading fleet manifest from '%s'", fleet_file_path)
+        try:
+            with fleet_file_path.open("r", encoding="utf-8") as fleet_file:
+                fleet_data = json.load(fleet_file)
+        except OSError as e:
+            raise RuntimeError(f"Error reading fleet manifest '{fleet_file_path}': {e}") from e
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid fleet manifest '{fleet_file_path}': {e}") from e
+
+        return parse_fleet(fleet_data, fleet_file_path.absolute().parent)
+
+    def provision_fleet(
+        self, fleet_file_path: Path, max_workers: int = DEFAULT_LAUNCH_CONCURRENCY
+    ) -> list[FleetResult]:
+        """
+        Install every valid entry of the fleet manifest, and return the result of each entry in manifest order.
+        """
+        entries, results = self.load_fleet(fleet_file_path)
+        results.extend(self.provision(entries, max_workers))
+        return sorted(results, key=lambda result: result.index)
+
+    @traced("fleet.provision")
+    def provision(self, entries: list[FleetEntry], max_workers: int = DEFAULT_LAUNCH_CONCURRENCY) -> list[FleetResult]:
+        """
+        Install the entries on at most max_workers threads. A failed entry is rolled back to the state it had before,
+        without stopping the others.
+        """
+        if max_workers < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        logger.debug("Provisioning %d installations with concurrency %d", len(entries), max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fleet") as executor:
+            return list(executor.map(self._provision_entry, entries))
+
+    def _provision_entry(self, entry: FleetEntry) -> FleetResult:
+        result = FleetResult(entry.index, entry.install_directory, entry.config.command_name, FleetStatus.INSTALLED)
+        try:
+            launcher = Launcher(
+                entry.install_directory,
+                self.config_filename,
+                self.script_filename,
+                config=entry.config,
+                registry_backend=self._registry_backend,
+            )
+            snapshot = self._take_snapshot(entry, launcher)
+        except (RuntimeError, OSError, ValueError) as e:
+            # Nothing was written yet
+            result.status, result.error = FleetStatus.ROLLED_BACK, str(e)
+            return result
+
+        try:
+            launcher.install()
+        except RuntimeError as e:
+            logger.warning("Rolling back installation '%s': %s", entry.install_directory, e)
+            result.status, result.error = FleetStatus.ROLLED_BACK, str(e)
+            try:
+                self._restore_snapshot(snapshot)
+            except (RuntimeError, OSError) as rollback_error:
+                logger.error("Error rolling back installation '%s': %s", entry.install_directory, rollback_error)
+                result.status, result.error = FleetStatus.FAILED, f"{e} Rollback failed. {rollback_error}"
+
+        return result
+
+    def _take_snapshot(self, entry: FleetEntry, launcher: Launcher) -> _InstallSnapshot:
+        install_directory = entry.install_directory
+        snapshot = _InstallSnapshot(install_directory, install_directory.exists())
+        if not snapshot.directory_existed:
+            created_directory = install_directory
+            while not created_directory.parent.exists():
+                created_directory = created_directory.parent
+            snapshot.created_directory = created_directory
+
+        # Every file and command the installation writes or removes, such as the scripts of new aliases
+        plan = launcher.plan_install()
+        command_names = {entry.config.command_name, *plan.manifest.registrations, *plan.unregistrations}
+        if snapshot.directory_existed:
+            config_file_path = install_directory / self.config_filename
+            manifest = ManifestHandler(install_directory / MANIFEST_FILE_NAME).load_manifest()
+
+            file_paths = {
+                config_file_path,
+                config_file_path.with_suffix(CONFIG_SNAPSHOT_SUFFIX),
+                install_directory / self.script_filename,
+                install_directory / MANIFEST_FILE_NAME,
+                *(install_directory / file_name for file_name in manifest.artifacts),
+                *(install_directory / file_name for file_name in plan.manifest.artifacts),
+                *plan.writes,
+                *plan.removals,
+            }
+            for file_path in file_paths:
+                snapshot.files[file_path] = file_path.read_bytes() if file_path.exists() else None
+
+            command_names.update(manifest.registrations)
+            if config_file_path.exists():
+                command_names.add(ConfigHandler(config_file_path).load_config().command_name)
+
+        with self._create_register(entry.install_directory).session() as registry:
+            for command_name in command_names:
+                snapshot.registrations[command_name] = registry.get_registered_path(command_name)
+
+        return snapshot
+
+    def _restore_snapshot(self, snapshot: _InstallSnapshot) -> None:
+        if snapshot.created_directory:
+            shutil.rmtree(snapshot.created_directory, ignore_errors=True)
+        else:
+            for file_path, content in snapshot.files.items():
+                if content is None:
+                    file_path.unlink(missing_ok=True)
+                else:
+                    with atomic_open(file_path, mode="wb") as restored_file:
+                        restored_file.write(content)
+        # The restored files may keep the identity of the files they replace
+        clear_config_cache()
+
+        with self._create_register(snapshot.install_directory).session() as registry:
+            for command_name, registered_path in snapshot.registrations.items():
+                registry.restore(command_name, registered_path)
+
+    def _create_register(self, install_directory: Path) -> AppPathsRegister:
+        return AppPathsRegister(install_directory / self.script_filename, self._registry_backend)
@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from warp_launcher.atomic import atomic_open, locked
+from warp_launcher.constants import (
+    HISTORY_INDEX_FILE_NAME,
+    HISTORY_LOG_FILE_NAME,
+    HISTORY_LOG_MAX_SIZE,
+    HISTORY_MAX_ENTRIES,
+    HISTORY_MAX_RANK,
+    INSTALL_DIRECTORY,
+    WRITE_LOCK_FILE_NAME,
+)
+from warp_launcher.tracing import traced
+
+if TYPE_CHECKING:
+    import mmap
+
+_INDEX_MAGIC: Final[bytes] = b"WLHIST02"
+# Magic, then the size of each section: names blob, name starts, posting starts, postings, trigram keys,
+# trigram starts, trigram postings, record starts and records blob
+_INDEX_HEADER_FORMAT: Final[str] = "=8s9I"
+_INDEX_SECTIONS: Final[tuple[str, ...]] = (
+    "names",
+    "name_starts",
+    "posting_starts",
+    "postings",
+    "trigram_keys",
+    "trigram_starts",
+    "trigram_postings",
+    "record_starts",
+    "records",
+)
+_BLOB_SECTIONS: Final[tuple[str, ...]] = ("names", "records")
+
+_HOUR: Final[int] = 60 * 60
+_DAY: Final[int] = 24 * _HOUR
+_WEEK: Final[int] = 7 * _DAY
+
+logger = logging.getLogger(__name__)
+
+
+def frecency(rank: float, last_access: int, now: int) -> float:
+    """
+    Weight the visit rank by how recently the directory was last visited.
+    """
+    age = now - last_access
+    if age < _HOUR:
+        return rank * 4
+    if age < _DAY:
+        return rank * 2
+    if age < _WEEK:
+        return rank / 2
+    return rank / 4
+
+
+def _get_name(path: str) -> str:
+    # Last path component, or the path itself for a root directory
+    return os.path.basename(path.rstrip("\\/")) or path
+
+
+def _get_trigrams(value: bytes) -> set[int]:
+    return {int.from_bytes(value[index : index + 3], "little") for index in range(len(value) - 2)}
+
+
+def _matches(path: str, terms: list[str]) -> bool:
+    """
+    Check that the terms appear in order in the path, the last one in the last path component.
+    """
+    lowered_path = path.lower()
+    position = 0
+    for term in terms[:-1]:
+        position = lowered_path.find(term, position)
+        if position < 0:
+            return False
+        position += len(term)
+
+    return lowered_path.rfind(terms[-1]) >= position and terms[-1] in _get_name(lowered_path)
+
+
+@dataclass
+class HistoryEntry:
+    path: str
+    rank: float
+    last_access: int
+
+
+class _HistoryIndex:
+    """
+    Read-only view of a history index file. The entries are stored by rank, and the lower-cased last path components,
+    their entries and their trigrams are stored in sorted integer arrays that are searched in place.
+    """
+
+    def __init__(self, index_map: mmap.mmap) -> None:
+        import struct
+
+        self._index_map = index_map
+        self._index_view = memoryview(index_map)
+        self._sections: dict[str, memoryview] = {}
+
+        magic, *sizes = struct.unpack_from(_INDEX_HEADER_FORMAT, index_map)
+        if magic != _INDEX_MAGIC:
+            self.close()
+            raise ValueError("Invalid history index")
+
+        offset = struct.calcsize(_INDEX_HEADER_FORMAT)
+        self._names_offset = offset
+        for name, size in zip(_INDEX_SECTIONS, sizes, strict=True):
+            section = self._index_view[offset : offset + size]
+            self._sections[name] = section if name in _BLOB_SECTIONS else section.cast("I")
+            offset += size
+
+        self.name_count = len(self._sections["name_starts"]) - 1
+        self.entry_count = len(self._sections["record_starts"]) - 1
+
+    def __enter__(self) -> _HistoryIndex:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for section in self._sections.values():
+            section.release()
+        self._index_view.release()
+        self._index_map.close()
+
+    def get_name(self, name_index: int) -> bytes:
+        name_starts = self._sections["name_starts"]
+        return bytes(self._sections["names"][name_starts[name_index] : name_starts[name_index + 1] - 1])
+
+    def get_first_entry(self, name_index: int) -> int:
+        return self._sections["postings"][self._sections["posting_starts"][name_index]]
+
+    def get_entries(self, name_index: int) -> Iterator[int]:
+        posting_starts = self._sections["posting_starts"]
+        postings = self._sections["postings"]
+        for posting in range(posting_starts[name_index], posting_starts[name_index + 1]):
+            yield postings[posting]
+
+    def get_entry(self, entry_index: int) -> HistoryEntry:
+        record_starts = self._sections["record_starts"]
+        record = bytes(self._sections["records"][record_starts[entry_index] : record_starts[entry_index + 1]])
+        rank, last_access, path = record.decode().rstrip("\n").split("\t", 2)
+        return HistoryEntry(path, float(rank), int(last_access))
+
+    def find_names(self, term: bytes) -> Iterator[int]:
+        """
+        Yield, in rank order, the indexes of the names that may contain the term.
+        """
+        from bisect import bisect_left, bisect_right
+
+        name_starts = self._sections["name_starts"]
+
+        if len(term) < 3:
+            # Too short for the trigrams, scan the names blob instead
+            position, names_end = self._names_offset, self._names_offset + name_starts[-1]
+            while (hit := self._index_map.find(term, position, names_end)) >= 0:
+                name_index = bisect_right(name_starts, hit - self._names_offset) - 1
+                yield name_index
+                position = self._names_offset + name_starts[name_index + 1]
+            return
+
+        trigram_keys = self._sections["trigram_keys"]
+        trigram_starts = self._sections["trigram_starts"]
+
+        # Walk the shortest list among the trigrams of the term
+        shortest: tuple[int, int] | None = None
+        for trigram in _get_trigrams(term):
+            key_index = bisect_left(trigram_keys, trigram)
+            if key_index == len(trigram_keys) or trigram_keys[key_index] != trigram:
+                return
+            start, end = trigram_starts[key_index], trigram_starts[key_index + 1]
+            if shortest is None or end - start < shortest[1] - shortest[0]:
+                shortest = (start, end)
+
+        if shortest:
+            trigram_postings = self._sections["trigram_postings"]
+            for posting in range(*shortest):
+                yield trigram_postings[posting]
+
+    def read_entries(self) -> Iterator[HistoryEntry]:
+        for entry_index in range(self.entry_count):
+            yield self.get_entry(entry_index)
+
+
+class HistoryHandler:
+    """
+    Frecency-ranked history of the launched directories. Launches are appended to a small log, which is periodically
+    compacted into a ranked, memory-mappable index that is searched without parsing it.
+    """
+
+    def __init__(self, install_directory: Path = INSTALL_DIRECTORY) -> None:
+        self.log_file_path: Path = install_directory / HISTORY_LOG_FILE_NAME
+        self.index_file_path: Path = install_directory / HISTORY_INDEX_FILE_NAME
+        # Log moved aside by the running compaction, or left by a failed one
+        self.pending_log_file_path: Path = install_directory / f"{HISTORY_LOG_FILE_NAME}.pending"
+
+    @traced("history.record")
+    def record(self, path: Path | str, now: int | None = None) -> None:
+        """
+        Append a launch to the history log, compacting it once it grows past its limit. Errors are logged and ignored,
+        the history never fails a launch.
+        """
+        path_str = os.path.abspath(path)
+        if "\n" in path_str or "\t" in path_str:
+            return
+
+        line = f"{now if now is not None else int(time.time())}\t{path_str}\n".encode()
+        try:
+            # A single append is atomic enough for concurrent launches and needs no lock
+            file_descriptor = os.open(self.log_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(file_descriptor, line)
+                log_size = os.fstat(file_descriptor).st_size
+            finally:
+                os.close(file_descriptor)
+
+            if log_size > HISTORY_LOG_MAX_SIZE:
+                self.compact(now)
+        except (OSError, ValueError) as e:
+            logger.debug("Launch not recorded in history: %s", e)
+
+    @traced("history.compact")
+    def compact(self, now: int | None = None) -> None:
+        """
+        Merge the log into the index, aging the ranks and evicting the entries beyond the history limits.
+        """
+        current_time = now if now is not None else int(time.time())
+
+        # Compactions are applied one by one, each one merges the index left by the previous one
+        with locked(self.index_file_path.with_name(WRITE_LOCK_FILE_NAME)):
+            # Move the log aside first, launches recorded meanwhile start a new log. A pending log left by a failed
+            # compaction is merged first, the current log waits for the next compaction
+            if not self.pending_log_file_path.exists():
+                try:
+                    os.replace(self.log_file_path, self.pending_log_file_path)
+                except FileNotFoundError:
+                    return
+
+            entries: dict[str, HistoryEntry] = {}
+            index = self._open_index()
+            if index:
+                with index:
+                    entries = {entry.path: entry for entry in index.read_entries()}
+
+            for timestamp, path in self._read_log(self.pending_log_file_path):
+                entry = entries.setdefault(path, HistoryEntry(path, 0.0, timestamp))
+                entry.rank += 1
+                entry.last_access = max(entry.last_access, timestamp)
+
+            self._write_index(self._age(list(entries.values()), current_time))
+            # Only dropped once its launches are in the index, a failed compaction keeps them for the next one
+            self.pending_log_file_path.unlink()
+
+        logger.debug("History compacted into '%s'", self.index_file_path)
+
+    @traced("history.lookup")
+    def lookup(self, query: str, now: int | None = None) -> Path | None:
+        """
+        Find the existing directory with the highest frecency that matches the query terms, or None if no one does.
+        """
+        terms = query.lower().split()
+        if not terms:
+            return None
+
+        current_time = now if now is not None else int(time.time())
+
+        # Launches not compacted yet count with their own visits only, unless they are the best indexed match
+        recent: dict[str, HistoryEntry] = {}
+        launches = self._read_log(self.pending_log_file_path, terms[-1]) + self._read_log(self.log_file_path, terms[-1])
+        for timestamp, path in launches:
+            if _matches(path, terms):
+                entry = recent.setdefault(path, HistoryEntry(path, 0.0, timestamp))
+                entry.rank += 1
+                entry.last_access = max(entry.last_access, timestamp)
+
+        candidates = [entry for entry in recent.values() if os.path.isdir(entry.path)]
+
+        indexed = self._search_index(terms)
+        if indexed:
+            recent_entry = recent.pop(indexed.path, None)
+            if recent_entry:
+                candidates.remove(recent_entry)
+                indexed.rank += recent_entry.rank
+                indexed.last_access = max(indexed.last_access, recent_entry.last_access)
+            candidates.append(indexed)
+
+        if not candidates:
+            return None
+
+        best = max(candidates, key=lambda entry: frecency(entry.rank, entry.last_access, current_time))
+        return Path(best.path)
+
+    def _search_index(self, terms: list[str]) -> HistoryEntry | None:
+        """
+        Return the best ranked indexed entry that matches the terms and still exists.
+        """
+        index = self._open_index()
+        if not index:
+            return None
+
+        last_term = terms[-1].encode()
+        best_entry_index = None
+        with index:
+            for name_index in index.find_names(last_term):
+                # Names are ordered by their best ranked entry, and their entries by rank
+                if best_entry_index is not None and index.get_first_entry(name_index) > best_entry_index:
+                    break
+                if last_term not in index.get_name(name_index):
+                    continue
+
+                for entry_index in index.get_entries(name_index):
+                    if best_entry_index is not None and entry_index >= best_entry_index:
+                        break
+                    entry = index.get_entry(entry_index)
+                    if _matches(entry.path, terms) and os.path.isdir(entry.path):
+                        best_entry_index = entry_index
+                        break
+
+            return index.get_entry(best_entry_index) if best_entry_index is not None else None
+
+    def _open_index(self) -> _HistoryIndex | None:
+        import mmap
+
+        try:
+            with self.index_file_path.open("rb") as index_file:
+                index_map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing or empty index
+            return None
+
+        try:
+            return _HistoryIndex(index_map)
+        except Exception as e:
+            logger.debug("Ignoring invalid history index '%s': %s", self.index_file_path, e)
+            return None
+
+    @staticmethod
+    def _read_log(log_file_path: Path, term: str = "") -> list[tuple[int, str]]:
+        """
+        Read the launches in the log, only the lines that contain the lower-cased term if one is given.
+        """
+        try:
+            content = log_file_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return []
+
+        if term and term not in content.lower():
+            return []
+
+        launches = []
+        for line in content.splitlines():
+            if term and term not in line.lower():
+                continue
+            timestamp, separator, path = line.partition("\t")
+            if separator and timestamp.isdigit() and path:
+                launches.append((int(timestamp), path))
+        return launches
+
+    @staticmethod
+    def _age(entries: list[HistoryEntry], now: int) -> list[HistoryEntry]:
+        """
+        Scale down the ranks once their total exceeds the limit, dropping the entries that fall below one visit, and
+        keep the entries with the highest frecency.
+        """
+        total_rank = sum(entry.rank for entry in entries)
+        if total_rank > HISTORY_MAX_RANK:
+            factor = 0.9 * HISTORY_MAX_RANK / total_rank
+            for entry in entries:
+                entry.rank *= factor
+            entries = [entry for entry in entries if entry.rank >= 1]
+
+        entries.sort(key=lambda entry: frecency(entry.rank, entry.last_access, now), reverse=True)
+        return entries[:HISTORY_MAX_ENTRIES]
+
+    def _write_index(self, entries: list[HistoryEntry]) -> None:
+        import struct
+        from array import array
+
+        # Entries of each lower-cased last path component, the names are ordered by their best ranked entry
+        entries_by_name: dict[bytes, list[int]] = {}
+        for entry_index, entry in enumerate(entries):
+            entries_by_name.setdefault(_get_name(entry.path).lower().encode(), []).append(entry_index)
+
+        names = bytearray()
+        name_starts, posting_starts, postings = array("I"), array("I"), array("I")
+        names_by_trigram: dict[int, list[int]] = {}
+        for name_index, (name, name_entries) in enumerate(entries_by_name.items()):
+            name_starts.append(len(names))
+            names += name + b"\n"
+            posting_starts.append(len(postings))
+            postings.extend(name_entries)
+            for trigram in _get_trigrams(name):
+                names_by_trigram.setdefault(trigram, []).append(name_index)
+        name_starts.append(len(names))
+        posting_starts.append(len(postings))
+
+        trigram_keys, trigram_starts, trigram_postings = array("I"), array("I"), array("I")
+        for trigram in sorted(names_by_trigram):
+            trigram_keys.append(trigram)
+            trigram_starts.append(len(trigram_postings))
+            trigram_postings.extend(names_by_trigram[trigram])
+        trigram_starts.append(len(trigram_postings))
+
+        records = bytearray()
+        record_starts = array("I")
+        for entry in entries:
+            record_starts.append(len(records))
+            records += f"{entry.rank:.3f}\t{entry.last_access}\t{entry.path}\n".encode()
+        record_starts.append(len(records))
+
+        # Pad the names so the integer sections stay aligned
+        names += b"\0" * (-len(names) % 4)
+
+        sections = (
+            names,
+            name_starts,
+            posting_starts,
+            postings,
+            trigram_keys,
+            trigram_starts,
+            trigram_postings,
+            record_starts,
+            records,
+        )
+        header = struct.pack(
+            _INDEX_HEADER_FORMAT,
+            _INDEX_MAGIC,
+            *(len(section) * (section.itemsize if isinstance(section, array) else 1) for section in sections),
+        )
+
+        # The caller holds the write lock
+        with atomic_open(self.index_file_path, lock=False, mode="wb") as index_file:
+            index_file.write(header)
+            for section in sections:
+                index_file.write(section)
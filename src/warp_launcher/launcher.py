@@ -1,25 +1,69 @@
+from __future__ import annotations
+
 import logging
 import os
-import shutil
-import subprocess
+import sys
+import time
+from collections.abc import Iterable
+from functools import cached_property
 from pathlib import Path
-
-from warp_launcher.config import ConfigHandler
-from warp_launcher.constants import CONFIG_FILE_NAME, INSTALL_DIRECTORY, LAUNCHER_SCRIPT_NAME
-from warp_launcher.enums import LaunchMode
-from warp_launcher.registry import AppPathsRegister
-from warp_launcher.script import ScriptHandler
-from warp_launcher.utils import validate_command_name, validate_path
+from typing import TYPE_CHECKING
+
+from warp_launcher.config import Config, ConfigHandler
+from warp_launcher.constants import (
+    CONFIG_FILE_NAME,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_LAUNCH_CONCURRENCY,
+    DEFAULT_TIMEOUT_POLICY,
+    INSTALL_DIRECTORY,
+    LAUNCHER_SCRIPT_NAME,
+    MANIFEST_FILE_NAME,
+    PATH_PROBE_TIMEOUT,
+    SELECT_OPTION,
+)
+from warp_launcher.dispatcher import UriDispatcher, get_dispatcher
+from warp_launcher.enums import LaunchMode, TimeoutPolicy
+from warp_launcher.tracing import span, traced
+from warp_launcher.utils import validate_command_name
+
+if TYPE_CHECKING:
+    from warp_launcher.coalesce import LaunchCoalescer
+    from warp_launcher.history import HistoryHandler
+    from warp_launcher.layout import Layout, LayoutHandler
+    from warp_launcher.manifest import InstallPlan, ManifestHandler
+    from warp_launcher.overrides import OverrideResolver
+    from warp_launcher.reachability import ReachabilityChecker
+    from warp_launcher.registry import AppPathsRegister, AppPathsSession, ContextMenuRegister, RegistryBackend
+    from warp_launcher.script import ScriptHandler
 
 logger = logging.getLogger(__name__)
 
 
+def _build_context_menu_command() -> str:
+    """
+    Build the command line of the context-menu verb, '%V' is replaced by Explorer with the selected folder.
+    """
+    executable_file_path = Path(sys.executable)
+    # The windowless interpreter does not flash a console for each selected folder
+    windowless_file_path = executable_file_path.with_name("pythonw.exe")
+    if windowless_file_path.exists():
+        executable_file_path = windowless_file_path
+
+    return f'"{executable_file_path}" -m warp_launcher.fastlaunch {SELECT_OPTION} "%V"'
+
+
 class Launcher:
     def __init__(
         self,
         install_directory: Path = INSTALL_DIRECTORY,
         config_filename: str = CONFIG_FILE_NAME,
         script_filename: str = LAUNCHER_SCRIPT_NAME,
+        config: Config | None = None,
+        dispatcher: UriDispatcher | None = None,
+        registry_backend: RegistryBackend | None = None,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        path_timeout: float = PATH_PROBE_TIMEOUT,
+        timeout_policy: TimeoutPolicy = DEFAULT_TIMEOUT_POLICY,
     ):
         if not install_directory:
             raise ValueError("Installation directory must be provided")
@@ -29,33 +73,94 @@ class Launcher:
             raise ValueError("Script filename must be provided")
 
         self.install_directory = install_directory
-        logger.debug(f"Installation directory: {self.install_directory}")
+        logger.debug("Installation directory: %s", self.install_directory)
 
         # Setup configuration handler
         config_file_path: Path = self.install_directory / config_filename
         self._config_handler: ConfigHandler = ConfigHandler(config_file_path)
 
-        # Setup script handler
-        script_file_path: Path = self.install_directory / script_filename
-        self._script_handler: ScriptHandler = ScriptHandler(script_file_path)
+        # Setup the dispatcher that hands the Warp URI off to the operating system
+        self._dispatcher: UriDispatcher = dispatcher if dispatcher else get_dispatcher()
 
-        # Setup registry for the application paths
-        self._app_paths_register: AppPathsRegister = AppPathsRegister(script_file_path)
+        # The script and registry handlers are only needed to install or uninstall
+        self._script_file_path: Path = self.install_directory / script_filename
+        self._registry_backend = registry_backend
 
-        # Load the configuration from the configuration file
-        self._config = self._config_handler.load_config()
+        # Identical launches repeated within this many seconds, by any process, are dispatched once
+        self._coalesce_window = coalesce_window
+
+        # Paths that do not answer within this many seconds, such as a disconnected network drive, follow the policy
+        self._path_timeout = path_timeout
+        self._timeout_policy = timeout_policy
+
+        # Use the provided configuration or load it from the configuration file
+        self._config = config if config else self._config_handler.load_config()
+
+        # Settings given explicitly, such as command-line options, take precedence over the directory overrides
+        self._explicit_settings: set[str] = set()
+
+    @cached_property
+    def _script_handler(self) -> ScriptHandler:
+        from warp_launcher.script import ScriptHandler
+
+        return ScriptHandler(self._script_file_path)
+
+    @cached_property
+    def _coalescer(self) -> LaunchCoalescer:
+        from warp_launcher.coalesce import LaunchCoalescer
+
+        return LaunchCoalescer(self.install_directory, self._coalesce_window)
+
+    @cached_property
+    def _override_resolver(self) -> OverrideResolver:
+        from warp_launcher.overrides import OverrideResolver
+
+        return OverrideResolver(self.install_directory)
+
+    @cached_property
+    def _reachability_checker(self) -> ReachabilityChecker:
+        from warp_launcher.reachability import ReachabilityChecker
+
+        return ReachabilityChecker(self.install_directory, self._path_timeout, self._timeout_policy)
+
+    @cached_property
+    def _history_handler(self) -> HistoryHandler:
+        from warp_launcher.history import HistoryHandler
+
+        return HistoryHandler(self.install_directory)
+
+    @cached_property
+    def _manifest_handler(self) -> ManifestHandler:
+        from warp_launcher.manifest import ManifestHandler
+
+        return ManifestHandler(self.install_directory / MANIFEST_FILE_NAME)
+
+    @cached_property
+    def _app_paths_register(self) -> AppPathsRegister:
+        from warp_launcher.registry import AppPathsRegister
+
+        return AppPathsRegister(self._script_file_path, self._registry_backend)
+
+    @cached_property
+    def _context_menu_register(self) -> ContextMenuRegister:
+        from warp_launcher.registry import ContextMenuRegister
+
+        return ContextMenuRegister(self._registry_backend)
 
     @property
     def command_name(self) -> str:
         return self._config.command_name
 
     @command_name.setter
+    @traced("launcher.validate_command_name")
     def command_name(self, new_command_name: str) -> None:
         command_name, error = validate_command_name(new_command_name)
         if not command_name:
             raise ValueError(error)
+        if self._config.get_alias(command_name):
+            raise ValueError(f"Command '{command_name}' is already an alias")
         self._config.command_name = command_name
-        logger.info(f"Command name set to '{command_name}'")
+        logger.info("Command name set to '%s'", command_name)
 
     @property
     def launch_mode(self) -> LaunchMode:
@@ -67,76 +172,426 @@ class Launcher:
         if not launch_mode:
             raise ValueError(f"Invalid mode specified: '{new_launch_mode}'")
         self._config.launch_mode = launch_mode
-        logger.info(f"Launch mode set to '{launch_mode}'")
+        self._explicit_settings.add("launch_mode")
+        logger.info("Launch mode set to '%s'", launch_mode)
 
     @property
     def launch_path(self) -> Path:
         return self._config.launch_path
 
     @launch_path.setter
+    @traced("launcher.validate_launch_path")
     def launch_path(self, new_launch_path: str) -> None:
-        path, error = validate_path(new_launch_path)
+        path, error = self._reachability_checker.validate_path(new_launch_path)
         if not path:
             raise ValueError(error)
         self._config.launch_path = path
-        logger.info(f"Launch path set to '{path}'")
+        self._explicit_settings.add("launch_path")
+        logger.info("Launch path set to '%s'", path)
+
+    @property
+    def aliases(self) -> list[Config]:
+        return self._config.aliases
 
-    def launch_warp(self) -> Path:
+    @traced("launcher.add_alias")
+    def add_alias(self, command_name: str, launch_mode: str | None = None, launch_path: str | None = None) -> None:
+        """
+        Adds a command that launches in its own mode and path, replacing the alias with the same name. The mode and
+        the path it does not set are the ones of the main command.
+        """
+        alias_name, error = validate_command_name(command_name)
+        if not alias_name:
+            raise ValueError(error)
+        if alias_name.lower() == self._config.command_name.lower():
+            raise ValueError(f"Alias '{alias_name}' is already the command name")
+
+        alias_mode = LaunchMode.from_name(launch_mode) if launch_mode else self._config.launch_mode
+        if not alias_mode:
+            raise ValueError(f"Invalid mode specified: '{launch_mode}'")
+
+        alias_path = self._config.launch_path
+        if launch_path:
+            path, error = self._reachability_checker.validate_path(launch_path)
+            if not path:
+                raise ValueError(error)
+            alias_path = path
+
+        # A new list, so the configurations sharing the previous one are left unchanged
+        aliases = [alias for alias in self._config.aliases if alias.command_name.lower() != alias_name.lower()]
+        self._config.aliases = [*aliases, Config(alias_name, alias_mode, alias_path)]
+        logger.info("Alias '%s' set to launch in '%s' mode at '%s'", alias_name, alias_mode, alias_path)
+
+    def remove_alias(self, command_name: str) -> None:
         """
-        Launches the warp application using the provided Config.
+        Removes the alias with the command name, raise ValueError if there is none.
         """
-        launch_path = Path(os.getcwd()) if self._config.is_launch_path_parent_process() else self._config.launch_path
+        alias = self._config.get_alias(command_name)
+        if not alias:
+            raise ValueError(f"Command '{command_name}' is not an alias")
 
-        uri = f"warp://action/{self._config.launch_mode.value}?path={launch_path}"
+        self._config.aliases = [other for other in self._config.aliases if other is not alias]
+        logger.info("Alias '%s' removed", alias.command_name)
 
-        subprocess.Popen(
-            ["cmd", "/c", "start", "", uri],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            creationflags=subprocess.DETACHED_PROCESS,
-        )
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    def reload_config(self) -> Config:
+        """
+        Replaces the configuration with the one of the configuration file, discarding the settings changed since.
+        """
+        self._config = self._config_handler.load_config()
+        self._explicit_settings.clear()
+        return self._config
+
+    def save_config(self) -> None:
+        """
+        Saves the configuration to the configuration file, without installing it.
+        """
+        self._config_handler.save_config(self._config)
 
-        logger.info(f"Warp launched in '{self._config.launch_mode}' mode at '{launch_path}'")
+    @traced("launcher.launch")
+    def launch_warp(self, working_directory: Path | None = None) -> Path:
+        """
+        Launches the warp application using the provided Config, overridden by the directory configuration files of
+        the working directory and its ancestors. The working directory, the current one by default, is used when the
+        launch path refers to the parent process. A launch path that does not answer within the path timeout follows
+        the timeout policy. A launch identical to one dispatched within the coalesce window, such as the second click
+        of a double-click, is dropped.
+        """
+        working_directory = working_directory if working_directory else Path(os.getcwd())
+        config = self.resolve_config(working_directory)
+
+        launch_path = working_directory if config.is_launch_path_parent_process() else config.launch_path
+        launch_path = self._reachability_checker.check_launch_path(launch_path)
+
+        if not self._coalescer.claim(config.launch_mode.value, launch_path):
+            logger.info("Ignoring repeated launch in '%s' mode at '%s'", config.launch_mode, launch_path)
+            return launch_path
+
+        try:
+            self._dispatch(launch_path, config.launch_mode)
+        except Exception:
+            # A failed launch is not a repeat, the next identical one must not be dropped
+            self._coalescer.release(config.launch_mode.value, launch_path)
+            raise
+
+        # Recorded once Warp is launched, so the history never delays the launch
+        self._history_handler.record(launch_path)
         return launch_path
 
+    @traced("launcher.resolve_config")
+    def resolve_config(self, directory: Path) -> Config:
+        """
+        Returns the Config that applies to launches from the directory, with its directory overrides applied.
+        """
+        config = self._override_resolver.resolve(self._config, directory)
+        if config is self._config:
+            return config
+
+        for setting in self._explicit_settings:
+            setattr(config, setting, getattr(self._config, setting))
+        return config
+
+    @traced("launcher.launch_many")
+    def launch_many(
+        self,
+        paths: Iterable[str | Path],
+        max_workers: int = DEFAULT_LAUNCH_CONCURRENCY,
+        interval: float = 0.0,
+    ) -> list[Path]:
+        """
+        Launches warp at each path using the configured launch mode, overridden by the directory configuration files of
+        the path and its ancestors. All the paths are validated before the first launch, at most max_workers at the
+        same time. Duplicates are launched once, and the hand-offs are made in the order of the paths, so the tabs and
+        windows open in that order, consecutive ones started at least interval seconds apart.
+        """
+        if interval < 0:
+            raise ValueError("Interval must not be negative")
+
+        launches = self.resolve_launches(paths, max_workers)
+
+        logger.debug("Launching %d paths with concurrency %d and interval %ss", len(launches), max_workers, interval)
+
+        failures = []
+        for index, (launch_path, launch_mode) in enumerate(launches):
+            if index and interval:
+                time.sleep(interval)
+            try:
+                self.launch_at(launch_path, launch_mode)
+            except Exception as e:
+                failures.append(f"'{launch_path}': {e}")
+
+        if failures:
+            raise RuntimeError(f"Failed to launch {len(failures)} of {len(launches)} paths. {'; '.join(failures)}")
+
+        return [launch_path for launch_path, _ in launches]
+
+    def resolve_launches(
+        self, paths: Iterable[str | Path], max_workers: int = DEFAULT_LAUNCH_CONCURRENCY
+    ) -> list[tuple[Path, LaunchMode]]:
+        """
+        Validates the paths as validate_launch_paths does and returns each one with the launch mode of its directory
+        overrides, so every path is checked before the first launch.
+        """
+        if max_workers < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        launch_paths = self.validate_launch_paths(paths, max_workers)
+        return [(launch_path, self.resolve_config(launch_path).launch_mode) for launch_path in launch_paths]
+
+    def launch_at(self, launch_path: Path, launch_mode: LaunchMode | None = None) -> None:
+        """
+        Hands a launch path already validated off to Warp, in the configured launch mode by default, and records it
+        in the history once Warp is launched.
+        """
+        self._dispatch(launch_path, launch_mode)
+        self._history_handler.record(launch_path)
+
+    def validate_launch_paths(self, paths: Iterable[str | Path], max_workers: int = 1) -> list[Path]:
+        """
+        Validates the paths together, at most max_workers at the same time, and returns them as absolute paths without
+        duplicates, raise ValueError with every error if any path is invalid. The paths that do not answer within the
+        path timeout follow the policy.
+        """
+        launch_paths: list[Path] = []
+        errors: list[str] = []
+        with span("launcher.validate_paths"):
+            validations = self._reachability_checker.validate_paths(
+                dict.fromkeys(str(path) for path in paths), max_workers
+            )
+        for result in validations:
+            if result.value:
+                launch_paths.append(result.value.absolute())
+            else:
+                errors.append(str(result.error))
+
+        if errors:
+            raise ValueError("; ".join(errors))
+        # Paths replaced by the home directory may repeat it
+        return list(dict.fromkeys(launch_paths))
+
+    @traced("launcher.launch_layout")
+    def launch_layout(self, layout: Layout, layout_handler: LayoutHandler | None = None) -> Path:
+        """
+        Saves the layout as a Warp Launch Configuration and opens it with a single URI.
+        """
+        from urllib.parse import quote
+
+        from warp_launcher.layout import LayoutHandler
+
+        handler = layout_handler if layout_handler else LayoutHandler()
+        configuration_file_path = handler.save_launch_configuration(layout)
+
+        self._dispatcher.dispatch(f"warp://launch/{quote(configuration_file_path.name)}")
+
+        logger.info("Warp launched with layout '%s'", layout.name)
+        return configuration_file_path
+
+    @traced("launcher.dispatch")
+    def _dispatch(self, launch_path: Path, launch_mode: LaunchMode | None = None) -> None:
+        launch_mode = launch_mode if launch_mode else self._config.launch_mode
+        uri = f"warp://action/{launch_mode.value}?path={launch_path}"
+
+        self._dispatcher.dispatch(uri)
+
+        logger.info("Warp launched in '%s' mode at '%s'", launch_mode, launch_path)
+
+    @traced("launcher.plan_install")
+    def plan_install(self) -> InstallPlan:
+        """
+        Compares the desired installation with the install manifest, the installed files and the App Paths registry,
+        and returns the writes needed to reach it, without writing anything.
+        """
+        with self._app_paths_register.session() as registry:
+            return self._plan_install(registry)
+
+    def _plan_install(self, registry: AppPathsSession) -> InstallPlan:
+        from warp_launcher.manifest import InstallPlan, hash_content, hash_file
+
+        manifest = self._manifest_handler.load_manifest()
+        plan = InstallPlan()
+
+        # Each command, the main one and its aliases, has its own script
+        scripts = {self._get_script_file_path(command.command_name): command for command in self._config.get_commands()}
+        # Each file is hashed as it is written, with the newline option of its target
+        artifacts: dict[Path, tuple[str, str | None]] = {}
+        for script_file_path, command in scripts.items():
+            script_handler = self._get_script_handler(script_file_path)
+            artifacts[script_file_path] = (
+                script_handler.render_script(command),
+                script_handler.target.open_options().get("newline"),
+            )
+        artifacts[self._config_handler.config_file_path] = (self._config_handler.render_config(self._config), None)
+        for file_path, (content, newline) in artifacts.items():
+            content_hash = hash_content(content, newline)
+            plan.manifest.artifacts[file_path.name] = content_hash
+
+            current_hash = hash_file(file_path)
+            if current_hash == content_hash:
+                continue
+
+            plan.writes.append(file_path)
+            if current_hash is None:
+                plan.changes.append(f"File '{file_path.name}' is missing")
+            elif manifest.artifacts.get(file_path.name) == current_hash:
+                plan.changes.append(f"File '{file_path.name}' is outdated")
+            else:
+                plan.changes.append(f"File '{file_path.name}' was modified outside the installer")
+
+        # Files generated by previous installations, such as the script of another script target
+        for artifact_name in sorted(set(manifest.artifacts) - set(plan.manifest.artifacts)):
+            artifact_file_path = self.install_directory / artifact_name
+            if artifact_file_path.exists():
+                plan.removals.append(artifact_file_path)
+                plan.changes.append(f"File '{artifact_name}' is no longer used")
+
+        for script_file_path, command in scripts.items():
+            command_name = command.command_name
+            plan.manifest.registrations[command_name] = str(script_file_path)
+
+            registered_path = registry.get_registered_path(command_name)
+            if registered_path != str(script_file_path):
+                plan.registrations.append(command_name)
+                if registered_path is None:
+                    plan.changes.append(f"Command '{command_name}' is not registered")
+                else:
+                    plan.changes.append(f"Command '{command_name}' is registered to '{registered_path}'")
+
+        # Installations made before the manifest existed only know the commands from the saved configuration
+        previous_command_names = set(manifest.registrations)
+        if not manifest.registrations and self._config_handler.config_file_path.exists():
+            previous_command_names.update(
+                command.command_name for command in self._config_handler.load_config().get_commands()
+            )
+
+        # Registry keys are case-insensitive, a command renamed only in case is registered again rather than removed
+        command_name_keys = {command_name.lower() for command_name in plan.manifest.registrations}
+        for previous_command_name in sorted(previous_command_names):
+            if previous_command_name.lower() in command_name_keys:
+                continue
+            if registry.is_registered(previous_command_name):
+                plan.unregistrations.append(previous_command_name)
+                plan.changes.append(f"Previous command '{previous_command_name}' is still registered")
+
+        plan.update_manifest = manifest != plan.manifest or not plan.is_empty()
+        return plan
+
+    def check_install(self) -> list[str]:
+        """
+        Returns the differences between the installation and the current configuration, without writing anything.
+        """
+        try:
+            return self.plan_install().changes
+        except (RuntimeError, OSError) as e:
+            raise RuntimeError(f"Failed to check the installation. {e}") from e
+
+    def _get_script_file_path(self, command_name: str) -> Path:
+        """
+        Returns the script of a command, the aliases have their name appended to the name of the main script.
+        """
+        if command_name == self._config.command_name:
+            return self._script_file_path
+        return self._script_file_path.with_name(
+            f"{self._script_file_path.stem}-{command_name}{self._script_file_path.suffix}"
+        )
+
+    def _get_script_handler(self, script_file_path: Path) -> ScriptHandler:
+        if script_file_path == self._script_file_path:
+            return self._script_handler
+
+        from warp_launcher.script import ScriptHandler
+
+        return ScriptHandler(script_file_path)
+
+    @traced("launcher.install")
     def install(self) -> None:
         """
-        Persists the configuration by saving the script, the configuration file,
-        and registering the command in the App Paths registry.
+        Persists the configuration by saving the scripts of the command and its aliases, the configuration file,
+        and registering the commands in the App Paths registry. Only the differences with the current installation
+        are written, and the registry changes are applied together, in a single session, once the files are saved.
         """
         try:
-            if self._config_handler.config_file_path.exists():
-                logger.debug("Found existing configuration, checking if the previous command should be removed")
-                saved_command_name = self._config_handler.load_config().command_name
-                is_command_registered = self._app_paths_register.is_registered(saved_command_name)
-                if saved_command_name != self._config.command_name and is_command_registered:
-                    logger.info(f"Removing previous command '{saved_command_name}'")
-                    self._app_paths_register.unregister(saved_command_name)
+            with self._app_paths_register.session() as registry:
+                plan = self._plan_install(registry)
 
-            self.install_directory.mkdir(exist_ok=True)
+                for change in plan.changes:
+                    logger.debug(change)
 
-            self._script_handler.save_script(self._config)
+                for previous_command_name in plan.unregistrations:
+                    logger.info("Removing previous command '%s'", previous_command_name)
+                    registry.unregister(previous_command_name)
 
-            self._config_handler.save_config(self._config)
+                if plan.writes or plan.update_manifest:
+                    self.install_directory.mkdir(parents=True, exist_ok=True)
 
-            self._app_paths_register.register(self._config.command_name)
+                for command in self._config.get_commands():
+                    script_file_path = self._get_script_file_path(command.command_name)
+                    if script_file_path in plan.writes:
+                        self._get_script_handler(script_file_path).save_script(command)
+
+                if self._config_handler.config_file_path in plan.writes:
+                    self._config_handler.save_config(self._config)
+
+                for command_name in plan.registrations:
+                    registry.register(command_name, Path(plan.manifest.registrations[command_name]))
+
+            # Removed once the commands are registered to the new files
+            for artifact_file_path in plan.removals:
+                logger.info("Removing previous file '%s'", artifact_file_path.name)
+                artifact_file_path.unlink(missing_ok=True)
+
+            if plan.update_manifest:
+                self._manifest_handler.save_manifest(plan.manifest)
         except (RuntimeError, OSError) as e:
             raise RuntimeError(f"Failed to install. {e}") from e
 
-        logger.info("Installation completed successfully.")
+        if plan.is_empty():
+            logger.info("Installation is already up to date.")
+        else:
+            logger.info("Installation completed successfully.")
         logger.info(
-            f"Now you can type '{self.command_name}' in the Explorer address bar "
-            f"or run 'start {self.command_name}' in the terminal to open Warp at that location."
+            "Now you can type '%s' in the Explorer address bar "
+            "or run 'start %s' in the terminal to open Warp at that location.",
+            self.command_name,
+            self.command_name,
         )
+        for alias in self._config.aliases:
+            logger.info(
+                "Type '%s' to launch in '%s' mode at '%s'.", alias.command_name, alias.launch_mode, alias.launch_path
+            )
 
+    @traced("launcher.install_context_menu")
+    def install_context_menu(self) -> None:
+        """
+        Adds an 'Open in Warp' verb to the Explorer context menu of the folders and folder backgrounds. The folders of
+        a multiple selection are gathered by the first process that Explorer starts and launched together.
+        """
+        try:
+            self._context_menu_register.register(_build_context_menu_command())
+        except RuntimeError as e:
+            raise RuntimeError(f"Failed to install the context menu. {e}") from e
+
+        logger.info("Select one or several folders in Explorer and choose '%s'", self._context_menu_register.label)
+
+    @traced("launcher.uninstall")
     def uninstall(self) -> None:
         """
-        Removes the installation directory and unregisters the command from the App Paths registry.
+        Removes the installation directory and unregisters the command and its aliases from the App Paths registry,
+        together in a single session.
         """
         try:
             config = self._config_handler.load_config()
 
-            self._app_paths_register.unregister(config.command_name)
+            with self._app_paths_register.session() as registry:
+                for command in config.get_commands():
+                    registry.unregister(command.command_name)
+
+                # Commands registered by previous installations
+                for command_name in self._manifest_handler.load_manifest().registrations:
+                    registry.unregister(command_name)
+
+            self._context_menu_register.unregister()
 
             self._remove_install_directory()
         except RuntimeError as e:
@@ -145,8 +600,10 @@ class Launcher:
         logger.info("Uninstallation completed successfully")
 
     def _remove_install_directory(self) -> None:
+        import shutil
+
         # Remove installation directory if it exists
-        logger.debug(f"Removing installation directory '{self.install_directory}'")
+        logger.debug("Removing installation directory '%s'", self.install_directory)
 
         if not self.install_directory.exists():
             logger.info("Installation directory does not exist")
@@ -155,5 +612,5 @@ class Launcher:
             shutil.rmtree(self.install_directory)
             logger.info("Installation directory removed")
         except OSError as e:
-            logger.error(f"Error removing installation directory '{self.install_directory}': {e}")
+            logger.error("Error removing installation directory '%s': %s", self.install_directory, e)
             raise RuntimeError(f"Error removing installation directory: {e}") from e
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.constants import WARP_LAUNCH_CONFIGURATIONS_DIRECTORY
+from warp_launcher.enums import SplitDirection
+from warp_launcher.utils import validate_path
+
+_NAME_KEY: Final[str] = "name"
+_WINDOWS_KEY: Final[str] = "windows"
+_TABS_KEY: Final[str] = "tabs"
+_TITLE_KEY: Final[str] = "title"
+_COLOR_KEY: Final[str] = "color"
+_LAYOUT_KEY: Final[str] = "layout"
+_CWD_KEY: Final[str] = "cwd"
+_COMMANDS_KEY: Final[str] = "commands"
+_SPLIT_DIRECTION_KEY: Final[str] = "splitDirection"
+_PANES_KEY: Final[str] = "panes"
+
+_TAB_COLORS: Final[tuple[str, ...]] = ("red", "green", "yellow", "blue", "magenta", "cyan")
+_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[\w][\w .-]*$")
+
+logger = logging.getLogger(__name__)
+
+
+def _quote(value: str) -> str:
+    # A JSON string is a valid YAML double-quoted scalar
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _get_list(data: dict[str, Any], key: str) -> list[Any]:
+    value = data.get(key, [])
+    if not isinstance(value, list):
+        raise ValueError(f"'{key}' must be a list")
+    return value
+
+
+def _get_dict(value: Any, description: str) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ValueError(f"{description} must be an object")
+    return value
+
+
+@dataclass
+class Pane:
+    cwd: Path | None = None
+    commands: list[str] = field(default_factory=list)
+    split_direction: SplitDirection | None = None
+    panes: list[Pane] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], base_directory: Path) -> Pane:
+        """
+        Create a Pane from a dictionary, relative paths are resolved from the base directory.
+        Raise ValueError if a value is invalid.
+        """
+        panes = [cls.from_dict(_get_dict(pane, "Pane"), base_directory) for pane in _get_list(data, _PANES_KEY)]
+        if panes:
+            split_direction = SplitDirection.from_value(data.get(_SPLIT_DIRECTION_KEY, str(SplitDirection.VERTICAL)))
+            if not split_direction:
+                raise ValueError(f"Invalid split direction: '{data.get(_SPLIT_DIRECTION_KEY)}'")
+            if _CWD_KEY in data or _COMMANDS_KEY in data:
+                raise ValueError("A pane with nested panes cannot define a working directory or commands")
+            return cls(split_direction=split_direction, panes=panes)
+
+        cwd = None
+        if data.get(_CWD_KEY):
+            cwd, error = validate_path(str(base_directory / Path(str(data[_CWD_KEY])).expanduser()))
+            if not cwd:
+                raise ValueError(error)
+
+        commands = _get_list(data, _COMMANDS_KEY)
+        if not all(isinstance(command, str) and command for command in commands):
+            raise ValueError("Commands must be non-empty strings")
+
+        if not cwd and not commands:
+            raise ValueError("A pane must define a working directory, commands or nested panes")
+
+        return cls(cwd=cwd, commands=commands)
+
+    def to_yaml_lines(self, indent: int) -> list[str]:
+        prefix = " " * indent
+        if self.panes:
+            lines = [f"{prefix}split_direction: {self.split_direction}", f"{prefix}panes:"]
+            for pane in self.panes:
+                pane_lines = pane.to_yaml_lines(indent + 4)
+                lines.append(f"{prefix}  - {pane_lines[0].lstrip()}")
+                lines.extend(pane_lines[1:])
+            return lines
+
+        lines = [f"{prefix}cwd: {_quote(str(self.cwd))}"] if self.cwd else []
+        if self.commands:
+            lines.append(f"{prefix}commands:")
+            lines.extend(f"{prefix}  - exec: {_quote(command)}" for command in self.commands)
+        return lines
+
+
+@dataclass
+class Tab:
+    layout: Pane
+    title: str | None = None
+    color: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], base_directory: Path) -> Tab:
+        """
+        Create a Tab from a dictionary, the pane layout can be given inline. Raise ValueError if a value is invalid.
+        """
+        title = data.get(_TITLE_KEY)
+        if title is not None and not isinstance(title, str):
+            raise ValueError("Tab title must be a string")
+
+        color = data.get(_COLOR_KEY)
+        if color is not None and color not in _TAB_COLORS:
+            raise ValueError(f"Invalid tab color: '{color}'")
+
+        layout_data = _get_dict(data.get(_LAYOUT_KEY, data), "Tab layout")
+        return cls(Pane.from_dict(layout_data, base_directory), title, color)
+
+
+@dataclass
+class Window:
+    tabs: list[Tab]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], base_directory: Path) -> Window:
+        """
+        Create a Window from a dictionary, raise ValueError if a value is invalid.
+        """
+        tabs = [Tab.from_dict(_get_dict(tab, "Tab"), base_directory) for tab in _get_list(data, _TABS_KEY)]
+        if not tabs:
+            raise ValueError("A window must have at least one tab")
+        return cls(tabs)
+
+
+@dataclass
+class Layout:
+    name: str
+    windows: list[Window]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], base_directory: Path) -> Layout:
+        """
+        Create a Layout from a dictionary, relative paths are resolved from the base directory.
+        Raise ValueError if a value is invalid.
+        """
+        name = data.get(_NAME_KEY)
+        if not isinstance(name, str) or not _NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid layout name: '{name}'")
+
+        windows = [
+            Window.from_dict(_get_dict(window, "Window"), base_directory) for window in _get_list(data, _WINDOWS_KEY)
+        ]
+        if not windows:
+            raise ValueError("A layout must have at least one window")
+
+        return cls(name, windows)
+
+    def to_yaml(self) -> str:
+        """
+        Render the layout as a Warp Launch Configuration.
+        """
+        lines = ["---", f"name: {_quote(self.name)}", "windows:"]
+        for window in self.windows:
+            lines.append("  - tabs:")
+            for tab in window.tabs:
+                tab_lines = []
+                if tab.title:
+                    tab_lines.append(f"title: {_quote(tab.title)}")
+                if tab.color:
+                    tab_lines.append(f"color: {tab.color}")
+                tab_lines.append("layout:")
+
+                lines.append(f"      - {tab_lines[0]}")
+                lines.extend(f"        {line}" for line in tab_lines[1:])
+                lines.extend(tab.layout.to_yaml_lines(10))
+        return "\n".join(lines) + "\n"
+
+
+class LayoutHandler:
+    def __init__(self, launch_configurations_directory: Path = WARP_LAUNCH_CONFIGURATIONS_DIRECTORY) -> None:
+        self.launch_configurations_directory: Path = launch_configurations_directory
+
+    @staticmethod
+    def load_layout(layout_file_path: Path) -> Layout:
+        """
+        Load a declarative layout from a JSON file, raise ValueError if the layout is invalid.
+        """
+        logger.debug("Loading layout from '%s'", layout_file_path)
+        try:
+            with layout_file_path.open("r", encoding="utf-8") as layout_file:
+                layout_data = json.load(layout_file)
+        except OSError as e:
+            raise RuntimeError(f"Error reading layout '{layout_file_path}': {e}") from e
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid layout '{layout_file_path}': {e}") from e
+
+        return Layout.from_dict(_get_dict(layout_data, "Layout"), layout_file_path.absolute().parent)
+
+    def save_launch_configuration(self, layout: Layout) -> Path:
+        """
+        Write the layout as a Warp Launch Configuration, the file is only rewritten when its content changes.
+        """
+        configuration_file_path = self.launch_configurations_directory / f"{layout.name}.yaml"
+        content = layout.to_yaml()
+
+        try:
+            if configuration_file_path.exists() and configuration_file_path.read_text(encoding="utf-8") == content:
+                logger.debug("Launch configuration '%s' is up to date", configuration_file_path)
+                return configuration_file_path
+
+            logger.debug("Saving launch configuration to '%s'", configuration_file_path)
+            self.launch_configurations_directory.mkdir(parents=True, exist_ok=True)
+            # Replaced at once, so Warp never reads a partial launch configuration
+            with atomic_open(configuration_file_path, lock=False, encoding="utf-8") as configuration_file:
+                configuration_file.write(content)
+        except OSError as e:
+            logger.error("Error writing launch configuration '%s': %s", configuration_file_path, e)
+            raise RuntimeError(f"Error writing launch configuration: {e}") from e
+
+        return configuration_file_path
@@ -1,7 +1,15 @@
+import atexit
+import json
 import logging
 import sys
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Any, TextIO
 
-from warp_launcher.constants import LOG_FORMAT
+from warp_launcher.constants import LOG_FILE_BACKUP_COUNT, LOG_FILE_MAX_SIZE, LOG_FORMAT
+from warp_launcher.enums import LogFileFormat
 
 # ANSI color codes
 _DEFAULT = "\033[0m"
@@ -16,22 +24,124 @@ _COLOR_MAP = {
     logging.WARNING: _YELLOW,
 }
 
+_listener: QueueListener | None = None
+
 
 class ColorFormatter(logging.Formatter):
     """Formatter that colors the log messages based on level."""
 
+    def __init__(self, fmt: str | None = None, use_color: bool = True) -> None:
+        super().__init__(fmt)
+        self.use_color = use_color
+
     def format(self, record: logging.LogRecord) -> str:
         message = super().format(record)
+        if not self.use_color:
+            return message
         color = _COLOR_MAP.get(record.levelno, _DEFAULT)
         return f"{color}{message}{_DEFAULT}"
 
 
-def configure_logging(level: int = logging.INFO) -> None:
-    """Configure console logger."""
+class JsonLinesFormatter(logging.Formatter):
+    """Formatter that writes each log record as a single JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves the formatting of the tracebacks to the background thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The message is merged on the calling thread, the arguments could change once the call returns.
+        # The queue stays in-process, so the exception info does not have to be pickled
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _is_terminal(stream: TextIO) -> bool:
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _create_file_handler(log_file_path: Path, log_file_format: LogFileFormat) -> logging.Handler:
+    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # The file is only opened once the first record is written
+    handler = RotatingFileHandler(
+        log_file_path,
+        maxBytes=LOG_FILE_MAX_SIZE,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    if log_file_format == LogFileFormat.JSONL:
+        handler.setFormatter(JsonLinesFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    return handler
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    log_file_path: Path | None = None,
+    log_file_format: LogFileFormat = LogFileFormat.TEXT,
+    stream: TextIO | None = None,
+) -> None:
+    """
+    Configure the console logger, and optionally a rotating log file. The records are handed to a background thread
+    that formats and writes them, so logging never blocks on the console or the file.
+    """
+    global _listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    if not root_logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(ColorFormatter(LOG_FORMAT))
-        root_logger.addHandler(handler)
+    if root_logger.handlers:
+        return
+
+    console_stream = stream if stream else sys.stdout
+    console_handler = logging.StreamHandler(console_stream)
+    console_handler.setFormatter(ColorFormatter(LOG_FORMAT, use_color=_is_terminal(console_stream)))
+    handlers: list[logging.Handler] = [console_handler]
+
+    if log_file_path:
+        handlers.append(_create_file_handler(log_file_path, log_file_format))
+
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root_logger.addHandler(_DeferredQueueHandler(queue))
+
+    _listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Write the pending records, then stop the background thread and close the handlers.
+    """
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, _DeferredQueueHandler):
+            root_logger.removeHandler(handler)
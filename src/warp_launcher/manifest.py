@@ -0,0 +1,124 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.tracing import traced
+
+_ARTIFACTS_KEY: Final[str] = "artifacts"
+_REGISTRATIONS_KEY: Final[str] = "registrations"
+
+logger = logging.getLogger(__name__)
+
+
+def hash_content(content: str, newline: str | None = None) -> str:
+    """
+    Hash the bytes a file opened in text mode with the newline option writes for the content: the line endings
+    translated to the ones of the system, unless newline is given, and encoded in UTF-8.
+    """
+    line_ending = os.linesep if newline is None else newline
+    if line_ending:
+        content = content.replace("\n", line_ending)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def hash_file(file_path: Path) -> str | None:
+    """
+    Hash the bytes of a file, return None if it does not exist or cannot be read.
+    """
+    try:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+@dataclass
+class InstallManifest:
+    # Content hash of each generated file, by file name
+    artifacts: dict[str, str] = field(default_factory=dict)
+    # Registered App Paths value of each command, by command name
+    registrations: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        return {_ARTIFACTS_KEY: dict(self.artifacts), _REGISTRATIONS_KEY: dict(self.registrations)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "InstallManifest":
+        """
+        Create an InstallManifest instance from a dictionary, raise ValueError if a value is invalid.
+        """
+        sections = []
+        for key in (_ARTIFACTS_KEY, _REGISTRATIONS_KEY):
+            section = data.get(key, {})
+            if not isinstance(section, dict) or not all(
+                isinstance(name, str) and isinstance(value, str) for name, value in section.items()
+            ):
+                raise ValueError(f"Invalid manifest section: '{key}'")
+            sections.append(section)
+
+        return cls(*sections)
+
+
+@dataclass
+class InstallPlan:
+    # Files to write, and files of previous installations that are no longer generated
+    writes: list[Path] = field(default_factory=list)
+    removals: list[Path] = field(default_factory=list)
+    # Commands to register and previous commands to unregister
+    registrations: list[str] = field(default_factory=list)
+    unregistrations: list[str] = field(default_factory=list)
+    # Human-readable description of each difference with the desired installation
+    changes: list[str] = field(default_factory=list)
+    # Manifest describing the installation once the plan is applied
+    manifest: InstallManifest = field(default_factory=InstallManifest)
+    update_manifest: bool = False
+
+    def is_empty(self) -> bool:
+        return not (self.writes or self.removals or self.registrations or self.unregistrations)
+
+
+class ManifestHandler:
+    def __init__(self, manifest_file_path: Path) -> None:
+        self.manifest_file_path: Path = manifest_file_path
+
+    @traced("manifest.load")
+    def load_manifest(self) -> InstallManifest:
+        """
+        Load the install manifest, or return an empty manifest if not exist or an error occurs.
+        """
+        logger.debug("Loading install manifest from '%s'", self.manifest_file_path)
+        try:
+            with self.manifest_file_path.open("r", encoding="utf-8") as manifest_file:
+                return InstallManifest.from_dict(json.load(manifest_file))
+        except FileNotFoundError:
+            logger.debug("Install manifest not found")
+        except Exception as e:
+            logger.warning("Ignoring invalid install manifest '%s': %s", self.manifest_file_path, e)
+        return InstallManifest()
+
+    def load_script_filename(self) -> str | None:
+        """
+        Return the name of the installed main launcher script, which depends on the script target it was installed
+        with, or None if no command is registered.
+        """
+        # The main command is registered first, the aliases have their own scripts
+        for registered_path in self.load_manifest().registrations.values():
+            return Path(registered_path).name
+        return None
+
+    @traced("manifest.save")
+    def save_manifest(self, manifest: InstallManifest) -> None:
+        """
+        Save the install manifest to file.
+        """
+        logger.debug("Saving install manifest to '%s'", self.manifest_file_path)
+        try:
+            with atomic_open(self.manifest_file_path, encoding="utf-8") as manifest_file:
+                json.dump(manifest.to_dict(), manifest_file, indent=4)
+        except OSError as e:
+            logger.error("Error saving install manifest '%s': %s", self.manifest_file_path, e)
+            raise RuntimeError(f"Error saving install manifest: {e}") from e
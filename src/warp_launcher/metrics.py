@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from warp_launcher.atomic import atomic_open, locked
+from warp_launcher.constants import (
+    INSTALL_DIRECTORY,
+    METRICS_FILE_NAME,
+    METRICS_LOG_FILE_NAME,
+    METRICS_LOG_MAX_SIZE,
+    METRICS_MAX_SERIES,
+    WRITE_LOCK_FILE_NAME,
+)
+
+# Each power of two is split in 2^3 buckets, so a bucket is at most 12.5% wide
+_SUB_BUCKET_BITS: Final[int] = 3
+_SUB_BUCKET_COUNT: Final[int] = 1 << _SUB_BUCKET_BITS
+# Longest duration kept apart, about 12 days in microseconds, longer ones fall in the last bucket
+_MAX_VALUE: Final[int] = (1 << 40) - 1
+
+# Phase of the series that holds the end-to-end duration of an action
+TOTAL_PHASE: Final[str] = "total"
+
+# Upper bounds, in seconds, of the buckets of the OpenMetrics export
+_EXPORT_BOUNDS: Final[tuple[float, ...]] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+_EXPORT_METRIC_NAME: Final[str] = "warp_launcher_duration_seconds"
+
+# Series of a histogram: the action and one of its phases
+SeriesKey = tuple[str, str]
+
+logger = logging.getLogger(__name__)
+
+
+def get_bucket_index(value: int) -> int:
+    """
+    Return the bucket of a duration in microseconds. Values below the sub-bucket count have a bucket each, the
+    larger ones share a bucket with the values that have the same highest bits.
+    """
+    value = min(max(value, 0), _MAX_VALUE)
+    if value < _SUB_BUCKET_COUNT:
+        return value
+
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKET_COUNT + (value >> shift) - _SUB_BUCKET_COUNT
+
+
+def get_bucket_bounds(index: int) -> tuple[int, int]:
+    """
+    Return the lowest and the highest duration in microseconds of a bucket.
+    """
+    if index < _SUB_BUCKET_COUNT:
+        return index, index
+
+    shift = index // _SUB_BUCKET_COUNT - 1
+    sub_bucket = index % _SUB_BUCKET_COUNT + _SUB_BUCKET_COUNT
+    return sub_bucket << shift, ((sub_bucket + 1) << shift) - 1
+
+
+@dataclass
+class Histogram:
+    """Log-bucketed durations in microseconds, with the number of samples of each non-empty bucket."""
+
+    counts: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    total: int = 0
+
+    def record(self, value: int) -> None:
+        index = get_bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += max(value, 0)
+
+    def get_quantile(self, quantile: float) -> float:
+        """
+        Return the duration in microseconds below which the quantile of the samples falls, the middle of its bucket.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = quantile * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lowest, highest = get_bucket_bounds(index)
+                return (lowest + highest) / 2
+
+        return float(get_bucket_bounds(max(self.counts))[1])
+
+    def count_up_to(self, value: int) -> int:
+        """
+        Return the number of samples in the buckets that end at or below the duration in microseconds.
+        """
+        return sum(count for index, count in self.counts.items() if get_bucket_bounds(index)[1] <= value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+            "count": self.count,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Histogram:
+        try:
+            counts = {int(index): int(count) for index, count in data["counts"].items()}
+            return cls(counts, int(data["count"]), int(data["total"]))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"Invalid histogram: {e}") from e
+
+
+class MetricsHandler:
+    """
+    Latency histograms of the actions and their phases. Each run appends its durations to a small log, which is
+    periodically compacted into the histograms, so recording costs a single append.
+    """
+
+    def __init__(self, install_directory: Path = INSTALL_DIRECTORY, max_series: int = METRICS_MAX_SERIES) -> None:
+        self.log_file_path: Path = install_directory / METRICS_LOG_FILE_NAME
+        self.metrics_file_path: Path = install_directory / METRICS_FILE_NAME
+        # Log moved aside by the running compaction, or left by a failed one
+        self.pending_log_file_path: Path = install_directory / f"{METRICS_LOG_FILE_NAME}.pending"
+        self.max_series = max_series
+
+    def record(self, action: str, durations: dict[str, int]) -> None:
+        """
+        Append the durations in microseconds of the phases of an action, the end-to-end one under the total phase.
+        Errors are logged and ignored, the metrics never fail an action.
+        """
+        fields = [action, *(f"{phase}={duration}" for phase, duration in durations.items())]
+        if any(character in "".join(fields) for character in "\t\n"):
+            return
+
+        line = ("\t".join(fields) + "\n").encode()
+        try:
+            # A single append is atomic enough for concurrent runs and needs no lock
+            file_descriptor = os.open(self.log_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(file_descriptor, line)
+                log_size = os.fstat(file_descriptor).st_size
+            finally:
+                os.close(file_descriptor)
+
+            if log_size > METRICS_LOG_MAX_SIZE:
+                self.compact()
+        except (OSError, ValueError) as e:
+            logger.debug("Durations not recorded: %s", e)
+
+    def compact(self) -> None:
+        """
+        Merge the log into the histograms.
+        """
+        # Compactions are applied one by one, each one merges the histograms saved by the previous one
+        with locked(self.metrics_file_path.with_name(WRITE_LOCK_FILE_NAME)):
+            # Move the log aside first, runs recorded meanwhile start a new log. A pending log left by a failed
+            # compaction is merged first, the current log waits for the next compaction
+            if not self.pending_log_file_path.exists():
+                try:
+                    os.replace(self.log_file_path, self.pending_log_file_path)
+                except FileNotFoundError:
+                    return
+
+            histograms = self._load_histograms()
+            self._merge_log(histograms, self.pending_log_file_path)
+            self._save_histograms(histograms)
+            # Only dropped once its runs are saved, a failed compaction keeps them for the next one
+            self.pending_log_file_path.unlink()
+
+        logger.debug("Durations compacted into '%s'", self.metrics_file_path)
+
+    def load_histograms(self) -> dict[SeriesKey, Histogram]:
+        """
+        Return the histogram of each series, including the runs not compacted yet. The series are ordered by action,
+        the end-to-end duration first and then the phases.
+        """
+        histograms = self._load_histograms()
+        self._merge_log(histograms, self.pending_log_file_path)
+        self._merge_log(histograms, self.log_file_path)
+        return dict(sorted(histograms.items(), key=lambda item: (item[0][0], item[0][1] != TOTAL_PHASE, item[0][1])))
+
+    def export_openmetrics(self, export_file_path: Path) -> None:
+        """
+        Write the histograms as an OpenMetrics text file, such as the ones read by the textfile collector of the
+        Prometheus node exporter. The file is replaced at once, so it is never read half written.
+        """
+        lines = [
+            f"# TYPE {_EXPORT_METRIC_NAME} histogram",
+            f"# UNIT {_EXPORT_METRIC_NAME} seconds",
+            f"# HELP {_EXPORT_METRIC_NAME} Duration of the warp-launcher actions and their phases.",
+        ]
+        for (action, phase), histogram in self.load_histograms().items():
+            labels = f'action="{action}",phase="{phase}"'
+            for bound in _EXPORT_BOUNDS:
+                count = histogram.count_up_to(int(bound * 1_000_000))
+                lines.append(f'{_EXPORT_METRIC_NAME}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{_EXPORT_METRIC_NAME}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{_EXPORT_METRIC_NAME}_count{{{labels}}} {histogram.count}")
+            lines.append(f"{_EXPORT_METRIC_NAME}_sum{{{labels}}} {histogram.total / 1_000_000}")
+        lines.append("# EOF")
+
+        try:
+            with atomic_open(export_file_path, lock=False, encoding="utf-8", newline="\n") as export_file:
+                export_file.write("\n".join(lines) + "\n")
+        except OSError as e:
+            raise RuntimeError(f"Error exporting metrics to '{export_file_path}': {e}") from e
+
+    def _merge_log(self, histograms: dict[SeriesKey, Histogram], log_file_path: Path) -> None:
+        try:
+            with log_file_path.open("r", encoding="utf-8", errors="replace") as log_file:
+                lines = log_file.readlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            action, *fields = line.rstrip("\n").split("\t")
+            for phase_field in fields:
+                phase, _, duration = phase_field.rpartition("=")
+                if not phase or not duration.isdigit():
+                    continue
+
+                key = (action, phase)
+                histogram = histograms.get(key)
+                if histogram is None:
+                    # The series are bounded, phases beyond the limit are dropped
+                    if len(histograms) >= self.max_series:
+                        continue
+                    histogram = histograms[key] = Histogram()
+                histogram.record(int(duration))
+
+    def _load_histograms(self) -> dict[SeriesKey, Histogram]:
+        try:
+            with self.metrics_file_path.open("r", encoding="utf-8") as metrics_file:
+                data = json.load(metrics_file)
+            return {
+                (series["action"], series["phase"]): Histogram.from_dict(series["histogram"])
+                for series in data["series"]
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring invalid metrics file '%s': %s", self.metrics_file_path, e)
+            return {}
+
+    def _save_histograms(self, histograms: dict[SeriesKey, Histogram]) -> None:
+        data = {
+            "series": [
+                {"action": action, "phase": phase, "histogram": histogram.to_dict()}
+                for (action, phase), histogram in sorted(histograms.items())
+            ]
+        }
+        # The caller holds the write lock
+        with atomic_open(self.metrics_file_path, lock=False, encoding="utf-8") as metrics_file:
+            json.dump(data, metrics_file, separators=(",", ":"))
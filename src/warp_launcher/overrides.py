@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.config import Config, ConfigHandler
+from warp_launcher.constants import (
+    INSTALL_DIRECTORY,
+    OVERRIDES_FILE_NAME,
+    OVERRIDES_INDEX_FILE_NAME,
+    OVERRIDES_INDEX_MAX_ENTRIES,
+    OVERRIDES_INDEX_TTL,
+)
+from warp_launcher.utils import StatKey, get_stat_key, merge_dicts
+
+logger = logging.getLogger(__name__)
+
+
+class OverrideResolver:
+    """
+    Resolves the settings of the directory configuration files found in a directory and its ancestors, the nearest
+    file taking precedence. The resolutions are kept in an index of the installation directory, together with the
+    identity of the files they were read from, so a launch from an indexed directory only checks the files found
+    instead of every ancestor. Files created in an ancestor are found once the entry is older than the index TTL.
+    """
+
+    def __init__(
+        self,
+        install_directory: Path = INSTALL_DIRECTORY,
+        ttl: float = OVERRIDES_INDEX_TTL,
+        max_entries: int = OVERRIDES_INDEX_MAX_ENTRIES,
+    ) -> None:
+        self.index_file_path: Path = install_directory / OVERRIDES_INDEX_FILE_NAME
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def resolve(self, config: Config, directory: Path) -> Config:
+        """
+        Return the config with the overrides of the directory applied, or the config itself if there are none.
+        Invalid overrides are logged and ignored, they never fail a launch.
+        """
+        overrides = self.find_overrides(directory)
+        if not overrides:
+            return config
+
+        try:
+            return config.with_overrides(overrides)
+        except ValueError as e:
+            logger.warning("Ignoring the overrides of '%s': %s", directory, e)
+            return config
+
+    def find_overrides(self, directory: Path, now: int | None = None) -> dict[str, Any]:
+        """
+        Return the merged overrides of the directory configuration files of the directory and its ancestors.
+        """
+        directory_key = os.path.normcase(os.path.abspath(directory))
+        now = now if now is not None else time.time_ns()
+
+        index = self._load_index()
+        entry = index.get(directory_key)
+        if entry is not None and self._is_entry_valid(entry, now):
+            logger.debug("Overrides of '%s' found in the index", directory_key)
+            return dict(entry["overrides"])
+
+        overrides, files = self._walk(directory_key)
+        index[directory_key] = {"checked": now, "files": files, "overrides": overrides}
+        self._save_index(index)
+        return overrides
+
+    def clear_index(self) -> None:
+        """
+        Remove the index, every directory is resolved again on its next launch.
+        """
+        self.index_file_path.unlink(missing_ok=True)
+
+    def _is_entry_valid(self, entry: dict[str, Any], now: int) -> bool:
+        try:
+            if not 0 <= now - entry["checked"] < self.ttl * 1_000_000_000:
+                return False
+            # The index is JSON, the identities are read back as lists
+            return all(get_stat_key(file_path) == tuple(stat_key) for file_path, stat_key in entry["files"].items())
+        except (KeyError, TypeError, AttributeError):
+            return False
+
+    def _walk(self, directory: str) -> tuple[dict[str, Any], dict[str, StatKey]]:
+        """
+        Read the directory configuration files from the directory up to the root, the nearest values are kept.
+        """
+        overrides: dict[str, Any] = {}
+        files: dict[str, StatKey] = {}
+
+        current_directory = directory
+        while True:
+            overrides_file_path = os.path.join(current_directory, OVERRIDES_FILE_NAME)
+            stat_key = get_stat_key(overrides_file_path)
+            if stat_key is not None:
+                # An invalid file is remembered too, so it is only read again once it changes
+                files[overrides_file_path] = stat_key
+                try:
+                    overrides = merge_dicts(overrides, ConfigHandler.read_overrides(Path(overrides_file_path)))
+                except (ValueError, RuntimeError) as e:
+                    logger.warning("Ignoring directory configuration: %s", e)
+
+            parent_directory = os.path.dirname(current_directory)
+            if parent_directory == current_directory:
+                break
+            current_directory = parent_directory
+
+        logger.debug("Overrides of '%s' resolved from %d files", directory, len(files))
+        return overrides, files
+
+    def _load_index(self) -> dict[str, Any]:
+        try:
+            with self.index_file_path.open("r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug("Overrides index not loaded: %s", e)
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_index(self, index: dict[str, Any]) -> None:
+        # The least recently resolved directories are dropped first
+        if len(index) > self.max_entries:
+            recent_keys = sorted(index, key=lambda key: self._get_checked(index[key]))[-self.max_entries :]
+            index = {key: index[key] for key in recent_keys}
+
+        # Replaced at once, so concurrent launches never read a partial index
+        try:
+            with atomic_open(self.index_file_path, lock=False, encoding="utf-8") as index_file:
+                json.dump(index, index_file, separators=(",", ":"))
+        except OSError as e:
+            logger.debug("Overrides index not saved: %s", e)
+
+    @staticmethod
+    def _get_checked(entry: Any) -> int:
+        checked = entry.get("checked") if isinstance(entry, dict) else None
+        return checked if isinstance(checked, int) else 0
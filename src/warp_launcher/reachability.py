@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.constants import (
+    DEFAULT_TIMEOUT_POLICY,
+    INSTALL_DIRECTORY,
+    PATH_CACHE_FILE_NAME,
+    PATH_CACHE_MAX_ENTRIES,
+    PATH_CACHE_TTL,
+    PATH_NEGATIVE_CACHE_TTL,
+    PATH_PROBE_TIMEOUT,
+)
+from warp_launcher.enums import ProbeStatus, TimeoutPolicy
+from warp_launcher.tracing import traced
+from warp_launcher.utils import ValidationResult, probe_path, string_to_path
+
+# Outcome of a probe: its status and the reason a path cannot be used
+_ProbeOutcome = tuple[ProbeStatus, str | None]
+
+logger = logging.getLogger(__name__)
+
+
+class ReachabilityChecker:
+    """
+    Checks that paths are reachable under a deadline, so a launch path on a disconnected mapped drive or a hung share
+    fails fast instead of freezing the launch, and applies the timeout policy to the paths that do not answer.
+
+    The outcomes are cached in the installation directory: reachable paths for the TTL, and unreachable ones for the
+    negative TTL, so a dead share costs the timeout once rather than on every launch. Only the slow failures are
+    cached, a missing local directory is checked again on the next launch.
+    """
+
+    def __init__(
+        self,
+        install_directory: Path = INSTALL_DIRECTORY,
+        timeout: float = PATH_PROBE_TIMEOUT,
+        policy: TimeoutPolicy = DEFAULT_TIMEOUT_POLICY,
+        ttl: float = PATH_CACHE_TTL,
+        negative_ttl: float = PATH_NEGATIVE_CACHE_TTL,
+        max_entries: int = PATH_CACHE_MAX_ENTRIES,
+    ) -> None:
+        if timeout <= 0:
+            raise ValueError("Path timeout must be positive")
+
+        self.install_directory = install_directory
+        self.cache_file_path: Path = install_directory / PATH_CACHE_FILE_NAME
+        self.timeout = timeout
+        self.policy = policy
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+
+    def probe(self, path: Path, now: int | None = None) -> _ProbeOutcome:
+        """
+        Return OK for a reachable path, FAILED with the reason for an unreachable one, or TIMEOUT.
+        """
+        return self._probe_all([path], now)[0]
+
+    def validate_path(self, path: str | Path | None) -> tuple[Path | None, str | None]:
+        """
+        Validate that a path exists and is accessible, the timeout policy decides for a path that does not answer.
+        """
+        return self._validate_all([path])[0]
+
+    @traced("reachability.validate_paths")
+    def validate_paths(self, paths: Iterable[str | Path | None], max_workers: int = 1) -> list[ValidationResult[Path]]:
+        """
+        Validate many paths in one pass, reading and writing the cache once. At most max_workers paths not in the
+        cache are probed at the same time, so a few slow shares do not add up their timeouts.
+        """
+        candidates = list(paths)
+        return [
+            ValidationResult(candidate, *result)
+            for candidate, result in zip(candidates, self._validate_all(candidates, max_workers), strict=True)
+        ]
+
+    @traced("reachability.check_launch_path")
+    def check_launch_path(self, launch_path: Path) -> Path:
+        """
+        Return the path to launch: the launch path itself, unless it does not answer in time, then the timeout policy
+        decides between the launch path, the home directory or a RuntimeError. An unreachable launch path is left to
+        Warp, as it was validated when configured.
+        """
+        status, error = self.probe(launch_path)
+        if status != ProbeStatus.TIMEOUT:
+            return launch_path
+
+        checked_path, policy_error = self._apply_policy(launch_path, str(error))
+        if not checked_path:
+            raise RuntimeError(policy_error)
+        return checked_path
+
+    def _validate_all(
+        self, paths: list[str | Path | None], max_workers: int = 1
+    ) -> list[tuple[Path | None, str | None]]:
+        path_objects = [string_to_path(str(path)) if isinstance(path, str | Path) else None for path in paths]
+        outcomes = iter(
+            self._probe_all([path_object for path_object in path_objects if path_object], max_workers=max_workers)
+        )
+
+        results: list[tuple[Path | None, str | None]] = []
+        for path, path_object in zip(paths, path_objects, strict=True):
+            if not path_object:
+                results.append((None, f"Path '{path}' is not valid"))
+                continue
+
+            status, error = next(outcomes)
+            if status == ProbeStatus.OK:
+                results.append((path_object, None))
+            elif status == ProbeStatus.TIMEOUT:
+                results.append(self._apply_policy(path_object, str(error)))
+            else:
+                results.append((None, error))
+        return results
+
+    def _apply_policy(self, path: Path, error: str) -> tuple[Path | None, str | None]:
+        if self.policy == TimeoutPolicy.LAUNCH:
+            logger.warning("%s, launching it anyway", error)
+            return path, None
+
+        if self.policy == TimeoutPolicy.HOME:
+            logger.warning("%s, launching in the home directory instead", error)
+            return Path.home(), None
+
+        return None, error
+
+    def _probe_all(self, paths: list[Path], now: int | None = None, max_workers: int = 1) -> list[_ProbeOutcome]:
+        now = now if now is not None else time.time_ns()
+        cache = self._load_cache()
+
+        outcomes: dict[str, _ProbeOutcome] = {}
+        uncached_paths: dict[str, Path] = {}
+        for path in paths:
+            key = os.path.abspath(path)
+            if key in outcomes or key in uncached_paths:
+                continue
+
+            outcome = self._get_cached_outcome(cache.get(key), now)
+            if outcome:
+                logger.debug("Path '%s' is known as %s", path, outcome[0])
+                outcomes[key] = outcome
+            else:
+                uncached_paths[key] = path
+
+        if len(uncached_paths) > 1 and max_workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(uncached_paths))) as executor:
+                probes = list(executor.map(self._probe_path, uncached_paths.values()))
+        else:
+            probes = [self._probe_path(path) for path in uncached_paths.values()]
+
+        is_cache_changed = False
+        for key, (outcome, elapsed) in zip(uncached_paths, probes, strict=True):
+            outcomes[key] = outcome
+            # A failure that answered quickly is cheap to check again, and the path may be created meanwhile
+            if outcome[0] != ProbeStatus.FAILED or elapsed >= self.timeout / 10:
+                cache[key] = [now, outcome[0].value, outcome[1]]
+                is_cache_changed = True
+
+        if is_cache_changed:
+            self._save_cache(cache, now)
+        return [outcomes[os.path.abspath(path)] for path in paths]
+
+    def _probe_path(self, path: Path) -> tuple[_ProbeOutcome, float]:
+        """
+        Probe the path under the timeout, return its outcome and how long it took to answer.
+        """
+        start = time.perf_counter()
+        try:
+            error = probe_path(path, str(path), self.timeout)
+            outcome = (ProbeStatus.FAILED, error) if error else (ProbeStatus.OK, None)
+        except TimeoutError as e:
+            outcome = (ProbeStatus.TIMEOUT, str(e))
+        return outcome, time.perf_counter() - start
+
+    def _get_cached_outcome(self, entry: Any, now: int) -> _ProbeOutcome | None:
+        try:
+            checked, status_value, error = entry
+            status = ProbeStatus(status_value)
+            ttl = self.ttl if status == ProbeStatus.OK else self.negative_ttl
+            if not 0 <= now - int(checked) < ttl * 1_000_000_000:
+                return None
+        except (TypeError, ValueError):
+            return None
+        return status, error if isinstance(error, str) else None
+
+    def _load_cache(self) -> dict[str, Any]:
+        try:
+            with self.cache_file_path.open("r", encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug("Path cache not loaded: %s", e)
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self, cache: dict[str, Any], now: int) -> None:
+        # The cache is only an optimization, it never creates the installation directory
+        if not self.install_directory.is_dir():
+            return
+
+        # Expired entries are dropped, and the oldest ones beyond the limit
+        longest_ttl = max(self.ttl, self.negative_ttl) * 1_000_000_000
+        entries = [
+            (key, entry)
+            for key, entry in cache.items()
+            if isinstance(entry, list) and entry and isinstance(entry[0], int) and now - entry[0] < longest_ttl
+        ]
+        entries.sort(key=lambda item: item[1][0])
+        del entries[: -self.max_entries]
+
+        try:
+            with atomic_open(self.cache_file_path, lock=False, encoding="utf-8") as cache_file:
+                json.dump(dict(entries), cache_file)
+        except OSError as e:
+            logger.debug("Path cache not saved: %s", e)
@@ -1,43 +1,447 @@
+import json
 import logging
-import winreg
+import sys
+import threading
+from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Final
+from types import TracebackType
+from typing import Any, ClassVar, Final
+
+from warp_launcher.atomic import atomic_open
+from warp_launcher.constants import CONTEXT_MENU_LABEL, CONTEXT_MENU_VERB, INSTALL_DIRECTORY, REGISTRY_FILE_NAME
+from warp_launcher.tracing import traced
+
+if sys.platform == "win32":
+    import winreg
 
 _HKEY_NAME: Final[str] = "HKEY_CURRENT_USER"
 _APP_PATHS_SUBKEY: Final[str] = r"Software\Microsoft\Windows\CurrentVersion\App Paths"
+# Merged view of the per-user and per-machine classes, where the URI schemes are registered
+_CLASSES_HKEY_NAME: Final[str] = "HKEY_CLASSES_ROOT"
+# Per-user classes, merged into the classes root, where the context-menu verbs are registered
+_CLASSES_SUBKEY: Final[str] = r"Software\Classes"
+# Shell keys of the context menu of a folder and of the background of an open folder
+_CONTEXT_MENU_SHELL_SUBKEYS: Final[tuple[str, ...]] = (r"Directory\shell", r"Directory\Background\shell")
 
 logger = logging.getLogger(__name__)
 
 
 def _build_app_paths_subkey(executable_name: str) -> str:
+    return f"{_APP_PATHS_SUBKEY}\\{_build_app_paths_name(executable_name)}"
+
+
+def _build_app_paths_name(executable_name: str) -> str:
     if not executable_name:
         raise ValueError("executable_name cannot be empty")
 
-    return f"{_APP_PATHS_SUBKEY}\\{executable_name}.exe"
+    return f"{executable_name}.exe"
+
+
+class RegistrySession(ABC):
+    """
+    Batch of operations on the subkeys of a parent key. Reads are served immediately, writes and deletions are
+    queued and applied together, through a single parent key handle, when the session exits without error.
+    """
+
+    def __init__(self, parent_subkey: str) -> None:
+        self.parent_subkey = parent_subkey
+        # Pending name and default value of each subkey, by lower-cased name, a None value deletes the subkey
+        self._pending: dict[str, tuple[str, str | None]] = {}
+
+    def __enter__(self) -> "RegistrySession":
+        self._open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self._close()
+
+    def get_default_value(self, name: str) -> str | None:
+        """
+        Returns the default value of the subkey, including pending changes, or None if it does not exist.
+        """
+        if name.lower() in self._pending:
+            return self._pending[name.lower()][1]
+        return self._read(name)
+
+    def set_default_value(self, name: str, value: str) -> None:
+        self._pending[name.lower()] = (name, value)
+
+    def delete_key(self, name: str) -> None:
+        self._pending[name.lower()] = (name, None)
+
+    @traced("registry.commit")
+    def commit(self) -> None:
+        """
+        Apply the pending changes, raise OSError if one of them fails.
+        """
+        pending, self._pending = self._pending, {}
+        for name, value in pending.values():
+            if value is None:
+                if not self._delete(name):
+                    logger.debug("Key '%s\\%s' does not exist", self.parent_subkey, name)
+            else:
+                self._write(name, value)
+
+    def _open(self) -> None:
+        return None
+
+    def _close(self) -> None:
+        return None
+
+    @abstractmethod
+    def _read(self, name: str) -> str | None: ...
+
+    @abstractmethod
+    def _write(self, name: str, value: str) -> None: ...
+
+    @abstractmethod
+    def _delete(self, name: str) -> bool: ...
+
+
+class RegistryBackend(ABC):
+    """Stores registry keys with a default string value, the only part of the registry the launcher uses."""
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def get_default_value(self, subkey: str) -> str | None:
+        """
+        Returns the default value of the key, or None if it does not exist. Raise OSError if it cannot be read.
+        """
+
+    @abstractmethod
+    def set_default_value(self, subkey: str, value: str) -> None:
+        """
+        Creates the key if needed and sets its default value. Raise OSError if it cannot be written.
+        """
+
+    @abstractmethod
+    def delete_key(self, subkey: str) -> bool:
+        """
+        Deletes the key, returns False if it does not exist. Raise OSError if it cannot be deleted.
+        """
+
+    def key_exists(self, subkey: str) -> bool:
+        return self.get_default_value(subkey) is not None
+
+    @abstractmethod
+    def session(self, parent_subkey: str) -> RegistrySession:
+        """
+        Creates a session that batches the operations on the subkeys of the parent key.
+        """
+
+
+class WinregBackend(RegistryBackend):
+    """Windows registry, one hive per backend."""
+
+    name = "winreg"
+
+    def __init__(self, hive_name: str = _HKEY_NAME) -> None:
+        self.hive_name = hive_name
+
+    @property
+    def hive(self) -> Any:
+        return getattr(winreg, self.hive_name)
+
+    def get_default_value(self, subkey: str) -> str | None:
+        try:
+            registry_key = winreg.OpenKey(self.hive, subkey, access=winreg.KEY_READ)
+        except FileNotFoundError:
+            return None
+
+        try:
+            value, _ = winreg.QueryValueEx(registry_key, "")
+        except FileNotFoundError:
+            # The key exists without a default value
+            return ""
+        finally:
+            winreg.CloseKey(registry_key)
+
+        return value if isinstance(value, str) else ""
+
+    def set_default_value(self, subkey: str, value: str) -> None:
+        registry_key = winreg.CreateKeyEx(self.hive, subkey, access=winreg.KEY_WRITE)
+        try:
+            winreg.SetValueEx(registry_key, "", 0, winreg.REG_SZ, value)
+        finally:
+            winreg.CloseKey(registry_key)
+
+    def delete_key(self, subkey: str) -> bool:
+        try:
+            winreg.DeleteKey(self.hive, subkey)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def key_exists(self, subkey: str) -> bool:
+        try:
+            registry_key = winreg.OpenKey(self.hive, subkey, access=winreg.KEY_READ)
+        except FileNotFoundError:
+            return False
+
+        winreg.CloseKey(registry_key)
+        return True
+
+    def session(self, parent_subkey: str) -> RegistrySession:
+        return _WinregSession(self, parent_subkey)
+
+
+class _WinregSession(RegistrySession):
+    def __init__(self, backend: WinregBackend, parent_subkey: str) -> None:
+        super().__init__(parent_subkey)
+        self._backend = backend
+        self._parent_key: Any = None
+
+    def _open(self) -> None:
+        self._parent_key = winreg.CreateKeyEx(
+            self._backend.hive, self.parent_subkey, access=winreg.KEY_READ | winreg.KEY_WRITE
+        )
+
+    def _close(self) -> None:
+        if self._parent_key is not None:
+            winreg.CloseKey(self._parent_key)
+            self._parent_key = None
+
+    def _read(self, name: str) -> str | None:
+        try:
+            registry_key = winreg.OpenKey(self._parent_key, name, access=winreg.KEY_READ)
+        except FileNotFoundError:
+            return None
+
+        try:
+            value, _ = winreg.QueryValueEx(registry_key, "")
+        except FileNotFoundError:
+            return ""
+        finally:
+            winreg.CloseKey(registry_key)
+
+        return value if isinstance(value, str) else ""
+
+    def _write(self, name: str, value: str) -> None:
+        registry_key = winreg.CreateKeyEx(self._parent_key, name, access=winreg.KEY_WRITE)
+        try:
+            winreg.SetValueEx(registry_key, "", 0, winreg.REG_SZ, value)
+        finally:
+            winreg.CloseKey(registry_key)
+
+    def _delete(self, name: str) -> bool:
+        try:
+            winreg.DeleteKey(self._parent_key, name)
+        except FileNotFoundError:
+            return False
+        return True
+
+
+class MemoryRegistryBackend(RegistryBackend):
+    """Keeps the keys in memory, used by tests and on platforms without a Windows registry."""
+
+    name = "memory"
+
+    def __init__(self, keys: dict[str, str] | None = None) -> None:
+        # Default value of each key, by lower-cased subkey since registry keys are case-insensitive
+        self.keys: dict[str, str] = {subkey.lower(): value for subkey, value in (keys or {}).items()}
+        # Serializes the read-modify-write of the keys, the backend can be shared by several threads
+        self._lock = threading.Lock()
+
+    def get_default_value(self, subkey: str) -> str | None:
+        return self._load().get(subkey.lower())
+
+    def set_default_value(self, subkey: str, value: str) -> None:
+        with self._lock:
+            keys = self._load()
+            keys[subkey.lower()] = value
+            self._save(keys)
+
+    def delete_key(self, subkey: str) -> bool:
+        with self._lock:
+            keys = self._load()
+            if keys.pop(subkey.lower(), None) is None:
+                return False
+            self._save(keys)
+            return True
+
+    def session(self, parent_subkey: str) -> RegistrySession:
+        return _MemorySession(self, parent_subkey)
+
+    def _load(self) -> dict[str, str]:
+        return self.keys
+
+    def _save(self, keys: dict[str, str]) -> None:
+        self.keys = keys
+
+
+class _MemorySession(RegistrySession):
+    def __init__(self, backend: MemoryRegistryBackend, parent_subkey: str) -> None:
+        super().__init__(parent_subkey)
+        self._backend = backend
+        self._keys: dict[str, str] = {}
+
+    def _open(self) -> None:
+        self._keys = dict(self._backend._load())
+
+    def _read(self, name: str) -> str | None:
+        return self._keys.get(self._build_subkey(name))
+
+    def _write(self, name: str, value: str) -> None:
+        self._keys[self._build_subkey(name)] = value
+
+    def _delete(self, name: str) -> bool:
+        return self._keys.pop(self._build_subkey(name), None) is not None
+
+    def commit(self) -> None:
+        if not self._pending:
+            return
+
+        # The changes are applied to the latest keys, so sessions committed by other threads are not overwritten,
+        # and all of them are stored at once
+        with self._backend._lock:
+            self._keys = dict(self._backend._load())
+            super().commit()
+            self._backend._save(self._keys)
+
+    def _build_subkey(self, name: str) -> str:
+        return f"{self.parent_subkey}\\{name}".lower()
+
+
+class FileRegistryBackend(MemoryRegistryBackend):
+    """Persists the keys in a JSON file, so the install flow can be exercised without Windows."""
+
+    name = "file"
+
+    def __init__(self, registry_file_path: Path = INSTALL_DIRECTORY / REGISTRY_FILE_NAME) -> None:
+        super().__init__()
+        self.registry_file_path: Path = registry_file_path
+
+    def _load(self) -> dict[str, str]:
+        try:
+            with self.registry_file_path.open("r", encoding="utf-8") as registry_file:
+                keys = json.load(registry_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            raise OSError(f"Error reading registry file '{self.registry_file_path}': {e}") from e
+
+        if not isinstance(keys, dict):
+            raise OSError(f"Invalid registry file '{self.registry_file_path}'")
+        return {str(subkey): str(value) for subkey, value in keys.items()}
+
+    def _save(self, keys: dict[str, str]) -> None:
+        self.registry_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Replaced at once, a failed or concurrent write never leaves a truncated registry file
+        with atomic_open(self.registry_file_path, encoding="utf-8") as registry_file:
+            json.dump(keys, registry_file, indent=4)
+
+
+def get_registry_backend() -> RegistryBackend:
+    """
+    Returns the Windows registry backend on Windows, and a file-backed registry elsewhere, which only records the
+    registrations, so a warning is logged.
+    """
+    if sys.platform == "win32":
+        return WinregBackend()
+
+    backend = FileRegistryBackend()
+    logger.warning(
+        "The Windows registry is not available, the registrations are only recorded in '%s' and have no effect",
+        backend.registry_file_path,
+    )
+    return backend
+
+
+class AppPathsSession:
+    """App Paths operations batched in a registry session, the changes are applied together on exit."""
+
+    def __init__(self, session: RegistrySession, executable_file_path: Path) -> None:
+        self._session = session
+        self.executable_file_path: Path = executable_file_path
+
+    def __enter__(self) -> "AppPathsSession":
+        logger.debug("Opening key '%s' in '%s'", _APP_PATHS_SUBKEY, _HKEY_NAME)
+        try:
+            self._session.__enter__()
+        except OSError as e:
+            logger.error("Error opening key '%s': %s", _APP_PATHS_SUBKEY, e)
+            raise RuntimeError(f"Error opening App Paths registry key: {e}") from e
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            self._session.__exit__(exc_type, exc_value, traceback)
+        except OSError as e:
+            logger.error("Error applying changes to key '%s': %s", _APP_PATHS_SUBKEY, e)
+            raise RuntimeError(f"Error applying App Paths registry changes: {e}") from e
+
+    def register(self, executable_name: str, executable_file_path: Path | None = None) -> None:
+        """
+        Register the executable name to the file, the one of the session by default.
+        """
+        executable_file_path = executable_file_path if executable_file_path else self.executable_file_path
+        logger.debug("Registering '%s' with value '%s'", executable_name, executable_file_path)
+        self._session.set_default_value(_build_app_paths_name(executable_name), str(executable_file_path))
+
+    def unregister(self, executable_name: str) -> None:
+        logger.debug("Removing '%s'", executable_name)
+        self._session.delete_key(_build_app_paths_name(executable_name))
+
+    def restore(self, executable_name: str, registered_path: str | None) -> None:
+        """
+        Set the registration back to a value read before, None removes it.
+        """
+        logger.debug("Restoring '%s' to '%s'", executable_name, registered_path)
+        if registered_path is None:
+            self._session.delete_key(_build_app_paths_name(executable_name))
+        else:
+            self._session.set_default_value(_build_app_paths_name(executable_name), registered_path)
+
+    def get_registered_path(self, executable_name: str) -> str | None:
+        try:
+            return self._session.get_default_value(_build_app_paths_name(executable_name))
+        except OSError as e:
+            logger.error("Error reading '%s': %s", executable_name, e)
+            return None
+
+    def is_registered(self, executable_name: str) -> bool:
+        return self.get_registered_path(executable_name) is not None
 
 
 class AppPathsRegister:
-    def __init__(self, executable_file_path: Path):
-        self.__hkey = winreg.HKEY_CURRENT_USER
+    def __init__(self, executable_file_path: Path, backend: RegistryBackend | None = None):
+        self._backend: RegistryBackend = backend if backend else get_registry_backend()
         self.executable_file_path: Path = executable_file_path
 
+    def session(self) -> AppPathsSession:
+        """
+        Batches App Paths operations, the parent key is opened once and the changes are applied on exit.
+        """
+        return AppPathsSession(self._backend.session(_APP_PATHS_SUBKEY), self.executable_file_path)
+
     def register(self, executable_name: str) -> None:
         """
         Registers the application in Windows App Paths Subkey.
         """
         subkey = _build_app_paths_subkey(executable_name)
 
-        logger.debug(f"Registering key '{subkey}' in '{_HKEY_NAME}'")
+        logger.debug("Registering key '%s' in '%s'", subkey, _HKEY_NAME)
 
         try:
-            registry_key = winreg.CreateKeyEx(self.__hkey, subkey, access=winreg.KEY_WRITE)
-
-            logger.debug(f"Setting key default value to '{self.executable_file_path}'")
-            winreg.SetValueEx(registry_key, "", 0, winreg.REG_SZ, str(self.executable_file_path))
-
-            winreg.CloseKey(registry_key)
+            logger.debug("Setting key default value to '%s'", self.executable_file_path)
+            self._backend.set_default_value(subkey, str(self.executable_file_path))
         except Exception as e:
-            logger.error(f"Error registering key '{subkey}' with value '{self.executable_file_path}': {e}")
+            logger.error("Error registering key '%s' with value '%s': %s", subkey, self.executable_file_path, e)
             raise RuntimeError(f"Error registering App Paths registry key: {e}") from e
 
     def unregister(self, executable_name: str) -> None:
@@ -46,17 +450,29 @@ class AppPathsRegister:
         """
         subkey = _build_app_paths_subkey(executable_name)
 
-        logger.debug(f"Removing key '{subkey}' from '{_HKEY_NAME}'")
-        if not self.is_registered(executable_name):
-            logger.info("Key is not registered")
+        logger.debug("Removing key '%s' from '%s'", subkey, _HKEY_NAME)
 
         try:
-            winreg.DeleteKey(self.__hkey, subkey)
-            logger.info("Registry key removed")
+            if self._backend.delete_key(subkey):
+                logger.info("Registry key removed")
+            else:
+                logger.info("Key is not registered")
         except Exception as e:
-            logger.error(f"Error unregistering key '{subkey}': {e}")
+            logger.error("Error unregistering key '%s': %s", subkey, e)
             raise RuntimeError(f"Error unregistering App Paths registry key: {e}") from e
 
+    def get_registered_path(self, executable_name: str) -> str | None:
+        """
+        Returns the path registered for the application in Windows App Paths, or None if it is not registered.
+        """
+        subkey = _build_app_paths_subkey(executable_name)
+
+        try:
+            return self._backend.get_default_value(subkey)
+        except Exception as e:
+            logger.error("Error reading key '%s': %s", subkey, e)
+            return None
+
     def is_registered(self, executable_name: str) -> bool:
         """
         Checks if the application is already registered in Windows App Paths.
@@ -64,11 +480,100 @@ class AppPathsRegister:
         subkey = _build_app_paths_subkey(executable_name)
 
         try:
-            registry_key = winreg.OpenKey(self.__hkey, subkey, access=winreg.KEY_READ)
-            winreg.CloseKey(registry_key)
-            return True
-        except FileNotFoundError:
-            return False
+            return self._backend.key_exists(subkey)
         except Exception as e:
-            logger.error(f"Error opening key '{subkey}': {e}")
+            logger.error("Error opening key '%s': %s", subkey, e)
             return False
+
+
+class UriSchemeRegister:
+    """Reads the handler registered for a URI scheme, such as the one of Warp."""
+
+    def __init__(self, backend: RegistryBackend | None = None) -> None:
+        if backend:
+            self._backend: RegistryBackend = backend
+        elif sys.platform == "win32":
+            self._backend = WinregBackend(_CLASSES_HKEY_NAME)
+        else:
+            self._backend = FileRegistryBackend()
+
+    def get_open_command(self, scheme: str) -> str | None:
+        """
+        Returns the command that opens the URIs of the scheme, or None if no handler is registered.
+        """
+        subkey = rf"{scheme}\shell\open\command"
+
+        try:
+            return self._backend.get_default_value(subkey)
+        except Exception as e:
+            logger.error("Error reading key '%s': %s", subkey, e)
+            return None
+
+    def is_registered(self, scheme: str) -> bool:
+        """
+        Checks if a handler is registered for the URI scheme.
+        """
+        return bool(self.get_open_command(scheme))
+
+
+class ContextMenuRegister:
+    """
+    Explorer context-menu verb of the folders and of the folder backgrounds, registered for the current user. The
+    keys of both menus are written or removed together, through a single session of the classes key.
+    """
+
+    def __init__(
+        self, backend: RegistryBackend | None = None, verb: str = CONTEXT_MENU_VERB, label: str = CONTEXT_MENU_LABEL
+    ) -> None:
+        self._backend: RegistryBackend = backend if backend else get_registry_backend()
+        self.verb = verb
+        self.label = label
+
+    def register(self, command_line: str) -> None:
+        """
+        Adds the verb to both context menus, running the command line with the selected folder.
+        """
+        logger.debug("Registering verb '%s' with command '%s'", self.verb, command_line)
+
+        try:
+            with self._backend.session(_CLASSES_SUBKEY) as session:
+                for shell_subkey in _CONTEXT_MENU_SHELL_SUBKEYS:
+                    session.set_default_value(f"{shell_subkey}\\{self.verb}", self.label)
+                    session.set_default_value(f"{shell_subkey}\\{self.verb}\\command", command_line)
+        except OSError as e:
+            logger.error("Error registering verb '%s': %s", self.verb, e)
+            raise RuntimeError(f"Error registering context menu verb: {e}") from e
+
+    def unregister(self) -> None:
+        """
+        Removes the verb from both context menus.
+        """
+        logger.debug("Removing verb '%s'", self.verb)
+
+        try:
+            with self._backend.session(_CLASSES_SUBKEY) as session:
+                for shell_subkey in _CONTEXT_MENU_SHELL_SUBKEYS:
+                    # A key is deleted after its subkeys
+                    session.delete_key(f"{shell_subkey}\\{self.verb}\\command")
+                    session.delete_key(f"{shell_subkey}\\{self.verb}")
+        except OSError as e:
+            logger.error("Error removing verb '%s': %s", self.verb, e)
+            raise RuntimeError(f"Error removing context menu verb: {e}") from e
+
+    def get_registered_command(self) -> str | None:
+        """
+        Returns the command line run by the verb of the folders, or None if it is not registered.
+        """
+        subkey = f"{_CLASSES_SUBKEY}\\{_CONTEXT_MENU_SHELL_SUBKEYS[0]}\\{self.verb}\\command"
+
+        try:
+            return self._backend.get_default_value(subkey)
+        except Exception as e:
+            logger.error("Error reading key '%s': %s", subkey, e)
+            return None
+
+    def is_registered(self) -> bool:
+        """
+        Checks if the verb is registered in the context menu of the folders.
+        """
+        return self.get_registered_command() is not None
@@ -1,37 +1,242 @@
 import logging
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
+from string import Template
+from typing import Any, ClassVar
 
+from warp_launcher.atomic import atomic_open
 from warp_launcher.config import Config
+from warp_launcher.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+class ScriptTarget(ABC):
+    """Compiles the configuration into a launcher script for one script host."""
+
+    name: ClassVar[str]
+    extension: ClassVar[str]
+    # Whether the script host is only available on Windows
+    windows: ClassVar[bool] = True
+    # Templates are parsed once, when the target is defined
+    template: ClassVar[Template]
+    # Expression of the target language that evaluates to the working directory of the script
+    working_directory: ClassVar[str]
+    # Statement that hands the URI off, and the one that replaces it when measuring the script host
+    hand_off: ClassVar[str]
+    dry_run_hand_off: ClassVar[str]
+
+    def render(self, config: Config, dry_run: bool = False) -> str:
+        """
+        Builds the content of the launcher script for the provided configuration.
+        """
+        if config.is_launch_path_parent_process():
+            launch_path = self.working_directory
+        else:
+            launch_path = self.quote(str(config.launch_path))
+
+        return self.template.substitute(
+            launch_path=launch_path,
+            launch_mode=config.launch_mode.value,
+            hand_off=self.dry_run_hand_off if dry_run else self.hand_off,
+        )
+
+    @abstractmethod
+    def quote(self, value: str) -> str:
+        """
+        Quote the value as a string literal of the target language.
+        """
+
+    @abstractmethod
+    def build_command(self, script_file_path: Path) -> list[str]:
+        """
+        Build the command line of the default file association of the script, the one run when the command is
+        typed in the Explorer address bar, so the measured cost is the cost of a launch.
+        """
+
+    def open_options(self) -> dict[str, Any]:
+        return {}
+
+
+class VbsScriptTarget(ScriptTarget):
+    """Visual Basic Script run by wscript.exe."""
+
+    name = "vbs"
+    extension = ".vbs"
+    template = Template(
+        "path = ${launch_path}\n"
+        'If Right(path, 1) = "\\" Then path = Left(path, Len(path) - 1) End If\n'
+        'warpURI = "warp://action/${launch_mode}?path=" & path\n'
+        "${hand_off}"
+    )
+    working_directory = 'CreateObject("Scripting.FileSystemObject").GetAbsolutePathName(".")'
+    hand_off = 'CreateObject("WScript.Shell").Run warpURI, 0, False'
+    dry_run_hand_off = 'Set shell = CreateObject("WScript.Shell")'
+
+    def quote(self, value: str) -> str:
+        return '"' + value.replace('"', '""') + '"'
+
+    def build_command(self, script_file_path: Path) -> list[str]:
+        # Default open verb of VBSFile: "%SystemRoot%\System32\WScript.exe" "%1" %*
+        return ["wscript.exe", str(script_file_path)]
+
+
+class CmdScriptTarget(ScriptTarget):
+    """Batch file run by cmd.exe, it starts the URI without any COM object."""
+
+    name = "cmd"
+    extension = ".cmd"
+    template = Template(
+        "@echo off\n"
+        'set "launch_path=${launch_path}"\n'
+        'if "%launch_path:~-1%"=="\\" set "launch_path=%launch_path:~0,-1%"\n'
+        'set "warp_uri=warp://action/${launch_mode}?path=%launch_path%"\n'
+        "${hand_off}"
+    )
+    working_directory = "%CD%"
+    hand_off = 'start "" "%warp_uri%"'
+    dry_run_hand_off = "rem"
+
+    def quote(self, value: str) -> str:
+        # Inside a quoted set command only the percent sign is special, a path cannot contain a double quote
+        return value.replace("%", "%%")
+
+    def build_command(self, script_file_path: Path) -> list[str]:
+        # A batch file is opened by "%1" %*, which the system runs through the command processor
+        return ["cmd.exe", "/c", str(script_file_path)]
+
+
+class ShScriptTarget(ScriptTarget):
+    """POSIX shell script, used to exercise the launcher outside Windows."""
+
+    name = "sh"
+    extension = ".sh"
+    windows = False
+    template = Template(
+        "#!/bin/sh\n"
+        "launch_path=${launch_path}\n"
+        'case "$$launch_path" in ?*/) launch_path="$${launch_path%/}" ;; esac\n'
+        'warp_uri="warp://action/${launch_mode}?path=$$launch_path"\n'
+        "${hand_off}"
+    )
+    working_directory = '"$(pwd)"'
+    hand_off = 'exec xdg-open "$warp_uri"'
+    dry_run_hand_off = ":"
+
+    def quote(self, value: str) -> str:
+        return shlex.quote(value)
+
+    def build_command(self, script_file_path: Path) -> list[str]:
+        return ["sh", str(script_file_path)]
+
+    def open_options(self) -> dict[str, Any]:
+        return {"newline": "\n"}
+
+
+SCRIPT_TARGETS: dict[str, type[ScriptTarget]] = {
+    target.name: target for target in (VbsScriptTarget, CmdScriptTarget, ShScriptTarget)
+}
+
+
+def get_script_target(name: str | None = None) -> ScriptTarget:
+    """
+    Create the script target registered with the given name, or the VBS one, raise ValueError if it is unknown.
+    """
+    target_name = name or VbsScriptTarget.name
+    target_class = SCRIPT_TARGETS.get(target_name)
+    if not target_class:
+        raise ValueError(f"Invalid script target: '{target_name}'")
+
+    return target_class()
+
+
+def get_script_target_for(script_file_path: Path) -> ScriptTarget:
+    """
+    Create the script target that matches the extension of the script file, scripts without a known extension are
+    compiled as VBS.
+    """
+    for target_class in SCRIPT_TARGETS.values():
+        if script_file_path.suffix.lower() == target_class.extension:
+            return target_class()
+    return VbsScriptTarget()
+
+
+def get_available_script_targets() -> list[str]:
+    """
+    Return the names of the script targets whose host is available on this platform.
+    """
+    is_windows = sys.platform == "win32"
+    return [name for name, target_class in SCRIPT_TARGETS.items() if target_class.windows == is_windows]
+
+
+def measure_script_targets(config: Config, names: list[str], repeat: int = 5) -> dict[str, float]:
+    """
+    Run a dry run script of each target, which starts the script host and evaluates the URI without handing it off,
+    and return the median latencies sorted from the cheapest. Targets whose host is not available are skipped.
+    """
+    latencies: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in names:
+            target = get_script_target(name)
+            script_file_path = Path(temp_dir) / f"launcher{target.extension}"
+            with script_file_path.open("w", encoding="utf-8", **target.open_options()) as script_file:
+                script_file.write(target.render(config, dry_run=True))
+
+            samples = []
+            try:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    subprocess.run(target.build_command(script_file_path), capture_output=True, check=True)
+                    samples.append(time.perf_counter() - start)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning("Skipping script target '%s': %s", name, e)
+                continue
+
+            latencies[name] = sorted(samples)[len(samples) // 2]
+
+    return dict(sorted(latencies.items(), key=lambda item: item[1]))
+
+
 class ScriptHandler:
     def __init__(self, script_file_path: Path) -> None:
         self._script_file_path: Path = script_file_path
+        self._target: ScriptTarget = get_script_target_for(script_file_path)
 
-    def save_script(self, config: Config) -> None:
-        """
-        Creates or updates the .vbs launcher script in the installation directory.
-        """
-        logger.debug(f"Saving launch script to '{self._script_file_path}'")
+    @property
+    def script_file_path(self) -> Path:
+        return self._script_file_path
 
-        path_definition = f'path = "{config.launch_path}"'
+    @property
+    def target(self) -> ScriptTarget:
+        return self._target
 
-        if config.is_launch_path_parent_process():
-            path_definition = 'path = CreateObject("Scripting.FileSystemObject").GetAbsolutePathName(".")'
+    def render_script(self, config: Config) -> str:
+        """
+        Builds the content of the launcher script for the provided configuration.
+        """
+        return self._target.render(config)
 
-        script_body = (
-            'If Right(path, 1) = "\\" Then path = Left(path, Len(path) - 1) End If\n'
-            f'warpURI = "warp://action/{config.launch_mode.value}?path=" & path\n'
-            'CreateObject("WScript.Shell").Run warpURI, 0, False'
-        )
+    @traced("script.save")
+    def save_script(self, config: Config) -> None:
+        """
+        Creates or updates the launcher script in the installation directory.
+        """
+        logger.debug("Saving launch script to '%s'", self._script_file_path)
 
-        script_content = f"{path_definition}\n{script_body}"
+        script_content = self.render_script(config)
 
         try:
-            with self._script_file_path.open("w", encoding="utf-8") as script_file:
+            with atomic_open(self._script_file_path, encoding="utf-8", **self._target.open_options()) as script_file:
                 script_file.write(script_content)
+
+            if not self._target.windows:
+                os.chmod(self._script_file_path, 0o755)
         except OSError as e:
-            logger.error(f"Error writing script '{self._script_file_path}': {e}")
+            logger.error("Error writing script '%s': %s", self._script_file_path, e)
             raise RuntimeError(f"Error writing script: {e}") from e
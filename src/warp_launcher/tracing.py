@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from warp_launcher import IMPORT_START_NS
+
+if TYPE_CHECKING:
+    import threading
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_NANOSECONDS_PER_MILLISECOND = 1_000_000
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    name: str
+    start: int
+    end: int
+    depth: int
+    thread: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "start_ms": _to_milliseconds(self.start - IMPORT_START_NS),
+            "duration_ms": _to_milliseconds(self.end - self.start),
+            "depth": self.depth,
+            "thread": self.thread,
+        }
+
+
+class _Span:
+    __slots__ = ("_depth", "_name", "_start", "_tracer")
+
+    def __init__(self, tracer: Tracer, name: str) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._start = 0
+        self._depth = 0
+
+    def __enter__(self) -> None:
+        self._depth = self._tracer._enter()
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._tracer._exit(self._name, self._start, time.perf_counter_ns(), self._depth)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _PhaseSpan:
+    __slots__ = ("_name", "_recorder", "_start")
+
+    def __init__(self, recorder: PhaseRecorder, name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._recorder.add(self._name, time.perf_counter_ns() - self._start)
+
+
+class PhaseRecorder:
+    """
+    Sums the durations of the spans mapped to a phase, the only spans timed while tracing is disabled, so the main
+    phases of every run can be recorded without the cost of a trace.
+    """
+
+    def __init__(self, phases: dict[str, str]) -> None:
+        self.phases = phases
+        self.durations: dict[str, int] = {}
+
+    def add(self, name: str, duration: int) -> None:
+        phase = self.phases.get(name)
+        if phase:
+            self.durations[phase] = self.durations.get(phase, 0) + duration
+
+    def add_spans(self, spans: list[SpanRecord]) -> None:
+        """
+        Sum the spans collected by a tracer, which times them instead of the recorder while tracing is enabled.
+        """
+        for record in spans:
+            self.add(record.name, record.end - record.start)
+
+
+class Tracer:
+    """Collects the timing spans of the current process, from any thread."""
+
+    def __init__(self) -> None:
+        import threading
+
+        self.spans: list[SpanRecord] = []
+        self._local: threading.local = threading.local()
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def add_span(self, name: str, start: int, end: int) -> None:
+        """
+        Record a phase measured before tracing was enabled.
+        """
+        self.spans.append(SpanRecord(name, start, end, 0, _get_thread_name()))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Build the timing report, the spans are sorted by start time and their start is relative to the package import.
+        """
+        spans = sorted(self.spans, key=lambda record: (record.start, record.depth))
+        return {
+            "total_ms": _to_milliseconds(time.perf_counter_ns() - IMPORT_START_NS),
+            "spans": [record.to_dict() for record in spans],
+        }
+
+    def _enter(self) -> int:
+        depth: int = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        return depth
+
+    def _exit(self, name: str, start: int, end: int, depth: int) -> None:
+        self._local.depth = depth
+        # Appending to a list is atomic, so spans closed by concurrent launches need no lock
+        self.spans.append(SpanRecord(name, start, end, depth, _get_thread_name()))
+
+
+_tracer: Tracer | None = None
+_phase_recorder: PhaseRecorder | None = None
+
+
+def span(name: str) -> _Span | _PhaseSpan | _NoopSpan:
+    """
+    Time the enclosed block, a shared no-op context manager is returned while tracing is disabled, unless the span
+    is a recorded phase.
+    """
+    tracer = _tracer
+    if tracer is None:
+        recorder = _phase_recorder
+        if recorder is None or name not in recorder.phases:
+            return _NOOP_SPAN
+        return _PhaseSpan(recorder, name)
+    return tracer.span(name)
+
+
+def traced[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Time every call of the decorated function.
+    """
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            tracer = _tracer
+            if tracer is None:
+                recorder = _phase_recorder
+                if recorder is None or name not in recorder.phases:
+                    return function(*args, **kwargs)
+                with _PhaseSpan(recorder, name):
+                    return function(*args, **kwargs)
+            with tracer.span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def enable_tracing() -> Tracer:
+    """
+    Start collecting spans, return the tracer that collects them.
+    """
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable_tracing() -> Tracer | None:
+    """
+    Stop collecting spans, return the tracer that collected them, if any.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def enable_phase_recording(phases: dict[str, str]) -> PhaseRecorder:
+    """
+    Start summing the durations of the spans mapped to a phase by their name, return the recorder that sums them.
+    """
+    global _phase_recorder
+    _phase_recorder = PhaseRecorder(phases)
+    return _phase_recorder
+
+
+def disable_phase_recording() -> PhaseRecorder | None:
+    """
+    Stop summing the phase durations, return the recorder that summed them, if any.
+    """
+    global _phase_recorder
+    recorder, _phase_recorder = _phase_recorder, None
+    return recorder
+
+
+def run_profiled(function: Callable[[], int], profile_file_path: Path) -> int:
+    """
+    Run the function under cProfile and tracemalloc, and save the peak memory and the profile statistics to file.
+    """
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        return function()
+    finally:
+        profiler.disable()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report = io.StringIO()
+        report.write(f"Current memory: {current / 1024:.1f} KiB\nPeak memory: {peak / 1024:.1f} KiB\n\n")
+        pstats.Stats(profiler, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats()
+
+        try:
+            profile_file_path.parent.mkdir(parents=True, exist_ok=True)
+            profile_file_path.write_text(report.getvalue(), encoding="utf-8")
+            logger.info("Profile saved to '%s'", profile_file_path)
+        except OSError as e:
+            logger.error("Error saving profile '%s': %s", profile_file_path, e)
+
+
+def _get_thread_name() -> str:
+    import threading
+
+    return threading.current_thread().name
+
+
+def _to_milliseconds(nanoseconds: int) -> float:
+    return round(nanoseconds / _NANOSECONDS_PER_MILLISECOND, 3)
@@ -1,15 +1,49 @@
 import logging
 import os
 import re
-from collections.abc import Hashable
+import threading
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TypeVar
+from typing import Final, TypeVar
 
 logger = logging.getLogger(__name__)
 
 _K = TypeVar("_K", bound=Hashable)
 _V = TypeVar("_V")
 
+# Reserved characters, or a colon anywhere but after a drive letter
+_INVALID_PATH_PATTERN: Final[re.Pattern[str]] = re.compile(r'[<>"|?*]|(?<!^.):', re.DOTALL)
+_COMMAND_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[a-zA-Z0-9_-]+$")
+_COMMAND_NAME_SYMBOLS: Final[tuple[str, ...]] = ("-", "_")
+_COMMAND_NAME_SYMBOLS_MESSAGE: Final[str] = " or ".join(f"'{symbol}'" for symbol in _COMMAND_NAME_SYMBOLS)
+
+
+# File identity used to detect changes: modification time, size and inode
+StatKey = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class ValidationResult[T]:
+    candidate: object
+    value: T | None
+    error: str | None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
+def get_stat_key(file_path: str | Path) -> StatKey | None:
+    """
+    Return the identity of the file, used to detect changes, or None if it does not exist or cannot be read.
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
 
 def string_to_path(path_str: str | None) -> Path | None:
     """
@@ -18,45 +52,105 @@ def string_to_path(path_str: str | None) -> Path | None:
     if not isinstance(path_str, str) or not path_str.strip():
         return None
 
-    invalid_chars = ["<", ">", '"', "|", "?", "*"]
-    if any(char in str(path_str) for char in invalid_chars):
-        return None
-
-    colon_positions = [i for i, char in enumerate(path_str) if char == ":"]
-    if colon_positions and not (len(colon_positions) == 1 and colon_positions[0] == 1):
+    if _INVALID_PATH_PATTERN.search(path_str):
         return None
 
     try:
-        return Path(path_str.strip()).expanduser()
+        path = Path(path_str.strip())
+        return path.expanduser() if path_str.lstrip().startswith("~") else path
     except Exception as error:
         logging.error(error)
         return None
 
 
-def validate_path(path: str | Path | None) -> tuple[Path | None, str | None]:
+def _probe_path(path_object: Path, path_str: str) -> str | None:
+    # A readable path exists, so the existence is only checked to explain a failure
+    if os.access(path_str, os.R_OK):
+        return None
+
+    if not path_object.exists():
+        return f"Path '{path_object}' does not exist"
+
+    return f"Path '{path_object}' is not accessible"
+
+
+def probe_path(path_object: Path, path_str: str, timeout: float | None = None) -> str | None:
     """
-    Validate that a path exists and is accessible.
+    Return why the path cannot be used, or None if it exists and is accessible. With a timeout the filesystem is
+    probed on a daemon worker thread, left behind by a hung network drive, and TimeoutError is raised once it expires.
     """
+    if timeout is None:
+        return _probe_path(path_object, path_str)
+
+    outcomes: list[str | None] = []
+
+    def probe() -> None:
+        try:
+            outcomes.append(_probe_path(path_object, path_str))
+        except Exception as e:
+            outcomes.append(f"Path '{path_object}' is not accessible: {e}")
+
+    worker = threading.Thread(target=probe, name="path-probe", daemon=True)
+    worker.start()
+    worker.join(timeout)
+
+    if not outcomes:
+        raise TimeoutError(f"Path '{path_object}' did not answer within {timeout:g} s")
+    return outcomes[0]
+
+
+def _validate_path(
+    path: str | Path | None, probes: dict[str, str | None], timeout: float | None
+) -> tuple[Path | None, str | None]:
     path_object = None
     try:
-        if isinstance(path, str):
-            path_object = string_to_path(path)
+        if isinstance(path, str | Path):
+            path_object = string_to_path(str(path))
 
         if not path_object:
             return None, f"Path '{path}' is not valid"
 
-        if not path_object.exists():
-            return None, f"Path '{path_object}' does not exist"
+        # The probed string is the stripped candidate, formatting the Path again costs more than the probe itself
+        path_str = str(path).strip()
+        if path_str.startswith("~"):
+            path_str = str(path_object)
 
-        if not os.access(path_object, os.R_OK):
-            return None, f"Path '{path_object}' is not accessible"
+        if path_str not in probes:
+            try:
+                probes[path_str] = probe_path(path_object, path_str, timeout)
+            except TimeoutError as e:
+                probes[path_str] = str(e)
 
-        return path_object, None
+        error = probes[path_str]
+        return (None, error) if error else (path_object, None)
     except Exception as error:
         logging.error(error)
         return None, f"Path '{path}' is not valid"
 
 
+def validate_path(path: str | Path | None, timeout: float | None = None) -> tuple[Path | None, str | None]:
+    """
+    Validate that a path exists and is accessible, a path that does not answer within the timeout is not valid.
+    """
+    return _validate_path(path, {}, timeout)
+
+
+def validate_paths(paths: Iterable[str | Path | None], timeout: float | None = None) -> list[ValidationResult[Path]]:
+    """
+    Validate many paths in one pass, repeated candidates are validated once and each distinct path is only probed
+    once on the filesystem, under its own timeout.
+    """
+    probes: dict[str, str | None] = {}
+    validations: dict[str | Path | None, ValidationResult[Path]] = {}
+    results = []
+    for path in paths:
+        result = validations.get(path)
+        if result is None:
+            result = validations[path] = ValidationResult(path, *_validate_path(path, probes, timeout))
+        results.append(result)
+    return results
+
+
 def validate_command_name(command_name: str | None) -> tuple[str | None, str | None]:
     """
     Validate the command name format.
@@ -64,18 +158,27 @@ def validate_command_name(command_name: str | None) -> tuple[str | None, str | N
     if not command_name:
         return None, "Command is not valid"
 
-    symbols_allowed = ["-", "_"]
-    symbols_allowed_message = " or ".join(f"'{symbol}'" for symbol in symbols_allowed)
+    if command_name[0] in _COMMAND_NAME_SYMBOLS or command_name[-1] in _COMMAND_NAME_SYMBOLS:
+        return None, f"Command name '{command_name}' should not start or end with {_COMMAND_NAME_SYMBOLS_MESSAGE}"
 
-    if command_name[0] in symbols_allowed or command_name[-1] in symbols_allowed:
-        return None, f"Command name '{command_name}' should not start or end with {symbols_allowed_message}"
+    if not _COMMAND_NAME_PATTERN.match(command_name):
+        return None, f"Only alphanumeric characters and {_COMMAND_NAME_SYMBOLS_MESSAGE} are allowed"
 
-    pattern = re.compile(r"^[a-zA-Z0-9_-]+$")
+    return command_name, None
 
-    if not pattern.match(command_name):
-        return None, f"Only alphanumeric characters and {symbols_allowed_message} are allowed"
 
-    return command_name, None
+def validate_command_names(command_names: Iterable[str | None]) -> list[ValidationResult[str]]:
+    """
+    Validate many command names in one pass, repeated names are only validated once.
+    """
+    validations: dict[str | None, ValidationResult[str]] = {}
+    results = []
+    for command_name in command_names:
+        result = validations.get(command_name)
+        if result is None:
+            result = validations[command_name] = ValidationResult(command_name, *validate_command_name(command_name))
+        results.append(result)
+    return results
 
 
 def merge_dicts(dict_a: dict[_K, _V], dict_b: dict[_K, _V]) -> dict[_K, _V | None]:
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Final
+
+from warp_launcher.config import ConfigHandler
+from warp_launcher.constants import (
+    CONFIG_FILE_NAME,
+    INSTALL_DIRECTORY,
+    LAUNCHER_SCRIPT_NAME,
+    MANIFEST_FILE_NAME,
+    WATCH_DEBOUNCE,
+    WATCH_POLL_INTERVAL,
+)
+from warp_launcher.launcher import Launcher
+from warp_launcher.manifest import ManifestHandler
+from warp_launcher.registry import RegistryBackend
+from warp_launcher.utils import StatKey, get_stat_key
+
+# inotify flags and events of a file that is written, replaced, renamed or deleted
+_IN_NONBLOCK: Final[int] = 0o4000
+_IN_CLOEXEC: Final[int] = 0o2000000
+_IN_CLOSE_WRITE: Final[int] = 0x00000008
+_IN_MOVED_FROM: Final[int] = 0x00000040
+_IN_MOVED_TO: Final[int] = 0x00000080
+_IN_DELETE: Final[int] = 0x00000200
+_IN_EVENT_HEADER: Final[struct.Struct] = struct.Struct("iIII")
+_IN_BUFFER_SIZE: Final[int] = 64 * 1024
+
+# Windows directory change notification filter and wait result
+_FILE_NOTIFY_CHANGE_FILE_NAME: Final[int] = 0x00000001
+_FILE_NOTIFY_CHANGE_LAST_WRITE: Final[int] = 0x00000010
+_WAIT_OBJECT_0: Final[int] = 0x00000000
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeSource(ABC):
+    """Signals the changes of a file, blocking in the operating system while nothing happens."""
+
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until the file may have changed or the timeout expires, return False on timeout.
+        """
+
+    def close(self) -> None:
+        return None
+
+
+class InotifyChangeSource(ChangeSource):
+    """Linux inotify watch of the directory, so the file can also be replaced by a rename."""
+
+    def __init__(self, file_path: Path) -> None:
+        import ctypes
+
+        self._file_name: bytes = os.fsencode(file_path.name)
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._descriptor: int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._descriptor < 0:
+            raise OSError(ctypes.get_errno(), "Error initializing inotify")
+
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+        if libc.inotify_add_watch(self._descriptor, os.fsencode(file_path.parent), mask) < 0:
+            error_number = ctypes.get_errno()
+            os.close(self._descriptor)
+            raise OSError(error_number, f"Error watching '{file_path.parent}'")
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._descriptor], [], [], remaining)[0]:
+                return False
+            # Events of the other files of the directory are read and dropped
+            if self._read_events():
+                return True
+
+    def _read_events(self) -> bool:
+        changed = False
+        while True:
+            try:
+                buffer = os.read(self._descriptor, _IN_BUFFER_SIZE)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(buffer):
+                _, _, _, name_length = _IN_EVENT_HEADER.unpack_from(buffer, offset)
+                name_offset = offset + _IN_EVENT_HEADER.size
+                if buffer[name_offset : name_offset + name_length].rstrip(b"\0") == self._file_name:
+                    changed = True
+                offset = name_offset + name_length
+
+    def close(self) -> None:
+        os.close(self._descriptor)
+
+
+class WindowsChangeSource(ChangeSource):
+    """Windows change notification of the directory, signaled for any of its files."""
+
+    def __init__(self, file_path: Path) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._kernel32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+        self._kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        self._kernel32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+        self._kernel32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+        self._kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        self._kernel32.WaitForSingleObject.restype = wintypes.DWORD
+
+        self._handle = self._kernel32.FindFirstChangeNotificationW(
+            str(file_path.parent), False, _FILE_NOTIFY_CHANGE_FILE_NAME | _FILE_NOTIFY_CHANGE_LAST_WRITE
+        )
+        if not self._handle or self._handle == ctypes.c_void_p(-1).value:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def wait(self, timeout: float) -> bool:
+        if self._kernel32.WaitForSingleObject(self._handle, int(timeout * 1000)) != _WAIT_OBJECT_0:
+            return False
+        self._kernel32.FindNextChangeNotification(self._handle)
+        return True
+
+    def close(self) -> None:
+        self._kernel32.FindCloseChangeNotification(self._handle)
+
+
+class PollingChangeSource(ChangeSource):
+    """Compares the identity of the file at a fixed interval, used where no notification API is available."""
+
+    def __init__(self, file_path: Path, poll_interval: float = WATCH_POLL_INTERVAL) -> None:
+        self._file_path = file_path
+        self._poll_interval = poll_interval
+        self._stat_key: StatKey | None = get_stat_key(file_path)
+
+    def wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while True:
+            time.sleep(max(0.0, min(self._poll_interval, deadline - time.monotonic())))
+
+            stat_key = get_stat_key(self._file_path)
+            if stat_key != self._stat_key:
+                self._stat_key = stat_key
+                return True
+            if time.monotonic() >= deadline:
+                return False
+
+
+def create_change_source(file_path: Path, poll_interval: float = WATCH_POLL_INTERVAL) -> ChangeSource:
+    """
+    Create the notification based source of the platform, or a polling one if it is not available.
+    """
+    try:
+        if sys.platform == "win32":
+            return WindowsChangeSource(file_path)
+        if sys.platform.startswith("linux"):
+            return InotifyChangeSource(file_path)
+    except (OSError, AttributeError) as e:
+        logger.debug("File change notifications are not available, polling instead: %s", e)
+
+    return PollingChangeSource(file_path, poll_interval)
+
+
+class ConfigWatcher:
+    """Applies the changes of the configuration file to the installation as soon as it is saved."""
+
+    def __init__(
+        self,
+        install_directory: Path = INSTALL_DIRECTORY,
+        config_filename: str = CONFIG_FILE_NAME,
+        registry_backend: RegistryBackend | None = None,
+        debounce: float = WATCH_DEBOUNCE,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+    ) -> None:
+        self.install_directory = install_directory
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._config_filename = config_filename
+        self._registry_backend = registry_backend
+        self._config_handler: ConfigHandler = ConfigHandler(install_directory / config_filename)
+        self._manifest_handler: ManifestHandler = ManifestHandler(install_directory / MANIFEST_FILE_NAME)
+
+        # Identity of the configuration file once its last change was handled
+        self._stat_key: StatKey | None = get_stat_key(self._config_handler.config_file_path)
+        self._stop_event = threading.Event()
+
+    def watch_forever(self) -> None:
+        """
+        Apply the changes of the configuration file until stopped or the process is interrupted.
+        """
+        if not self.install_directory.is_dir():
+            raise RuntimeError(f"Installation directory '{self.install_directory}' does not exist, install first")
+
+        change_source = create_change_source(self._config_handler.config_file_path, self.poll_interval)
+        logger.info("Watching '%s' for changes", self._config_handler.config_file_path)
+        try:
+            while not self._stop_event.is_set():
+                # The timeout only bounds how long a stop request waits
+                if not change_source.wait(self.poll_interval):
+                    continue
+
+                # Editors save in several steps, wait until the file has been quiet for the debounce delay
+                while not self._stop_event.is_set() and change_source.wait(self.debounce):
+                    pass
+
+                if not self._stop_event.is_set():
+                    self.sync()
+        except KeyboardInterrupt:
+            logger.info("Watch interrupted")
+        finally:
+            change_source.close()
+
+    def stop(self) -> None:
+        """
+        Stop watching, the watch loop returns within the poll interval.
+        """
+        self._stop_event.set()
+
+    def sync(self) -> bool:
+        """
+        Apply the configuration file to the installation if it changed since the last sync, return True if the
+        installation was updated. An invalid configuration is reported and left unapplied.
+        """
+        stat_key = get_stat_key(self._config_handler.config_file_path)
+        if stat_key == self._stat_key:
+            logger.debug("Configuration file unchanged")
+            return False
+        self._stat_key = stat_key
+
+        try:
+            config = self._config_handler.read_config()
+        except (ValueError, RuntimeError) as e:
+            logger.warning("Ignoring configuration change, keeping the current installation: %s", e)
+            return False
+
+        launcher = Launcher(
+            self.install_directory,
+            self._config_filename,
+            self._get_script_filename(),
+            config=config,
+            registry_backend=self._registry_backend,
+        )
+        try:
+            launcher.install()
+        except RuntimeError as e:
+            logger.error("Error applying configuration change: %s", e)
+            return False
+        finally:
+            # The install rewrites the configuration file when it is formatted differently, that is not a new change
+            self._stat_key = get_stat_key(self._config_handler.config_file_path)
+
+        return True
+
+    def _get_script_filename(self) -> str:
+        """
+        Return the name of the installed launcher script, which depends on the script target it was installed with.
+        """
+        return self._manifest_handler.load_script_filename() or LAUNCHER_SCRIPT_NAME
@@ -0,0 +1,5 @@
+@echo off
+set "launch_path=C:\Users\O'Brien\100%% & $Projects"
+if "%launch_path:~-1%"=="\" set "launch_path=%launch_path:~0,-1%"
+set "warp_uri=warp://action/new_tab?path=%launch_path%"
+start "" "%warp_uri%"
\ No newline at end of file
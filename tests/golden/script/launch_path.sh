@@ -0,0 +1,5 @@
+#!/bin/sh
+launch_path='/home/o'"'"'brien/100% & $projects'
+case "$launch_path" in ?*/) launch_path="${launch_path%/}" ;; esac
+warp_uri="warp://action/new_tab?path=$launch_path"
+exec xdg-open "$warp_uri"
\ No newline at end of file
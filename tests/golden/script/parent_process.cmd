@@ -0,0 +1,5 @@
+@echo off
+set "launch_path=%CD%"
+if "%launch_path:~-1%"=="\" set "launch_path=%launch_path:~0,-1%"
+set "warp_uri=warp://action/new_window?path=%launch_path%"
+start "" "%warp_uri%"
\ No newline at end of file
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.aio import AsyncLauncher
+from warp_launcher.config import Config
+from warp_launcher.constants import OVERRIDES_FILE_NAME
+from warp_launcher.dispatcher import RecordingDispatcher, UriDispatcher
+from warp_launcher.enums import LaunchMode
+from warp_launcher.history import HistoryHandler
+from warp_launcher.registry import AppPathsRegister, MemoryRegistryBackend
+
+
+class _SlowDispatcher(UriDispatcher):
+    name = "slow"
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+
+    def _hand_off(self, uri):
+        time.sleep(self.delay)
+
+
+class TestAsyncLauncher(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name)
+
+        self.test_paths = []
+        for name in ("first", "second", "third"):
+            path = self.install_dir / name
+            path.mkdir()
+            self.test_paths.append(path)
+
+        self.dispatcher = RecordingDispatcher()
+        self.config = Config("test-command", LaunchMode.TAB, Path("."))
+        self.launcher = await AsyncLauncher.create(
+            self.install_dir, config=self.config, dispatcher=self.dispatcher, coalesce_window=0
+        )
+
+    async def test_launch(self):
+        launch_paths = await self.launcher.launch(*self.test_paths, str(self.test_paths[0]))
+
+        self.assertEqual(launch_paths, self.test_paths)
+        self.assertEqual(
+            self.dispatcher.uris, [f"warp://action/{LaunchMode.TAB.value}?path={path}" for path in self.test_paths]
+        )
+        self.assertEqual(HistoryHandler(self.install_dir).lookup("second"), self.test_paths[1])
+
+    async def test_launch_applies_directory_overrides(self):
+        (self.test_paths[1] / OVERRIDES_FILE_NAME).write_text(json.dumps({"launchMode": "window"}), encoding="utf-8")
+
+        await self.launcher.launch(*self.test_paths[:2])
+
+        self.assertEqual(
+            self.dispatcher.uris,
+            [
+                f"warp://action/{LaunchMode.TAB.value}?path={self.test_paths[0]}",
+                f"warp://action/{LaunchMode.WINDOW.value}?path={self.test_paths[1]}",
+            ],
+        )
+
+    async def test_launch_working_directory(self):
+        with patch("os.getcwd", return_value=str(self.test_paths[0])):
+            launch_paths = await self.launcher.launch()
+
+        self.assertEqual(launch_paths, [self.test_paths[0]])
+        self.assertEqual(self.dispatcher.uris, [f"warp://action/new_tab?path={self.test_paths[0]}"])
+
+    async def test_launch_validates_before_launching(self):
+        with self.assertRaises(ValueError) as context:
+            await self.launcher.launch(*self.test_paths, "<invalid>", "/non/existent")
+
+        self.assertIn("<invalid>", str(context.exception))
+        self.assertIn("does not exist", str(context.exception))
+        self.assertEqual(self.dispatcher.uris, [])
+
+    async def test_launch_validates_concurrently_and_launches_in_order(self):
+        lock = threading.Lock()
+        running = max_running = 0
+
+        def slow_probe_path(path_object, path_str, timeout=None):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        with patch("warp_launcher.reachability.probe_path", side_effect=slow_probe_path):
+            await self.launcher.launch(*self.test_paths, max_concurrency=2)
+
+        self.assertEqual(max_running, 2)
+        self.assertEqual(
+            self.dispatcher.uris, [f"warp://action/{LaunchMode.TAB.value}?path={path}" for path in self.test_paths]
+        )
+
+    async def test_launch_does_not_block_event_loop(self):
+        launcher = await AsyncLauncher.create(self.install_dir, config=self.config, dispatcher=_SlowDispatcher(0.1))
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        await launcher.launch(self.test_paths[0])
+        ticker.cancel()
+
+        self.assertGreaterEqual(ticks, 5)
+
+    async def test_launch_records_history_after_each_hand_off(self):
+        history_handler = HistoryHandler(self.install_dir)
+        recorded_paths = []
+
+        def hand_off(uri):
+            recorded_paths.append([history_handler.lookup(path.name) for path in self.test_paths])
+
+        with patch.object(RecordingDispatcher, "_hand_off", side_effect=hand_off):
+            await self.launcher.launch(*self.test_paths)
+
+        self.assertEqual(recorded_paths[1], [self.test_paths[0], None, None])
+        self.assertEqual(recorded_paths[2], [self.test_paths[0], self.test_paths[1], None])
+
+    @patch.object(RecordingDispatcher, "_hand_off", side_effect=[None, RuntimeError("failed"), None])
+    async def test_launch_reports_failures(self, mock_hand_off):
+        with self.assertRaises(RuntimeError) as context:
+            await self.launcher.launch(*self.test_paths, max_concurrency=1)
+
+        self.assertEqual(mock_hand_off.call_count, len(self.test_paths))
+        self.assertIn("Failed to launch 1 of 3 paths", str(context.exception))
+
+    async def test_launch_invalid_options(self):
+        with self.assertRaises(ValueError):
+            await self.launcher.launch(*self.test_paths, max_concurrency=0)
+
+        with self.assertRaises(ValueError):
+            await self.launcher.launch(*self.test_paths, interval=-1)
+
+    async def test_save_and_load_config(self):
+        await self.launcher.set_launch_path(str(self.test_paths[1]))
+        await self.launcher.save_config()
+
+        saved_config = json.loads((self.install_dir / "config.json").read_text(encoding="utf-8"))
+        self.assertEqual(saved_config["launchPath"], str(self.test_paths[1]))
+
+        (self.install_dir / "config.json").write_text(
+            json.dumps({**saved_config, "launchMode": "window"}), encoding="utf-8"
+        )
+        config = await self.launcher.load_config()
+
+        self.assertEqual(config.launch_mode, LaunchMode.WINDOW)
+        self.assertIs(self.launcher.config, config)
+
+    async def test_set_invalid_launch_path(self):
+        with self.assertRaises(ValueError):
+            await self.launcher.set_launch_path("/non/existent")
+
+    async def test_install_and_uninstall(self):
+        install_dir = self.install_dir / "install"
+        backend = MemoryRegistryBackend()
+        launcher = await AsyncLauncher.create(install_dir, config=self.config, registry_backend=backend)
+
+        await launcher.install()
+
+        self.assertEqual(await launcher.check_install(), [])
+        self.assertTrue(AppPathsRegister(install_dir / "launcher.vbs", backend).is_registered("test-command"))
+
+        await launcher.uninstall()
+
+        self.assertFalse(install_dir.exists())
+        self.assertFalse(AppPathsRegister(install_dir / "launcher.vbs", backend).is_registered("test-command"))
+
+
+if __name__ == "__main__":
+    pytest.main()
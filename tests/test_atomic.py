@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import pytest
+
+from warp_launcher.atomic import atomic_open, locked
+from warp_launcher.config import Config, ConfigHandler
+from warp_launcher.enums import LaunchMode
+
+_SOURCE_DIRECTORY = Path(__file__).parent.parent / "src"
+
+
+class TestAtomicOpen(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name)
+        self.file_path = self.install_dir / "config.json"
+
+    def test_atomic_open_replaces_file(self):
+        self.file_path.write_text("previous", encoding="utf-8")
+
+        with atomic_open(self.file_path, encoding="utf-8") as file:
+            file.write("new")
+            # The target keeps the previous content until the block exits
+            self.assertEqual(self.file_path.read_text(encoding="utf-8"), "previous")
+
+        self.assertEqual(self.file_path.read_text(encoding="utf-8"), "new")
+        self.assertEqual(sorted(path.name for path in self.install_dir.iterdir()), ["config.json", "write.lock"])
+
+    def test_atomic_open_keeps_file_on_error(self):
+        self.file_path.write_text("previous", encoding="utf-8")
+
+        with self.assertRaises(ValueError), atomic_open(self.file_path, encoding="utf-8") as file:
+            file.write("partial")
+            raise ValueError("Interrupted")
+
+        self.assertEqual(self.file_path.read_text(encoding="utf-8"), "previous")
+        self.assertEqual(sorted(path.name for path in self.install_dir.iterdir()), ["config.json", "write.lock"])
+
+    def test_atomic_open_without_lock(self):
+        with atomic_open(self.file_path, lock=False, encoding="utf-8") as file:
+            file.write("new")
+
+        self.assertEqual([path.name for path in self.install_dir.iterdir()], ["config.json"])
+
+    def test_atomic_open_missing_directory(self):
+        with self.assertRaises(OSError), atomic_open(self.install_dir / "missing" / "config.json", lock=False) as file:
+            file.write("new")
+
+    def test_locked_serializes_threads(self):
+        counter_file_path = self.install_dir / "counter"
+        counter_file_path.write_text("0", encoding="utf-8")
+
+        def increment():
+            for _ in range(50):
+                with locked(self.install_dir / "write.lock"):
+                    value = int(counter_file_path.read_text(encoding="utf-8"))
+                    counter_file_path.write_text(str(value + 1), encoding="utf-8")
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(counter_file_path.read_text(encoding="utf-8"), "200")
+
+    @unittest.skipIf(sys.platform == "win32", "Open files cannot be replaced on Windows, readers may be refused")
+    def test_readers_never_see_partial_writes(self):
+        # Large enough to need many writes of the file buffer, so a partial write would be seen
+        launch_paths = ["a" * 50_000, "b" * 70_000]
+        writer_script = (
+            "import sys; from pathlib import Path; from warp_launcher.config import Config, ConfigHandler; "
+            "from warp_launcher.enums import LaunchMode; handler = ConfigHandler(Path(sys.argv[1])); "
+            "configs = [Config('warp', LaunchMode.TAB, Path(path)) for path in sys.argv[2:]]; "
+            "[handler.save_config(configs[index % len(configs)]) for index in range(200)]"
+        )
+        reader_script = (
+            "import sys, json; from pathlib import Path; from warp_launcher.config import ConfigHandler; "
+            "handler = ConfigHandler(Path(sys.argv[1])); expected = set(sys.argv[2:]); bad_reads = 0\n"
+            "for _ in range(500):\n"
+            "    content = Path(sys.argv[1]).read_text(encoding='utf-8')\n"
+            "    if json.loads(content)['launchPath'] not in expected: bad_reads += 1\n"
+            "    if str(handler.read_config(validate_launch_path=False).launch_path) not in expected: bad_reads += 1\n"
+            "print(bad_reads)"
+        )
+        config_file_path = self.install_dir / "config.json"
+        ConfigHandler(config_file_path).save_config(Config("warp", LaunchMode.TAB, Path(launch_paths[0])))
+        arguments = [str(config_file_path), *launch_paths]
+
+        env = {**os.environ, "PYTHONPATH": str(_SOURCE_DIRECTORY)}
+        writers = [subprocess.Popen([sys.executable, "-c", writer_script, *arguments], env=env) for _ in range(3)]
+        readers = [
+            subprocess.Popen(
+                [sys.executable, "-c", reader_script, *arguments], stdout=subprocess.PIPE, text=True, env=env
+            )
+            for _ in range(3)
+        ]
+        results = [reader.communicate(timeout=60)[0].strip() for reader in readers]
+        return_codes = [writer.wait(timeout=60) for writer in writers]
+
+        self.assertEqual(results, ["0", "0", "0"])
+        self.assertEqual(return_codes, [0, 0, 0])
+        self.assertFalse(list(self.install_dir.glob("*.tmp")))
+
+
+if __name__ == "__main__":
+    pytest.main()
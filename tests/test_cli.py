@@ -0,0 +1,317 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import call, patch
+
+import pytest
+
+from warp_launcher import tracing
+
+# noinspection PyProtectedMember
+from warp_launcher.cli import _SCRIPT_TARGET_NAMES, _read_launch_paths, main, parse_cli_arguments
+from warp_launcher.constants import DEFAULT_LAUNCH_CONCURRENCY
+from warp_launcher.doctor import DoctorReport, ProbeResult
+from warp_launcher.enums import FleetStatus, ProbeStatus, TimeoutPolicy
+from warp_launcher.fleet import FleetResult
+from warp_launcher.manifest import InstallManifest, ManifestHandler
+from warp_launcher.metrics import MetricsHandler
+from warp_launcher.script import SCRIPT_TARGETS
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.paths_file = Path(self.temp_dir.name) / "paths.txt"
+        self.paths_file.write_text("C:\\first\n\n# comment\n  C:\\second  \n", encoding="utf-8")
+
+        patcher = patch("warp_launcher.cli.Launcher")
+        self.addCleanup(patcher.stop)
+        self.mock_launcher = patcher.start()
+
+        patcher = patch("warp_launcher.daemon.forward_launch", return_value=None)
+        self.addCleanup(patcher.stop)
+        self.mock_forward_launch = patcher.start()
+
+        patcher = patch("warp_launcher.cli.INSTALL_DIRECTORY", Path(self.temp_dir.name))
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def test_read_launch_paths(self):
+        parsed_args = parse_cli_arguments(["-l", "-p", "C:\\zero", "--paths-file", str(self.paths_file)])
+
+        self.assertEqual(_read_launch_paths(parsed_args), ["C:\\zero", "C:\\first", "C:\\second"])
+
+    @patch("sys.stdin", io.StringIO("C:\\first\nC:\\second\n"))
+    def test_read_launch_paths_from_stdin(self):
+        parsed_args = parse_cli_arguments(["-l", "--paths-file", "-"])
+
+        self.assertEqual(_read_launch_paths(parsed_args), ["C:\\first", "C:\\second"])
+
+    def test_read_launch_paths_missing_file(self):
+        parsed_args = parse_cli_arguments(["-l", "--paths-file", str(Path(self.temp_dir.name) / "missing.txt")])
+
+        with self.assertRaises(RuntimeError):
+            _read_launch_paths(parsed_args)
+
+    def test_main_single_launch(self):
+        self.assertEqual(main(["-l", "-p", "C:\\first"]), 0)
+
+        launcher = self.mock_launcher.return_value
+        self.assertEqual(launcher.launch_path, "C:\\first")
+        launcher.launch_warp.assert_called_once_with()
+        launcher.launch_many.assert_not_called()
+
+    def test_main_batch_launch(self):
+        self.assertEqual(main(["-l", "-p", "C:\\first", "-p", "C:\\second", "--interval", "0.5"]), 0)
+
+        launcher = self.mock_launcher.return_value
+        launcher.launch_many.assert_called_once_with(["C:\\first", "C:\\second"], DEFAULT_LAUNCH_CONCURRENCY, 0.5)
+        launcher.launch_warp.assert_not_called()
+        self.mock_forward_launch.assert_not_called()
+        self.mock_launcher.assert_called_once()
+
+    def test_main_coalesce_window(self):
+        self.assertEqual(main(["-l", "-p", "C:\\first", "--coalesce-window", "0"]), 0)
+
+        self.assertEqual(self.mock_launcher.call_args.kwargs["coalesce_window"], 0)
+        self.mock_forward_launch.assert_not_called()
+        self.mock_launcher.return_value.launch_warp.assert_called_once_with()
+
+    def test_main_path_timeout(self):
+        self.assertEqual(main(["-l", "-p", "C:\\first", "--path-timeout", "0.5", "--on-timeout", "home"]), 0)
+
+        self.assertEqual(self.mock_launcher.call_args.kwargs["path_timeout"], 0.5)
+        self.assertEqual(self.mock_launcher.call_args.kwargs["timeout_policy"], TimeoutPolicy.HOME)
+        self.mock_forward_launch.assert_not_called()
+
+    @patch("sys.stderr", new_callable=io.StringIO)
+    def test_recording_dispatcher_not_selectable(self, mock_stderr):
+        with self.assertRaises(SystemExit):
+            parse_cli_arguments(["-l", "--dispatcher", "recording"])
+
+        self.assertIn("invalid choice", mock_stderr.getvalue())
+
+    def test_main_batch_install_fails(self):
+        self.assertEqual(main(["-i", "-p", "C:\\first", "-p", "C:\\second"]), 1)
+
+        self.mock_launcher.return_value.install.assert_not_called()
+
+    @patch("warp_launcher.history.HistoryHandler.lookup", return_value=Path("C:\\projects\\warp"))
+    def test_main_jump(self, mock_lookup):
+        self.assertEqual(main(["-l", "--jump", "warp"]), 0)
+
+        mock_lookup.assert_called_once_with("warp")
+        self.assertEqual(self.mock_forward_launch.call_args.args[3], str(Path("C:\\projects\\warp")))
+        launcher = self.mock_launcher.return_value
+        self.assertEqual(launcher.launch_path, str(Path("C:\\projects\\warp")))
+        launcher.launch_warp.assert_called_once_with()
+
+    @patch("warp_launcher.history.HistoryHandler.lookup", return_value=None)
+    def test_main_jump_without_match_fails(self, mock_lookup):
+        self.assertEqual(main(["-l", "--jump", "warp"]), 1)
+
+        self.mock_launcher.return_value.launch_warp.assert_not_called()
+
+    def test_main_jump_invalid_combinations_fail(self):
+        self.assertEqual(main(["-i", "--jump", "warp"]), 1)
+        self.assertEqual(main(["-l", "--jump", "warp", "-p", "C:\\first"]), 1)
+
+        self.mock_launcher.assert_not_called()
+
+    def test_main_check_install(self):
+        launcher = self.mock_launcher.return_value
+
+        launcher.check_install.return_value = []
+        self.assertEqual(main(["-i", "--check"]), 0)
+
+        launcher.check_install.return_value = ["File 'config.json' is missing"]
+        self.assertEqual(main(["-i", "--check"]), 1)
+
+        launcher.install.assert_not_called()
+
+    def test_main_check_without_install_fails(self):
+        self.assertEqual(main(["-l", "--check"]), 1)
+
+        self.mock_launcher.return_value.check_install.assert_not_called()
+
+    def test_main_install_context_menu(self):
+        self.assertEqual(main(["-i", "--context-menu"]), 0)
+
+        self.mock_launcher.return_value.install.assert_called_once_with()
+        self.mock_launcher.return_value.install_context_menu.assert_called_once_with()
+
+    def test_main_context_menu_without_install_fails(self):
+        self.assertEqual(main(["-l", "--context-menu"]), 1)
+
+        self.mock_launcher.return_value.install_context_menu.assert_not_called()
+
+    def test_main_install_aliases(self):
+        args = ["-i", "--remove-alias", "old", "--alias", "wtab=tab", "--alias", r"wapi=window:C:\repos\api"]
+        self.assertEqual(main([*args, "--alias", "whome=:~"]), 0)
+
+        launcher = self.mock_launcher.return_value
+        launcher.remove_alias.assert_called_once_with("old")
+        self.assertEqual(
+            launcher.add_alias.call_args_list,
+            [call("wtab", "tab", None), call("wapi", "window", r"C:\repos\api"), call("whome", None, "~")],
+        )
+        launcher.install.assert_called_once_with()
+
+    def test_main_alias_without_install_fails(self):
+        self.assertEqual(main(["-l", "--alias", "wtab=tab"]), 1)
+
+        self.mock_launcher.return_value.add_alias.assert_not_called()
+
+    def test_script_target_names(self):
+        self.assertEqual(_SCRIPT_TARGET_NAMES, tuple(SCRIPT_TARGETS))
+
+    def test_main_install_script_target(self):
+        self.assertEqual(main(["-i", "--script-target", "cmd"]), 0)
+
+        self.assertEqual(self.mock_launcher.call_args.kwargs["script_filename"], "launcher.cmd")
+        self.mock_launcher.return_value.install.assert_called_once_with()
+
+    def test_main_install_keeps_installed_script_target(self):
+        registrations = {"warp": str(Path(self.temp_dir.name) / "launcher.cmd")}
+        ManifestHandler(Path(self.temp_dir.name) / "manifest.json").save_manifest(InstallManifest({}, registrations))
+
+        for args in (["-i"], ["-u"]):
+            with self.subTest(args=args):
+                self.assertEqual(main(args), 0)
+                self.assertEqual(self.mock_launcher.call_args.kwargs["script_filename"], "launcher.cmd")
+
+        # Launches do not read the install manifest
+        self.assertEqual(main(["-l", "-p", "C:\\first"]), 0)
+        self.assertEqual(self.mock_launcher.call_args.kwargs["script_filename"], "launcher.vbs")
+
+    @patch("warp_launcher.script.measure_script_targets", return_value={"cmd": 0.1, "vbs": 0.2})
+    def test_main_install_fastest_script_target(self, mock_measure_script_targets):
+        self.assertEqual(main(["-i", "--script-target", "fastest"]), 0)
+
+        mock_measure_script_targets.assert_called_once()
+        self.assertEqual(self.mock_launcher.call_args.kwargs["script_filename"], "launcher.cmd")
+
+    @patch("warp_launcher.script.measure_script_targets", return_value={})
+    def test_main_install_fastest_script_target_unavailable_fails(self, mock_measure_script_targets):
+        self.assertEqual(main(["-i", "--script-target", "fastest"]), 1)
+
+        self.mock_launcher.assert_not_called()
+
+    def test_main_script_target_without_install_fails(self):
+        self.assertEqual(main(["-l", "--script-target", "cmd"]), 1)
+
+        self.mock_launcher.assert_not_called()
+
+    def test_main_log_file_with_uninstall_fails(self):
+        with patch("warp_launcher.cli.configure_logging") as mock_configure_logging:
+            self.assertEqual(main(["-u", "--log-file", "jsonl"]), 1)
+
+        self.assertEqual(mock_configure_logging.call_args.args[1].name, "launcher.jsonl")
+        self.mock_launcher.return_value.uninstall.assert_not_called()
+
+    @patch("warp_launcher.fleet.FleetHandler")
+    def test_main_install_manifest(self, mock_fleet_handler):
+        fleet_file_path = Path(self.temp_dir.name) / "fleet.json"
+        provision_fleet = mock_fleet_handler.return_value.provision_fleet
+        provision_fleet.return_value = [FleetResult(0, Path("C:\\alice"), "warp", FleetStatus.INSTALLED)]
+
+        self.assertEqual(main(["--install-manifest", str(fleet_file_path), "--concurrency", "8"]), 0)
+
+        provision_fleet.assert_called_once_with(fleet_file_path, 8)
+        self.assertEqual(mock_fleet_handler.call_args.kwargs["script_filename"], "launcher.vbs")
+        self.mock_launcher.assert_not_called()
+
+        provision_fleet.return_value.append(FleetResult(1, Path("C:\\bob"), "warp", FleetStatus.ROLLED_BACK, "Failed"))
+        self.assertEqual(main(["--install-manifest", str(fleet_file_path)]), 1)
+
+    @patch("warp_launcher.fleet.FleetHandler")
+    def test_main_install_manifest_with_command_fails(self, mock_fleet_handler):
+        self.assertEqual(main(["--install-manifest", "fleet.json", "-c", "warp"]), 1)
+
+        mock_fleet_handler.assert_not_called()
+
+    @patch("warp_launcher.doctor.Doctor")
+    def test_main_doctor(self, mock_doctor):
+        results = [ProbeResult("config", ProbeStatus.OK, "Valid", 0.001)]
+        mock_doctor.return_value.run.return_value = DoctorReport(results)
+
+        self.assertEqual(main(["--doctor"]), 0)
+        self.mock_launcher.assert_not_called()
+
+        results.append(ProbeResult("launch_path", ProbeStatus.TIMEOUT, "No answer", 2.0))
+        self.assertEqual(main(["--doctor"]), 1)
+
+    @patch("sys.stderr", new_callable=io.StringIO)
+    def test_main_trace(self, mock_stderr):
+        self.assertEqual(main(["-l", "-p", "C:\\first", "--trace"]), 0)
+
+        report = json.loads(mock_stderr.getvalue())
+        span_names = [span["name"] for span in report["spans"]]
+        for name in ("imports", "parse_arguments", "configure_logging", "forward_to_daemon", "create_launcher"):
+            self.assertIn(name, span_names)
+        self.assertIsNone(tracing._tracer)
+
+    def test_main_records_metrics(self):
+        def launch_warp():
+            with tracing.span("launcher.dispatch"):
+                pass
+
+        self.mock_launcher.return_value.launch_warp.side_effect = launch_warp
+        self.assertEqual(main(["-l", "-p", "C:\\first"]), 0)
+        # Failed actions are recorded too
+        self.assertEqual(main(["-i", "--check"]), 1)
+
+        histograms = MetricsHandler(Path(self.temp_dir.name)).load_histograms()
+
+        self.assertEqual(histograms[("launch", "total")].count, 1)
+        self.assertEqual(histograms[("launch", "run")].count, 1)
+        # The main phases are timed on every run, the detailed ones only traced on request
+        self.assertEqual(histograms[("launch", "dispatch")].count, 1)
+        self.assertNotIn(("launch", "create_launcher"), histograms)
+        self.assertEqual(histograms[("check", "total")].count, 1)
+        self.assertIsNone(tracing._tracer)
+        self.assertIsNone(tracing._phase_recorder)
+
+    @patch("sys.stderr", new_callable=io.StringIO)
+    def test_main_records_metrics_while_tracing(self, mock_stderr):
+        def launch_warp():
+            with tracing.span("launcher.dispatch"):
+                pass
+
+        self.mock_launcher.return_value.launch_warp.side_effect = launch_warp
+        self.assertEqual(main(["-l", "-p", "C:\\first", "--trace"]), 0)
+
+        histograms = MetricsHandler(Path(self.temp_dir.name)).load_histograms()
+        self.assertEqual(histograms[("launch", "dispatch")].count, 1)
+
+    def test_main_stats(self):
+        MetricsHandler(Path(self.temp_dir.name)).record("launch", {"total": 20_000})
+        export_file_path = Path(self.temp_dir.name) / "warp_launcher.prom"
+
+        with self.assertLogs("warp_launcher.cli", "INFO") as logs:
+            self.assertEqual(main(["--stats", "--export-metrics", str(export_file_path)]), 0)
+
+        self.assertIn("p50", "\n".join(logs.output))
+        self.assertIn("# EOF", export_file_path.read_text(encoding="utf-8"))
+        # Reporting the durations is not recorded
+        self.assertEqual(MetricsHandler(Path(self.temp_dir.name)).load_histograms()[("launch", "total")].count, 1)
+
+    def test_main_export_metrics_without_stats_fails(self):
+        self.assertEqual(main(["-l", "--export-metrics", "warp_launcher.prom"]), 1)
+
+    def test_main_profile(self):
+        profile_file_path = Path(self.temp_dir.name) / "profile.txt"
+
+        with patch("warp_launcher.cli.INSTALL_DIRECTORY", Path(self.temp_dir.name)):
+            self.assertEqual(main(["-l", "-p", "C:\\first", "--profile"]), 0)
+
+        self.assertIn("Peak memory:", profile_file_path.read_text(encoding="utf-8"))
+        self.mock_launcher.return_value.launch_warp.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    pytest.main()
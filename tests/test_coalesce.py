@@ -0,0 +1,194 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.coalesce import LaunchBatcher, LaunchCoalescer
+from warp_launcher.config import Config
+from warp_launcher.dispatcher import RecordingDispatcher
+from warp_launcher.enums import LaunchMode
+from warp_launcher.launcher import Launcher
+
+_SOURCE_DIRECTORY = Path(__file__).parent.parent / "src"
+
+_SECOND = 1_000_000_000
+
+
+class TestLaunchCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name)
+        self.launch_path = Path(self.temp_dir.name) / "project"
+        self.coalescer = LaunchCoalescer(self.install_dir, window=0.5)
+
+    def test_claim_drops_repeated_launch_within_window(self):
+        self.assertTrue(self.coalescer.claim("new_window", self.launch_path, now=10 * _SECOND))
+        self.assertFalse(self.coalescer.claim("new_window", self.launch_path, now=10 * _SECOND + _SECOND // 4))
+
+        # The window starts at the dispatched launch, not at the dropped ones
+        self.assertTrue(self.coalescer.claim("new_window", self.launch_path, now=10 * _SECOND + _SECOND // 2))
+
+    def test_claim_different_launches(self):
+        self.assertTrue(self.coalescer.claim("new_window", self.launch_path, now=_SECOND))
+        self.assertTrue(self.coalescer.claim("new_tab", self.launch_path, now=_SECOND))
+        self.assertTrue(self.coalescer.claim("new_window", self.install_dir, now=_SECOND))
+
+    def test_claim_drops_expired_records(self):
+        for index in range(10):
+            self.coalescer.claim("new_window", self.install_dir / str(index), now=_SECOND)
+
+        self.coalescer.claim("new_window", self.launch_path, now=2 * _SECOND)
+
+        record = (self.install_dir / "launches.lock").read_text(encoding="utf-8")
+        self.assertEqual(record.splitlines(), [f"{2 * _SECOND} new_window\t{self.launch_path.absolute()}"])
+
+    def test_release_allows_repeated_launch(self):
+        self.assertTrue(self.coalescer.claim("new_window", self.launch_path, now=10 * _SECOND))
+        self.assertTrue(self.coalescer.claim("new_tab", self.launch_path, now=10 * _SECOND))
+
+        self.coalescer.release("new_window", self.launch_path)
+
+        self.assertTrue(self.coalescer.claim("new_window", self.launch_path, now=10 * _SECOND + _SECOND // 4))
+        self.assertFalse(self.coalescer.claim("new_tab", self.launch_path, now=10 * _SECOND + _SECOND // 4))
+
+    def test_claim_disabled(self):
+        coalescer = LaunchCoalescer(self.install_dir, window=0)
+
+        self.assertTrue(coalescer.claim("new_window", self.launch_path))
+        self.assertTrue(coalescer.claim("new_window", self.launch_path))
+        self.assertFalse((self.install_dir / "launches.lock").exists())
+
+    def test_claim_allows_launch_on_error(self):
+        coalescer = LaunchCoalescer(self.install_dir / "missing", window=0.5)
+
+        self.assertTrue(coalescer.claim("new_window", self.launch_path))
+        self.assertTrue(coalescer.claim("new_window", self.launch_path))
+
+    def test_claim_across_processes(self):
+        script = (
+            "import sys; from pathlib import Path; from warp_launcher.coalesce import LaunchCoalescer; "
+            "print(LaunchCoalescer(Path(sys.argv[1]), window=30).claim('new_window', sys.argv[2]))"
+        )
+        env = {**os.environ, "PYTHONPATH": str(_SOURCE_DIRECTORY)}
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", script, str(self.install_dir), str(self.launch_path)],
+                stdout=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+            for _ in range(4)
+        ]
+        results = [process.communicate(timeout=30)[0].strip() for process in processes]
+
+        self.assertEqual(sorted(results), ["False", "False", "False", "True"])
+
+
+class TestLaunchBatcher(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name)
+        self.batcher = LaunchBatcher(self.install_dir, window=0.2)
+
+    def test_submit_single_path(self):
+        self.assertEqual(self.batcher.submit(self.install_dir / "project"), [self.install_dir / "project"])
+        self.assertEqual((self.install_dir / "selection.lock").read_text(encoding="utf-8"), "")
+
+    def test_submit_gathers_selection(self):
+        paths = [self.install_dir / f"project{index}" for index in range(10)]
+        results: list[list[Path]] = []
+
+        def submit(path: Path) -> None:
+            results.append(LaunchBatcher(self.install_dir, window=0.2).submit(path))
+
+        # One thread for each of the processes started by Explorer
+        threads = [threading.Thread(target=submit, args=(path,)) for path in paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        batches = [result for result in results if result]
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(sorted(batches[0]), sorted(paths))
+
+    def test_submit_takes_over_dead_leader(self):
+        (self.install_dir / "selection.lock").write_text(f"{_SECOND} {self.install_dir / 'first'}\n", encoding="utf-8")
+
+        launch_paths = self.batcher.submit(self.install_dir / "second")
+
+        self.assertEqual(launch_paths, [self.install_dir / "second", self.install_dir / "first"])
+
+    def test_submit_launches_alone_on_error(self):
+        batcher = LaunchBatcher(self.install_dir / "missing", window=0.2)
+
+        self.assertEqual(batcher.submit(self.install_dir / "project"), [self.install_dir / "project"])
+
+    def test_submit_across_processes(self):
+        script = (
+            "import sys; from pathlib import Path; from warp_launcher.coalesce import LaunchBatcher; "
+            "print(len(LaunchBatcher(Path(sys.argv[1]), window=1).submit(sys.argv[2])))"
+        )
+        env = {**os.environ, "PYTHONPATH": str(_SOURCE_DIRECTORY)}
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", script, str(self.install_dir), str(self.install_dir / f"project{index}")],
+                stdout=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+            for index in range(4)
+        ]
+        results = [process.communicate(timeout=30)[0].strip() for process in processes]
+
+        self.assertEqual(sorted(results), ["0", "0", "0", "4"])
+
+
+class TestLauncherCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config = Config("warp", LaunchMode.TAB, Path(self.temp_dir.name))
+
+    def test_launch_warp_drops_repeated_launch(self):
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(Path(self.temp_dir.name), config=self.config, dispatcher=dispatcher)
+
+        self.assertEqual(launcher.launch_warp(), Path(self.temp_dir.name))
+        self.assertEqual(launcher.launch_warp(), Path(self.temp_dir.name))
+
+        self.assertEqual(len(dispatcher.uris), 1)
+
+    def test_launch_warp_retries_failed_launch(self):
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(Path(self.temp_dir.name), config=self.config, dispatcher=dispatcher)
+
+        with (
+            patch.object(RecordingDispatcher, "_hand_off", side_effect=RuntimeError("failed")),
+            self.assertRaises(RuntimeError),
+        ):
+            launcher.launch_warp()
+        launcher.launch_warp()
+
+        self.assertEqual(len(dispatcher.uris), 1)
+
+    def test_launch_warp_without_coalescing(self):
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(Path(self.temp_dir.name), config=self.config, dispatcher=dispatcher, coalesce_window=0)
+
+        launcher.launch_warp()
+        launcher.launch_warp()
+
+        self.assertEqual(len(dispatcher.uris), 2)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,3 +1,7 @@
+import json
+import os
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -6,9 +10,20 @@ from unittest.mock import patch
 import pytest
 
 # noinspection PyProtectedMember
-from warp_launcher.config import _COMMAND_NAME_KEY, _LAUNCH_MODE_KEY, _LAUNCH_PATH_KEY, Config, ConfigHandler
+from warp_launcher.config import (
+    _ALIASES_KEY,
+    _COMMAND_NAME_KEY,
+    _LAUNCH_MODE_KEY,
+    _LAUNCH_PATH_KEY,
+    Config,
+    ConfigHandler,
+    clear_config_cache,
+)
 from warp_launcher.constants import DEFAULT_COMMAND_NAME, DEFAULT_LAUNCH_MODE, DEFAULT_LAUNCH_PATH
 from warp_launcher.enums import LaunchMode
+from warp_launcher.utils import validate_path
+
+_SOURCE_DIRECTORY = Path(__file__).parent.parent / "src"
 
 
 class TestConfig(unittest.TestCase):
@@ -70,6 +85,49 @@ class TestConfig(unittest.TestCase):
             with self.subTest(config_dict=config_dict), self.assertRaises(ValueError):
                 Config.from_dict(config_dict)
 
+    def test_config_from_dict_without_launch_path_validation(self):
+        config_dict = {_COMMAND_NAME_KEY: "test_command", _LAUNCH_MODE_KEY: "tab", _LAUNCH_PATH_KEY: "/non/existent"}
+
+        config = Config.from_dict(config_dict, validate_launch_path=False)
+
+        self.assertEqual(config.launch_path, Path("/non/existent"))
+        with self.assertRaises(ValueError):
+            Config.from_dict({**config_dict, _LAUNCH_PATH_KEY: ""}, validate_launch_path=False)
+
+    def test_config_from_dict_with_aliases(self):
+        config_dict = {
+            **self.test_config.to_dict(),
+            _ALIASES_KEY: {"test_window": {_LAUNCH_MODE_KEY: "window"}, "test_path": {_LAUNCH_PATH_KEY: "."}},
+        }
+
+        config = Config.from_dict(config_dict)
+
+        self.assertEqual(
+            config.aliases,
+            [
+                Config("test_window", LaunchMode.WINDOW, self.test_config.launch_path),
+                Config("test_path", LaunchMode.TAB, Path(".")),
+            ],
+        )
+        self.assertEqual(Config.from_dict(config.to_dict()), config)
+        self.assertEqual(Config.from_dict(config_dict, validate_launch_path=False), config)
+        self.assertEqual(
+            [command.command_name for command in config.get_commands()], ["test_command", "test_window", "test_path"]
+        )
+        self.assertIs(config.get_alias("TEST_PATH"), config.aliases[1])
+
+    def test_config_from_dict_with_invalid_aliases(self):
+        test_cases = [
+            ("not an object", ["test_alias"]),
+            ("invalid alias", {"test_alias": "tab"}),
+            ("repeated command", {"TEST_COMMAND": {}}),
+            ("invalid alias name", {"_invalid_": {}}),
+            ("invalid alias mode", {"test_alias": {_LAUNCH_MODE_KEY: "invalid"}}),
+        ]
+        for name, aliases in test_cases:
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                Config.from_dict({**self.test_config.to_dict(), _ALIASES_KEY: aliases})
+
     def test_load_config_non_existing_file(self):
         non_existing_config_file_path = Path("/non/existent") / "test.json"
 
@@ -101,6 +159,25 @@ class TestConfig(unittest.TestCase):
         config = handler.load_config()
         self.assertEqual(config, self.test_config)
 
+    def test_read_config_missing_fields_take_defaults(self):
+        self.config_file_path.write_text(json.dumps({_COMMAND_NAME_KEY: "test_command"}), encoding="utf-8")
+
+        config = ConfigHandler(self.config_file_path).read_config()
+
+        self.assertEqual(config, Config("test_command", DEFAULT_LAUNCH_MODE, DEFAULT_LAUNCH_PATH))
+
+    def test_read_config_raises_errors(self):
+        handler = ConfigHandler(self.config_file_path)
+
+        with self.assertRaises(RuntimeError):
+            handler.read_config()
+
+        for content in ("not valid json", "[]", json.dumps({_COMMAND_NAME_KEY: "-invalid"})):
+            with self.subTest(content=content):
+                self.config_file_path.write_text(content, encoding="utf-8")
+                with self.assertRaises(ValueError):
+                    handler.read_config()
+
     @patch("warp_launcher.config.json.dump", side_effect=OSError("Permission denied"))
     def test_save_config_io_error(self, mock_class):
         handler = ConfigHandler(self.config_file_path)
@@ -119,5 +196,142 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config, self.default_config)
 
 
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        clear_config_cache()
+        self.addCleanup(clear_config_cache)
+
+        self.test_config = Config("test_command", LaunchMode.TAB, Path.home())
+        self.config_file_path = Path(self.temp_dir.name) / "config.json"
+        self.config_file_path.write_text(json.dumps(self.test_config.to_dict()), encoding="utf-8")
+        self.handler = ConfigHandler(self.config_file_path)
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    def test_load_config_uses_cache(self, mock_json_load):
+        first_config = self.handler.load_config()
+        second_config = ConfigHandler(self.config_file_path).load_config()
+
+        self.assertEqual(first_config, self.test_config)
+        self.assertEqual(second_config, self.test_config)
+        mock_json_load.assert_called_once()
+
+    def test_load_config_returns_copies(self):
+        first_config = self.handler.load_config()
+        first_config.launch_mode = LaunchMode.WINDOW
+
+        self.assertEqual(self.handler.load_config(), self.test_config)
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    def test_load_config_invalidates_changed_file(self, mock_json_load):
+        self.handler.load_config()
+
+        changed_config = Config("changed_command", LaunchMode.WINDOW, Path.home())
+        self.config_file_path.write_text(json.dumps(changed_config.to_dict()), encoding="utf-8")
+
+        self.assertEqual(self.handler.load_config(), changed_config)
+        self.assertEqual(mock_json_load.call_count, 2)
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    @patch("warp_launcher.config.validate_path", wraps=validate_path)
+    def test_load_config_uses_snapshot(self, mock_validate_path, mock_json_load):
+        self.handler.load_config()
+        self.assertTrue(self.handler.snapshot_file_path.exists())
+
+        # A new process only has the snapshot
+        clear_config_cache()
+
+        self.assertEqual(self.handler.load_config(), self.test_config)
+        mock_json_load.assert_called_once()
+        mock_validate_path.assert_not_called()
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    @patch("warp_launcher.config.validate_path", side_effect=AssertionError("probed"))
+    def test_load_config_does_not_probe_launch_path(self, mock_validate_path, mock_json_load):
+        unreachable_config = Config("test_command", LaunchMode.WINDOW, Path(self.temp_dir.name) / "dead-share")
+        self.config_file_path.write_text(json.dumps(unreachable_config.to_dict()), encoding="utf-8")
+
+        # The launch checks the path under the timeout policy, the other settings are kept and cached meanwhile
+        self.assertEqual(self.handler.load_config(), unreachable_config)
+        self.assertEqual(self.handler.load_config(), unreachable_config)
+        mock_json_load.assert_called_once()
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    def test_load_config_ignores_outdated_snapshot(self, mock_json_load):
+        self.handler.load_config()
+        clear_config_cache()
+
+        stat_result = self.config_file_path.stat()
+        os.utime(self.config_file_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.handler.load_config(), self.test_config)
+        self.assertEqual(mock_json_load.call_count, 2)
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    def test_load_config_snapshot_with_aliases(self, mock_json_load):
+        config = Config(
+            "test_command", LaunchMode.TAB, Path.home(), [Config("test_alias", LaunchMode.WINDOW, Path("."))]
+        )
+        self.handler.save_config(config)
+        clear_config_cache()
+
+        self.assertEqual(self.handler.load_config(), config)
+        mock_json_load.assert_not_called()
+
+    def test_load_config_ignores_invalid_snapshot(self):
+        self.handler.load_config()
+        clear_config_cache()
+
+        self.handler.snapshot_file_path.write_text("invalid snapshot", encoding="utf-8")
+
+        self.assertEqual(self.handler.load_config(), self.test_config)
+
+    @patch("warp_launcher.config.json.load", wraps=json.load)
+    def test_save_config_updates_cache(self, mock_json_load):
+        changed_config = Config("changed_command", LaunchMode.WINDOW, Path.home())
+
+        self.handler.save_config(changed_config)
+
+        self.assertEqual(self.handler.load_config(), changed_config)
+        mock_json_load.assert_not_called()
+
+    @unittest.skipIf(sys.platform == "win32", "Open files cannot be replaced on Windows, readers may be refused")
+    def test_concurrent_saves_cache_their_own_file_identity(self):
+        # Each process checks that whenever the file has the identity it cached, it holds the configuration it saved
+        writer_script = (
+            "import os, sys, json; from pathlib import Path; from warp_launcher import config as config_module; "
+            "from warp_launcher.config import Config, ConfigHandler; from warp_launcher.enums import LaunchMode\n"
+            "config_file_path = Path(sys.argv[1]); handler = ConfigHandler(config_file_path)\n"
+            "config = Config(sys.argv[2], LaunchMode.TAB, Path(sys.argv[2])); bad_entries = 0\n"
+            "def get_identity():\n"
+            "    stat_result = os.stat(config_file_path)\n"
+            "    return [stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino]\n"
+            "for _ in range(200):\n"
+            "    handler.save_config(config)\n"
+            "    stat_key, cached_config = config_module._config_cache[config_file_path]\n"
+            "    identity = get_identity(); content = config_file_path.read_text(encoding='utf-8')\n"
+            "    if list(stat_key) == identity == get_identity() and json.loads(content) != cached_config.to_dict():\n"
+            "        bad_entries += 1\n"
+            "print(bad_entries)"
+        )
+        env = {**os.environ, "PYTHONPATH": str(_SOURCE_DIRECTORY)}
+        writers = [
+            subprocess.Popen(
+                [sys.executable, "-c", writer_script, str(self.config_file_path), command_name],
+                stdout=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+            for command_name in ("first_command", "second_command")
+        ]
+        results = [writer.communicate(timeout=60)[0].strip() for writer in writers]
+
+        self.assertEqual(results, ["0", "0"])
+        # A new process trusts the snapshot of the final file
+        clear_config_cache()
+        self.assertEqual(self.handler.load_config(), self.handler.read_config(validate_launch_path=False))
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from multiprocessing.connection import Client
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.config import Config, ConfigHandler
+from warp_launcher.constants import DAEMON_FILE_NAME
+from warp_launcher.daemon import LaunchDaemon, forward_launch, stop_daemon
+from warp_launcher.enums import LaunchMode
+
+
+class TestLaunchDaemon(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.install_dir = Path(self.temp_dir.name)
+        self.test_config = Config("test-command", LaunchMode.TAB, Path("."))
+        ConfigHandler(self.install_dir / "config.json").save_config(self.test_config)
+
+        patcher = patch("warp_launcher.launcher.Launcher.launch_warp", autospec=True)
+        self.addCleanup(patcher.stop)
+        self.mock_launch_warp = patcher.start()
+        self.mock_launch_warp.side_effect = lambda launcher, working_directory=None: working_directory
+
+    def start_daemon(self, **options) -> threading.Thread:
+        daemon = LaunchDaemon(self.install_dir, **options)
+        daemon.start()
+
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(stop_daemon, self.install_dir)
+        return thread
+
+    def test_forward_launch_without_daemon(self):
+        self.assertIsNone(forward_launch(self.install_dir, self.install_dir))
+        self.mock_launch_warp.assert_not_called()
+
+    def test_forward_launch_with_stale_endpoint(self):
+        endpoint = {"address": str(self.install_dir / "missing.sock"), "authkey": "00"}
+        (self.install_dir / DAEMON_FILE_NAME).write_text(json.dumps(endpoint), encoding="utf-8")
+
+        self.assertIsNone(forward_launch(self.install_dir, self.install_dir))
+
+    def test_forward_launch_uses_client_working_directory(self):
+        self.start_daemon()
+
+        launch_path = forward_launch(self.install_dir, Path("/client/cwd"))
+
+        self.assertEqual(launch_path, Path("/client/cwd"))
+        self.mock_launch_warp.assert_called_once()
+        launcher = self.mock_launch_warp.call_args.args[0]
+        self.assertEqual(launcher.config, self.test_config)
+
+    def test_forward_launch_resolves_relative_path_from_client_working_directory(self):
+        client_directory = self.install_dir / "client" / "docs"
+        client_directory.mkdir(parents=True)
+        (self.install_dir / "client" / "src").mkdir()
+        self.start_daemon()
+
+        # The daemon runs from the working directory of the tests, not the one of the client
+        self.assertNotEqual(Path.cwd(), client_directory)
+        forward_launch(self.install_dir, client_directory, launch_path=os.path.join("..", "src"))
+
+        launcher = self.mock_launch_warp.call_args.args[0]
+        self.assertEqual(launcher.launch_path.resolve(), (self.install_dir / "client" / "src").resolve())
+
+    def test_forward_launch_applies_overrides_without_changing_warm_config(self):
+        self.start_daemon()
+
+        forward_launch(self.install_dir, self.install_dir, launch_mode="window")
+        forward_launch(self.install_dir, self.install_dir)
+
+        first_launcher = self.mock_launch_warp.call_args_list[0].args[0]
+        second_launcher = self.mock_launch_warp.call_args_list[1].args[0]
+        self.assertEqual(first_launcher.launch_mode, LaunchMode.WINDOW)
+        self.assertEqual(second_launcher.launch_mode, LaunchMode.TAB)
+
+    def test_forward_launch_reports_invalid_request(self):
+        self.start_daemon()
+
+        with self.assertRaises(RuntimeError) as context:
+            forward_launch(self.install_dir, self.install_dir, launch_mode="invalid")
+
+        self.assertIn("Invalid mode", str(context.exception))
+        self.mock_launch_warp.assert_not_called()
+
+    def test_stop_daemon(self):
+        thread = self.start_daemon()
+
+        self.assertTrue(stop_daemon(self.install_dir))
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertFalse((self.install_dir / DAEMON_FILE_NAME).exists())
+        self.assertFalse(stop_daemon(self.install_dir))
+
+    def test_stalled_client_does_not_block_launches(self):
+        self.start_daemon(request_timeout=0.1)
+        endpoint = json.loads((self.install_dir / DAEMON_FILE_NAME).read_text(encoding="utf-8"))
+
+        # Authenticates and then sends nothing
+        stalled_connection = Client(endpoint["address"], authkey=bytes.fromhex(endpoint["authkey"]))
+        self.addCleanup(stalled_connection.close)
+
+        launch_paths = []
+        client = threading.Thread(
+            target=lambda: launch_paths.append(forward_launch(self.install_dir, self.install_dir))
+        )
+        client.start()
+        client.join(5)
+
+        self.assertEqual(launch_paths, [self.install_dir])
+
+    def test_start_fails_when_daemon_is_running(self):
+        self.start_daemon()
+
+        with self.assertRaises(RuntimeError):
+            LaunchDaemon(self.install_dir).start()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.constants import DEFAULT_DISPATCHER
+from warp_launcher.dispatcher import (
+    DISPATCHERS,
+    CmdStartDispatcher,
+    RecordingDispatcher,
+    StartfileDispatcher,
+    XdgOpenDispatcher,
+    get_dispatcher,
+    measure_dispatchers,
+)
+
+
+class TestDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.test_uri = "warp://action/new_tab?path=C:\\test\\path"
+
+    def test_get_dispatcher(self):
+        self.assertEqual(get_dispatcher().name, DEFAULT_DISPATCHER)
+
+        for name, dispatcher_class in DISPATCHERS.items():
+            with self.subTest(name=name):
+                self.assertIsInstance(get_dispatcher(name), dispatcher_class)
+
+        for name in ("invalid", RecordingDispatcher.name):
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                get_dispatcher(name)
+
+    def test_recording_dispatcher(self):
+        dispatcher = RecordingDispatcher()
+
+        result = dispatcher.dispatch(self.test_uri)
+
+        self.assertEqual(dispatcher.uris, [self.test_uri])
+        self.assertEqual(result.uri, self.test_uri)
+        self.assertEqual(result.dispatcher, RecordingDispatcher.name)
+        self.assertGreaterEqual(result.latency, 0)
+
+    @patch("subprocess.DETACHED_PROCESS", 8, create=True)
+    @patch("subprocess.Popen")
+    def test_cmd_start_dispatcher(self, mock_popen):
+        CmdStartDispatcher().dispatch(self.test_uri)
+
+        mock_popen.assert_called_once_with(
+            ["cmd", "/c", "start", "", self.test_uri],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=8,
+        )
+        mock_popen.return_value.wait.assert_not_called()
+
+    @patch("subprocess.Popen")
+    def test_xdg_open_dispatcher_waits_for_hand_off(self, mock_popen):
+        XdgOpenDispatcher(wait=True).dispatch(self.test_uri)
+
+        mock_popen.assert_called_once_with(
+            ["xdg-open", self.test_uri],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        mock_popen.return_value.wait.assert_called_once()
+
+    @patch("subprocess.Popen", side_effect=FileNotFoundError("xdg-open"))
+    def test_process_dispatcher_error(self, mock_popen):
+        with self.assertRaises(RuntimeError):
+            XdgOpenDispatcher().dispatch(self.test_uri)
+
+        mock_popen.assert_called_once()
+
+    @unittest.skipUnless(sys.platform == "win32", "os.startfile is only available on Windows")
+    @patch("os.startfile")
+    def test_startfile_dispatcher(self, mock_startfile):
+        StartfileDispatcher().dispatch(self.test_uri)
+
+        mock_startfile.assert_called_once_with(self.test_uri)
+
+    @unittest.skipIf(sys.platform == "win32", "os.startfile is available on Windows")
+    def test_startfile_dispatcher_unavailable(self):
+        with self.assertRaises(RuntimeError):
+            StartfileDispatcher().dispatch(self.test_uri)
+
+    def test_measure_dispatchers(self):
+        with patch.dict(DISPATCHERS, {RecordingDispatcher.name: RecordingDispatcher}):
+            latencies = measure_dispatchers(self.test_uri, [RecordingDispatcher.name], repeat=3)
+
+        self.assertEqual(list(latencies), [RecordingDispatcher.name])
+        self.assertGreaterEqual(latencies[RecordingDispatcher.name], 0)
+
+
+if __name__ == "__main__":
+    pytest.main()
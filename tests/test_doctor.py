@@ -0,0 +1,164 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.config import Config
+from warp_launcher.doctor import Doctor, ProbeResult
+from warp_launcher.enums import LaunchMode, ProbeStatus
+from warp_launcher.launcher import Launcher
+from warp_launcher.registry import MemoryRegistryBackend, UriSchemeRegister
+
+_WARP_OPEN_COMMAND = '"C:\\Program Files\\Warp\\warp.exe" "%1"'
+
+
+class TestUriSchemeRegister(unittest.TestCase):
+    def test_get_open_command(self):
+        register = UriSchemeRegister(MemoryRegistryBackend({"warp\\shell\\open\\command": _WARP_OPEN_COMMAND}))
+
+        self.assertEqual(register.get_open_command("warp"), _WARP_OPEN_COMMAND)
+        self.assertTrue(register.is_registered("WARP"))
+        self.assertFalse(register.is_registered("other"))
+
+
+class TestDoctor(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name) / "install"
+        self.launch_dir = Path(self.temp_dir.name) / "projects"
+        self.launch_dir.mkdir()
+
+        self.registry_backend = MemoryRegistryBackend()
+        self.scheme_backend = MemoryRegistryBackend({"warp\\shell\\open\\command": _WARP_OPEN_COMMAND})
+        Launcher(
+            self.install_dir,
+            config=Config("test-command", LaunchMode.TAB, self.launch_dir),
+            registry_backend=self.registry_backend,
+        ).install()
+
+    def create_doctor(self, **options):
+        return Doctor(
+            self.install_dir, registry_backend=self.registry_backend, scheme_backend=self.scheme_backend, **options
+        )
+
+    def get_statuses(self, report):
+        return {result.name: result.status for result in report.results}
+
+    def test_run_healthy_installation(self):
+        report = self.create_doctor().run()
+
+        self.assertTrue(report.is_healthy())
+        self.assertFalse(report.cached)
+        self.assertEqual(
+            [result.name for result in report.results], ["config", "script", "app_paths", "uri_handler", "launch_path"]
+        )
+        self.assertTrue(all(result.status == ProbeStatus.OK for result in report.results))
+        self.assertTrue(all(result.duration >= 0 for result in report.results))
+
+    def test_run_reports_problems(self):
+        (self.install_dir / "launcher.vbs").write_text("' edited by hand", encoding="utf-8")
+        self.registry_backend.delete_key("Software\\Microsoft\\Windows\\CurrentVersion\\App Paths\\test-command.exe")
+        self.launch_dir.rmdir()
+
+        report = Doctor(
+            self.install_dir, registry_backend=self.registry_backend, scheme_backend=MemoryRegistryBackend()
+        )
+        statuses = self.get_statuses(report.run())
+
+        self.assertEqual(
+            statuses,
+            {
+                "config": ProbeStatus.OK,
+                "script": ProbeStatus.WARNING,
+                "app_paths": ProbeStatus.FAILED,
+                "uri_handler": ProbeStatus.FAILED,
+                "launch_path": ProbeStatus.FAILED,
+            },
+        )
+
+    def test_run_checks_alias_registrations(self):
+        launcher = Launcher(self.install_dir, registry_backend=self.registry_backend)
+        launcher.add_alias("test-alias", "window")
+        launcher.install()
+
+        app_paths_result = self.create_doctor().run(use_cache=False).results[2]
+        self.assertEqual(app_paths_result.status, ProbeStatus.OK)
+        self.assertIn("'test-command', 'test-alias'", app_paths_result.detail)
+
+        self.registry_backend.delete_key("Software\\Microsoft\\Windows\\CurrentVersion\\App Paths\\test-alias.exe")
+        app_paths_result = self.create_doctor().run(use_cache=False).results[2]
+
+        self.assertEqual(app_paths_result.status, ProbeStatus.FAILED)
+        self.assertEqual(app_paths_result.detail, "Command 'test-alias' is not registered")
+
+    def test_run_without_installation(self):
+        doctor = Doctor(
+            Path(self.temp_dir.name) / "missing",
+            registry_backend=self.registry_backend,
+            scheme_backend=self.scheme_backend,
+        )
+
+        report = doctor.run()
+
+        self.assertFalse(report.is_healthy())
+        self.assertEqual(self.get_statuses(report)["config"], ProbeStatus.FAILED)
+        self.assertFalse((Path(self.temp_dir.name) / "missing").exists())
+
+    def test_run_times_out_stuck_probe(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def stuck_validate_path(path):
+            release.wait(5)
+            return None, "Unreachable"
+
+        with patch("warp_launcher.doctor.validate_path", side_effect=stuck_validate_path):
+            report = self.create_doctor(timeout=0.2).run()
+
+        statuses = self.get_statuses(report)
+        self.assertEqual(statuses["launch_path"], ProbeStatus.TIMEOUT)
+        self.assertEqual(statuses["config"], ProbeStatus.OK)
+        self.assertFalse(report.is_healthy())
+
+    def test_run_uses_cached_results(self):
+        doctor = self.create_doctor()
+        first_report = doctor.run()
+
+        with patch.object(Doctor, "_run_probes") as mock_run_probes:
+            report = self.create_doctor().run()
+
+        mock_run_probes.assert_not_called()
+        self.assertTrue(report.cached)
+        self.assertEqual(report.results, first_report.results)
+        self.assertEqual(report.checked, first_report.checked)
+
+    def test_run_cache_invalidation(self):
+        self.create_doctor().run()
+
+        with patch.object(Doctor, "_run_probes", return_value=[]) as mock_run_probes:
+            self.create_doctor(cache_ttl=0).run()
+            self.create_doctor().run(use_cache=False)
+
+            # A change of the configuration invalidates the results
+            config_file_path = self.install_dir / "config.json"
+            config_data = json.loads(config_file_path.read_text(encoding="utf-8"))
+            config_file_path.write_text(json.dumps({**config_data, "launchMode": "window"}), encoding="utf-8")
+            self.create_doctor().run()
+
+        self.assertEqual(mock_run_probes.call_count, 3)
+
+    def test_probe_result_from_dict(self):
+        result = ProbeResult("config", ProbeStatus.OK, "Valid", 0.5)
+
+        self.assertEqual(ProbeResult.from_dict(result.to_dict()), result)
+        with self.assertRaises(ValueError):
+            ProbeResult.from_dict({"name": "config", "status": "unknown"})
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# noinspection PyProtectedMember
+from warp_launcher.fastlaunch import _parse_fast_arguments, main
+
+_SOURCE_DIRECTORY = Path(__file__).parent.parent / "src"
+
+# Modules imported by the fast launch path
+_FAST_LAUNCH_MODULES = ("warp_launcher.fastlaunch", "warp_launcher.daemon", "warp_launcher.launcher")
+
+# Upper bounds of the modules newly loaded by the fast launch path, measured 83 modules, 11 of this package
+_MODULE_BUDGET = 90
+_PACKAGE_MODULE_BUDGET = 11
+
+# Modules that must only be loaded by the install, uninstall and daemon actions
+_FORBIDDEN_MODULES = (
+    "argparse",
+    "multiprocessing",
+    "secrets",
+    "shutil",
+    "winreg",
+    "warp_launcher.cli",
+    "warp_launcher.logger",
+    "warp_launcher.registry",
+    "warp_launcher.script",
+)
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(_SOURCE_DIRECTORY)}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _load_modules(*modules: str) -> set[str]:
+    """
+    Names of the modules newly loaded by importing the given modules in a fresh interpreter.
+    """
+    code = f"import sys; before = set(sys.modules); import {', '.join(modules)}; print(*set(sys.modules) - before)"
+    return set(_run_python("-c", code).stdout.split())
+
+
+class TestFastLaunch(unittest.TestCase):
+    def test_parse_fast_arguments(self):
+        test_cases = [
+            ([], (None, None)),
+            (["-m", "tab"], ("tab", None)),
+            (["--mode=tab", "-p", "C:\\test"], ("tab", "C:\\test")),
+            (["--path", "C:\\test"], (None, "C:\\test")),
+            (["-p"], None),
+            (["-p", "C:\\a", "-p", "C:\\b"], None),
+            (["-v"], None),
+            (["-m", "tab", "--install"], None),
+        ]
+
+        for args, expected in test_cases:
+            with self.subTest(args=args):
+                self.assertEqual(_parse_fast_arguments(args), expected)
+
+    @patch("warp_launcher.cli.main", return_value=0)
+    def test_main_delegates_other_arguments_to_cli(self, mock_cli_main):
+        self.assertEqual(main(["-v"]), 0)
+
+        mock_cli_main.assert_called_once_with(["--launch", "-v"])
+
+    @patch("warp_launcher.launcher.Launcher")
+    @patch("warp_launcher.daemon.forward_launch", return_value=Path("C:\\test"))
+    def test_main_forwards_to_daemon(self, mock_forward_launch, mock_launcher):
+        self.assertEqual(main(["-m", "tab"]), 0)
+
+        mock_forward_launch.assert_called_once()
+        mock_launcher.assert_not_called()
+
+    @patch("warp_launcher.launcher.Launcher")
+    @patch("warp_launcher.daemon.forward_launch", return_value=None)
+    def test_main_launches_in_process(self, mock_forward_launch, mock_launcher):
+        self.assertEqual(main(["-m", "tab"]), 0)
+
+        launcher = mock_launcher.return_value
+        self.assertEqual(launcher.launch_mode, "tab")
+        launcher.launch_warp.assert_called_once_with()
+
+    @patch("warp_launcher.launcher.Launcher", side_effect=ValueError("Invalid"))
+    @patch("warp_launcher.daemon.forward_launch", return_value=None)
+    def test_main_returns_error_code(self, mock_forward_launch, mock_launcher):
+        self.assertEqual(main([]), 1)
+
+    @patch("warp_launcher.launcher.Launcher")
+    @patch("warp_launcher.coalesce.LaunchBatcher")
+    def test_main_launches_selection(self, mock_batcher, mock_launcher):
+        mock_batcher.return_value.submit.return_value = [Path("C:\\first"), Path("C:\\second")]
+
+        self.assertEqual(main(["--select", "C:\\first"]), 0)
+
+        mock_batcher.return_value.submit.assert_called_once_with("C:\\first")
+        mock_launcher.return_value.launch_many.assert_called_once_with([Path("C:\\first"), Path("C:\\second")])
+
+    @patch("warp_launcher.launcher.Launcher")
+    @patch("warp_launcher.coalesce.LaunchBatcher")
+    def test_main_leaves_selection_to_leader(self, mock_batcher, mock_launcher):
+        mock_batcher.return_value.submit.return_value = []
+
+        self.assertEqual(main(["--select", "C:\\second"]), 0)
+
+        mock_launcher.assert_not_called()
+
+    def test_fast_launch_imports_only_dispatch_modules(self):
+        code = f"import sys, {', '.join(_FAST_LAUNCH_MODULES)}; print('\\n'.join(sys.modules))"
+        loaded_modules = set(_run_python("-c", code).stdout.splitlines())
+
+        self.assertEqual(loaded_modules & set(_FORBIDDEN_MODULES), set())
+
+    def test_fast_launch_module_budget(self):
+        fast_modules = _load_modules(*_FAST_LAUNCH_MODULES)
+        cli_modules = _load_modules("warp_launcher.cli")
+
+        self.assertLessEqual(len(fast_modules), _MODULE_BUDGET, sorted(fast_modules))
+        package_modules = {name for name in fast_modules if name.split(".")[0] == "warp_launcher"}
+        self.assertLessEqual(len(package_modules), _PACKAGE_MODULE_BUDGET, sorted(package_modules))
+        # Measured in the same run, so this bound does not depend on the interpreter version
+        self.assertLess(len(fast_modules), len(cli_modules))
+
+
+if __name__ == "__main__":
+    pytest.main()
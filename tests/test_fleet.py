@@ -0,0 +1,211 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from warp_launcher.config import Config
+from warp_launcher.enums import FleetStatus, LaunchMode
+from warp_launcher.fleet import FleetEntry, FleetHandler, parse_fleet
+from warp_launcher.registry import AppPathsRegister, MemoryRegistryBackend
+
+
+class _FailingRegistryBackend(MemoryRegistryBackend):
+    """Stand-in for winreg that fails after applying the registration of one command, like a partial write."""
+
+    def __init__(self, failing_command_name: str) -> None:
+        super().__init__()
+        self.failing_key = f"\\{failing_command_name}.exe"
+
+    def _save(self, keys: dict[str, str]) -> None:
+        super()._save(keys)
+        if any(key.endswith(self.failing_key) for key in keys):
+            raise OSError("Access denied")
+
+
+class TestParseFleet(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.base_directory = Path(self.temp_dir.name)
+        (self.base_directory / "projects").mkdir()
+
+    def test_parse_fleet(self):
+        entries, invalid_results = parse_fleet(
+            {
+                "installs": [
+                    {"installDirectory": "alice", "commandName": "warp-alice", "launchMode": "tab"},
+                    {"installDirectory": "bob", "commandName": "warp-bob", "launchPath": "projects"},
+                ]
+            },
+            self.base_directory,
+        )
+
+        self.assertEqual(invalid_results, [])
+        self.assertEqual([entry.index for entry in entries], [0, 1])
+        self.assertEqual(entries[0].install_directory, self.base_directory.absolute() / "alice")
+        self.assertEqual(entries[0].config.launch_mode, LaunchMode.TAB)
+        self.assertTrue(entries[0].config.is_launch_path_parent_process())
+        self.assertEqual(entries[1].config.launch_mode, LaunchMode.WINDOW)
+        self.assertEqual(entries[1].config.launch_path, self.base_directory / "projects")
+
+    def test_parse_fleet_reports_every_invalid_entry(self):
+        entries, invalid_results = parse_fleet(
+            {
+                "installs": [
+                    {"installDirectory": "alice", "commandName": "warp-alice"},
+                    "bob",
+                    {"commandName": "warp-carol"},
+                    {"installDirectory": "dave", "commandName": "-dave"},
+                    {"installDirectory": "erin", "commandName": "warp-erin", "launchMode": "pane"},
+                    {"installDirectory": "frank", "commandName": "warp-frank", "launchPath": "missing"},
+                    {"installDirectory": "alice", "commandName": "warp-grace"},
+                    {"installDirectory": "heidi", "commandName": "WARP-ALICE"},
+                ]
+            },
+            self.base_directory,
+        )
+
+        self.assertEqual([entry.index for entry in entries], [0])
+        self.assertEqual([result.index for result in invalid_results], [1, 2, 3, 4, 5, 6, 7])
+        self.assertTrue(all(result.status == FleetStatus.INVALID for result in invalid_results))
+        errors = [str(result.error) for result in invalid_results]
+        self.assertEqual(errors[0], "Entry must be an object")
+        self.assertIn("Install directory", errors[1])
+        self.assertIn("should not start or end", errors[2])
+        self.assertIn("Invalid launch mode", errors[3])
+        self.assertIn("does not exist", errors[4])
+        self.assertIn("used by a previous entry", errors[5])
+        self.assertIn("used by a previous entry", errors[6])
+
+    def test_parse_fleet_malformed(self):
+        for data in ([], {"installs": {}}, {}):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                parse_fleet(data, self.base_directory)
+
+
+class TestFleetHandler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        self.fleet_file_path = self.root / "fleet.json"
+
+    def write_fleet(self, installs):
+        self.fleet_file_path.write_text(json.dumps({"installs": installs}), encoding="utf-8")
+
+    def is_registered(self, backend, command_name):
+        return AppPathsRegister(self.root / "launcher.vbs", backend).is_registered(command_name)
+
+    def test_provision_fleet(self):
+        backend = MemoryRegistryBackend()
+        self.write_fleet([{"installDirectory": f"user{index}", "commandName": f"warp{index}"} for index in range(8)])
+
+        results = FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path, max_workers=4)
+
+        self.assertEqual([result.index for result in results], list(range(8)))
+        self.assertTrue(all(result.status == FleetStatus.INSTALLED for result in results))
+        for index in range(8):
+            install_directory = self.root / f"user{index}"
+            self.assertTrue((install_directory / "launcher.vbs").exists())
+            # The installations share the registry, none of the concurrent registrations is lost
+            registered_path = AppPathsRegister(install_directory, backend).get_registered_path(f"warp{index}")
+            self.assertEqual(registered_path, str(install_directory / "launcher.vbs"))
+
+    def test_provision_fleet_creates_nested_install_directory(self):
+        backend = _FailingRegistryBackend("broken")
+        self.write_fleet(
+            [
+                {"installDirectory": "nested/user0/launcher", "commandName": "warp0"},
+                {"installDirectory": "other/user1/launcher", "commandName": "broken"},
+            ]
+        )
+
+        # One at a time, the failing backend also fails a concurrent save made while the broken command is registered
+        results = FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path, max_workers=1)
+
+        self.assertEqual([result.status for result in results], [FleetStatus.INSTALLED, FleetStatus.ROLLED_BACK])
+        self.assertTrue((self.root / "nested" / "user0" / "launcher" / "launcher.vbs").exists())
+        # The rollback removes the parent directories it created too
+        self.assertFalse((self.root / "other").exists())
+        self.assertTrue(self.is_registered(backend, "warp0"))
+        self.assertFalse(self.is_registered(backend, "broken"))
+
+    def test_provision_fleet_keeps_invalid_entries_in_order(self):
+        backend = MemoryRegistryBackend()
+        self.write_fleet([{"commandName": "warp0"}, {"installDirectory": "user1", "commandName": "warp1"}])
+
+        results = FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path)
+
+        self.assertEqual([result.status for result in results], [FleetStatus.INVALID, FleetStatus.INSTALLED])
+        self.assertTrue(self.is_registered(backend, "warp1"))
+
+    def test_provision_fleet_rolls_back_failed_entry(self):
+        backend = _FailingRegistryBackend("broken")
+        self.write_fleet(
+            [
+                {"installDirectory": "user0", "commandName": "warp0"},
+                {"installDirectory": "user1", "commandName": "broken"},
+                {"installDirectory": "user2", "commandName": "warp2"},
+            ]
+        )
+
+        results = FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path, max_workers=1)
+
+        statuses = [result.status for result in results]
+        self.assertEqual(statuses, [FleetStatus.INSTALLED, FleetStatus.ROLLED_BACK, FleetStatus.INSTALLED])
+        self.assertIn("Access denied", str(results[1].error))
+        self.assertFalse((self.root / "user1").exists())
+        self.assertFalse(self.is_registered(backend, "broken"))
+        self.assertTrue(self.is_registered(backend, "warp0"))
+        self.assertTrue(self.is_registered(backend, "warp2"))
+
+    def test_provision_fleet_restores_previous_installation(self):
+        backend = _FailingRegistryBackend("broken")
+        self.write_fleet([{"installDirectory": "user0", "commandName": "warp0", "launchMode": "tab"}])
+        FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path)
+        config_content = (self.root / "user0" / "config.json").read_text(encoding="utf-8")
+        manifest_content = (self.root / "user0" / "manifest.json").read_text(encoding="utf-8")
+
+        self.write_fleet([{"installDirectory": "user0", "commandName": "broken"}])
+        results = FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path)
+
+        self.assertEqual(results[0].status, FleetStatus.ROLLED_BACK)
+        self.assertEqual((self.root / "user0" / "config.json").read_text(encoding="utf-8"), config_content)
+        self.assertEqual((self.root / "user0" / "manifest.json").read_text(encoding="utf-8"), manifest_content)
+        self.assertTrue(self.is_registered(backend, "warp0"))
+        self.assertFalse(self.is_registered(backend, "broken"))
+
+    def test_provision_removes_artifacts_of_failed_entry(self):
+        backend = _FailingRegistryBackend("broken")
+        install_directory = self.root / "user0"
+        self.write_fleet([{"installDirectory": "user0", "commandName": "warp0"}])
+        FleetHandler(registry_backend=backend).provision_fleet(self.fleet_file_path)
+        file_names = sorted(path.name for path in install_directory.iterdir())
+
+        alias = Config("broken-tab", LaunchMode.TAB, self.root)
+        entry = FleetEntry(0, install_directory, Config("broken", LaunchMode.WINDOW, self.root, [alias]))
+        results = FleetHandler(registry_backend=backend).provision([entry])
+
+        self.assertEqual(results[0].status, FleetStatus.ROLLED_BACK)
+        self.assertFalse((install_directory / "launcher-broken-tab.vbs").exists())
+        self.assertEqual(sorted(path.name for path in install_directory.iterdir()), file_names)
+        self.assertFalse(self.is_registered(backend, "broken-tab"))
+        self.assertTrue(self.is_registered(backend, "warp0"))
+
+    def test_load_fleet_errors(self):
+        with self.assertRaises(RuntimeError):
+            FleetHandler.load_fleet(self.root / "missing.json")
+
+        self.fleet_file_path.write_text("{", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            FleetHandler.load_fleet(self.fleet_file_path)
+
+    def test_provision_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            FleetHandler(registry_backend=MemoryRegistryBackend()).provision([], max_workers=0)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,192 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.history import HistoryEntry, HistoryHandler, frecency
+
+_NOW = 1_700_000_000
+
+
+class TestHistoryHandler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        self.history_handler = HistoryHandler(self.root)
+
+        self.directories = {}
+        for name in ("projects/warp-launcher", "projects/warp-docs", "work/launcher", "work/api"):
+            directory = self.root / name
+            directory.mkdir(parents=True)
+            self.directories[name] = directory
+
+    def record(self, name, times=1, now=_NOW):
+        for _ in range(times):
+            self.history_handler.record(self.directories[name], now)
+
+    def test_frecency_prefers_recent_visits(self):
+        self.assertGreater(frecency(1, _NOW, _NOW), frecency(1, _NOW - 2 * 24 * 60 * 60, _NOW))
+        self.assertGreater(frecency(20, _NOW - 30 * 24 * 60 * 60, _NOW), frecency(1, _NOW, _NOW))
+
+    def test_lookup_recorded_launches(self):
+        self.record("projects/warp-launcher")
+        self.record("work/launcher", times=3)
+
+        self.assertEqual(self.history_handler.lookup("launcher", _NOW), self.directories["work/launcher"])
+        self.assertEqual(self.history_handler.lookup("warp laun", _NOW), self.directories["projects/warp-launcher"])
+        self.assertIsNone(self.history_handler.lookup("missing", _NOW))
+        self.assertIsNone(self.history_handler.lookup("  ", _NOW))
+
+    def test_lookup_matches_last_term_in_last_component(self):
+        self.record("projects/warp-docs")
+
+        self.assertIsNone(self.history_handler.lookup("projects", _NOW))
+        self.assertIsNone(self.history_handler.lookup("docs warp", _NOW))
+        self.assertEqual(self.history_handler.lookup("PROJ DOCS", _NOW), self.directories["projects/warp-docs"])
+
+    def test_lookup_after_compaction(self):
+        self.record("projects/warp-launcher", times=2)
+        self.record("work/launcher")
+        self.record("work/api")
+        self.history_handler.compact(_NOW)
+
+        self.assertFalse(self.history_handler.log_file_path.exists())
+        self.assertEqual(self.history_handler.lookup("launcher", _NOW), self.directories["projects/warp-launcher"])
+        self.assertEqual(self.history_handler.lookup("wo la", _NOW), self.directories["work/launcher"])
+        self.assertEqual(self.history_handler.lookup("i", _NOW), self.directories["work/api"])
+
+        # Launches recorded after the compaction add to the indexed visits
+        self.record("work/launcher", times=2)
+        self.assertEqual(self.history_handler.lookup("launcher", _NOW), self.directories["work/launcher"])
+
+        self.history_handler.compact(_NOW)
+        entries = {entry.path: entry.rank for entry in self.read_index_entries()}
+        self.assertEqual(entries[str(self.directories["work/launcher"])], 3)
+
+    def test_lookup_skips_deleted_directories(self):
+        self.record("projects/warp-launcher", times=2)
+        self.record("work/launcher")
+        self.history_handler.compact(_NOW)
+
+        self.directories["projects/warp-launcher"].rmdir()
+
+        self.assertEqual(self.history_handler.lookup("launcher", _NOW), self.directories["work/launcher"])
+
+    def test_lookup_prefers_higher_rank_of_later_name(self):
+        entries = [
+            HistoryEntry(str(self.directories["projects/warp-launcher"]), 10.0, _NOW),
+            HistoryEntry(str(self.root / "missing" / "launcher"), 9.0, _NOW),
+            HistoryEntry(str(self.directories["projects/warp-docs"]), 8.0, _NOW),
+            HistoryEntry(str(self.directories["work/launcher"]), 1.0, _NOW),
+        ]
+        self.history_handler._write_index(entries)
+
+        self.assertEqual(self.history_handler.lookup("warp", _NOW), self.directories["projects/warp-launcher"])
+        self.assertEqual(self.history_handler.lookup("laun", _NOW), self.directories["projects/warp-launcher"])
+        self.assertEqual(self.history_handler.lookup("work laun", _NOW), self.directories["work/launcher"])
+        self.assertEqual(self.history_handler.lookup("docs", _NOW), self.directories["projects/warp-docs"])
+
+    @patch("warp_launcher.history.HISTORY_LOG_MAX_SIZE", 1)
+    def test_record_compacts_large_log(self):
+        self.record("work/api")
+
+        self.assertFalse(self.history_handler.log_file_path.exists())
+        self.assertEqual(self.history_handler.lookup("api", _NOW), self.directories["work/api"])
+
+    @patch("warp_launcher.history.HISTORY_MAX_ENTRIES", 2)
+    def test_compaction_evicts_lowest_frecency(self):
+        self.record("projects/warp-launcher", times=3)
+        self.record("work/launcher", times=2)
+        self.record("work/api", now=_NOW - 30 * 24 * 60 * 60)
+        self.history_handler.compact(_NOW)
+
+        self.assertEqual(
+            [entry.path for entry in self.read_index_entries()],
+            [str(self.directories["projects/warp-launcher"]), str(self.directories["work/launcher"])],
+        )
+
+    @patch("warp_launcher.history.HISTORY_MAX_RANK", 4.0)
+    def test_compaction_ages_ranks(self):
+        self.record("projects/warp-launcher", times=4)
+        self.record("work/api")
+        self.history_handler.compact(_NOW)
+
+        entries = self.read_index_entries()
+        self.assertEqual([entry.path for entry in entries], [str(self.directories["projects/warp-launcher"])])
+        self.assertLess(sum(entry.rank for entry in entries), 4.0)
+
+    def test_concurrent_compactions_keep_every_launch(self):
+        writing, resume = threading.Event(), threading.Event()
+        write_index = HistoryHandler._write_index
+
+        def paused_write_index(history_handler, entries):
+            # The first compaction waits before writing its index, while the second one runs
+            if not writing.is_set():
+                writing.set()
+                resume.wait(timeout=30)
+            write_index(history_handler, entries)
+
+        with patch.object(HistoryHandler, "_write_index", paused_write_index):
+            self.record("work/api")
+            first = threading.Thread(target=self.history_handler.compact, args=(_NOW,))
+            first.start()
+            writing.wait(timeout=30)
+
+            self.record("work/launcher")
+            second = threading.Thread(target=self.history_handler.compact, args=(_NOW,))
+            second.start()
+            second.join(timeout=0.2)
+            resume.set()
+            first.join(timeout=30)
+            second.join(timeout=30)
+
+        self.assertEqual(
+            sorted(entry.path for entry in self.read_index_entries()),
+            sorted([str(self.directories["work/api"]), str(self.directories["work/launcher"])]),
+        )
+        self.assertFalse(self.history_handler.pending_log_file_path.exists())
+
+    def test_failed_compaction_keeps_log(self):
+        self.record("work/api")
+        with patch.object(HistoryHandler, "_write_index", side_effect=OSError("Disk full")), self.assertRaises(OSError):
+            self.history_handler.compact(_NOW)
+
+        # Launches of the failed compaction are still found, and merged by the next one
+        self.record("work/launcher")
+        self.assertEqual(self.history_handler.lookup("api", _NOW), self.directories["work/api"])
+        self.history_handler.compact(_NOW)
+        self.history_handler.compact(_NOW)
+
+        self.assertEqual(
+            sorted(entry.path for entry in self.read_index_entries()),
+            sorted([str(self.directories["work/api"]), str(self.directories["work/launcher"])]),
+        )
+        self.assertEqual(
+            sorted(path.name for path in self.root.iterdir() if path.is_file()), ["history.idx", "write.lock"]
+        )
+
+    def test_record_without_install_directory(self):
+        history_handler = HistoryHandler(self.root / "missing")
+        history_handler.record(self.directories["work/api"], _NOW)
+
+        self.assertFalse(history_handler.log_file_path.exists())
+        self.assertIsNone(history_handler.lookup("api", _NOW))
+
+    def test_invalid_index_is_ignored(self):
+        self.history_handler.index_file_path.write_bytes(b"invalid history index content")
+        self.record("work/api")
+
+        self.assertEqual(self.history_handler.lookup("api", _NOW), self.directories["work/api"])
+
+    def read_index_entries(self):
+        index = self.history_handler._open_index()
+        with index:
+            return list(index.read_entries())
+
+
+if __name__ == "__main__":
+    pytest.main()
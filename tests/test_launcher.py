@@ -1,4 +1,9 @@
+import json
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -6,8 +11,12 @@ from unittest.mock import patch
 import pytest
 
 from warp_launcher.config import Config
+from warp_launcher.constants import OVERRIDES_FILE_NAME
+from warp_launcher.dispatcher import RecordingDispatcher
 from warp_launcher.enums import LaunchMode
+from warp_launcher.history import HistoryHandler
 from warp_launcher.launcher import Launcher
+from warp_launcher.registry import AppPathsRegister, ContextMenuRegister, FileRegistryBackend, MemoryRegistryBackend
 
 
 class TestLauncher(unittest.TestCase):
@@ -25,7 +34,10 @@ class TestLauncher(unittest.TestCase):
         self.test_install_dir = Path(r"C:\test\install")
         self.test_config_file = "test_config.json"
         self.test_script_file = "test_launcher.vbs"
-        self.test_launcher = Launcher(self.test_install_dir, self.test_config_file, self.test_script_file)
+        self.registry_backend = MemoryRegistryBackend()
+        self.test_launcher = Launcher(
+            self.test_install_dir, self.test_config_file, self.test_script_file, registry_backend=self.registry_backend
+        )
 
     def test_command_name_getter_setter(self):
         self.assertEqual(self.test_launcher.command_name, self.test_command_name)
@@ -45,6 +57,43 @@ class TestLauncher(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.test_launcher.launch_path = r"C:\Invalid\Path"
 
+    def test_add_and_remove_alias(self):
+        self.test_launcher.add_alias("test-window", "window")
+        self.test_launcher.add_alias("test-home", launch_path=str(Path.home()))
+        self.test_launcher.add_alias("TEST-WINDOW", "tab")
+
+        self.assertEqual(
+            self.test_launcher.aliases,
+            [
+                Config("test-home", self.test_launch_mode, Path.home()),
+                Config("TEST-WINDOW", LaunchMode.TAB, self.test_launch_path),
+            ],
+        )
+
+        self.test_launcher.remove_alias("test-home")
+
+        self.assertEqual([alias.command_name for alias in self.test_launcher.aliases], ["TEST-WINDOW"])
+
+    def test_add_invalid_alias(self):
+        test_cases = [
+            ("invalid name", ("_invalid_",)),
+            ("command name", (self.test_command_name.upper(),)),
+            ("invalid mode", ("test-alias", "INVALID")),
+            ("invalid path", ("test-alias", None, r"C:\Invalid\Path")),
+        ]
+        for name, arguments in test_cases:
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                self.test_launcher.add_alias(*arguments)
+
+        with self.assertRaises(ValueError):
+            self.test_launcher.remove_alias("test-alias")
+
+    def test_command_name_cannot_be_an_alias(self):
+        self.test_launcher.add_alias("test-alias")
+
+        with self.assertRaises(ValueError):
+            self.test_launcher.command_name = "test-alias"
+
     @patch("warp_launcher.launcher.Path.mkdir", side_effect=PermissionError("Access denied"))
     def test_create_install_directory_raises_error(self, mock_mkdir):
         with self.assertRaises(RuntimeError) as context:
@@ -53,20 +102,36 @@ class TestLauncher(unittest.TestCase):
         mock_mkdir.assert_called_once()
         self.assertIn("Failed to install", str(context.exception))
 
-    @patch("warp_launcher.registry.AppPathsRegister.register", return_value=None)
+    @patch("warp_launcher.manifest.ManifestHandler.save_manifest", return_value=None)
+    @patch("warp_launcher.registry.AppPathsSession.register", return_value=None)
     @patch("warp_launcher.config.ConfigHandler.save_config", return_value=None)
     @patch("warp_launcher.script.ScriptHandler.save_script", return_value=None)
     @patch("warp_launcher.launcher.Path.mkdir")
-    def test_install_success(self, mock_mkdir, mock_save_script, mock_save_config, mock_register):
+    def test_install_success(self, mock_mkdir, mock_save_script, mock_save_config, mock_register, mock_save_manifest):
         self.test_launcher.install()
 
-        mock_mkdir.assert_called_once_with(exist_ok=True)
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
         mock_save_script.assert_called_once_with(self.test_config)
         mock_save_config.assert_called_once_with(self.test_config)
-        mock_register.assert_called_once_with(self.test_config.command_name)
+        mock_register.assert_called_once_with(
+            self.test_config.command_name, self.test_install_dir / self.test_script_file
+        )
+        mock_save_manifest.assert_called_once()
+
+    @patch("warp_launcher.manifest.ManifestHandler.save_manifest", return_value=None)
+    @patch("warp_launcher.config.ConfigHandler.save_config", return_value=None)
+    @patch("warp_launcher.script.ScriptHandler.save_script", return_value=None)
+    @patch("warp_launcher.launcher.Path.mkdir")
+    def test_install_registers_command(self, mock_mkdir, mock_save_script, mock_save_config, mock_save_manifest):
+        self.test_launcher.install()
+
+        self.assertEqual(
+            AppPathsRegister(Path(), self.registry_backend).get_registered_path(self.test_command_name),
+            str(self.test_install_dir / self.test_script_file),
+        )
 
     @patch("shutil.rmtree")
-    @patch("warp_launcher.registry.AppPathsRegister.unregister")
+    @patch("warp_launcher.registry.AppPathsSession.unregister")
     @patch("pathlib.Path.exists", return_value=True)
     def test_uninstall_success(self, mock_exists, mock_unregister, mock_rmtree):
         self.test_launcher.uninstall()
@@ -76,7 +141,7 @@ class TestLauncher(unittest.TestCase):
         mock_rmtree.assert_called_once_with(self.test_install_dir)
 
     @patch("shutil.rmtree", side_effect=PermissionError("Unregister error"))
-    @patch("warp_launcher.registry.AppPathsRegister.unregister")
+    @patch("warp_launcher.registry.AppPathsSession.unregister")
     @patch("pathlib.Path.exists", return_value=True)
     def test_uninstall_failure(self, mock_exists, mock_unregister, mock_rmtree):
         with self.assertRaises(RuntimeError) as context:
@@ -87,6 +152,7 @@ class TestLauncher(unittest.TestCase):
         mock_rmtree.assert_called_once_with(self.test_install_dir)
         self.assertIn("Failed to uninstall", str(context.exception))
 
+    @unittest.skipUnless(sys.platform == "win32", "the default dispatcher uses 'cmd start' on Windows")
     @patch("subprocess.Popen")
     def test_launch_warp(self, mock_popen):
         self.test_launcher._config.is_launch_path_parent_process = lambda: False
@@ -101,6 +167,341 @@ class TestLauncher(unittest.TestCase):
             creationflags=subprocess.DETACHED_PROCESS,
         )
 
+    def test_launch_warp_with_dispatcher(self):
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(self.test_install_dir, dispatcher=dispatcher)
+        launcher._config.is_launch_path_parent_process = lambda: False
+
+        launch_path = launcher.launch_warp()
+
+        expected_uri = f"warp://action/{self.test_config.launch_mode.value}?path={self.test_config.launch_path}"
+        self.assertEqual(dispatcher.uris, [expected_uri])
+        self.assertEqual(launch_path, self.test_launch_path)
+
+    def test_launch_warp_in_working_directory(self):
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(self.test_install_dir, dispatcher=dispatcher)
+        launcher._config.is_launch_path_parent_process = lambda: True
+
+        launch_path = launcher.launch_warp(Path(r"C:\working\directory"))
+
+        self.assertEqual(launch_path, Path(r"C:\working\directory"))
+        self.assertTrue(dispatcher.uris[0].endswith(f"?path={launch_path}"))
+
+
+class TestLauncherIncrementalInstall(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name) / "install"
+
+        # File-backed registry, outside the installation directory
+        self.registry_backend = FileRegistryBackend(Path(self.temp_dir.name) / "registry.json")
+        patcher = patch.object(self.registry_backend, "_save", wraps=self.registry_backend._save)
+        self.addCleanup(patcher.stop)
+        self.mock_save_registry = patcher.start()
+        self.app_paths_register = AppPathsRegister(Path(r"C:\other\launcher.vbs"), self.registry_backend)
+
+        self.test_config = Config("test-command", LaunchMode.TAB, Path("."))
+
+    def create_launcher(self, config=None):
+        return Launcher(
+            self.install_dir, config=config if config else self.test_config, registry_backend=self.registry_backend
+        )
+
+    def test_install_writes_everything_once(self):
+        launcher = self.create_launcher()
+        launcher.install()
+
+        script_file_path = self.install_dir / "launcher.vbs"
+        self.assertTrue(script_file_path.exists())
+        self.assertTrue((self.install_dir / "config.json").exists())
+        self.assertTrue((self.install_dir / "manifest.json").exists())
+        self.assertEqual(self.app_paths_register.get_registered_path("test-command"), str(script_file_path))
+        self.mock_save_registry.assert_called_once()
+        self.assertEqual(launcher.check_install(), [])
+
+    def test_reinstall_without_changes_writes_nothing(self):
+        self.create_launcher().install()
+        self.mock_save_registry.reset_mock()
+        manifest_modified_time = (self.install_dir / "manifest.json").stat().st_mtime_ns
+
+        with (
+            patch("warp_launcher.script.ScriptHandler.save_script") as mock_save_script,
+            patch("warp_launcher.config.ConfigHandler.save_config") as mock_save_config,
+        ):
+            self.create_launcher().install()
+
+        mock_save_script.assert_not_called()
+        mock_save_config.assert_not_called()
+        self.mock_save_registry.assert_not_called()
+        self.assertEqual((self.install_dir / "manifest.json").stat().st_mtime_ns, manifest_modified_time)
+
+    def test_reinstall_only_writes_changed_artifacts(self):
+        self.create_launcher().install()
+        (self.install_dir / "config.json").write_text("{}", encoding="utf-8")
+        self.mock_save_registry.reset_mock()
+
+        launcher = self.create_launcher()
+        self.assertEqual(launcher.check_install(), ["File 'config.json' was modified outside the installer"])
+
+        with (
+            patch("warp_launcher.script.ScriptHandler.save_script") as mock_save_script,
+            patch("warp_launcher.config.ConfigHandler.save_config") as mock_save_config,
+        ):
+            launcher.install()
+
+        mock_save_script.assert_not_called()
+        mock_save_config.assert_called_once()
+        self.mock_save_registry.assert_not_called()
+
+    def test_reinstall_with_new_command_unregisters_previous(self):
+        self.create_launcher().install()
+
+        new_config = Config("new-command", LaunchMode.TAB, Path("."))
+        launcher = self.create_launcher(new_config)
+        self.assertEqual(
+            launcher.check_install(),
+            [
+                "File 'config.json' is outdated",
+                "Command 'new-command' is not registered",
+                "Previous command 'test-command' is still registered",
+            ],
+        )
+
+        launcher.install()
+
+        self.assertTrue(self.app_paths_register.is_registered("new-command"))
+        self.assertFalse(self.app_paths_register.is_registered("test-command"))
+        self.assertEqual(launcher.check_install(), [])
+
+    def test_reinstall_with_new_script_target_removes_previous_script(self):
+        self.create_launcher().install()
+
+        launcher = Launcher(
+            self.install_dir,
+            script_filename="launcher.cmd",
+            config=self.test_config,
+            registry_backend=self.registry_backend,
+        )
+        self.assertEqual(
+            launcher.check_install(),
+            [
+                "File 'launcher.cmd' is missing",
+                "File 'launcher.vbs' is no longer used",
+                f"Command 'test-command' is registered to '{self.install_dir / 'launcher.vbs'}'",
+            ],
+        )
+
+        launcher.install()
+
+        self.assertFalse((self.install_dir / "launcher.vbs").exists())
+        self.assertTrue((self.install_dir / "launcher.cmd").read_text(encoding="utf-8").startswith("@echo off"))
+        self.assertEqual(
+            self.app_paths_register.get_registered_path("test-command"), str(self.install_dir / "launcher.cmd")
+        )
+        self.assertEqual(launcher.check_install(), [])
+
+    def test_check_install_reports_registry_drift(self):
+        self.create_launcher().install()
+        self.app_paths_register.register("test-command")
+
+        self.assertEqual(
+            self.create_launcher().check_install(),
+            ["Command 'test-command' is registered to 'C:\\other\\launcher.vbs'"],
+        )
+        self.assertEqual(self.app_paths_register.get_registered_path("test-command"), r"C:\other\launcher.vbs")
+
+    def test_check_install_writes_nothing(self):
+        changes = self.create_launcher().check_install()
+
+        self.assertEqual(len(changes), 3)
+        self.assertFalse(self.install_dir.exists())
+        self.mock_save_registry.assert_not_called()
+
+    def test_install_aliases_in_one_registry_session(self):
+        launcher = self.create_launcher()
+        launcher.add_alias("test-window", "window")
+        launcher.add_alias("test-fixed", launch_path=self.temp_dir.name)
+        launcher.install()
+
+        for command_name, script_name in [
+            ("test-command", "launcher.vbs"),
+            ("test-window", "launcher-test-window.vbs"),
+            ("test-fixed", "launcher-test-fixed.vbs"),
+        ]:
+            with self.subTest(command_name=command_name):
+                self.assertEqual(
+                    self.app_paths_register.get_registered_path(command_name), str(self.install_dir / script_name)
+                )
+        self.assertIn("new_window", (self.install_dir / "launcher-test-window.vbs").read_text(encoding="utf-8"))
+        self.assertIn(
+            f'path = "{self.temp_dir.name}"', (self.install_dir / "launcher-test-fixed.vbs").read_text(encoding="utf-8")
+        )
+        self.mock_save_registry.assert_called_once()
+        self.assertEqual(self.create_launcher(launcher.config).check_install(), [])
+
+    def test_reinstall_without_alias_removes_it(self):
+        launcher = self.create_launcher()
+        launcher.add_alias("test-window", "window")
+        launcher.install()
+        self.mock_save_registry.reset_mock()
+
+        launcher.remove_alias("test-window")
+        self.assertEqual(
+            launcher.check_install(),
+            [
+                "File 'config.json' is outdated",
+                "File 'launcher-test-window.vbs' is no longer used",
+                "Previous command 'test-window' is still registered",
+            ],
+        )
+
+        launcher.install()
+
+        self.assertFalse((self.install_dir / "launcher-test-window.vbs").exists())
+        self.assertFalse(self.app_paths_register.is_registered("test-window"))
+        self.assertTrue(self.app_paths_register.is_registered("test-command"))
+        self.mock_save_registry.assert_called_once()
+
+    def test_uninstall_removes_aliases_in_one_registry_session(self):
+        launcher = self.create_launcher()
+        launcher.add_alias("test-window", "window")
+        launcher.add_alias("test-other", "tab")
+        launcher.install()
+        self.mock_save_registry.reset_mock()
+
+        launcher.uninstall()
+
+        for command_name in ("test-command", "test-window", "test-other"):
+            with self.subTest(command_name=command_name):
+                self.assertFalse(self.app_paths_register.is_registered(command_name))
+        # One session for all the App Paths keys, and one for the context menu
+        self.assertEqual(self.mock_save_registry.call_count, 2)
+        self.assertFalse(self.install_dir.exists())
+
+    def test_install_and_uninstall_context_menu(self):
+        launcher = self.create_launcher()
+        launcher.install()
+        launcher.install_context_menu()
+
+        command_line = ContextMenuRegister(self.registry_backend).get_registered_command()
+        self.assertTrue(command_line.endswith('-m warp_launcher.fastlaunch --select "%V"'))
+
+        self.create_launcher().uninstall()
+
+        self.assertIsNone(ContextMenuRegister(self.registry_backend).get_registered_command())
+        self.assertFalse(self.app_paths_register.is_registered("test-command"))
+
+
+class TestLauncherLaunchMany(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.test_paths = []
+        for name in ("first", "second", "third"):
+            path = Path(self.temp_dir.name) / name
+            path.mkdir()
+            self.test_paths.append(path)
+
+        self.dispatcher = RecordingDispatcher()
+        config = Config("test-command", LaunchMode.TAB, Path("."))
+        self.test_launcher = Launcher(Path(self.temp_dir.name), config=config, dispatcher=self.dispatcher)
+
+    def test_launch_many(self):
+        launch_paths = self.test_launcher.launch_many([*self.test_paths, str(self.test_paths[0])])
+
+        self.assertEqual(launch_paths, self.test_paths)
+        self.assertEqual(
+            self.dispatcher.uris, [f"warp://action/{LaunchMode.TAB.value}?path={path}" for path in self.test_paths]
+        )
+
+    def test_launch_many_applies_directory_overrides(self):
+        (self.test_paths[1] / OVERRIDES_FILE_NAME).write_text(json.dumps({"launchMode": "window"}), encoding="utf-8")
+
+        self.test_launcher.launch_many(self.test_paths)
+
+        self.assertEqual(
+            self.dispatcher.uris,
+            [
+                f"warp://action/{LaunchMode.TAB.value}?path={self.test_paths[0]}",
+                f"warp://action/{LaunchMode.WINDOW.value}?path={self.test_paths[1]}",
+                f"warp://action/{LaunchMode.TAB.value}?path={self.test_paths[2]}",
+            ],
+        )
+
+    def test_launch_many_records_history(self):
+        self.test_launcher.launch_many(self.test_paths)
+
+        self.assertEqual(HistoryHandler(Path(self.temp_dir.name)).lookup("second"), self.test_paths[1])
+
+    def test_launch_many_validates_before_launching(self):
+        with self.assertRaises(ValueError) as context:
+            self.test_launcher.launch_many([*self.test_paths, "<invalid>", "/non/existent"])
+
+        self.assertIn("<invalid>", str(context.exception))
+        self.assertIn("does not exist", str(context.exception))
+        self.assertEqual(self.dispatcher.uris, [])
+
+    def test_launch_many_validates_concurrently_and_launches_in_order(self):
+        lock = threading.Lock()
+        running = max_running = 0
+
+        def slow_probe_path(path_object, path_str, timeout=None):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        with patch("warp_launcher.reachability.probe_path", side_effect=slow_probe_path):
+            self.test_launcher.launch_many(self.test_paths, max_workers=2)
+
+        self.assertEqual(max_running, 2)
+        self.assertEqual(
+            self.dispatcher.uris, [f"warp://action/{LaunchMode.TAB.value}?path={path}" for path in self.test_paths]
+        )
+
+    def test_launch_many_interval(self):
+        start = time.perf_counter()
+        self.test_launcher.launch_many(self.test_paths, interval=0.02)
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        self.assertEqual(len(self.dispatcher.uris), len(self.test_paths))
+
+    @patch.object(RecordingDispatcher, "_hand_off", side_effect=[None, RuntimeError("failed"), None])
+    def test_launch_many_reports_failures(self, mock_hand_off):
+        with self.assertRaises(RuntimeError) as context:
+            self.test_launcher.launch_many(self.test_paths, max_workers=1)
+
+        self.assertEqual(mock_hand_off.call_count, len(self.test_paths))
+
+        self.assertIn("Failed to launch 1 of 3 paths", str(context.exception))
+
+    def test_launch_at(self):
+        self.test_launcher.launch_at(self.test_paths[1], LaunchMode.WINDOW)
+
+        self.assertEqual(self.dispatcher.uris, [f"warp://action/{LaunchMode.WINDOW.value}?path={self.test_paths[1]}"])
+        self.assertEqual(HistoryHandler(Path(self.temp_dir.name)).lookup("second"), self.test_paths[1])
+
+    def test_resolve_launches(self):
+        (self.test_paths[1] / OVERRIDES_FILE_NAME).write_text(json.dumps({"launchMode": "window"}), encoding="utf-8")
+
+        launches = self.test_launcher.resolve_launches([*self.test_paths[:2], self.test_paths[0]])
+
+        self.assertEqual(launches, [(self.test_paths[0], LaunchMode.TAB), (self.test_paths[1], LaunchMode.WINDOW)])
+        self.assertEqual(self.dispatcher.uris, [])
+
+    def test_launch_many_invalid_options(self):
+        with self.assertRaises(ValueError):
+            self.test_launcher.launch_many(self.test_paths, max_workers=0)
+
+        with self.assertRaises(ValueError):
+            self.test_launcher.launch_many(self.test_paths, interval=-1)
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,129 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from warp_launcher.config import Config
+from warp_launcher.dispatcher import RecordingDispatcher
+from warp_launcher.enums import LaunchMode, SplitDirection
+from warp_launcher.launcher import Launcher
+from warp_launcher.layout import Layout, LayoutHandler, Pane
+
+
+class TestLayout(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.temp_path = Path(self.temp_dir.name)
+        self.api_path = self.temp_path / "api"
+        self.web_path = self.temp_path / "web"
+        self.api_path.mkdir()
+        self.web_path.mkdir()
+
+        self.layout_data = {
+            "name": "Morning Restore",
+            "windows": [
+                {
+                    "tabs": [
+                        {"title": 'api "main"', "color": "blue", "cwd": "api", "commands": ["npm start"]},
+                        {
+                            "layout": {
+                                "splitDirection": "horizontal",
+                                "panes": [{"cwd": str(self.api_path)}, {"cwd": "web", "commands": ["ls"]}],
+                            }
+                        },
+                    ]
+                }
+            ],
+        }
+        self.layout_file_path = self.temp_path / "layout.json"
+        self.layout_file_path.write_text(json.dumps(self.layout_data), encoding="utf-8")
+
+        self.configurations_dir = self.temp_path / "launch_configurations"
+        self.handler = LayoutHandler(self.configurations_dir)
+
+    def test_load_layout(self):
+        layout = LayoutHandler.load_layout(self.layout_file_path)
+
+        self.assertEqual(layout.name, "Morning Restore")
+        first_tab, second_tab = layout.windows[0].tabs
+        self.assertEqual(first_tab.layout, Pane(cwd=self.api_path, commands=["npm start"]))
+        self.assertEqual(second_tab.layout.split_direction, SplitDirection.HORIZONTAL)
+        self.assertEqual(second_tab.layout.panes, [Pane(cwd=self.api_path), Pane(cwd=self.web_path, commands=["ls"])])
+
+    def test_layout_to_yaml(self):
+        layout = LayoutHandler.load_layout(self.layout_file_path)
+
+        expected_yaml = (
+            "---\n"
+            'name: "Morning Restore"\n'
+            "windows:\n"
+            "  - tabs:\n"
+            '      - title: "api \\"main\\""\n'
+            "        color: blue\n"
+            "        layout:\n"
+            f"          cwd: {json.dumps(str(self.api_path))}\n"
+            "          commands:\n"
+            '            - exec: "npm start"\n'
+            "      - layout:\n"
+            "          split_direction: horizontal\n"
+            "          panes:\n"
+            f"            - cwd: {json.dumps(str(self.api_path))}\n"
+            f"            - cwd: {json.dumps(str(self.web_path))}\n"
+            "              commands:\n"
+            '                - exec: "ls"\n'
+        )
+        self.assertEqual(layout.to_yaml(), expected_yaml)
+
+    def test_layout_from_dict_with_invalid_data(self):
+        test_cases = [
+            {},
+            {"name": "../escape", "windows": [{"tabs": [{"cwd": "api"}]}]},
+            {"name": "empty", "windows": []},
+            {"name": "no-tabs", "windows": [{"tabs": []}]},
+            {"name": "empty-pane", "windows": [{"tabs": [{"title": "empty"}]}]},
+            {"name": "missing-path", "windows": [{"tabs": [{"cwd": "missing"}]}]},
+            {"name": "color", "windows": [{"tabs": [{"cwd": "api", "color": "pink"}]}]},
+            {"name": "split", "windows": [{"tabs": [{"splitDirection": "diagonal", "panes": [{"cwd": "api"}]}]}]},
+            {"name": "commands", "windows": [{"tabs": [{"cwd": "api", "commands": "ls"}]}]},
+        ]
+
+        for layout_data in test_cases:
+            with self.subTest(layout_data=layout_data), self.assertRaises(ValueError):
+                Layout.from_dict(layout_data, self.temp_path)
+
+    def test_load_layout_invalid_json(self):
+        self.layout_file_path.write_text("not valid json", encoding="utf-8")
+
+        with self.assertRaises(ValueError):
+            LayoutHandler.load_layout(self.layout_file_path)
+
+    def test_save_launch_configuration_only_writes_changes(self):
+        layout = LayoutHandler.load_layout(self.layout_file_path)
+
+        configuration_file_path = self.handler.save_launch_configuration(layout)
+        modified_time = configuration_file_path.stat().st_mtime_ns
+
+        self.assertEqual(configuration_file_path, self.configurations_dir / "Morning Restore.yaml")
+        self.assertEqual(configuration_file_path.read_text(encoding="utf-8"), layout.to_yaml())
+        self.assertEqual(list(self.configurations_dir.iterdir()), [configuration_file_path])
+
+        self.handler.save_launch_configuration(layout)
+        self.assertEqual(configuration_file_path.stat().st_mtime_ns, modified_time)
+
+    def test_launch_layout_dispatches_single_uri(self):
+        dispatcher = RecordingDispatcher()
+        config = Config("test-command", LaunchMode.TAB, Path("."))
+        launcher = Launcher(self.temp_path, config=config, dispatcher=dispatcher)
+
+        configuration_file_path = launcher.launch_layout(LayoutHandler.load_layout(self.layout_file_path), self.handler)
+
+        self.assertTrue(configuration_file_path.exists())
+        self.assertEqual(dispatcher.uris, ["warp://launch/Morning%20Restore.yaml"])
+
+
+if __name__ == "__main__":
+    pytest.main()
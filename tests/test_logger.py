@@ -0,0 +1,107 @@
+import io
+import json
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from warp_launcher.enums import LogFileFormat
+from warp_launcher.logger import ColorFormatter, JsonLinesFormatter, configure_logging, shutdown_logging
+
+
+def _create_record(message: str, *args: object, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("warp_launcher.test", level, __file__, 1, message, args, None)
+
+
+class TestFormatters(unittest.TestCase):
+    def test_color_formatter(self):
+        record = _create_record("Launch path set to '%s'", "C:\\test", level=logging.ERROR)
+
+        self.assertEqual(ColorFormatter("%(message)s").format(record), "\033[91mLaunch path set to 'C:\\test'\033[0m")
+        self.assertEqual(ColorFormatter("%(message)s", use_color=False).format(record), "Launch path set to 'C:\\test'")
+
+    def test_json_lines_formatter(self):
+        record = _create_record("Launch path set to '%s'", "C:\\test")
+
+        entry = json.loads(JsonLinesFormatter().format(record))
+
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["logger"], "warp_launcher.test")
+        self.assertEqual(entry["message"], "Launch path set to 'C:\\test'")
+        self.assertNotIn("exception", entry)
+
+
+class TestConfigureLogging(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        # Isolate the root logger from the handlers installed by the test runner
+        root_logger = logging.getLogger()
+        handlers, level = root_logger.handlers[:], root_logger.level
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+
+        def restore():
+            shutdown_logging()
+            for handler in handlers:
+                root_logger.addHandler(handler)
+            root_logger.setLevel(level)
+
+        self.addCleanup(restore)
+        self.logger = logging.getLogger("warp_launcher.test")
+
+    def test_configure_logging_console(self):
+        stream = io.StringIO()
+        configure_logging(logging.INFO, stream=stream)
+
+        self.logger.debug("Hidden")
+        self.logger.info("Launch path set to '%s'", "C:\\test")
+        shutdown_logging()
+
+        # Not a terminal, so no color codes
+        self.assertEqual(stream.getvalue(), "Launch path set to 'C:\\test'\n")
+
+    def test_configure_logging_is_idempotent(self):
+        stream = io.StringIO()
+        configure_logging(logging.INFO, stream=stream)
+        configure_logging(logging.DEBUG, stream=stream)
+
+        self.logger.debug("Shown")
+        shutdown_logging()
+
+        self.assertEqual(stream.getvalue(), "Shown\n")
+        self.assertEqual(logging.getLogger().handlers, [])
+
+    def test_configure_logging_text_file(self):
+        log_file_path = Path(self.temp_dir.name) / "logs" / "launcher.log"
+        configure_logging(logging.INFO, log_file_path, LogFileFormat.TEXT, stream=io.StringIO())
+
+        self.logger.info("Launch path set to '%s'", "C:\\test")
+        shutdown_logging()
+
+        self.assertIn("INFO warp_launcher.test: Launch path set to 'C:\\test'", log_file_path.read_text("utf-8"))
+
+    def test_configure_logging_json_lines_file(self):
+        log_file_path = Path(self.temp_dir.name) / "launcher.jsonl"
+        configure_logging(logging.INFO, log_file_path, LogFileFormat.JSONL, stream=io.StringIO())
+
+        arguments = ["C:\\test"]
+        self.logger.info("Launching %s", arguments)
+        # The message is merged when logged, later changes to the arguments are not reflected
+        arguments.append("C:\\other")
+        try:
+            raise ValueError("failure")
+        except ValueError:
+            self.logger.exception("Launch failed")
+        shutdown_logging()
+
+        entries = [json.loads(line) for line in log_file_path.read_text("utf-8").splitlines()]
+        self.assertEqual([entry["message"] for entry in entries], ["Launching ['C:\\\\test']", "Launch failed"])
+        self.assertIn("ValueError: failure", entries[1]["exception"])
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,110 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from warp_launcher.manifest import InstallManifest, InstallPlan, ManifestHandler, hash_content, hash_file
+
+
+class TestHashing(unittest.TestCase):
+    def test_hash_file_matches_content_hash(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "file.txt"
+            file_path.write_text("content", encoding="utf-8")
+
+            self.assertEqual(hash_file(file_path), hash_content("content"))
+
+    def test_hash_file_matches_content_hash_with_newline(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "file.txt"
+            for newline in (None, "\n", "\r\n"):
+                with file_path.open("w", encoding="utf-8", newline=newline) as file:
+                    file.write("line\ncontent\n")
+
+                self.assertEqual(hash_file(file_path), hash_content("line\ncontent\n", newline))
+
+    def test_hash_file_detects_line_ending_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "file.txt"
+            file_path.write_bytes(b"line\ncontent\n")
+            lf_hash = hash_file(file_path)
+            file_path.write_bytes(b"line\r\ncontent\r\n")
+
+            self.assertNotEqual(hash_file(file_path), lf_hash)
+            self.assertEqual(hash_file(file_path), hash_content("line\ncontent\n", "\r\n"))
+
+    def test_hash_undecodable_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "file.txt"
+            file_path.write_bytes(b"\xff\xfe")
+
+            self.assertIsNotNone(hash_file(file_path))
+
+    def test_hash_missing_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertIsNone(hash_file(Path(temp_dir) / "missing.txt"))
+
+
+class TestInstallManifest(unittest.TestCase):
+    def test_round_trip(self):
+        manifest = InstallManifest({"launcher.vbs": "abc"}, {"warp": r"C:\install\launcher.vbs"})
+
+        self.assertEqual(InstallManifest.from_dict(manifest.to_dict()), manifest)
+
+    def test_from_dict_with_missing_sections(self):
+        self.assertEqual(InstallManifest.from_dict({}), InstallManifest())
+
+    def test_from_dict_with_invalid_section(self):
+        with self.assertRaises(ValueError):
+            InstallManifest.from_dict({"artifacts": ["launcher.vbs"]})
+
+        with self.assertRaises(ValueError):
+            InstallManifest.from_dict({"registrations": {"warp": 1}})
+
+    def test_empty_plan(self):
+        self.assertTrue(InstallPlan().is_empty())
+        self.assertFalse(InstallPlan(registrations=["warp"]).is_empty())
+
+
+class TestManifestHandler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.manifest_handler = ManifestHandler(Path(self.temp_dir.name) / "manifest.json")
+
+    def test_save_and_load_manifest(self):
+        manifest = InstallManifest({"config.json": "abc"}, {"warp": "launcher.vbs"})
+        self.manifest_handler.save_manifest(manifest)
+
+        self.assertEqual(self.manifest_handler.load_manifest(), manifest)
+
+    def test_load_missing_manifest(self):
+        self.assertEqual(self.manifest_handler.load_manifest(), InstallManifest())
+
+    def test_load_invalid_manifest(self):
+        self.manifest_handler.manifest_file_path.write_text("not json", encoding="utf-8")
+
+        self.assertEqual(self.manifest_handler.load_manifest(), InstallManifest())
+
+    def test_load_script_filename(self):
+        self.assertIsNone(self.manifest_handler.load_script_filename())
+
+        install_directory = Path(self.temp_dir.name)
+        registrations = {
+            "warp": str(install_directory / "launcher.cmd"),
+            "wtab": str(install_directory / "launcher-wtab.cmd"),
+        }
+        self.manifest_handler.save_manifest(InstallManifest({}, registrations))
+
+        self.assertEqual(self.manifest_handler.load_script_filename(), "launcher.cmd")
+
+    def test_save_manifest_error(self):
+        handler = ManifestHandler(Path(self.temp_dir.name) / "missing" / "manifest.json")
+
+        with self.assertRaises(RuntimeError):
+            handler.save_manifest(InstallManifest())
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,191 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.metrics import Histogram, MetricsHandler, get_bucket_bounds, get_bucket_index
+
+
+class TestHistogram(unittest.TestCase):
+    def test_bucket_bounds_contain_value(self):
+        for value in [*range(100), 1_000, 4_095, 4_096, 123_456, 10_000_000]:
+            with self.subTest(value=value):
+                lowest, highest = get_bucket_bounds(get_bucket_index(value))
+                self.assertLessEqual(lowest, value)
+                self.assertGreaterEqual(highest, value)
+                # Buckets are at most an eighth of their lowest value wide
+                self.assertLessEqual(highest - lowest, max(lowest // 8, 0))
+
+    def test_bucket_indexes_are_contiguous(self):
+        indexes = sorted({get_bucket_index(value) for value in range(1 << 12)})
+
+        self.assertEqual(indexes, list(range(len(indexes))))
+
+    def test_quantiles(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.total, 500_500_000)
+        for quantile in (0.5, 0.95, 0.99):
+            with self.subTest(quantile=quantile):
+                self.assertAlmostEqual(histogram.get_quantile(quantile), quantile * 1_000_000, delta=quantile * 70_000)
+
+    def test_empty_histogram(self):
+        self.assertEqual(Histogram().get_quantile(0.99), 0.0)
+
+    def test_histogram_from_dict(self):
+        histogram = Histogram()
+        histogram.record(1500)
+
+        self.assertEqual(Histogram.from_dict(histogram.to_dict()), histogram)
+        with self.assertRaises(ValueError):
+            Histogram.from_dict({"counts": []})
+
+
+class TestMetricsHandler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name)
+        self.metrics_handler = MetricsHandler(self.install_dir)
+
+    def test_record_and_load(self):
+        self.metrics_handler.record("launch", {"total": 20_000, "launcher.launch": 5_000})
+        self.metrics_handler.record("launch", {"total": 30_000})
+        self.metrics_handler.record("install", {"total": 90_000})
+
+        histograms = self.metrics_handler.load_histograms()
+
+        self.assertEqual(list(histograms), [("install", "total"), ("launch", "total"), ("launch", "launcher.launch")])
+        self.assertEqual(histograms[("launch", "total")].count, 2)
+        self.assertEqual(histograms[("launch", "launcher.launch")].total, 5_000)
+
+    def test_compact(self):
+        for _ in range(3):
+            self.metrics_handler.record("launch", {"total": 20_000})
+
+        self.metrics_handler.compact()
+        self.metrics_handler.record("launch", {"total": 20_000})
+
+        self.assertEqual(
+            sorted(path.name for path in self.install_dir.iterdir()), ["metrics.json", "metrics.log", "write.lock"]
+        )
+        self.assertEqual(self.metrics_handler.load_histograms()[("launch", "total")].count, 4)
+        self.assertEqual(self.metrics_handler.log_file_path.read_text(encoding="utf-8"), "launch\ttotal=20000\n")
+
+    def test_concurrent_compactions_keep_every_run(self):
+        saving, resume = threading.Event(), threading.Event()
+        save_histograms = MetricsHandler._save_histograms
+
+        def paused_save_histograms(metrics_handler, histograms):
+            # The first compaction waits before saving its histograms, while the second one runs
+            if not saving.is_set():
+                saving.set()
+                resume.wait(timeout=30)
+            save_histograms(metrics_handler, histograms)
+
+        with patch.object(MetricsHandler, "_save_histograms", paused_save_histograms):
+            self.metrics_handler.record("launch", {"total": 20_000})
+            first = threading.Thread(target=self.metrics_handler.compact)
+            first.start()
+            saving.wait(timeout=30)
+
+            self.metrics_handler.record("install", {"total": 90_000})
+            second = threading.Thread(target=self.metrics_handler.compact)
+            second.start()
+            second.join(timeout=0.2)
+            resume.set()
+            first.join(timeout=30)
+            second.join(timeout=30)
+
+        histograms = self.metrics_handler.load_histograms()
+        self.assertEqual(histograms[("launch", "total")].count, 1)
+        self.assertEqual(histograms[("install", "total")].count, 1)
+        self.assertFalse(self.metrics_handler.log_file_path.exists())
+        self.assertFalse(self.metrics_handler.pending_log_file_path.exists())
+
+    def test_failed_compaction_keeps_log(self):
+        self.metrics_handler.record("launch", {"total": 20_000})
+        with (
+            patch.object(MetricsHandler, "_save_histograms", side_effect=OSError("Disk full")),
+            self.assertRaises(OSError),
+        ):
+            self.metrics_handler.compact()
+        self.metrics_handler.record("launch", {"total": 20_000})
+
+        self.assertEqual(self.metrics_handler.load_histograms()[("launch", "total")].count, 2)
+        self.metrics_handler.compact()
+        self.metrics_handler.compact()
+
+        self.assertEqual(self.metrics_handler.load_histograms()[("launch", "total")].count, 2)
+        self.assertEqual(sorted(path.name for path in self.install_dir.iterdir()), ["metrics.json", "write.lock"])
+
+    def test_record_compacts_large_log(self):
+        with patch("warp_launcher.metrics.METRICS_LOG_MAX_SIZE", 100):
+            for _ in range(10):
+                self.metrics_handler.record("launch", {"total": 20_000})
+
+        self.assertTrue(self.metrics_handler.metrics_file_path.exists())
+        self.assertLess(self.metrics_handler.log_file_path.stat().st_size, 100)
+        self.assertEqual(self.metrics_handler.load_histograms()[("launch", "total")].count, 10)
+
+    def test_series_are_bounded(self):
+        metrics_handler = MetricsHandler(self.install_dir, max_series=2)
+        metrics_handler.record("launch", {"total": 1, "first": 1, "second": 1})
+
+        self.assertEqual(len(metrics_handler.load_histograms()), 2)
+
+    def test_record_without_installation(self):
+        metrics_handler = MetricsHandler(self.install_dir / "missing")
+
+        metrics_handler.record("launch", {"total": 20_000})
+
+        self.assertFalse((self.install_dir / "missing").exists())
+
+    def test_invalid_metrics_file(self):
+        self.metrics_handler.metrics_file_path.write_text("{", encoding="utf-8")
+        self.metrics_handler.record("launch", {"total": 20_000})
+
+        with self.assertLogs("warp_launcher.metrics", "WARNING"):
+            histograms = self.metrics_handler.load_histograms()
+
+        self.assertEqual(histograms[("launch", "total")].count, 1)
+
+    def test_export_openmetrics(self):
+        self.metrics_handler.record("launch", {"total": 3_000})
+        self.metrics_handler.record("launch", {"total": 40_000})
+        export_file_path = self.install_dir / "warp_launcher.prom"
+
+        self.metrics_handler.export_openmetrics(export_file_path)
+
+        lines = export_file_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0], "# TYPE warp_launcher_duration_seconds histogram")
+        self.assertEqual(lines[-1], "# EOF")
+        self.assertIn('warp_launcher_duration_seconds_bucket{action="launch",phase="total",le="0.001"} 0', lines)
+        self.assertIn('warp_launcher_duration_seconds_bucket{action="launch",phase="total",le="0.005"} 1', lines)
+        self.assertIn('warp_launcher_duration_seconds_bucket{action="launch",phase="total",le="+Inf"} 2', lines)
+        self.assertIn('warp_launcher_duration_seconds_count{action="launch",phase="total"} 2', lines)
+        self.assertIn('warp_launcher_duration_seconds_sum{action="launch",phase="total"} 0.043', lines)
+
+    def test_export_openmetrics_error(self):
+        with self.assertRaises(RuntimeError):
+            self.metrics_handler.export_openmetrics(self.install_dir / "missing" / "warp_launcher.prom")
+
+    def test_saved_histograms_are_compact(self):
+        for value in range(1000):
+            self.metrics_handler.record("launch", {"total": 10_000 + value})
+        self.metrics_handler.compact()
+
+        data = json.loads(self.metrics_handler.metrics_file_path.read_text(encoding="utf-8"))
+
+        self.assertLessEqual(len(data["series"][0]["histogram"]["counts"]), 2)
+
+
+if __name__ == "__main__":
+    pytest.main()
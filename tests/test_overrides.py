@@ -0,0 +1,194 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.config import Config, ConfigHandler
+from warp_launcher.dispatcher import RecordingDispatcher
+from warp_launcher.enums import LaunchMode
+from warp_launcher.launcher import Launcher
+from warp_launcher.overrides import OverrideResolver
+
+_SECOND = 1_000_000_000
+
+
+class TestReadOverrides(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.overrides_file_path = Path(self.temp_dir.name) / ".warp-launcher.json"
+
+    def test_read_overrides(self):
+        self.overrides_file_path.write_text(
+            json.dumps({"commandName": "ignored", "launchMode": "tab", "launchPath": "src"}), encoding="utf-8"
+        )
+
+        overrides = ConfigHandler.read_overrides(self.overrides_file_path)
+
+        self.assertEqual(overrides, {"launchMode": "tab", "launchPath": str(Path(self.temp_dir.name) / "src")})
+
+    def test_read_overrides_keeps_parent_process_path(self):
+        self.overrides_file_path.write_text(json.dumps({"launchPath": "."}), encoding="utf-8")
+
+        self.assertEqual(ConfigHandler.read_overrides(self.overrides_file_path), {"launchPath": "."})
+
+    def test_read_overrides_errors(self):
+        with self.assertRaises(RuntimeError):
+            ConfigHandler.read_overrides(self.overrides_file_path)
+
+        for content in ("{", "[]"):
+            self.overrides_file_path.write_text(content, encoding="utf-8")
+            with self.subTest(content=content), self.assertRaises(ValueError):
+                ConfigHandler.read_overrides(self.overrides_file_path)
+
+    def test_config_with_overrides(self):
+        config = Config("warp", LaunchMode.WINDOW, Path("."))
+
+        overridden = config.with_overrides({"commandName": "other", "launchMode": "tab"})
+
+        self.assertEqual(overridden.command_name, "warp")
+        self.assertEqual(overridden.launch_mode, LaunchMode.TAB)
+        self.assertTrue(overridden.is_launch_path_parent_process())
+        self.assertEqual(config.launch_mode, LaunchMode.WINDOW)
+
+        with self.assertRaises(ValueError):
+            config.with_overrides({"launchMode": "pane"})
+
+
+class TestOverrideResolver(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name) / "root"
+        self.project = self.root / "project"
+        self.directory = self.project / "src" / "module"
+        self.directory.mkdir(parents=True)
+        self.install_dir = Path(self.temp_dir.name) / "install"
+        self.install_dir.mkdir()
+        self.resolver = OverrideResolver(self.install_dir, ttl=60)
+
+    def write_overrides(self, directory, **values):
+        (directory / ".warp-launcher.json").write_text(json.dumps(values), encoding="utf-8")
+
+    def test_find_overrides_nearest_file_wins(self):
+        self.write_overrides(self.root, launchMode="tab", launchPath=".")
+        self.write_overrides(self.project, launchMode="window")
+
+        overrides = self.resolver.find_overrides(self.directory)
+
+        self.assertEqual(overrides, {"launchMode": "window", "launchPath": "."})
+
+    def test_find_overrides_without_files(self):
+        self.assertEqual(self.resolver.find_overrides(self.directory), {})
+        self.assertTrue(self.resolver.index_file_path.exists())
+
+    def test_find_overrides_uses_index(self):
+        self.write_overrides(self.project, launchMode="tab")
+        self.resolver.find_overrides(self.directory, now=_SECOND)
+
+        # Only the file found by the first resolution is checked, the ancestors are not read again
+        with patch("warp_launcher.config.ConfigHandler.read_overrides") as mock_read_overrides:
+            overrides = OverrideResolver(self.install_dir, ttl=60).find_overrides(self.directory, now=2 * _SECOND)
+
+        mock_read_overrides.assert_not_called()
+        self.assertEqual(overrides, {"launchMode": "tab"})
+
+    def test_find_overrides_detects_modified_file(self):
+        self.write_overrides(self.project, launchMode="tab")
+        self.resolver.find_overrides(self.directory, now=_SECOND)
+
+        self.write_overrides(self.project, launchMode="window", launchPath=".")
+
+        self.assertEqual(
+            self.resolver.find_overrides(self.directory, now=2 * _SECOND), {"launchMode": "window", "launchPath": "."}
+        )
+
+        (self.project / ".warp-launcher.json").unlink()
+        self.assertEqual(self.resolver.find_overrides(self.directory, now=3 * _SECOND), {})
+
+    def test_find_overrides_detects_new_file_after_ttl(self):
+        self.resolver.find_overrides(self.directory, now=_SECOND)
+        self.write_overrides(self.root, launchMode="tab")
+
+        self.assertEqual(self.resolver.find_overrides(self.directory, now=2 * _SECOND), {})
+        self.assertEqual(self.resolver.find_overrides(self.directory, now=62 * _SECOND), {"launchMode": "tab"})
+
+    def test_find_overrides_ignores_invalid_file(self):
+        self.write_overrides(self.root, launchMode="tab")
+        (self.project / ".warp-launcher.json").write_text("{", encoding="utf-8")
+
+        with self.assertLogs("warp_launcher.overrides", "WARNING"):
+            overrides = self.resolver.find_overrides(self.directory)
+
+        self.assertEqual(overrides, {"launchMode": "tab"})
+
+    def test_index_keeps_most_recent_entries(self):
+        resolver = OverrideResolver(self.install_dir, ttl=60, max_entries=2)
+        for index, directory in enumerate((self.root, self.project, self.directory)):
+            resolver.find_overrides(directory, now=(index + 1) * _SECOND)
+
+        index = json.loads(resolver.index_file_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(len(index), 2)
+        self.assertNotIn(str(self.root), index)
+
+    def test_find_overrides_without_installation(self):
+        self.write_overrides(self.project, launchMode="tab")
+        resolver = OverrideResolver(Path(self.temp_dir.name) / "missing")
+
+        self.assertEqual(resolver.find_overrides(self.directory), {"launchMode": "tab"})
+
+    def test_resolve_ignores_invalid_values(self):
+        self.write_overrides(self.project, launchMode="pane")
+        config = Config("warp", LaunchMode.WINDOW, Path("."))
+
+        with self.assertLogs("warp_launcher.overrides", "WARNING"):
+            self.assertIs(self.resolver.resolve(config, self.directory), config)
+
+
+class TestLauncherOverrides(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.project = Path(self.temp_dir.name) / "project"
+        self.directory = self.project / "src"
+        self.directory.mkdir(parents=True)
+        self.install_dir = Path(self.temp_dir.name) / "install"
+        self.install_dir.mkdir()
+        self.dispatcher = RecordingDispatcher()
+        self.launcher = Launcher(
+            self.install_dir,
+            config=Config("warp", LaunchMode.WINDOW, Path(".")),
+            dispatcher=self.dispatcher,
+            coalesce_window=0,
+        )
+        (self.project / ".warp-launcher.json").write_text(
+            json.dumps({"launchMode": "tab", "launchPath": "."}), encoding="utf-8"
+        )
+
+    def test_launch_warp_applies_overrides(self):
+        launch_path = self.launcher.launch_warp(self.directory)
+
+        self.assertEqual(launch_path, self.directory)
+        self.assertEqual(self.dispatcher.uris, [f"warp://action/new_tab?path={self.directory}"])
+        # The global configuration is left unchanged
+        self.assertEqual(self.launcher.launch_mode, LaunchMode.WINDOW)
+
+    def test_launch_warp_explicit_settings_take_precedence(self):
+        self.launcher.launch_mode = "window"
+
+        self.launcher.launch_warp(self.directory)
+
+        self.assertEqual(self.dispatcher.uris, [f"warp://action/new_window?path={self.directory}"])
+
+    def test_launch_warp_overridden_launch_path(self):
+        (self.project / ".warp-launcher.json").write_text(json.dumps({"launchPath": "src"}), encoding="utf-8")
+
+        self.assertEqual(self.launcher.launch_warp(self.project), self.directory)
+
+
+if __name__ == "__main__":
+    pytest.main()
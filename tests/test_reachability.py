@@ -0,0 +1,167 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.config import Config, clear_config_cache
+from warp_launcher.dispatcher import RecordingDispatcher
+from warp_launcher.enums import LaunchMode, ProbeStatus, TimeoutPolicy
+from warp_launcher.launcher import Launcher
+from warp_launcher.reachability import ReachabilityChecker
+
+_SECOND = 1_000_000_000
+
+
+class TestReachabilityChecker(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name)
+        self.existing_path = Path(self.temp_dir.name)
+        self.missing_path = self.existing_path / "missing"
+        # Stands for a disconnected network drive, its probes hang until the test ends
+        self.share_path = self.existing_path / "share"
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        original_access = os.access
+
+        def access(path, mode):
+            if str(path).startswith(str(self.share_path)):
+                release.wait(5)
+            return original_access(path, mode)
+
+        patcher = patch("os.access", side_effect=access)
+        self.addCleanup(patcher.stop)
+        self.mock_access = patcher.start()
+
+    def create_checker(self, **options):
+        return ReachabilityChecker(self.install_dir, **{"timeout": 0.05, **options})
+
+    def test_probe(self):
+        checker = self.create_checker()
+
+        self.assertEqual(checker.probe(self.existing_path), (ProbeStatus.OK, None))
+        self.assertEqual(
+            checker.probe(self.missing_path), (ProbeStatus.FAILED, f"Path '{self.missing_path}' does not exist")
+        )
+        self.assertEqual(
+            checker.probe(self.share_path),
+            (ProbeStatus.TIMEOUT, f"Path '{self.share_path}' did not answer within 0.05 s"),
+        )
+
+    def test_probe_caches_reachable_and_unreachable_paths(self):
+        checker = self.create_checker()
+        checker.probe(self.existing_path, now=_SECOND)
+        checker.probe(self.share_path, now=_SECOND)
+        self.mock_access.reset_mock()
+
+        # A dead share costs the timeout once
+        self.assertEqual(self.create_checker().probe(self.share_path, now=2 * _SECOND)[0], ProbeStatus.TIMEOUT)
+        self.assertEqual(self.create_checker().probe(self.existing_path, now=2 * _SECOND)[0], ProbeStatus.OK)
+        self.mock_access.assert_not_called()
+
+        # Each outcome expires after its own TTL
+        checker = self.create_checker(ttl=5, negative_ttl=30)
+        checker.probe(self.existing_path, now=10 * _SECOND)
+        checker.probe(self.share_path, now=10 * _SECOND)
+        self.assertEqual(self.mock_access.call_count, 1)
+
+    def test_probe_does_not_cache_fast_failures(self):
+        checker = self.create_checker()
+
+        checker.probe(self.missing_path)
+        checker.probe(self.missing_path)
+
+        self.assertEqual(self.mock_access.call_count, 2)
+        self.assertFalse(checker.cache_file_path.exists())
+
+    def test_cache_is_bounded(self):
+        checker = self.create_checker(max_entries=2)
+
+        for index in range(4):
+            (self.existing_path / str(index)).mkdir()
+            checker.probe(self.existing_path / str(index), now=(index + 1) * _SECOND)
+
+        cache = json.loads(checker.cache_file_path.read_text(encoding="utf-8"))
+        self.assertEqual(sorted(Path(path).name for path in cache), ["2", "3"])
+
+    def test_cache_without_installation(self):
+        checker = ReachabilityChecker(self.install_dir / "missing", timeout=0.05)
+
+        self.assertEqual(checker.probe(self.existing_path)[0], ProbeStatus.OK)
+        self.assertFalse((self.install_dir / "missing").exists())
+
+    def test_invalid_cache_file(self):
+        checker = self.create_checker()
+        checker.cache_file_path.write_text('{"path": "invalid"', encoding="utf-8")
+
+        self.assertEqual(checker.probe(self.existing_path)[0], ProbeStatus.OK)
+
+    def test_validate_path_timeout_policies(self):
+        expected_results = {
+            TimeoutPolicy.LAUNCH: (self.share_path, None),
+            TimeoutPolicy.HOME: (Path.home(), None),
+            TimeoutPolicy.FAIL: (None, f"Path '{self.share_path}' did not answer within 0.05 s"),
+        }
+
+        for policy, expected_result in expected_results.items():
+            with self.subTest(policy=policy):
+                self.assertEqual(
+                    self.create_checker(policy=policy).validate_path(str(self.share_path)), expected_result
+                )
+
+    def test_validate_paths(self):
+        candidates = [str(self.existing_path), str(self.missing_path), "C:\\a|b", self.existing_path]
+
+        results = self.create_checker().validate_paths(candidates)
+
+        self.assertEqual([result.candidate for result in results], candidates)
+        self.assertEqual([result.is_valid for result in results], [True, False, False, True])
+        self.assertEqual(results[2].error, "Path 'C:\\a|b' is not valid")
+        # Each distinct path is probed once
+        self.assertEqual(self.mock_access.call_count, 2)
+
+    def test_check_launch_path(self):
+        self.assertEqual(self.create_checker().check_launch_path(self.missing_path), self.missing_path)
+        self.assertEqual(self.create_checker(policy=TimeoutPolicy.HOME).check_launch_path(self.share_path), Path.home())
+
+        with self.assertRaises(RuntimeError):
+            self.create_checker(policy=TimeoutPolicy.FAIL).check_launch_path(self.share_path)
+
+    def test_launch_warp_follows_timeout_policy(self):
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(
+            self.install_dir,
+            config=Config("warp", LaunchMode.TAB, self.share_path),
+            dispatcher=dispatcher,
+            path_timeout=0.05,
+            timeout_policy=TimeoutPolicy.HOME,
+        )
+
+        self.assertEqual(launcher.launch_warp(), Path.home())
+        self.assertTrue(dispatcher.uris[0].endswith(f"?path={Path.home()}"))
+
+    def test_launch_warp_with_saved_config_follows_timeout_policy(self):
+        clear_config_cache()
+        self.addCleanup(clear_config_cache)
+        config = Config("warp", LaunchMode.WINDOW, self.share_path)
+        (self.install_dir / "config.json").write_text(json.dumps(config.to_dict()), encoding="utf-8")
+        dispatcher = RecordingDispatcher()
+        launcher = Launcher(
+            self.install_dir, dispatcher=dispatcher, path_timeout=0.05, timeout_policy=TimeoutPolicy.HOME
+        )
+
+        # The saved settings are kept rather than replaced by the defaults while the share does not answer
+        self.assertEqual(launcher.config, config)
+        self.assertEqual(launcher.launch_warp(), Path.home())
+        self.assertEqual(dispatcher.uris, [f"warp://action/{LaunchMode.WINDOW.value}?path={Path.home()}"])
+
+
+if __name__ == "__main__":
+    pytest.main()
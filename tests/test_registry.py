@@ -1,18 +1,30 @@
+import sys
+import tempfile
 import unittest
-import winreg
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from warp_launcher.registry import AppPathsRegister
+from warp_launcher.registry import (
+    AppPathsRegister,
+    ContextMenuRegister,
+    FileRegistryBackend,
+    MemoryRegistryBackend,
+    WinregBackend,
+    get_registry_backend,
+)
 
+if sys.platform == "win32":
+    import winreg
 
+
+@unittest.skipUnless(sys.platform == "win32", "the winreg backend is only available on Windows")
 class TestAppPathsRegister(unittest.TestCase):
     def setUp(self):
         self.executable_name = "testapp"
         self.executable_path = Path(r"C:\test\path\app.vbs")
-        self.app_paths_register = AppPathsRegister(self.executable_path)
+        self.app_paths_register = AppPathsRegister(self.executable_path, WinregBackend())
         self.registry_key = r"Software\Microsoft\Windows\CurrentVersion\App Paths\testapp.exe"
 
     @patch("winreg.CreateKeyEx")
@@ -35,14 +47,46 @@ class TestAppPathsRegister(unittest.TestCase):
 
         mock_create_key.assert_called_once()
 
-    @patch("warp_launcher.registry.AppPathsRegister.is_registered", return_value=True)
     @patch("winreg.DeleteKey", side_effect=Exception("Access denied"))
-    def test_unregister_failure(self, mock_delete_key, mock_is_registered):
+    def test_unregister_failure(self, mock_delete_key):
         with self.assertRaises(RuntimeError):
             self.app_paths_register.unregister(self.executable_name)
 
         mock_delete_key.assert_called_once()
-        mock_is_registered.assert_called_once()
+
+    @patch("winreg.DeleteKey", side_effect=FileNotFoundError())
+    def test_unregister_not_registered(self, mock_delete_key):
+        self.app_paths_register.unregister(self.executable_name)
+
+        mock_delete_key.assert_called_once_with(winreg.HKEY_CURRENT_USER, self.registry_key)
+
+    @patch("winreg.CreateKeyEx")
+    @patch("winreg.SetValueEx")
+    @patch("winreg.DeleteKey")
+    @patch("winreg.CloseKey")
+    def test_session_reuses_parent_key(self, mock_close_key, mock_delete_key, mock_set_value, mock_create_key):
+        parent_key, child_key = MagicMock(), MagicMock()
+        mock_create_key.side_effect = [parent_key, child_key]
+
+        with self.app_paths_register.session() as session:
+            session.unregister("previous")
+            session.register(self.executable_name)
+            mock_set_value.assert_not_called()
+
+        self.assertEqual(
+            mock_create_key.call_args_list,
+            [
+                call(
+                    winreg.HKEY_CURRENT_USER,
+                    r"Software\Microsoft\Windows\CurrentVersion\App Paths",
+                    access=winreg.KEY_READ | winreg.KEY_WRITE,
+                ),
+                call(parent_key, "testapp.exe", access=winreg.KEY_WRITE),
+            ],
+        )
+        mock_delete_key.assert_called_once_with(parent_key, "previous.exe")
+        mock_set_value.assert_called_once_with(child_key, "", 0, winreg.REG_SZ, str(self.executable_path))
+        self.assertEqual(mock_close_key.call_args_list, [call(child_key), call(parent_key)])
 
     @patch("winreg.OpenKey")
     @patch("winreg.CloseKey")
@@ -71,5 +115,181 @@ class TestAppPathsRegister(unittest.TestCase):
         self.assertFalse(is_registered)
 
 
+class TestAppPathsRegisterMemoryBackend(unittest.TestCase):
+    def setUp(self):
+        self.executable_path = Path(r"C:\test\path\app.vbs")
+        self.backend = MemoryRegistryBackend()
+        self.app_paths_register = AppPathsRegister(self.executable_path, self.backend)
+
+    def test_register_and_unregister(self):
+        self.app_paths_register.register("testapp")
+
+        self.assertTrue(self.app_paths_register.is_registered("TestApp"))
+        self.assertEqual(self.app_paths_register.get_registered_path("testapp"), str(self.executable_path))
+
+        self.app_paths_register.unregister("testapp")
+
+        self.assertFalse(self.app_paths_register.is_registered("testapp"))
+        self.assertIsNone(self.app_paths_register.get_registered_path("testapp"))
+
+    def test_unregister_not_registered(self):
+        self.app_paths_register.unregister("testapp")
+
+        self.assertEqual(self.backend.keys, {})
+
+    def test_session_applies_changes_on_exit(self):
+        self.app_paths_register.register("previous")
+
+        with self.app_paths_register.session() as session:
+            session.unregister("previous")
+            session.register("testapp")
+
+            # Pending changes are visible in the session only
+            self.assertFalse(session.is_registered("previous"))
+            self.assertTrue(session.is_registered("testapp"))
+            self.assertTrue(self.app_paths_register.is_registered("previous"))
+            self.assertFalse(self.app_paths_register.is_registered("testapp"))
+
+        self.assertFalse(self.app_paths_register.is_registered("previous"))
+        self.assertTrue(self.app_paths_register.is_registered("testapp"))
+
+    def test_session_discards_changes_on_error(self):
+        with self.assertRaises(ValueError), self.app_paths_register.session() as session:
+            session.register("testapp")
+            raise ValueError("Install failed")
+
+        self.assertFalse(self.app_paths_register.is_registered("testapp"))
+
+    def test_overlapping_sessions_keep_both_changes(self):
+        with self.app_paths_register.session() as first, self.app_paths_register.session() as second:
+            first.register("first")
+            second.register("second")
+
+        self.assertTrue(self.app_paths_register.is_registered("first"))
+        self.assertTrue(self.app_paths_register.is_registered("second"))
+
+    def test_session_restore(self):
+        self.app_paths_register.register("previous")
+
+        with self.app_paths_register.session() as session:
+            session.restore("previous", None)
+            session.restore("testapp", r"C:\other\app.vbs")
+
+        self.assertFalse(self.app_paths_register.is_registered("previous"))
+        self.assertEqual(self.app_paths_register.get_registered_path("testapp"), r"C:\other\app.vbs")
+
+
+class TestFileRegistryBackend(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.registry_file_path = Path(self.temp_dir.name) / "registry" / "registry.json"
+        self.executable_path = Path(r"C:\test\path\app.vbs")
+
+    def test_keys_are_persisted(self):
+        AppPathsRegister(self.executable_path, FileRegistryBackend(self.registry_file_path)).register("testapp")
+
+        app_paths_register = AppPathsRegister(self.executable_path, FileRegistryBackend(self.registry_file_path))
+        self.assertEqual(app_paths_register.get_registered_path("testapp"), str(self.executable_path))
+
+    def test_session_saves_once(self):
+        backend = FileRegistryBackend(self.registry_file_path)
+
+        with (
+            patch.object(backend, "_save", wraps=backend._save) as mock_save,
+            AppPathsRegister(self.executable_path, backend).session() as session,
+        ):
+            session.register("first")
+            session.register("second")
+
+        mock_save.assert_called_once()
+        self.assertTrue(AppPathsRegister(self.executable_path, backend).is_registered("second"))
+
+    def test_failed_save_keeps_registry_file(self):
+        backend = FileRegistryBackend(self.registry_file_path)
+        AppPathsRegister(self.executable_path, backend).register("first")
+        content = self.registry_file_path.read_text(encoding="utf-8")
+
+        with (
+            patch("warp_launcher.registry.json.dump", side_effect=OSError("Disk full")),
+            self.assertRaises(RuntimeError),
+        ):
+            AppPathsRegister(self.executable_path, backend).register("second")
+
+        self.assertEqual(self.registry_file_path.read_text(encoding="utf-8"), content)
+        self.assertEqual(
+            sorted(path.name for path in self.registry_file_path.parent.iterdir()), ["registry.json", "write.lock"]
+        )
+
+    @unittest.skipIf(sys.platform == "win32", "The Windows registry is available on Windows")
+    def test_get_registry_backend_warns_without_windows_registry(self):
+        with self.assertLogs("warp_launcher.registry", "WARNING") as logs:
+            backend = get_registry_backend()
+
+        self.assertIsInstance(backend, FileRegistryBackend)
+        self.assertIn("have no effect", logs.output[0])
+
+    def test_invalid_registry_file(self):
+        self.registry_file_path.parent.mkdir()
+        self.registry_file_path.write_text("[]", encoding="utf-8")
+        app_paths_register = AppPathsRegister(self.executable_path, FileRegistryBackend(self.registry_file_path))
+
+        self.assertFalse(app_paths_register.is_registered("testapp"))
+        with self.assertRaises(RuntimeError):
+            app_paths_register.register("testapp")
+
+
+class TestContextMenuRegister(unittest.TestCase):
+    def setUp(self):
+        self.backend = MemoryRegistryBackend()
+        self.command_line = '"C:\\Python\\pythonw.exe" -m warp_launcher.fastlaunch --select "%V"'
+        self.register = ContextMenuRegister(self.backend)
+
+    def test_register_and_unregister(self):
+        self.register.register(self.command_line)
+
+        self.assertTrue(self.register.is_registered())
+        self.assertEqual(
+            self.backend.keys,
+            {
+                "software\\classes\\directory\\shell\\warplauncher": "Open in Warp",
+                "software\\classes\\directory\\shell\\warplauncher\\command": self.command_line,
+                "software\\classes\\directory\\background\\shell\\warplauncher": "Open in Warp",
+                "software\\classes\\directory\\background\\shell\\warplauncher\\command": self.command_line,
+            },
+        )
+
+        self.register.unregister()
+
+        self.assertFalse(self.register.is_registered())
+        self.assertEqual(self.backend.keys, {})
+
+    def test_register_saves_once(self):
+        backend = MemoryRegistryBackend()
+
+        with patch.object(backend, "_save", wraps=backend._save) as mock_save:
+            ContextMenuRegister(backend).register(self.command_line)
+
+        mock_save.assert_called_once()
+
+    def test_register_custom_verb(self):
+        ContextMenuRegister(self.backend, verb="Other", label="Open elsewhere").register("other.exe %V")
+
+        self.assertEqual(ContextMenuRegister(self.backend, verb="Other").get_registered_command(), "other.exe %V")
+        self.assertFalse(self.register.is_registered())
+
+    def test_unregister_not_registered(self):
+        self.register.unregister()
+
+        self.assertIsNone(self.register.get_registered_command())
+
+    def test_register_failure(self):
+        with (
+            patch.object(self.backend, "_save", side_effect=OSError("Access denied")),
+            self.assertRaises(RuntimeError),
+        ):
+            self.register.register(self.command_line)
+
+
 if __name__ == "__main__":
     pytest.main()
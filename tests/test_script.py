@@ -1,5 +1,10 @@
+import os
+import shutil
+import stat
+import sys
+import tempfile
 import unittest
-from pathlib import Path
+from pathlib import Path, PurePosixPath, PureWindowsPath
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -7,19 +12,37 @@ import pytest
 from warp_launcher.config import Config
 from warp_launcher.constants import PARENT_PROCESS_IDENTIFIER
 from warp_launcher.enums import LaunchMode
-from warp_launcher.script import ScriptHandler
+from warp_launcher.script import (
+    SCRIPT_TARGETS,
+    CmdScriptTarget,
+    ScriptHandler,
+    ShScriptTarget,
+    VbsScriptTarget,
+    get_script_target,
+    get_script_target_for,
+    measure_script_targets,
+)
+
+_GOLDEN_DIRECTORY = Path(__file__).parent / "golden" / "script"
+
+# Paths with the characters each script language has to quote
+_WINDOWS_LAUNCH_PATH = PureWindowsPath("C:\\Users\\O'Brien\\100% & $Projects")
+_POSIX_LAUNCH_PATH = PurePosixPath("/home/o'brien/100% & $projects")
 
 
 class TestScriptHandler(unittest.TestCase):
     def setUp(self):
-        self.test_script_path = Path("test_script.vbs")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.test_script_path = Path(self.temp_dir.name) / "test_script.vbs"
         self.script_handler = ScriptHandler(self.test_script_path)
         self.test_launch_mode = LaunchMode.TAB
         self.test_launch_path = Path(r"C:\test\path")
         self.test_config = Config("test-command", self.test_launch_mode, self.test_launch_path)
 
+    @patch("os.replace")
     @patch("pathlib.Path.open", new_callable=mock_open)
-    def test_save_script_with_regular_path(self, mock_file):
+    def test_save_script_with_regular_path(self, mock_file, mock_replace):
         self.script_handler.save_script(self.test_config)
 
         mock_file.assert_called_once_with("w", encoding="utf-8")
@@ -29,9 +52,11 @@ class TestScriptHandler(unittest.TestCase):
         script_content = "".join(call[0][0] for call in write_calls)
 
         self.assertIn(f'path = "{self.test_launch_path}"', script_content)
+        mock_replace.assert_called_once()
 
+    @patch("os.replace")
     @patch("pathlib.Path.open", new_callable=mock_open)
-    def test_save_script_with_parent_process_path(self, mock_file):
+    def test_save_script_with_parent_process_path(self, mock_file, mock_replace):
         config = Config("test-command", self.test_launch_mode, Path(PARENT_PROCESS_IDENTIFIER))
 
         self.script_handler.save_script(config)
@@ -53,5 +78,102 @@ class TestScriptHandler(unittest.TestCase):
         mock_file.assert_called_once_with("w", encoding="utf-8")
 
 
+class TestScriptTargets(unittest.TestCase):
+    def assert_golden(self, golden_file_name, content):
+        """
+        Compare the content with the golden file, set UPDATE_GOLDEN=1 to write the golden files again.
+        """
+        golden_file_path = _GOLDEN_DIRECTORY / golden_file_name
+        if os.environ.get("UPDATE_GOLDEN"):
+            golden_file_path.write_text(content, encoding="utf-8", newline="\n")
+
+        self.assertEqual(content, golden_file_path.read_text(encoding="utf-8"))
+
+    def test_render_golden_files(self):
+        for name, target_class in SCRIPT_TARGETS.items():
+            target = target_class()
+            launch_path = _WINDOWS_LAUNCH_PATH if target.windows else _POSIX_LAUNCH_PATH
+            with self.subTest(target=name):
+                self.assert_golden(
+                    f"launch_path{target.extension}", target.render(Config("warp", LaunchMode.TAB, launch_path))
+                )
+                self.assert_golden(
+                    f"parent_process{target.extension}",
+                    target.render(Config("warp", LaunchMode.WINDOW, Path(PARENT_PROCESS_IDENTIFIER))),
+                )
+
+    def test_render_vbs_matches_previous_script(self):
+        config = Config("warp", LaunchMode.TAB, Path(r"C:\test\path"))
+
+        self.assertEqual(
+            VbsScriptTarget().render(config),
+            f'path = "{config.launch_path}"\n'
+            'If Right(path, 1) = "\\" Then path = Left(path, Len(path) - 1) End If\n'
+            'warpURI = "warp://action/new_tab?path=" & path\n'
+            'CreateObject("WScript.Shell").Run warpURI, 0, False',
+        )
+
+    def test_render_dry_run_does_not_hand_off(self):
+        config = Config("warp", LaunchMode.TAB, Path(PARENT_PROCESS_IDENTIFIER))
+
+        for name, target_class in SCRIPT_TARGETS.items():
+            target = target_class()
+            with self.subTest(target=name):
+                self.assertNotIn(target.hand_off, target.render(config, dry_run=True))
+                self.assertIn(target.hand_off, target.render(config))
+
+    def test_quote(self):
+        test_cases = [
+            (VbsScriptTarget(), 'say "hi"', '"say ""hi"""'),
+            (CmdScriptTarget(), "C:\\100%", "C:\\100%%"),
+            (ShScriptTarget(), "it's", "'it'\"'\"'s'"),
+        ]
+
+        for target, value, expected in test_cases:
+            with self.subTest(target=target.name, value=value):
+                self.assertEqual(target.quote(value), expected)
+
+    def test_get_script_target(self):
+        self.assertIsInstance(get_script_target(), VbsScriptTarget)
+        self.assertIsInstance(get_script_target("cmd"), CmdScriptTarget)
+
+        with self.assertRaises(ValueError):
+            get_script_target("bat")
+
+    def test_get_script_target_for(self):
+        test_cases = [
+            ("launcher.vbs", VbsScriptTarget),
+            ("launcher.CMD", CmdScriptTarget),
+            ("launcher.sh", ShScriptTarget),
+            ("launcher", VbsScriptTarget),
+        ]
+
+        for file_name, expected in test_cases:
+            with self.subTest(file_name=file_name):
+                self.assertIsInstance(get_script_target_for(Path(file_name)), expected)
+
+    @unittest.skipIf(sys.platform == "win32", "POSIX shell scripts are not run on Windows")
+    def test_save_sh_script(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_file_path = Path(temp_dir) / "launcher.sh"
+
+            ScriptHandler(script_file_path).save_script(Config("warp", LaunchMode.TAB, Path(_POSIX_LAUNCH_PATH)))
+
+            self.assertEqual(
+                script_file_path.read_bytes().decode("utf-8"), (_GOLDEN_DIRECTORY / "launch_path.sh").read_text("utf-8")
+            )
+            self.assertTrue(script_file_path.stat().st_mode & stat.S_IXUSR)
+
+    @unittest.skipUnless(shutil.which("sh"), "A POSIX shell is required")
+    def test_measure_script_targets(self):
+        config = Config("warp", LaunchMode.TAB, Path(PARENT_PROCESS_IDENTIFIER))
+
+        with patch.object(CmdScriptTarget, "build_command", return_value=["missing-script-host"]):
+            latencies = measure_script_targets(config, ["cmd", "sh"], repeat=1)
+
+        self.assertEqual(list(latencies), ["sh"])
+        self.assertGreater(latencies["sh"], 0)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,146 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import pytest
+
+from warp_launcher import tracing
+from warp_launcher.tracing import (
+    disable_phase_recording,
+    disable_tracing,
+    enable_phase_recording,
+    enable_tracing,
+    run_profiled,
+    span,
+    traced,
+)
+
+
+@traced("double")
+def _double(value: int) -> int:
+    return value * 2
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(disable_tracing)
+        self.addCleanup(disable_phase_recording)
+
+    def test_span_disabled_is_shared_noop(self):
+        self.assertIsNone(tracing._tracer)
+        self.assertIs(span("first"), span("second"))
+
+        with span("first"):
+            pass
+
+        self.assertIsNone(disable_tracing())
+
+    def test_span_records_nested_spans(self):
+        tracer = enable_tracing()
+
+        with span("outer"), span("inner"):
+            pass
+
+        report = tracer.to_dict()
+        self.assertEqual([(s["name"], s["depth"]) for s in report["spans"]], [("outer", 0), ("inner", 1)])
+        outer, inner = report["spans"]
+        self.assertLessEqual(outer["start_ms"], inner["start_ms"])
+        self.assertGreaterEqual(outer["duration_ms"], inner["duration_ms"])
+        self.assertGreaterEqual(report["total_ms"], outer["start_ms"] + outer["duration_ms"])
+
+    def test_span_records_on_error(self):
+        tracer = enable_tracing()
+
+        with self.assertRaises(ValueError), span("failing"):
+            raise ValueError("failure")
+
+        with span("next"):
+            pass
+
+        self.assertEqual([(record.name, record.depth) for record in tracer.spans], [("failing", 0), ("next", 0)])
+
+    def test_span_depth_is_per_thread(self):
+        tracer = enable_tracing()
+
+        def worker():
+            with span("worker"):
+                pass
+
+        with span("main"):
+            thread = threading.Thread(target=worker, name="worker-thread")
+            thread.start()
+            thread.join()
+
+        records = {record.name: record for record in tracer.spans}
+        self.assertEqual(records["worker"].depth, 0)
+        self.assertEqual(records["worker"].thread, "worker-thread")
+
+    def test_traced(self):
+        self.assertEqual(_double(2), 4)
+
+        tracer = enable_tracing()
+        self.assertEqual(_double(3), 6)
+
+        self.assertEqual([record.name for record in tracer.spans], ["double"])
+        self.assertEqual(_double.__name__, "_double")
+
+    def test_disable_tracing_returns_tracer(self):
+        tracer = enable_tracing()
+
+        self.assertIs(disable_tracing(), tracer)
+        with span("ignored"):
+            pass
+
+        self.assertEqual(tracer.spans, [])
+
+    def test_phase_recording(self):
+        recorder = enable_phase_recording({"double": "compute", "first": "compute"})
+
+        self.assertEqual(_double(2), 4)
+        with span("first"):
+            pass
+        # Spans that are not phases stay no-ops
+        self.assertIs(span("other"), span("ignored"))
+
+        self.assertEqual(list(recorder.durations), ["compute"])
+        self.assertGreater(recorder.durations["compute"], 0)
+        self.assertIs(disable_phase_recording(), recorder)
+        self.assertIsNone(tracing._phase_recorder)
+
+    def test_phase_recording_while_tracing(self):
+        recorder = enable_phase_recording({"double": "compute"})
+        tracer = enable_tracing()
+
+        _double(2)
+
+        # The tracer times the span instead of the recorder, its spans are summed afterwards
+        self.assertEqual(recorder.durations, {})
+        recorder.add_spans(tracer.spans)
+        self.assertEqual(recorder.durations, {"compute": tracer.spans[0].end - tracer.spans[0].start})
+
+    def test_run_profiled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profile_file_path = Path(temp_dir) / "nested" / "profile.txt"
+
+            self.assertEqual(run_profiled(lambda: _double(21), profile_file_path), 42)
+
+            report = profile_file_path.read_text(encoding="utf-8")
+            self.assertIn("Peak memory:", report)
+            self.assertIn("_double", report)
+
+    def test_run_profiled_saves_on_error(self):
+        def fail() -> int:
+            raise RuntimeError("failure")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profile_file_path = Path(temp_dir) / "profile.txt"
+
+            with self.assertRaises(RuntimeError):
+                run_profiled(fail, profile_file_path)
+
+            self.assertTrue(profile_file_path.exists())
+
+
+if __name__ == "__main__":
+    pytest.main()
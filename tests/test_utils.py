@@ -0,0 +1,117 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.utils import (
+    get_stat_key,
+    string_to_path,
+    validate_command_name,
+    validate_command_names,
+    validate_path,
+    validate_paths,
+)
+
+
+class TestPathValidation(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.existing_path = Path(self.temp_dir.name)
+        self.missing_path = self.existing_path / "missing"
+
+    def test_string_to_path(self):
+        self.assertEqual(string_to_path("C:\\test\\path "), Path(r"C:\test\path"))
+        self.assertEqual(string_to_path("relative/path"), Path("relative/path"))
+
+        for invalid_path in (None, "", "   ", "C:\\test<", 'C:\\"test"', "C:\\a|b", "C:\\a?", "C:\\*"):
+            self.assertIsNone(string_to_path(invalid_path), invalid_path)
+
+    def test_string_to_path_colons(self):
+        self.assertEqual(string_to_path("C:"), Path("C:"))
+        self.assertIsNone(string_to_path(":test"))
+        self.assertIsNone(string_to_path("test:path"))
+        self.assertIsNone(string_to_path("C:\\test:path"))
+        self.assertIsNone(string_to_path("C::"))
+
+    def test_get_stat_key(self):
+        file_path = self.existing_path / "file.txt"
+        file_path.write_text("first", encoding="utf-8")
+        stat_key = get_stat_key(file_path)
+
+        self.assertEqual(get_stat_key(str(file_path)), stat_key)
+        file_path.write_text("second content", encoding="utf-8")
+        self.assertNotEqual(get_stat_key(file_path), stat_key)
+        self.assertIsNone(get_stat_key(self.missing_path))
+
+    def test_validate_path(self):
+        self.assertEqual(validate_path(str(self.existing_path)), (self.existing_path, None))
+        self.assertEqual(validate_path(self.existing_path), (self.existing_path, None))
+        self.assertEqual(validate_path(str(self.missing_path)), (None, f"Path '{self.missing_path}' does not exist"))
+        self.assertEqual(validate_path("C:\\a|b"), (None, "Path 'C:\\a|b' is not valid"))
+        self.assertEqual(validate_path(None), (None, "Path 'None' is not valid"))
+
+    @patch("os.access", return_value=False)
+    def test_validate_path_not_accessible(self, mock_access):
+        self.assertEqual(
+            validate_path(str(self.existing_path)), (None, f"Path '{self.existing_path}' is not accessible")
+        )
+
+    def test_validate_paths(self):
+        candidates = [str(self.existing_path), str(self.missing_path), "C:\\a|b", self.existing_path]
+
+        results = validate_paths(candidates)
+
+        self.assertEqual([result.candidate for result in results], candidates)
+        self.assertEqual([result.is_valid for result in results], [True, False, False, True])
+        self.assertEqual(results[0].value, self.existing_path)
+        self.assertEqual(results[1].error, f"Path '{self.missing_path}' does not exist")
+        self.assertIsNone(results[2].value)
+
+    def test_validate_path_timeout(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def hung_access(path, mode):
+            release.wait(5)
+            return True
+
+        with patch("os.access", side_effect=hung_access):
+            self.assertEqual(
+                validate_path(str(self.existing_path), timeout=0.05),
+                (None, f"Path '{self.existing_path}' did not answer within 0.05 s"),
+            )
+
+        self.assertEqual(validate_path(str(self.existing_path), timeout=1), (self.existing_path, None))
+
+    @patch("os.access", return_value=True)
+    def test_validate_paths_probes_once(self, mock_access):
+        results = validate_paths([str(self.existing_path)] * 100)
+
+        self.assertTrue(all(result.is_valid for result in results))
+        mock_access.assert_called_once()
+
+
+class TestCommandNameValidation(unittest.TestCase):
+    def test_validate_command_name(self):
+        self.assertEqual(validate_command_name("warp-launcher_2"), ("warp-launcher_2", None))
+        self.assertEqual(validate_command_name(None), (None, "Command is not valid"))
+        self.assertEqual(
+            validate_command_name("-warp"), (None, "Command name '-warp' should not start or end with '-' or '_'")
+        )
+        self.assertEqual(
+            validate_command_name("warp launcher"), (None, "Only alphanumeric characters and '-' or '_' are allowed")
+        )
+
+    def test_validate_command_names(self):
+        results = validate_command_names(["warp", "warp_", "warp", None])
+
+        self.assertEqual([result.value for result in results], ["warp", None, "warp", None])
+        self.assertEqual([result.is_valid for result in results], [True, False, True, False])
+
+
+if __name__ == "__main__":
+    pytest.main()
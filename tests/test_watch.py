@@ -0,0 +1,171 @@
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from warp_launcher.config import Config
+from warp_launcher.enums import LaunchMode
+from warp_launcher.launcher import Launcher
+from warp_launcher.registry import AppPathsRegister, MemoryRegistryBackend
+from warp_launcher.watch import ConfigWatcher, InotifyChangeSource, PollingChangeSource
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestChangeSources(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.file_path = Path(self.temp_dir.name) / "config.json"
+        self.file_path.write_text("{}", encoding="utf-8")
+
+    def test_polling_change_source(self):
+        change_source = PollingChangeSource(self.file_path, poll_interval=0.01)
+
+        self.assertFalse(change_source.wait(0.05))
+
+        self.file_path.write_text('{"commandName": "warp"}', encoding="utf-8")
+        self.assertTrue(change_source.wait(1.0))
+        self.assertFalse(change_source.wait(0.05))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is only available on Linux")
+    def test_inotify_change_source(self):
+        change_source = InotifyChangeSource(self.file_path)
+        self.addCleanup(change_source.close)
+
+        self.assertFalse(change_source.wait(0.05))
+
+        # Other files of the directory are ignored
+        (self.file_path.parent / "launcher.vbs").write_text("", encoding="utf-8")
+        self.assertFalse(change_source.wait(0.05))
+
+        self.file_path.write_text('{"commandName": "warp"}', encoding="utf-8")
+        self.assertTrue(change_source.wait(1.0))
+
+        # Editors that save to a temporary file and rename it over the original
+        temporary_file_path = self.file_path.with_suffix(".tmp")
+        temporary_file_path.write_text("{}", encoding="utf-8")
+        temporary_file_path.replace(self.file_path)
+        self.assertTrue(change_source.wait(1.0))
+
+
+class TestConfigWatcher(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.install_dir = Path(self.temp_dir.name) / "install"
+        self.config_file_path = self.install_dir / "config.json"
+
+        self.registry_backend = MemoryRegistryBackend()
+        self.app_paths_register = AppPathsRegister(self.install_dir / "launcher.vbs", self.registry_backend)
+
+        self.install(Config("test-command", LaunchMode.TAB, Path(".")))
+
+    def install(self, config, script_filename="launcher.vbs"):
+        Launcher(
+            self.install_dir, script_filename=script_filename, config=config, registry_backend=self.registry_backend
+        ).install()
+
+    def create_watcher(self):
+        return ConfigWatcher(
+            self.install_dir, registry_backend=self.registry_backend, debounce=0.05, poll_interval=0.05
+        )
+
+    def write_config(self, **values):
+        config_data = {"commandName": "test-command", "launchMode": "tab", "launchPath": ".", **values}
+        self.config_file_path.write_text(json.dumps(config_data), encoding="utf-8")
+
+    def test_sync_unchanged_configuration(self):
+        self.assertFalse(self.create_watcher().sync())
+
+    def test_sync_registers_new_command(self):
+        watcher = self.create_watcher()
+        script_content = (self.install_dir / "launcher.vbs").read_text(encoding="utf-8")
+
+        self.write_config(commandName="new-command")
+
+        with patch("warp_launcher.script.ScriptHandler.save_script") as mock_save_script:
+            self.assertTrue(watcher.sync())
+
+        mock_save_script.assert_not_called()
+        self.assertTrue(self.app_paths_register.is_registered("new-command"))
+        self.assertFalse(self.app_paths_register.is_registered("test-command"))
+        self.assertEqual((self.install_dir / "launcher.vbs").read_text(encoding="utf-8"), script_content)
+
+    def test_sync_regenerates_script(self):
+        watcher = self.create_watcher()
+
+        self.write_config(launchMode="window")
+
+        self.assertTrue(watcher.sync())
+        self.assertIn("new_window", (self.install_dir / "launcher.vbs").read_text(encoding="utf-8"))
+        self.assertTrue(self.app_paths_register.is_registered("test-command"))
+        # The rewrite of the configuration file by the install is not a new change
+        self.assertFalse(watcher.sync())
+
+    def test_sync_keeps_installed_script_target(self):
+        self.install(Config("test-command", LaunchMode.TAB, Path(".")), script_filename="launcher.cmd")
+        watcher = self.create_watcher()
+
+        self.write_config(launchMode="window")
+
+        self.assertTrue(watcher.sync())
+        self.assertIn("new_window", (self.install_dir / "launcher.cmd").read_text(encoding="utf-8"))
+        self.assertFalse((self.install_dir / "launcher.vbs").exists())
+
+    def test_sync_ignores_invalid_configuration(self):
+        watcher = self.create_watcher()
+
+        with self.assertLogs("warp_launcher.watch", "WARNING"):
+            self.write_config(commandName="-invalid")
+            self.assertFalse(watcher.sync())
+
+            self.config_file_path.write_text("not valid json", encoding="utf-8")
+            self.assertFalse(watcher.sync())
+
+        self.assertTrue(self.app_paths_register.is_registered("test-command"))
+
+    def test_watch_forever(self):
+        watcher = self.create_watcher()
+        install = patch.object(Launcher, "install", autospec=True, side_effect=Launcher.install).start()
+        self.addCleanup(patch.stopall)
+
+        thread = threading.Thread(target=watcher.watch_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(watcher.stop)
+
+        # A burst of saves is applied once
+        for index in range(5):
+            self.write_config(commandName=f"command{'-' * index}x")
+            time.sleep(0.005)
+
+        self.assertTrue(_wait_for(lambda: self.app_paths_register.is_registered("command----x")))
+        self.assertEqual(install.call_count, 1)
+
+        watcher.stop()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    def test_watch_forever_requires_installation(self):
+        watcher = ConfigWatcher(Path(self.temp_dir.name) / "missing")
+
+        with self.assertRaises(RuntimeError):
+            watcher.watch_forever()
+
+
+if __name__ == "__main__":
+    pytest.main()